@@ -3,8 +3,10 @@ import time
 import imgui
 import pygame as g
 
+import friends_cache
 import player
 import steam_wrapper as steam
+from lobby_members import MemberCache
 from round import Room
 
 
@@ -50,8 +52,13 @@ class Lobby:
         dbg(f"self.my_steamid={self.my_steamid}, self.my_name={self.my_name}")
 
         self.lobby_id = 0
+        self.members = MemberCache(steam)  # 成员表，按回调增量更新
+        self._members_version = -1
         self.member_names = []
+        self.friends = None  # 会话级好友缓存，见 _load_friends_list
+        self._friends_version = -1
         self._friend_ids = []
+        self.friend_names = []
         self._start_payload = None
         self._start_seen_ts = 0
 
@@ -137,9 +144,9 @@ class Lobby:
             self.create_btn_enabled = False
             self.invite_btn_enabled = True
 
+            self.members.reload(self.lobby_id)
             self._push_my_member_data()
             self._refresh_members_list()
-            self._refresh_member_names()
             self._after_enter_lobby()
 
             if self.is_host:
@@ -165,13 +172,13 @@ class Lobby:
             _on_joined_lobby_common(self)
 
         def on_lobby_chat_update(data):
-            if data['m_ulSteamIDLobby'] == self.lobby_id:
-                self._refresh_member_names()
+            if self.members.on_chat_update(data):
+                self._refresh_members_list()
             dbg(f"on_lobby_chat_update: lobby={data['m_ulSteamIDLobby']}, user_changed={data['m_ulSteamIDUserChanged']}, state_change={data['m_rgfChatMemberStateChange']}")
 
         def on_lobby_data_update(data):
-            self._refresh_member_names()
-            self._refresh_members_list()
+            if self.members.on_data_update(data):
+                self._refresh_members_list()
 
             if data['m_ulSteamIDLobby'] != self.lobby_id:
                 return
@@ -273,30 +280,24 @@ class Lobby:
         steam.set_lobby_member_data(self.lobby_id, "player", payload)
 
     def _collect_players(self):
-        """读取 Lobby 全体成员为 Player 实例列表（用 Player.create / 或直接 new Player）"""
-        res = []
+        """Lobby 里已发布 "player" 数据的成员（成员缓存里的 Player 实例，同一 Steam ID 始终是同一个）"""
         if not getattr(self, "lobby_id", None):
-            return res
-
-        count = steam.get_num_lobby_members(self.lobby_id)
-        for i in range(count):
-            steam_id = steam.get_lobby_member_by_index(self.lobby_id, i)
-            raw = steam.get_lobby_member_data(self.lobby_id, steam_id, "player")
-
-            s = raw.decode("utf-8", "ignore") if raw else ""
-            if not len(s.split(",", 3)) == 3: continue
-            name, steam_id, money = s.split(",", 3)
-            p = player.Player(steam_id, name, money)
-            p.money = int(money)
-
-            res.append(p)
-        return res
+            return []
+        return self.members.players()
 
     def _refresh_members_list(self):
-        players = self._collect_players()
-        items = [f"{p.username} | {p.steam_id} | ¥{p.money}" for p in players]
+        """成员缓存有变化时刷新显示行、昵称和 Rich Presence 人数"""
+        members = self.members
+        if members.version == self._members_version:
+            return
+        self._members_version = members.version
+        count_changed = len(members) != len(self.member_names)
         # 修改：更新 UI 状态变量
-        self.member_list_display = items
+        self.member_list_display = members.rows()
+        self.member_names = members.names()
+        dbg(f"members[{len(self.member_names)}]: {self.member_names}")
+        if self.lobby_id and count_changed:
+            steam.set_rich_presence("steam_player_group_size", str(len(self.member_names)))
 
     def _set_status(self, msg: str):
         self.status_message = msg
@@ -309,37 +310,19 @@ class Lobby:
         steam.set_rich_presence("steam_display", "#Status_Hosting")
 
     def _load_friends_list(self):
-        k_EFriendFlagImmediate = 4
-        cnt = steam.get_friend_count(k_EFriendFlagImmediate)
-        items, ids = [], []
-        for i in range(max(0, cnt)):
-            fid = steam.get_friend_by_index(i, k_EFriendFlagImmediate)
-            name = steam.get_friend_persona_name(fid)
-            display = name or b"Unknown"
-            items.append(display)
-            ids.append(fid)
-        self._friend_ids = ids
-
-    def _refresh_member_names(self):
-        if not self.lobby_id:
-            self.member_list_display = []
+        """好友列表来自会话级缓存：只在第一次打开大厅时批量读取，之后由 PersonaStateChange 更新"""
+        self.friends = friends_cache.get(steam)
+        self._friends_version = -1
+        self._refresh_friends_list()
+
+    def _refresh_friends_list(self):
+        """好友缓存有变化时刷新好友 ID 和昵称（每帧调用，没变化时只比较一次版本号）"""
+        friends = self.friends
+        if friends is None or friends.version == self._friends_version:
             return
-        count = steam.get_num_lobby_members(self.lobby_id)
-        names = []
-        for i in range(int(count)):
-            sid = steam.get_lobby_member_by_index(self.lobby_id, i)
-            pname = steam.get_friend_persona_name(sid)
-            display = (pname or b"")
-            if not display:
-                p = steam.get_lobby_member_data(self.lobby_id, sid, "player_name")
-                display = (p or b"Unknown").decode("utf-8", "ignore")
-            names.append(display)
-        self.member_names = names
-        self.member_list_display = names
-        dbg(f"members[{len(self.member_names)}]: {self.member_names}")
-        # 刷新成员列表后，同步人数到 Rich Presence
-        if self.lobby_id:
-            steam.set_rich_presence("steam_player_group_size", str(len(self.member_names)))
+        self._friends_version = friends.version
+        self._friend_ids = friends.ids()
+        self.friend_names = friends.names()
 
     # ---------- Actions ----------
     def create_public_lobby(self):
@@ -368,11 +351,14 @@ class Lobby:
             _after_leave_lobby()
             self._set_status("已离开Lobby")
             self.lobby_id = 0
+            self.members.clear()
             # 修改：更新 UI 状态变量
             self.member_list_display = []
+            self.member_names = []
 
     def draw_ui(self):
         """使用 ImGui 绘制大厅界面"""
+        self._refresh_friends_list()
         w, h = self.screen.get_size()
 
         # 使用一个全屏、固定的窗口作为背景
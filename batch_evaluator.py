@@ -0,0 +1,124 @@
+"""Vectorized hand evaluation over NumPy arrays of card codes.
+
+``evaluate_batch`` scores many hands at once with the same lookup tables and
+integer strengths as ``evaluator.evaluate``: rank and suit bitmasks are built
+with array operations and every hand category is resolved by table gathers,
+so millions of hands never touch a per-hand Python call.
+"""
+import numpy as np
+
+import evaluator
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # Rows per pass, bounds the temporary arrays
+
+_POPCOUNT = np.array(evaluator.POPCOUNT, dtype=np.int32)
+_TOP1 = np.array(evaluator.TOP1, dtype=np.int32)
+_TOP2 = np.array(evaluator.TOP2, dtype=np.int32)
+_TOP3 = np.array(evaluator.TOP3, dtype=np.int32)
+_TOP5 = np.array(evaluator.TOP5, dtype=np.int32)
+_STRAIGHT_HIGH = np.array(evaluator.STRAIGHT_HIGH, dtype=np.int32)
+_STRAIGHT_RANKS = np.array(evaluator.STRAIGHT_RANKS, dtype=np.int32)
+_CARD_BIT = np.array(evaluator.CARD_BIT, dtype=np.int32)
+_CARD_SUIT = np.array(evaluator.CARD_SUIT, dtype=np.int32)
+_SUIT_ONE = (1 << (4 * np.arange(4, dtype=np.int32)))
+
+
+def _rankBit(rank):
+    """Bit of a rank array; rows where rank is 0 (no such group) map to 0."""
+    return np.where(rank > 0, 1 << np.maximum(rank - 2, 0), 0)
+
+
+def _evaluateChunk(codes):
+    """Score one (n, k) block of card codes."""
+    columns = np.ascontiguousarray(codes.T)
+    bits = _CARD_BIT[columns]
+    suits = _CARD_SUIT[columns]
+
+    # Same carry chain as evaluator.evaluate, one card column at a time
+    seen1 = np.zeros(codes.shape[0], dtype=np.int32)
+    seen2 = np.zeros_like(seen1)
+    seen3 = np.zeros_like(seen1)
+    seen4 = np.zeros_like(seen1)
+    suitCounts = np.zeros_like(seen1)  # One 4-bit counter per suit
+    for bit, suit in zip(bits, suits):
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+        suitCounts += _SUIT_ONE[suit]
+
+    # With at most 7 cards only one suit can reach five
+    flushSuit = np.full_like(seen1, -1)
+    for suit in range(4):
+        flushSuit[((suitCounts >> (4 * suit)) & 0xF) >= 5] = suit
+    flushMask = np.zeros_like(seen1)
+    for bit, suit in zip(bits, suits):
+        flushMask |= np.where(suit == flushSuit, bit, 0)
+    flushHigh = _STRAIGHT_HIGH[flushMask]
+
+    quad = _TOP1[seen4]
+    trip = _TOP1[seen3]
+    tripBit = _rankBit(trip)
+    fullPair = _TOP1[seen2 & ~tripBit]
+    pair = _TOP1[seen2]
+    pairBit = _rankBit(pair)
+    lowPair = _TOP1[seen2 & ~pairBit]
+    lowPairBit = _rankBit(lowPair)
+    straightHigh = _STRAIGHT_HIGH[seen1]
+
+    shift = evaluator.RANK_SHIFT
+    conditions = [
+        flushHigh > 0,
+        flushMask > 0,
+        seen4 > 0,
+        (seen3 > 0) & (fullPair > 0),
+        straightHigh > 0,
+        seen3 > 0,
+        lowPair > 0,
+        seen2 > 0,
+    ]
+    choices = [
+        np.where(flushHigh == 14, evaluator.ROYAL_FLUSH, evaluator.STRAIGHT_FLUSH) << shift
+        | _STRAIGHT_RANKS[flushHigh],
+        evaluator.FLUSH << shift | _TOP5[flushMask],
+        evaluator.FOUR_OF_A_KIND << shift | quad * 0x11110 | _TOP1[seen1 & ~_rankBit(quad)],
+        evaluator.FULL_HOUSE << shift | trip * 0x11100 | fullPair * 0x11,
+        evaluator.STRAIGHT << shift | _STRAIGHT_RANKS[straightHigh],
+        evaluator.THREE_OF_A_KIND << shift | trip * 0x11100 | _TOP2[seen1 & ~tripBit],
+        evaluator.TWO_PAIR << shift | pair * 0x11000 | lowPair * 0x110 | _TOP1[seen1 & ~pairBit & ~lowPairBit],
+        evaluator.ONE_PAIR << shift | pair * 0x11000 | _TOP3[seen1 & ~pairBit],
+    ]
+    default = evaluator.HIGH_CARD << shift | _TOP5[seen1]
+    return np.select(conditions, choices, default).astype(np.int32)
+
+
+def evaluate_batch(cards, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Score a batch of hands.
+
+    Args:
+        cards: Integer array of shape (N, 5..7) holding card codes 0-51
+        chunk_size: Rows evaluated per vectorized pass
+
+    Returns:
+        np.ndarray: int32 array of N strengths comparable with evaluator.evaluate
+
+    Raises:
+        ValueError: When the array shape or card codes are invalid
+    """
+    cards = np.asarray(cards)
+    if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+        raise ValueError("cards must have shape (N, 5..7)")
+    if cards.size and (cards.min() < 0 or cards.max() >= evaluator.NUM_CARDS):
+        raise ValueError("card codes must be in range 0-51")
+
+    codes = cards.astype(np.int32, copy=False)
+    out = np.empty(codes.shape[0], dtype=np.int32)
+    for start in range(0, codes.shape[0], chunk_size):
+        stop = start + chunk_size
+        out[start:stop] = _evaluateChunk(codes[start:stop])
+    return out
+
+
+def encode_batch(hands):
+    """Convert a sequence of equally sized Card lists to an (N, k) code array."""
+    return np.array([evaluator.encode_cards(hand) for hand in hands], dtype=np.int32)
@@ -0,0 +1,90 @@
+"""Next-to-act cost at 9-handed tables with heavy folding: list scan versus ActionOrder.
+
+The scan baseline is what callers had to do before: advance Round's cursor and
+skip seats missing from a dict of active players, re-checking who is left to
+decide whether the betting round or the hand is over.
+
+Run from the repository root:
+    python benchmarks/bench_actions.py [--hands N] [--fold-rate F] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import round  # noqa: E402
+
+
+def scripts(hands, players, foldRate, seed):
+    """Pre-draw every decision so both engines replay the same hands"""
+    rng = random.Random(seed)
+    return [[rng.random() for _ in range(players * 8)] for _ in range(hands)]
+
+
+def playScan(order, decisions, foldRate):
+    """Baseline: cursor advance plus dict membership and rescans"""
+    active = {p: True for p in order.players}
+    actions = 0
+    draws = iter(decisions)
+    for street in round.STREETS:
+        order.setStreet(street)
+        toAct = [p for p in order if p in active]
+        current = order.current()
+        while toAct and len(active) > 1:
+            while current not in active or current not in toAct:
+                current = order.advance()
+            if next(draws, 1.0) < foldRate:
+                del active[current]
+            toAct.remove(current)
+            actions += 1
+        if len(active) <= 1:
+            break
+    return actions
+
+
+def playMask(order, decisions, foldRate):
+    """ActionOrder: bitmask next-to-act, O(1) completion checks"""
+    actions = round.ActionOrder(order)
+    count = 0
+    draws = iter(decisions)
+    for street in round.STREETS:
+        current = actions.startStreet(street)
+        while current is not None:
+            if next(draws, 1.0) < foldRate:
+                current = actions.fold(current)
+            else:
+                current = actions.act(current)
+            count += 1
+        if actions.isHandOver():
+            break
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=50000)
+    parser.add_argument("--players", type=int, default=9)
+    parser.add_argument("--fold-rate", type=float, default=0.6)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    seats = list(range(args.players))
+    order = round.Round(seats, seats[0])
+    plans = scripts(args.hands, args.players, args.fold_rate, args.seed)
+
+    for label, play in (("list scan", playScan), ("ActionOrder", playMask)):
+        total = 0
+        start = time.perf_counter()
+        for decisions in plans:
+            total += play(order, decisions, args.fold_rate)
+            order = round.Round.createNextRound(order)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<12}{args.hands / elapsed:>12,.0f} hands/sec{elapsed / total * 1e9:>10,.0f} ns/action"
+              f"  ({total / args.hands:.1f} actions/hand)")
+
+
+if __name__ == "__main__":
+    main()
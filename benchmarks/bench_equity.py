@@ -0,0 +1,55 @@
+"""Monte Carlo equity throughput and scaling across worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_equity.py [--trials N] [--opponents K] [--seed S]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import equity  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=400000)
+    parser.add_argument("--opponents", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    hand = [12, 25]  # Pocket aces
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    baseline = reference = None
+    for workers in counts:
+        start = time.perf_counter()
+        result = equity.monte_carlo_equity(hand, opponents=args.opponents, trials=args.trials,
+                                           seed=args.seed, workers=workers)
+        elapsed = time.perf_counter() - start
+        rate = result.trials / elapsed
+        baseline = baseline or rate
+        # The seed alone fixes the result, independent of the worker count
+        reference = reference or result
+        assert result == reference
+        print(f"workers={workers:<3}{rate:>14,.0f} trials/sec  x{rate / baseline:.2f}  equity={result.equity:.4f}")
+
+    # Heads-up on the turn: exact enumeration, then a second player hitting the board cache
+    board = [0, 14, 28, 40]
+    other = [11, 24]
+    deck = [c for c in range(52) if c not in hand + other + board]
+    cache = equity.BoardCache()
+    for label, cards in (("exact (cold cache)", hand), ("exact (warm cache)", other)):
+        start = time.perf_counter()
+        result = equity.exact_equity(cards, board, deck=deck, cache=cache)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22}{elapsed * 1000:>9.2f} ms  equity={result.equity:.4f}")
+    start = time.perf_counter()
+    result = equity.monte_carlo_equity(hand, board, deck=deck, trials=100000, seed=args.seed, workers=1)
+    elapsed = time.perf_counter() - start
+    print(f"{'sampled (100k trials)':<22}{elapsed * 1000:>9.2f} ms  equity={result.equity:.4f}")
+
+
+if __name__ == "__main__":
+    main()
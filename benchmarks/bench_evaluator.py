@@ -0,0 +1,108 @@
+"""Hands/sec of the combinatorial evaluator versus the table-driven one.
+
+Run from the repository root:
+    python benchmarks/bench_evaluator.py [--hands N] [--seed S]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import card  # noqa: E402
+import config  # noqa: E402
+import evaluator  # noqa: E402
+
+try:
+    import numpy as np
+    import batch_evaluator
+except ImportError:  # NumPy is optional for the scalar comparison
+    np = None
+
+
+def legacyPattens(cards):
+    """The original Card.getPattens algorithm over (rank, suit) pairs, kept as the 'before' baseline."""
+    best_hand = ("High Card", [0])
+    for combo in combinations(cards, 5):
+        ranks = sorted([c[0] for c in combo], reverse=True)
+        suits = [c[1] for c in combo]
+        unique_ranks = set(ranks)
+        is_flush = len(set(suits)) == 1
+        is_straight = len(unique_ranks) == 5 and max(ranks) - min(ranks) == 4
+        if {14, 2, 3, 4, 5} == unique_ranks:
+            is_straight = True
+            ranks = [5, 4, 3, 2, 1]
+        counts = sorted(Counter(ranks).values(), reverse=True)
+        if is_flush and ranks == [14, 13, 12, 11, 10]:
+            hand = ("Royal Flush", ranks)
+        elif is_flush and is_straight:
+            hand = ("Straight Flush", ranks)
+        elif counts == [4, 1]:
+            hand = ("Four of a Kind", ranks)
+        elif counts == [3, 2]:
+            hand = ("Full House", ranks)
+        elif is_flush:
+            hand = ("Flush", ranks)
+        elif is_straight:
+            hand = ("Straight", ranks)
+        elif counts == [3, 1, 1]:
+            hand = ("Three of a Kind", ranks)
+        elif counts == [2, 2, 1]:
+            hand = ("Two Pair", ranks)
+        elif counts == [2, 1, 1, 1]:
+            hand = ("One Pair", ranks)
+        else:
+            hand = ("High Card", ranks)
+        if config.HAND_RANKINGS[hand[0]] > config.HAND_RANKINGS[best_hand[0]] or (
+                config.HAND_RANKINGS[hand[0]] == config.HAND_RANKINGS[best_hand[0]] and hand[1] > best_hand[1]
+        ):
+            best_hand = hand
+    return best_hand
+
+
+def timeIt(label, func, hands):
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32}{len(hands) / elapsed:>14,.0f} hands/sec")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    codes = [rng.sample(range(evaluator.NUM_CARDS), 7) for _ in range(args.hands)]
+    pairs = [[(evaluator.CARD_RANK[c], evaluator.CARD_SUIT[c]) for c in hand] for hand in codes]
+    cards = [[card.Card(evaluator.CARD_RANK[c], config.CARD_SUITS[evaluator.CARD_SUIT[c]]) for c in hand]
+             for hand in codes]
+
+    # Both evaluators must agree on the hand category before timing them
+    for pair, code in zip(pairs, codes):
+        assert legacyPattens(pair)[0] == evaluator.hand_name(evaluator.evaluate(code))
+
+    before = timeIt("before: combinations(7, 5)", legacyPattens, pairs)
+    after = timeIt("after:  evaluator.evaluate", evaluator.evaluate, codes)
+    timeIt("after:  Card.getPattens", card.Card.getPattens, cards)
+    print(f"speedup (evaluate): {before / after:.1f}x")
+
+    if np is not None:
+        array = np.array(codes, dtype=np.int32)
+        assert batch_evaluator.evaluate_batch(array).tolist() == [evaluator.evaluate(c) for c in codes]
+        start = time.perf_counter()
+        batch_evaluator.evaluate_batch(array)
+        elapsed = time.perf_counter() - start
+        print(f"{'after:  evaluate_batch':<32}{len(codes) / elapsed:>14,.0f} hands/sec")
+        print(f"speedup (evaluate_batch): {before / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
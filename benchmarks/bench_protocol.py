@@ -0,0 +1,68 @@
+"""Bytes/message and encode/decode cost of the binary protocol versus pickle.
+
+Run from the repository root:
+    python benchmarks/bench_protocol.py [--loops N]
+"""
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import player  # noqa: E402
+import protocol  # noqa: E402
+
+try:
+    import round  # Needs pygame/imgui for the screen classes
+except ImportError:
+    round = None
+
+
+def sampleMessages():
+    players = [player.Player(76561198000000000 + i, f"player{i}") for i in range(6)]
+    setup = protocol.RoomSetup(1, 50, 0, tuple(
+        protocol.PlayerInfo(int(p.steam_id), p.money, p.username) for p in players))
+    messages = [
+        ("room setup", setup, players),
+        ("game state", protocol.GameState(42, 1, 3, 0b111011, 1250, 100, (4, 17, 30, None, None)), None),
+        ("player action", protocol.PlayerAction(3, protocol.ACTION_RAISE, 200), None),
+        ("state delta", protocol.StateDelta(41, 42, None, 4, None, 1350, 100, None), None),
+        ("hole cards", protocol.HoleCards(2, (12, 25)), None),
+        ("chat", protocol.ChatMessage(76561198000000001, "nice hand, gg"), None),
+    ]
+    return messages
+
+
+def micros(stmt, loops):
+    return min(timeit.repeat(stmt, number=loops, repeat=3)) / loops * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loops", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'message':<16}{'pickle B':>10}{'binary B':>10}{'pickle enc/dec µs':>22}{'binary enc/dec µs':>22}")
+    for label, msg, players in sampleMessages():
+        pickled = pickle.dumps(msg, protocol=pickle.HIGHEST_PROTOCOL)
+        binary = protocol.encode(msg)
+        assert protocol.decode(binary) == msg
+        pEnc = micros(lambda: pickle.dumps(msg, protocol=pickle.HIGHEST_PROTOCOL), args.loops)
+        pDec = micros(lambda: pickle.loads(pickled), args.loops)
+        bEnc = micros(lambda: protocol.encode(msg), args.loops)
+        bDec = micros(lambda: protocol.decode(binary), args.loops)
+        print(f"{label:<16}{len(pickled):>10}{len(binary):>10}{pEnc:>11.2f} /{pDec:>8.2f}{bEnc:>13.2f} /{bDec:>6.2f}")
+
+        if players is not None and round is not None:
+            # What send_object used to ship: the whole Room, players and CardPool included
+            room = round.Room([players, 1, 50])
+            roomPickled = pickle.dumps(room, protocol=pickle.HIGHEST_PROTOCOL)
+            rEnc = micros(lambda: pickle.dumps(room, protocol=pickle.HIGHEST_PROTOCOL), args.loops)
+            rDec = micros(lambda: pickle.loads(roomPickled), args.loops)
+            print(f"{'  (whole Room)':<16}{len(roomPickled):>10}{'':>10}{rEnc:>11.2f} /{rDec:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
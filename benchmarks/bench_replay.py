@@ -0,0 +1,76 @@
+"""Seek latency of replay.HandReplay into a long recorded session.
+
+Records one simulated table for --hands hands, verifies the whole session once,
+then seeks to random records, cold (fresh HandReplay) and warm (one replay
+object reused, the way a debugger scrubbing back and forth would).
+
+Run from the repository root:
+    python benchmarks/bench_replay.py [--hands N] [--players K] [--seeks S] [--interval I]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+import handlog  # noqa: E402
+import playerstore  # noqa: E402
+import replay  # noqa: E402
+import simulator  # noqa: E402
+
+
+def record(directory, hands, players, interval):
+    """Play one bot table with its deck seed and snapshots recorded"""
+    table = simulator.BotTable(0, players, 1)
+    path = os.path.join(directory, "table0.hands")
+    table.room.recordTo(handlog.HandLogWriter(path), 1, interval)
+    simulator.runTables([table], hands, [])
+    table.room.history.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hands", type=int, default=10000)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--seeks", type=int, default=200)
+    parser.add_argument("--interval", type=int, default=64, help="hands between stored snapshots")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        config.USER_DATA_PATH = scratch
+        start = time.perf_counter()
+        path = record(scratch, args.hands, args.players, args.interval)
+        playerstore.close()
+        print(f"recorded {args.hands} hands in {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(path) / 1024:.0f} KiB log)")
+
+        with replay.HandReplay(path) as session:
+            start = time.perf_counter()
+            session.verify()
+            elapsed = time.perf_counter() - start
+            print(f"verify             {elapsed:>8.2f} s   ({session.numHands / elapsed:,.0f} hands/sec)")
+
+            rng = random.Random(1)
+            targets = [rng.randrange(len(session)) for _ in range(args.seeks)]
+            for label, fresh in (("seek (cold)", True), ("seek (warm)", False)):
+                times = []
+                for index in targets:
+                    start = time.perf_counter()
+                    if fresh:
+                        with replay.HandReplay(path) as cold:
+                            cold.seek(index)
+                    else:
+                        session.seek(index)
+                    times.append(time.perf_counter() - start)
+                times.sort()
+                print(f"{label:<18} p50 {times[len(times) // 2] * 1e3:.2f} ms   "
+                      f"p99 {times[min(len(times) - 1, len(times) * 99 // 100)] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
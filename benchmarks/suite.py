@@ -0,0 +1,303 @@
+"""Microbenchmark suite for the core hot paths, with baseline regression gating.
+
+Each benchmark is calibrated so one sample takes about --sample-time seconds,
+then sampled --repeat times; the minimum per-call time is what gets compared
+(it is the least noisy statistic on a shared machine), the median is reported
+alongside it.
+
+Run from the repository root:
+    python benchmarks/suite.py [--filter TEXT] [--output results.json]
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json [--threshold 0.15]
+
+With --baseline the exit status is 1 when any benchmark is slower than its
+baseline by more than the threshold (a fraction, 0.15 = 15%).
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import card  # noqa: E402
+import config  # noqa: E402
+import deck  # noqa: E402
+import handlog  # noqa: E402
+import loopback  # noqa: E402
+import net  # noqa: E402
+import player  # noqa: E402
+import playerstore  # noqa: E402
+import pots  # noqa: E402
+import protocol  # noqa: E402
+import round  # noqa: E402
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """Register a setup function returning the zero-argument callable to time"""
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+
+def _players(count):
+    return [player.Player(76561198000000000 + i, f"player{i}") for i in range(count)]
+
+
+@benchmark("card.getPattens[7 cards]")
+def benchGetPattens():
+    rng = random.Random(1)
+    hands = [rng.sample(card.CARDS, 7) for _ in range(256)]
+    getPattens = card.Card.getPattens
+
+    def run():
+        for hand in hands:
+            getPattens(hand)
+    return run, len(hands)
+
+
+@benchmark("round.CardPool()")
+def benchCardPoolInit():
+    rng = deck.seededRng(1)
+    return lambda: round.CardPool(rng), 1
+
+
+@benchmark("round.CardPool.getNextCard[x23]+reset")
+def benchCardPoolDraw():
+    pool = round.CardPool(deck.seededRng(1))
+
+    def run():
+        draw = pool.getNextCard
+        for _ in range(23):  # Nine hands plus the board
+            draw()
+        pool.reset()
+    return run, 1
+
+
+@benchmark("round.Round()[9 players]")
+def benchRoundInit():
+    players = _players(9)
+    return lambda: round.Round(players, players[3]), 1
+
+
+@benchmark("round.Round.streetOrder[4 streets]")
+def benchStreetOrder():
+    players = _players(9)
+    order = round.Round(players, players[3])
+
+    def run():
+        for street in ("preflop", "flop", "turn", "river"):
+            order.streetOrder(street)
+    return run, 1
+
+
+@benchmark("round.Round.createNextRound[9 players]")
+def benchCreateNextRound():
+    players = _players(9)
+    state = [round.Round(players, players[0])]
+
+    def run():
+        state[0] = round.Round.createNextRound(state[0])
+    return run, 1
+
+
+@benchmark("pots.resolve[9 players, 8 side pots]")
+def benchResolve():
+    codes = random.Random(1).sample(range(52), 23)
+    board = codes[:5]
+    holes = [codes[5 + 2 * i:7 + 2 * i] for i in range(9)]
+    contributions = [10, 20, 30, 40, 50, 60, 70, 80, 90]
+    return lambda: pots.resolve(contributions, holes, board, 3), 1
+
+
+@benchmark("handlog.HandLogWriter.write")
+def benchHandLogWrite():
+    writer = handlog.HandLogWriter(os.path.join(config.USER_DATA_PATH, "bench_write.hands"))
+    return lambda: writer.write(handlog.CHIP_IN, 3, handlog.NO_CARD, 1, 20), 1
+
+
+@benchmark("handlog.HandLogReader.hand[random of 100k]")
+def benchHandLogSeek():
+    path = os.path.join(config.USER_DATA_PATH, "bench_read.hands")
+    with handlog.HandLogWriter(path) as writer:
+        for _ in range(100000):
+            writer.write(handlog.HAND_START, seat=0)
+            for seat in range(40):
+                writer.write(handlog.CHIP_IN, seat % 9, handlog.NO_CARD, seat // 10, 20)
+            writer.write(handlog.HAND_END)
+    reader = handlog.HandLogReader(path)
+    hands = random.Random(1).sample(range(reader.numHands), 256)
+
+    def run():
+        for hand in hands:
+            reader.hand(hand)
+    return run, len(hands)
+
+
+@benchmark("net.SteamNetworkMessenger.broadcast_to_lobby[GameState x8]")
+def benchBroadcast():
+    hub = loopback.LoopbackHub()
+    messenger = net.SteamNetworkMessenger(transport=hub.transport(1))
+    members = list(range(2, 10))
+    state = protocol.GameState(42, 1, 3, 0b111011, 1250, 100, (4, 17, 30, None, None))
+
+    def run():
+        messenger.broadcast_to_lobby(members, state)
+        hub._queues.clear()  # Keep the loopback queues from growing across samples
+    return run, 1
+
+
+@benchmark("net.SteamNetworkMessenger.receive_objects[GameState x64]")
+def benchReceive():
+    hub = loopback.LoopbackHub()
+    sender = hub.transport(1)
+    messenger = net.SteamNetworkMessenger(transport=hub.transport(2))
+    data = protocol.encode(protocol.GameState(42, 1, 3, 0b111011, 1250, 100, (4, 17, 30, None, None)))
+    channel = net.SteamNetworkMessenger.CHANNEL_GAME_STATE
+
+    def run():
+        for _ in range(64):
+            sender.send(2, data, channel, 0)
+        messenger.receive_objects(channel, 64)
+    return run, 64
+
+
+@benchmark("player.Player.storeData")
+def benchStoreData():
+    p = _players(1)[0]
+    return p.storeData, 1
+
+
+@benchmark("player.Player.create[existing]")
+def benchCreate():
+    p = _players(1)[0]
+    p.storeData()
+    return lambda: player.Player.create(p.steam_id, p.username), 1
+
+
+@benchmark("player.Player.remote[9 lobby members]")
+def benchRemote():
+    members = [(str(76561198000000000 + i), f"player{i}", 10000 + i) for i in range(9)]
+    remote = player.Player.remote
+
+    def run():
+        for steam_id, name, money in members:
+            remote(steam_id, name, money)
+    return run, 1
+
+
+@benchmark("playerstore.PlayerStore.flush[1000 dirty, sqlite]")
+def benchStoreFlush():
+    store = playerstore.get()
+    players = _players(1000)
+
+    def run():
+        for p in players:
+            store.markDirty(p)
+        store.flush()
+    return run, 1
+
+
+def measure(run, perCall, sampleTime, repeat):
+    """Calibrate the loop count, then return per-operation times (seconds) of each sample"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= sampleTime / 10 or loops >= 1 << 24:
+            break
+        loops *= 2
+    loops = max(1, int(loops * sampleTime / max(elapsed, 1e-9)))
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        samples.append((time.perf_counter() - start) / (loops * perCall))
+    return samples
+
+
+def runSuite(selected, sampleTime, repeat):
+    results = {}
+    for name, setup in selected:
+        run, perCall = setup()
+        run()  # Warm up caches and lazy imports
+        samples = measure(run, perCall, sampleTime, repeat)
+        results[name] = {
+            "min_us": min(samples) * 1e6,
+            "median_us": statistics.median(samples) * 1e6,
+            "stdev_us": statistics.pstdev(samples) * 1e6,
+            "samples": len(samples),
+        }
+        print(f"{name:<60}{results[name]['min_us']:>11.3f} µs  (median {results[name]['median_us']:.3f})")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the change against the baseline and return the names that regressed"""
+    regressions = []
+    print(f"\n{'benchmark':<60}{'baseline µs':>13}{'now µs':>11}{'change':>9}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<60}{'-':>13}{result['min_us']:>11.3f}{'new':>9}")
+            continue
+        change = result["min_us"] / base["min_us"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<60}{base['min_us']:>13.3f}{result['min_us']:>11.3f}{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--sample-time", type=float, default=0.1, help="seconds per sample")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--save-baseline", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown before failing")
+    args = parser.parse_args()
+
+    selected = [(name, setup) for name, setup in BENCHMARKS if args.filter in name]
+    with tempfile.TemporaryDirectory() as scratch:
+        config.USER_DATA_PATH = scratch  # Player benchmarks must not touch ./data
+        results = runSuite(selected, args.sample_time, args.repeat)
+        playerstore.close()
+
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "benchmarks": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf8") as f:
+                json.dump(document, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf8") as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,63 @@
 import config  # Import configuration module containing card definitions and rankings
-from collections import Counter  # Used for counting occurrences of card ranks
-from itertools import combinations  # Used for generating card combinations
+import evaluator  # Table-driven hand evaluator backing getPattens
 
 
 class Card:
-    """Playing card class representing a single playing card with its properties and methods"""
+    """Playing card class representing a single playing card with its properties and methods
 
-    def __init__(self, cardNumber, cardType):
-        """Initialize a playing card instance
+    Cards are immutable and interned: the 52 instances are built once at import
+    and every constructor call returns one of them, so dealing a deck never
+    allocates. Each card is backed by its evaluator code (suit * 13 + rank - 2)
+    and pickles as that code
+    """
+
+    __slots__ = ("code", "cardNumber", "cardType", "_info", "_str")
+
+    _interned = []  # code -> Card, filled once below
+
+    def __new__(cls, cardNumber, cardType):
+        """Return the interned card for a rank and suit
 
         Args:
-            cardNumber: The numeric value/rank of the card
+            cardNumber: The numeric value/rank of the card (2-14 or a CARD_NUMBER_RANK_MAP key)
             cardType: The suit of the card
+
+        Returns:
+            The shared Card instance
+
+        Raises:
+            ValueError: When the rank is outside 2-14 or the suit is unknown
         """
-        self.cardNumber = cardNumber  # Store the card's numeric value
-        self.cardType = cardType  # Store the card's suit
+        if not isinstance(cardNumber, int):
+            cardNumber = config.CARD_NUMBER_RANK_MAP[cardNumber]
+        if not 2 <= cardNumber <= 14:
+            raise ValueError(f"Invalid card number: {cardNumber!r}")
+        return cls._interned[config.CARD_SUITS.index(cardType) * 13 + cardNumber - 2]
+
+    @classmethod
+    def _intern(cls, code):
+        """Build the single instance for a card code (import time only)"""
+        self = object.__new__(cls)
+        cardNumber = evaluator.CARD_RANK[code]
+        cardType = config.CARD_SUITS[evaluator.CARD_SUIT[code]]
+        setattr_ = object.__setattr__  # Card.__setattr__ refuses every assignment
+        setattr_(self, "code", code)  # Evaluator code 0-51
+        setattr_(self, "cardNumber", cardNumber)  # Store the card's numeric value
+        setattr_(self, "cardType", cardType)  # Store the card's suit
+        setattr_(self, "_info", (cardNumber, cardType))  # Precomputed getCardInfo result
+        setattr_(self, "_str", f"{cardNumber}_{cardType}")  # Precomputed __str__ result
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Card is immutable; cannot delete {name!r}")
+
+    @classmethod
+    def fromCode(cls, code):
+        """Return the interned card for an evaluator code (0-51)"""
+        return cls._interned[code]
 
     def getCardInfo(self):
         """Retrieve the card's information
@@ -22,15 +65,30 @@ class Card:
         Returns:
             A tuple containing the card's number and suit
         """
-        return self.cardNumber, self.cardType
+        return self._info
 
     def __str__(self):
         """Return a string representation of the card
         Returns:
             str: A string representation of the card(cardNumber, cardType)
         """
-        return f"{self.cardNumber}_{self.cardType}"
+        return self._str
+
+    def __repr__(self):
+        return f"Card({self.cardNumber!r}, {self.cardType!r})"
+
+    def __int__(self):
+        return self.code
+
+    def __reduce__(self):
+        """Pickle as the card code; unpickling returns the interned instance"""
+        return _fromCode, (self.code,)
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     @classmethod
     def createCard(cls, cardNumber, cardType):
@@ -52,87 +110,32 @@ class Card:
         # Validate card type/suit
         if cardType not in config.CARD_TYPE_MAP:
             raise IndexError("Invalid card type")
-        # Create and return Card instance
-        return cls(config.CARD_TYPE_MAP[cardType], cardNumber)
+        # Return the interned Card instance
+        return cls(cardNumber, cardType)
 
     @classmethod
     def getPattens(cls, cards):
         """Analyze the best possible hand from a set of cards
 
-        Evaluates all possible 5-card combinations from the given cards
-        and determines the highest ranking hand
+        Compatibility wrapper around the table-driven evaluator; the best
+        5-card hand is resolved in a single pass without enumerating combinations
 
         Args:
             cards: A list of Card instances
 
         Returns:
-            A tuple containing the best hand name and its sorted ranks
+            A tuple containing the best hand name and its ranks, most significant first
         """
-        # Initialize best hand as "High Card" (lowest ranking)
-        best_hand = ("High Card", [0])
-
-        # Generate all possible 5-card combinations
-        for combo in combinations(cards, 5):
-            # Extract and sort ranks in descending order
-            ranks = sorted([c.rank for c in combo], reverse=True)
-            # Extract suit information
-            suits = [c.cardType for c in combo]
-            # Get unique ranks for straight and pair checking
-            unique_ranks = set(ranks)
-
-            # Check if all cards are the same suit (flush)
-            is_flush = len(set(suits)) == 1
-            # Check if ranks form a sequence (straight)
-            is_straight = len(unique_ranks) == 5 and max(ranks) - min(ranks) == 4
-
-            # Special case: Ace-low straight (A-2-3-4-5)
-            if {14, 2, 3, 4, 5} == unique_ranks:
-                is_straight = True
-                ranks = [5, 4, 3, 2, 1]  # Reorder for proper comparison
-
-            # Count occurrences of each rank
-            count = Counter(ranks)
-            # Sort counts in descending order for hand ranking
-            counts = sorted(count.values(), reverse=True)
-
-            # Determine the hand ranking for current combination
-            if is_flush and ranks == [14, 13, 12, 11, 10]:
-                # Highest possible hand: Royal Flush
-                hand = ("Royal Flush", ranks)
-            elif is_flush and is_straight:
-                # Straight Flush (second highest)
-                hand = ("Straight Flush", ranks)
-            elif counts == [4, 1]:
-                # Four of a kind
-                hand = ("Four of a Kind", ranks)
-            elif counts == [3, 2]:
-                # Full house (three of a kind plus a pair)
-                hand = ("Full House", ranks)
-            elif is_flush:
-                # Flush (all same suit, not a straight)
-                hand = ("Flush", ranks)
-            elif is_straight:
-                # Straight (sequence, not same suit)
-                hand = ("Straight", ranks)
-            elif counts == [3, 1, 1]:
-                # Three of a kind
-                hand = ("Three of a Kind", ranks)
-            elif counts == [2, 2, 1]:
-                # Two pairs
-                hand = ("Two Pair", ranks)
-            elif counts == [2, 1, 1, 1]:
-                # One pair
-                hand = ("One Pair", ranks)
-            else:
-                # High card (no other combination)
-                hand = ("High Card", ranks)
-
-            # Compare current hand with best hand found so far
-            # First compare hand rankings, then specific card ranks if tied
-            if config.HAND_RANKINGS[hand[0]] > config.HAND_RANKINGS[best_hand[0]] or (
-                    config.HAND_RANKINGS[hand[0]] == config.HAND_RANKINGS[best_hand[0]] and hand[1] > best_hand[1]
-            ):
-                best_hand = hand
-
-        # Return the highest ranking hand found
-        return best_hand
\ No newline at end of file
+        # Fewer than five cards cannot form a hand yet
+        if len(cards) < 5:
+            return "High Card", [0]
+        return evaluator.describe(evaluator.evaluate_cards(cards))
+
+
+def _fromCode(code):
+    """Unpickling hook for Card"""
+    return Card._interned[code]
+
+
+Card._interned = [Card._intern(code) for code in range(evaluator.NUM_CARDS)]
+CARDS = tuple(Card._interned)  # Every card, in code order
@@ -1,6 +1,7 @@
 # Player configs
 INIT_MONEY = 10000
 USER_DATA_PATH = "./data"
+PLAYER_DB = "players.db"  # SQLite file under USER_DATA_PATH, see playerstore
 
 # Card configs
 CARD_NUMBER_RANK_MAP = {  # Ranks of the card number
@@ -10,6 +11,7 @@ CARD_NUMBER_RANK_MAP = {  # Ranks of the card number
 }
 
 CARD_TYPE_MAP = {"♠", "♥", "♣", "♦"}    # Club梅花
+CARD_SUITS = ("♠", "♥", "♣", "♦")    # Stable suit order used for integer card encoding
 
 HAND_RANKINGS = {   # Pattern
     "Royal Flush": 10,
@@ -0,0 +1,99 @@
+from array import array  # Compact byte storage for the 52 card codes
+import random  # Seeded and OS-entropy random generators
+import secrets  # Seed source for fresh replayable decks
+
+import card  # Interned Card instances indexed by code
+
+
+def seededRng(seed=None):
+    """Create a reproducible RNG for replays and tests
+
+    Args:
+        seed: Seed value; a random 64-bit seed is drawn when None
+
+    Returns:
+        random.Random instance
+    """
+    if seed is None:
+        seed = secrets.randbits(64)
+    return random.Random(seed)
+
+
+def secureRng():
+    """Create an RNG backed by os.urandom (the secrets module source) for live play"""
+    return random.SystemRandom()
+
+
+class Deck:
+    """A 52-card deck stored as a preallocated byte array of card codes.
+
+    Dealing moves a cursor through the array instead of popping list items, and
+    reset() reshuffles the same array in place, so a round never allocates cards.
+    draw(), burn() and peek() all work from the same end of the deck.
+    """
+
+    def __init__(self, rng=None):
+        """Initialize a shuffled deck
+
+        Args:
+            rng: Object with a shuffle() method (random.Random API); defaults to secureRng()
+        """
+        self.rng = rng if rng is not None else secureRng()
+        self._codes = array("B", range(len(card.CARDS)))  # Card codes in deal order
+        self._cursor = 0  # Index of the next card to deal
+        self.reset()
+
+    def reset(self):
+        """Return every card to the deck and reshuffle it in place"""
+        self._cursor = 0
+        self.rng.shuffle(self._codes)
+
+    def draw(self):
+        """Deal the next card
+
+        Returns:
+            The next Card instance
+
+        Raises:
+            IndexError: When the deck is empty
+        """
+        cursor = self._cursor
+        if cursor >= len(self._codes):
+            raise IndexError("draw from an empty deck")
+        self._cursor = cursor + 1
+        return card.CARDS[self._codes[cursor]]
+
+    def burn(self, count=1):
+        """Discard the next `count` cards face down
+
+        Raises:
+            IndexError: When fewer than `count` cards remain
+        """
+        if self._cursor + count > len(self._codes):
+            raise IndexError("burn past the end of the deck")
+        self._cursor += count
+
+    def peek(self, count=1):
+        """Return the next `count` cards (in deal order) without dealing them"""
+        return [card.CARDS[code] for code in self._codes[self._cursor:self._cursor + count]]
+
+    def remainingCodes(self):
+        """Return the codes of the undealt cards, in deal order"""
+        return self._codes[self._cursor:]
+
+    def __len__(self):
+        """Get the number of undealt cards"""
+        return len(self._codes) - self._cursor
+
+    def __iter__(self):
+        """Iterate over the undealt cards in deal order (does not deal them)"""
+        return (card.CARDS[code] for code in self._codes[self._cursor:])
+
+    def __getstate__(self):
+        """Pickle as the 52 codes plus the cursor; the RNG stays local"""
+        return bytes(self._codes), self._cursor
+
+    def __setstate__(self, state):
+        codes, self._cursor = state
+        self._codes = array("B", codes)
+        self.rng = secureRng()
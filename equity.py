@@ -0,0 +1,335 @@
+"""Monte Carlo hand equity.
+
+Deals the missing board cards and every opponent's hole cards from the cards
+left in ``round.CardPool`` and scores each runout with the fastest evaluator
+available (``batch_evaluator`` when NumPy is installed, ``evaluator`` otherwise).
+
+Trials are cut into fixed-size tasks and task ``i`` draws from an RNG seeded
+with ``(seed, i)``, so a given seed and trial budget always produce the same
+counts whatever the number of worker processes. Tasks are fanned out over a
+``ProcessPoolExecutor`` and are large enough that scaling stays close to linear.
+
+Heads-up on the turn or river only a few thousand runouts remain, so
+``exact_equity`` walks all of them instead. For every complete board it keeps
+the sorted strengths of all opponent holdings in an LRU ``BoardCache`` keyed by
+board and remaining deck; every player in the hand deals from the same pool, so
+the queries made as each of them acts reuse those tables.
+"""
+import os
+import random
+import secrets
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from itertools import combinations
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import evaluator
+
+try:
+    import numpy as np
+    import batch_evaluator
+except ImportError:  # Fall back to the scalar evaluator
+    np = None
+
+TASK_TRIALS = 20000  # Trials per worker task
+TIE_UNIT = 2520  # lcm(1..10): split pots stay exact integers for up to 9 opponents
+
+EquityResult = namedtuple("EquityResult", ["equity", "win", "tie", "lose", "trials", "seed"])
+
+
+def _simulateNumpy(hand, board, deck, opponents, trials, rng):
+    """Vectorized runouts; returns (wins, ties, equity units)."""
+    need = 5 - len(board)
+    draw = need + 2 * opponents
+    deckArray = np.asarray(deck, dtype=np.int32)
+    picks = deckArray[np.argsort(rng.random((trials, len(deck))), axis=1)[:, :draw]]
+
+    boards = np.empty((trials, 5), dtype=np.int32)
+    boards[:, :len(board)] = board
+    boards[:, len(board):] = picks[:, :need]
+
+    heroCards = np.empty((trials, 7), dtype=np.int32)
+    heroCards[:, :2] = hand
+    heroCards[:, 2:] = boards
+    hero = batch_evaluator.evaluate_batch(heroCards)
+
+    best = np.zeros(trials, dtype=np.int32)
+    bestCount = np.zeros(trials, dtype=np.int32)
+    oppCards = np.empty((trials, 7), dtype=np.int32)
+    oppCards[:, 2:] = boards
+    for i in range(opponents):
+        oppCards[:, :2] = picks[:, need + 2 * i:need + 2 * i + 2]
+        score = batch_evaluator.evaluate_batch(oppCards)
+        bestCount = np.where(score > best, 1, np.where(score == best, bestCount + 1, bestCount))
+        best = np.maximum(best, score)
+
+    win = hero > best
+    tie = hero == best
+    units = int(win.sum()) * TIE_UNIT + int((TIE_UNIT // (bestCount[tie] + 1)).sum())
+    return int(win.sum()), int(tie.sum()), units
+
+
+def _simulatePython(hand, board, deck, opponents, trials, rng):
+    """Scalar runouts; returns (wins, ties, equity units)."""
+    need = 5 - len(board)
+    draw = need + 2 * opponents
+    evaluate = evaluator.evaluate
+    wins = ties = units = 0
+    for _ in range(trials):
+        picks = rng.sample(deck, draw)
+        fullBoard = board + picks[:need]
+        hero = evaluate(hand + fullBoard)
+        best, bestCount = 0, 0
+        for i in range(need, draw, 2):
+            score = evaluate(picks[i:i + 2] + fullBoard)
+            if score > best:
+                best, bestCount = score, 1
+            elif score == best:
+                bestCount += 1
+        if hero > best:
+            wins += 1
+            units += TIE_UNIT
+        elif hero == best:
+            ties += 1
+            units += TIE_UNIT // (bestCount + 1)
+    return wins, ties, units
+
+
+def _runTask(hand, board, deck, opponents, trials, seed, index):
+    """Worker entry point: simulate one deterministic task."""
+    if np is not None:
+        rng = np.random.default_rng([seed, index])
+        return _simulateNumpy(hand, board, deck, opponents, trials, rng)
+    rng = random.Random(seed * 1000003 + index)
+    return _simulatePython(hand, board, deck, opponents, trials, rng)
+
+
+def _taskSizes(trials):
+    """Yield task sizes until the trial budget is spent (forever for time-only budgets)."""
+    index = 0
+    while trials is None or index * TASK_TRIALS < trials:
+        if trials is None:
+            yield TASK_TRIALS
+        else:
+            yield min(TASK_TRIALS, trials - index * TASK_TRIALS)
+        index += 1
+
+
+def _codes(cards):
+    """Encode Card instances, skipping empty board slots."""
+    return [c if isinstance(c, int) else evaluator.encode_card(c) for c in cards if c is not None]
+
+
+def monte_carlo_equity(hand, board=(), opponents=1, deck=None, trials=100000, time_budget=None,
+                       seed=None, workers=None):
+    """Estimate the equity of a hand by sampling runouts.
+
+    Args:
+        hand: The player's two hole cards (Card instances or codes)
+        board: Known public cards; None slots are ignored
+        opponents: Number of opponents still in the hand
+        deck: Cards left to deal from (e.g. a CardPool); defaults to all unseen cards
+        trials: Trial budget, or None to run until time_budget expires
+        time_budget: Optional wall-clock budget in seconds
+        seed: RNG seed; a random one is chosen (and reported) when None
+        workers: Worker processes; defaults to os.cpu_count(), 1 runs in-process
+
+    Returns:
+        EquityResult with equity (win + split share), win/tie/lose rates, trials run and the seed
+
+    Raises:
+        ValueError: When the budgets or the card counts are inconsistent
+    """
+    if trials is None and time_budget is None:
+        raise ValueError("a trial budget or a time budget is required")
+    hand = _codes(hand)
+    board = _codes(board)
+    if len(hand) != 2 or len(board) > 5 or opponents < 1:
+        raise ValueError("need 2 hole cards, at most 5 board cards and at least 1 opponent")
+    if deck is None:
+        known = set(hand + board)
+        deck = [c for c in range(evaluator.NUM_CARDS) if c not in known]
+    else:
+        deck = _codes(deck)
+    if len(deck) < 5 - len(board) + 2 * opponents:
+        raise ValueError("not enough cards left in the deck")
+
+    if seed is None:
+        seed = secrets.randbits(63)
+    workers = workers or os.cpu_count() or 1
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    sizes = _taskSizes(trials)
+    totals = [0, 0, 0, 0]  # wins, ties, units, trials
+
+    def collect(size, outcome):
+        for i, value in enumerate(outcome + (size,)):
+            totals[i] += value
+
+    if workers == 1:
+        for index, size in enumerate(sizes):
+            if deadline is not None and index and time.perf_counter() >= deadline:
+                break
+            collect(size, _runTask(hand, board, deck, opponents, size, seed, index))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {}
+            index = 0
+            for size in sizes:
+                if deadline is not None and index and time.perf_counter() >= deadline:
+                    break
+                # Keep two tasks per worker in flight
+                while len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(pending.pop(future), future.result())
+                future = pool.submit(_runTask, hand, board, deck, opponents, size, seed, index)
+                pending[future] = size
+                index += 1
+            for future in pending:
+                collect(pending[future], future.result())
+
+    wins, ties, units, total = totals
+    return EquityResult(
+        equity=units / (TIE_UNIT * total),
+        win=wins / total,
+        tie=ties / total,
+        lose=(total - wins - ties) / total,
+        trials=total,
+        seed=seed,
+    )
+
+
+class BoardCache:
+    """LRU cache of per-board opponent strength tables."""
+
+    def __init__(self, maxsize=2048):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached table for key (marking it recently used), or None."""
+        table = self._entries.get(key)
+        if table is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return table
+
+    def put(self, key, table):
+        """Store a table, evicting the least recently used entry when full."""
+        self._entries[key] = table
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+_boardCache = BoardCache()
+
+
+def _opponentStrengths(board, deck):
+    """Sorted strengths of every two-card holding left in deck on a complete board."""
+    live = [c for c in deck if c not in board]
+    if np is not None:
+        first, second = np.triu_indices(len(live), 1)
+        liveArray = np.asarray(live, dtype=np.int32)
+        cards = np.empty((len(first), 7), dtype=np.int32)
+        cards[:, 0] = liveArray[first]
+        cards[:, 1] = liveArray[second]
+        cards[:, 2:] = board
+        return array("i", np.sort(batch_evaluator.evaluate_batch(cards)).tobytes())
+    board = list(board)
+    return array("i", sorted(evaluator.evaluate([a, b] + board) for a, b in combinations(live, 2)))
+
+
+def exact_equity(hand, board=(), deck=None, cache=None):
+    """Exact heads-up equity by enumerating every remaining runout and opponent holding.
+
+    Args:
+        hand: The player's two hole cards (Card instances or codes)
+        board: Known public cards; None slots are ignored
+        deck: Cards left to deal from (e.g. a CardPool); defaults to all unseen cards
+        cache: BoardCache for per-board tables; defaults to a process-wide cache
+
+    Returns:
+        EquityResult whose trials is the number of (runout, holding) pairs enumerated
+
+    Raises:
+        ValueError: When the card counts are inconsistent
+    """
+    hand = _codes(hand)
+    board = _codes(board)
+    if len(hand) != 2 or len(board) > 5:
+        raise ValueError("need 2 hole cards and at most 5 board cards")
+    known = set(hand + board)
+    deck = [c for c in (range(evaluator.NUM_CARDS) if deck is None else _codes(deck)) if c not in known]
+    need = 5 - len(board)
+    if len(deck) < need + 2:
+        raise ValueError("not enough cards left in the deck")
+    if cache is None:
+        cache = _boardCache
+
+    deckKey = 0
+    for c in deck:
+        deckKey |= 1 << c
+
+    wins = ties = total = 0
+    for runout in combinations(deck, need):
+        fullBoard = tuple(sorted(board + list(runout)))
+        key = (fullBoard, deckKey)
+        table = cache.get(key)
+        if table is None:
+            table = _opponentStrengths(fullBoard, deck)
+            cache.put(key, table)
+        hero = evaluator.evaluate(hand + list(fullBoard))
+        below = bisect_left(table, hero)
+        wins += below
+        ties += bisect_right(table, hero, below) - below
+        total += len(table)
+
+    return EquityResult(
+        equity=(wins + ties / 2) / total,
+        win=wins / total,
+        tie=ties / total,
+        lose=(total - wins - ties) / total,
+        trials=total,
+        seed=None,
+    )
+
+
+def room_equity(room, player, exact=None, **kwargs):
+    """Equity of a player's hand in a round.Room, dealing from room.cards.
+
+    Args:
+        room: Room whose publicCardPool, activePlayers and cards describe the hand
+        player: Player (or PlayerInGame) holding handCards
+        exact: Force (True) or forbid (False) enumeration; by default it is used
+            heads-up once the turn is out
+        **kwargs: Passed through to monte_carlo_equity
+
+    Returns:
+        EquityResult
+
+    Raises:
+        ValueError: When exact enumeration is forced with more than one opponent
+    """
+    opponents = max(1, len(room.activePlayers) - 1)
+    if exact is None:
+        board = [c for c in room.publicCardPool if c is not None]
+        exact = opponents == 1 and len(board) >= 4
+    if exact:
+        if opponents != 1:
+            raise ValueError("exact equity is only available heads-up")
+        return exact_equity(player.handCards, room.publicCardPool, deck=room.cards)
+    return monte_carlo_equity(player.handCards, room.publicCardPool, opponents, deck=room.cards, **kwargs)
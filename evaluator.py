@@ -0,0 +1,250 @@
+"""Table-driven Texas Hold'em hand evaluator.
+
+Cards are encoded as small integers ``suit * 13 + (rank - 2)`` (0-51), where the
+suit index follows ``config.CARD_SUITS`` and ranks run 2..14 (ace high).
+``evaluate`` folds 5, 6 or 7 such codes into per-suit and per-multiplicity rank
+bitmasks in a single pass and resolves the hand through precomputed 13-bit
+tables, so no 5-card combination is ever enumerated.
+
+The returned strength is a plain integer: the category (``config.HAND_RANKINGS``
+value) in the high bits followed by the five significant ranks as 4-bit nibbles.
+A larger strength always means a better hand, and equal strengths tie.
+"""
+import config
+
+RANK_SHIFT = 20  # Category lives above the five 4-bit rank nibbles
+NUM_CARDS = 52
+
+HIGH_CARD = config.HAND_RANKINGS["High Card"]
+ONE_PAIR = config.HAND_RANKINGS["One Pair"]
+TWO_PAIR = config.HAND_RANKINGS["Two Pair"]
+THREE_OF_A_KIND = config.HAND_RANKINGS["Three of a Kind"]
+STRAIGHT = config.HAND_RANKINGS["Straight"]
+FLUSH = config.HAND_RANKINGS["Flush"]
+FULL_HOUSE = config.HAND_RANKINGS["Full House"]
+FOUR_OF_A_KIND = config.HAND_RANKINGS["Four of a Kind"]
+STRAIGHT_FLUSH = config.HAND_RANKINGS["Straight Flush"]
+ROYAL_FLUSH = config.HAND_RANKINGS["Royal Flush"]
+
+HAND_NAMES = {value: name for name, value in config.HAND_RANKINGS.items()}
+
+# Per-card lookups, indexed by card code
+CARD_RANK = tuple(code % 13 + 2 for code in range(NUM_CARDS))
+CARD_SUIT = tuple(code // 13 for code in range(NUM_CARDS))
+CARD_BIT = tuple(1 << (code % 13) for code in range(NUM_CARDS))
+
+
+def _pack(ranks):
+    """Pack up to five ranks into left-aligned 4-bit nibbles."""
+    value = 0
+    for i, rank in enumerate(ranks):
+        value |= rank << (4 * (4 - i))
+    return value
+
+
+def _buildTables():
+    """Precompute every lookup keyed by a 13-bit rank mask."""
+    size = 1 << 13
+    popcount = [0] * size
+    top1 = [0] * size
+    top2 = [0] * size
+    top3 = [0] * size
+    top5 = [0] * size
+    straightHigh = [0] * size
+
+    wheel = (1 << 12) | 0b1111  # A-2-3-4-5
+    for mask in range(size):
+        ranks = [bit + 2 for bit in range(12, -1, -1) if mask >> bit & 1]
+        popcount[mask] = len(ranks)
+        # Kicker tables are stored unshifted so callers can place them freely
+        top1[mask] = ranks[0] if ranks else 0
+        top2[mask] = _pack(ranks[:2]) >> 12
+        top3[mask] = _pack(ranks[:3]) >> 8
+        top5[mask] = _pack(ranks[:5])
+
+        for high in range(14, 5, -1):
+            window = 0b11111 << (high - 6)
+            if mask & window == window:
+                straightHigh[mask] = high
+                break
+        else:
+            if mask & wheel == wheel:
+                straightHigh[mask] = 5
+
+    straightRanks = [0] * 15
+    for high in range(5, 15):
+        ranks = [high - i for i in range(5)]
+        if high == 5:
+            ranks[-1] = 1  # Ace plays low in the wheel
+        straightRanks[high] = _pack(ranks)
+
+    return (tuple(popcount), tuple(top1), tuple(top2), tuple(top3), tuple(top5),
+            tuple(straightHigh), tuple(straightRanks))
+
+
+POPCOUNT, TOP1, TOP2, TOP3, TOP5, STRAIGHT_HIGH, STRAIGHT_RANKS = _buildTables()
+
+
+def evaluate(codes):
+    """Score 5, 6 or 7 encoded cards.
+
+    Args:
+        codes: Iterable of card codes in range 0-51
+
+    Returns:
+        int: Comparable hand strength (higher is better)
+
+    Raises:
+        ValueError: When fewer than 5 or more than 7 cards are given
+    """
+    suits = [0, 0, 0, 0]
+    seen1 = seen2 = seen3 = seen4 = 0  # Ranks seen at least 1/2/3/4 times
+    count = 0
+    for code in codes:
+        bit = CARD_BIT[code]
+        suits[CARD_SUIT[code]] |= bit
+        if seen1 & bit:
+            if seen2 & bit:
+                if seen3 & bit:
+                    seen4 |= bit
+                else:
+                    seen3 |= bit
+            else:
+                seen2 |= bit
+        else:
+            seen1 |= bit
+        count += 1
+
+    if not 5 <= count <= 7:
+        raise ValueError("evaluate() needs 5 to 7 cards")
+    return _resolve(suits, seen1, seen2, seen3, seen4)
+
+
+def _resolve(suits, seen1, seen2, seen3, seen4):
+    """Turn the folded suit and multiplicity masks into a strength."""
+    # With at most 7 cards a flush rules out quads and full houses
+    for mask in suits:
+        if POPCOUNT[mask] >= 5:
+            high = STRAIGHT_HIGH[mask]
+            if high:
+                category = ROYAL_FLUSH if high == 14 else STRAIGHT_FLUSH
+                return category << RANK_SHIFT | STRAIGHT_RANKS[high]
+            return FLUSH << RANK_SHIFT | TOP5[mask]
+
+    if seen4:
+        quad = TOP1[seen4]
+        kicker = TOP1[seen1 & ~(1 << (quad - 2))]
+        return FOUR_OF_A_KIND << RANK_SHIFT | quad * 0x11110 | kicker
+
+    if seen3:
+        trip = TOP1[seen3]
+        tripBit = 1 << (trip - 2)
+        pairMask = seen2 & ~tripBit
+        if pairMask:
+            pair = TOP1[pairMask]
+            return FULL_HOUSE << RANK_SHIFT | trip * 0x11100 | pair * 0x11
+
+    high = STRAIGHT_HIGH[seen1]
+    if high:
+        return STRAIGHT << RANK_SHIFT | STRAIGHT_RANKS[high]
+
+    if seen3:
+        return THREE_OF_A_KIND << RANK_SHIFT | trip * 0x11100 | TOP2[seen1 & ~tripBit]
+
+    if seen2:
+        pair = TOP1[seen2]
+        pairBit = 1 << (pair - 2)
+        rest = seen2 & ~pairBit
+        if rest:
+            low = TOP1[rest]
+            kicker = TOP1[seen1 & ~pairBit & ~(1 << (low - 2))]
+            return TWO_PAIR << RANK_SHIFT | pair * 0x11000 | low * 0x110 | kicker
+        return ONE_PAIR << RANK_SHIFT | pair * 0x11000 | TOP3[seen1 & ~pairBit]
+
+    return HIGH_CARD << RANK_SHIFT | TOP5[seen1]
+
+
+def evaluate_board(holes, board):
+    """Score several hole-card pairs against one shared board in a single call.
+
+    The board is folded into the suit and multiplicity masks once; each hand
+    then only adds its own cards, which is what a showdown needs.
+
+    Args:
+        holes: Sequence of hole-card code sequences (usually pairs)
+        board: Board card codes shared by every hand
+
+    Returns:
+        list: Strength of each hand, in the order of `holes`
+
+    Raises:
+        ValueError: When a hand plus the board is not 5 to 7 cards
+    """
+    suits = [0, 0, 0, 0]
+    seen1 = seen2 = seen3 = seen4 = 0
+    for code in board:
+        bit = CARD_BIT[code]
+        suits[CARD_SUIT[code]] |= bit
+        seen4 |= seen3 & bit
+        seen3 |= seen2 & bit
+        seen2 |= seen1 & bit
+        seen1 |= bit
+    boardCount = len(board)
+
+    strengths = []
+    for hole in holes:
+        if not 5 <= boardCount + len(hole) <= 7:
+            raise ValueError("evaluate_board() needs 5 to 7 cards per hand")
+        handSuits = suits[:]
+        s1, s2, s3, s4 = seen1, seen2, seen3, seen4
+        for code in hole:
+            bit = CARD_BIT[code]
+            handSuits[CARD_SUIT[code]] |= bit
+            s4 |= s3 & bit
+            s3 |= s2 & bit
+            s2 |= s1 & bit
+            s1 |= bit
+        strengths.append(_resolve(handSuits, s1, s2, s3, s4))
+    return strengths
+
+
+def encode_card(card):
+    """Convert a card.Card instance to its integer code.
+
+    Args:
+        card: Card instance (which carries its code)
+
+    Returns:
+        int: Card code in range 0-51
+    """
+    return card.code
+
+
+def encode_cards(cards):
+    """Convert an iterable of Card instances to a list of codes."""
+    return [c.code for c in cards]
+
+
+def evaluate_cards(cards):
+    """Score 5 to 7 Card instances, see ``evaluate``."""
+    return evaluate(encode_cards(cards))
+
+
+def hand_category(strength):
+    """Return the HAND_RANKINGS value of a strength."""
+    return strength >> RANK_SHIFT
+
+
+def hand_name(strength):
+    """Return the hand name of a strength, e.g. 'Full House'."""
+    return HAND_NAMES[strength >> RANK_SHIFT]
+
+
+def hand_ranks(strength):
+    """Return the five significant ranks of a strength, most significant first."""
+    return [(strength >> (4 * (4 - i))) & 0xF for i in range(5)]
+
+
+def describe(strength):
+    """Return the (name, ranks) tuple used by card.Card.getPattens."""
+    return hand_name(strength), hand_ranks(strength)
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+steam_wrapper 的纯 Python 替身，用于没有 Steam 客户端时压测大厅和网络逻辑
+
+FakeSteamWorld 模拟 Steam 后端（大厅、大厅数据、成员数据、好友），每个
+FakeSteam 是其中一个客户端，方法名与 steam_wrapper 的模块函数一一对应，
+回调 513 / 504 / 505 / 506 / 304 在该客户端调用 run_callbacks() 时派发。
+
+单个客户端可以直接顶替模块：
+
+    import fake_steam_wrapper
+    fake_steam_wrapper.install()          # sys.modules["steam_wrapper"] 指向本模块
+    import Lobby                           # Lobby 里的 steam.* 调用都走假后端
+
+多个客户端在同一进程里各自持有一个 FakeSteam（可作为 steam_async.SteamAsync
+的 steam 参数），网络消息用 world.hub（loopback.LoopbackHub）传输：
+
+    world = FakeSteamWorld()
+    clients = [world.client(f"bot{i}") for i in range(32)]
+    messengers = [net.SteamNetworkMessenger(transport=c.transport()) for c in clients]
+"""
+import sys
+import weakref
+from collections import deque
+
+import loopback
+
+CBID_LobbyCreated = 513
+CBID_GameLobbyJoinRequested = 333
+CBID_LobbyEnter = 504
+CBID_LobbyChatUpdate = 506
+CBID_LobbyDataUpdate = 505
+CBID_LobbyInvite = 503
+CBID_GameRichPresenceJoinRequested = 337
+CBID_GameOverlayActivated = 331
+CBID_PersonaStateChange = 304
+SUPPORTED_CALLBACKS = (513, 333, 504, 506, 505, 503, 337, 331, 304)
+
+k_EResultOK = 1
+k_EResultFail = 2
+# EChatRoomEnterResponse
+k_EChatRoomEnterResponseSuccess = 1
+k_EChatRoomEnterResponseDoesntExist = 2
+k_EChatRoomEnterResponseNotAllowed = 3
+k_EChatRoomEnterResponseFull = 4
+# EChatMemberStateChange
+k_EChatMemberStateChangeEntered = 0x0001
+k_EChatMemberStateChangeLeft = 0x0002
+# EPersonaChange
+k_EPersonaChangeName = 0x0001
+
+FIRST_STEAM_ID = 76561198000000000
+FIRST_LOBBY_ID = 109775240000000000
+
+
+class _FakeLobby:
+    def __init__(self, lobby_id, owner, lobby_type, max_members):
+        self.lobby_id = lobby_id
+        self.owner = owner
+        self.lobby_type = lobby_type
+        self.max_members = max_members
+        self.joinable = True
+        self.members = []  # 按加入顺序的 Steam ID
+        self.data = {}
+        self.member_data = {}  # Steam ID -> {key: value}
+
+
+class FakeSteamWorld:
+    """模拟的 Steam 后端：所有客户端共享的大厅和好友状态"""
+
+    def __init__(self):
+        self.clients = {}  # Steam ID -> FakeSteam
+        self.lobbies = {}  # 大厅 ID -> _FakeLobby
+        self.hub = loopback.LoopbackHub()  # 网络消息
+        self._next_steam_id = FIRST_STEAM_ID
+        self._next_lobby_id = FIRST_LOBBY_ID
+        self._next_call = 1
+
+    def client(self, persona_name: str = None, steam_id: int = None):
+        """创建一个模拟客户端"""
+        if steam_id is None:
+            steam_id = self._next_steam_id
+            self._next_steam_id += 1
+        client = FakeSteam(self, steam_id, persona_name or f"player{steam_id - FIRST_STEAM_ID}")
+        self.clients[steam_id] = client
+        return client
+
+    def _call_handle(self):
+        """生成 SteamAPICall_t"""
+        handle = self._next_call
+        self._next_call += 1
+        return handle
+
+    def _post(self, steam_id, callback_id, data):
+        client = self.clients.get(steam_id)
+        if client is not None:
+            client._pending.append((callback_id, data))
+
+    def _broadcast(self, lobby, callback_id, data, exclude=None):
+        for member in lobby.members:
+            if member != exclude:
+                self._post(member, callback_id, dict(data))
+
+    def _create_lobby(self, owner, lobby_type, max_members):
+        lobby = _FakeLobby(self._next_lobby_id, owner, lobby_type, max_members)
+        self._next_lobby_id += 1
+        self.lobbies[lobby.lobby_id] = lobby
+        lobby.members.append(owner)
+        lobby.member_data[owner] = {}
+        self._post(owner, CBID_LobbyCreated, {'m_eResult': k_EResultOK, 'm_ulSteamIDLobby': lobby.lobby_id})
+        self._post(owner, CBID_LobbyEnter, {'m_ulSteamIDLobby': lobby.lobby_id, 'm_bLocked': False,
+                                            'm_EChatRoomEnterResponse': k_EChatRoomEnterResponseSuccess})
+        return lobby
+
+    def _join_lobby(self, steam_id, lobby_id):
+        lobby = self.lobbies.get(lobby_id)
+        if lobby is None:
+            response = k_EChatRoomEnterResponseDoesntExist
+        elif steam_id in lobby.members:
+            response = k_EChatRoomEnterResponseSuccess
+        elif not lobby.joinable:
+            response = k_EChatRoomEnterResponseNotAllowed
+        elif len(lobby.members) >= lobby.max_members:
+            response = k_EChatRoomEnterResponseFull
+        else:
+            response = k_EChatRoomEnterResponseSuccess
+            lobby.members.append(steam_id)
+            lobby.member_data[steam_id] = {}
+            self._broadcast(lobby, CBID_LobbyChatUpdate, {
+                'm_ulSteamIDLobby': lobby_id, 'm_ulSteamIDUserChanged': steam_id,
+                'm_ulSteamIDMakingChange': steam_id,
+                'm_rgfChatMemberStateChange': k_EChatMemberStateChangeEntered}, exclude=steam_id)
+        self._post(steam_id, CBID_LobbyEnter, {'m_ulSteamIDLobby': lobby_id, 'm_bLocked': False,
+                                               'm_EChatRoomEnterResponse': response})
+
+    def _leave_lobby(self, steam_id, lobby_id):
+        lobby = self.lobbies.get(lobby_id)
+        if lobby is None or steam_id not in lobby.members:
+            return
+        lobby.members.remove(steam_id)
+        lobby.member_data.pop(steam_id, None)
+        if not lobby.members:
+            del self.lobbies[lobby_id]
+            return
+        if lobby.owner == steam_id:
+            lobby.owner = lobby.members[0]  # 与 Steam 一样，房主转给下一位成员
+        self._broadcast(lobby, CBID_LobbyChatUpdate, {
+            'm_ulSteamIDLobby': lobby_id, 'm_ulSteamIDUserChanged': steam_id,
+            'm_ulSteamIDMakingChange': steam_id, 'm_rgfChatMemberStateChange': k_EChatMemberStateChangeLeft})
+
+    def _persona_changed(self, steam_id, change_flags):
+        # 好友（同一 world 里的其他客户端）都会收到 PersonaStateChange
+        for sid in self.clients:
+            if sid != steam_id:
+                self._post(sid, CBID_PersonaStateChange, {'m_ulSteamID': steam_id, 'm_nChangeFlags': change_flags})
+
+    def _data_updated(self, lobby, member_id):
+        self._broadcast(lobby, CBID_LobbyDataUpdate, {'m_ulSteamIDLobby': lobby.lobby_id,
+                                                      'm_ulSteamIDMember': member_id, 'm_bSuccess': True})
+
+
+class FakeSteam:
+    """FakeSteamWorld 中的一个客户端，接口与 steam_wrapper 模块相同"""
+
+    def __init__(self, world: FakeSteamWorld, steam_id: int, persona_name: str):
+        self.world = world
+        self.steam_id = steam_id
+        self.persona_name = persona_name
+        self.rich_presence = {}
+        self.launch_params = {}
+        self._pending = deque()  # 待派发的 (回调 ID, 数据)
+        self._callbacks = weakref.WeakSet()  # 和真实的 SteamCallback 一样，对象被回收即注销
+
+        client = self
+
+        class SteamCallback:
+            """与 steam_wrapper.SteamCallback 相同的构造方式：SteamCallback(callback_id, func)"""
+
+            def __init__(self, callback_id, py_callback):
+                if callback_id not in SUPPORTED_CALLBACKS:
+                    raise TypeError(f"Callback ID {callback_id} is not supported yet.")
+                self.callback_id = callback_id
+                self._py_callback = py_callback
+                client._callbacks.add(self)
+
+        self.SteamCallback = SteamCallback
+
+    def transport(self):
+        """本客户端在 world.hub 上的网络传输层"""
+        return self.world.hub.transport(self.steam_id)
+
+    # ---- 生命周期 ----
+    def init(self):
+        pass
+
+    def shutdown(self):
+        for lobby in list(self.world.lobbies.values()):
+            self.world._leave_lobby(self.steam_id, lobby.lobby_id)
+
+    def run_callbacks(self):
+        pending = self._pending
+        for _ in range(len(pending)):  # 回调里新产生的回调留到下一次
+            callback_id, data = pending.popleft()
+            for callback in list(self._callbacks):
+                if callback.callback_id == callback_id:
+                    callback._py_callback(data)
+
+    # ---- User / Apps / Utils ----
+    def get_my_steam_id(self):
+        return self.steam_id
+
+    def get_launch_query_param(self, key):
+        return self.launch_params.get(key, "").encode("utf-8")
+
+    def is_overlay_enabled(self):
+        return False
+
+    # ---- Friends ----
+    def get_my_persona_name(self):
+        return self.persona_name
+
+    def set_persona_name(self, persona_name):
+        """测试用：改昵称，好友们收到 PersonaStateChange（steam_wrapper 没有这个函数）"""
+        self.persona_name = persona_name
+        self.world._persona_changed(self.steam_id, k_EPersonaChangeName)
+
+    def activate_game_overlay_invite_dialog(self, lobby_id_int):
+        pass
+
+    def set_rich_presence(self, key, value):
+        self.rich_presence[key] = value
+
+    def clear_rich_presence(self):
+        self.rich_presence.clear()
+
+    def _friends(self):
+        # 同一个 world 里的其他客户端都互为好友
+        return [sid for sid in self.world.clients if sid != self.steam_id]
+
+    def get_friend_count(self, iFriendFlags):
+        return len(self._friends())
+
+    def get_friend_by_index(self, iFriend, iFriendFlags):
+        friends = self._friends()
+        return friends[iFriend] if 0 <= iFriend < len(friends) else None
+
+    def get_friend_persona_name(self, steamIDFriend):
+        client = self.world.clients.get(steamIDFriend)
+        return client.persona_name if client is not None else ""
+
+    def get_friends(self, iFriendFlags):
+        return tuple((sid, self.get_friend_persona_name(sid)) for sid in self._friends())
+
+    # ---- Matchmaking ----
+    def create_lobby(self, lobby_type, max_members):
+        self.world._create_lobby(self.steam_id, lobby_type, max_members)
+        return self.world._call_handle()
+
+    def join_lobby(self, lobby_id_int):
+        self.world._join_lobby(self.steam_id, lobby_id_int)
+        return self.world._call_handle()
+
+    def leave_lobby(self, lobby_id_int):
+        self.world._leave_lobby(self.steam_id, lobby_id_int)
+
+    def _lobby(self, lobby_id_int):
+        return self.world.lobbies.get(lobby_id_int)
+
+    def get_lobby_data(self, lobby_id_int, key):
+        lobby = self._lobby(lobby_id_int)
+        return lobby.data.get(key, "") if lobby is not None else ""
+
+    def set_lobby_data(self, lobby_id_int, key, value):
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None or lobby.owner != self.steam_id:
+            return False
+        lobby.data[key] = value
+        self.world._data_updated(lobby, lobby_id_int)
+        return True
+
+    def get_lobby_member_by_index(self, lobby_id_int, iMember):
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None or not 0 <= iMember < len(lobby.members):
+            return 0
+        return lobby.members[iMember]
+
+    def get_num_lobby_members(self, lobby_id_int):
+        lobby = self._lobby(lobby_id_int)
+        return len(lobby.members) if lobby is not None else 0
+
+    def get_lobby_members(self, lobby_id_int):
+        lobby = self._lobby(lobby_id_int)
+        return tuple(lobby.members) if lobby is not None else ()
+
+    def get_all_member_data(self, lobby_id_int, keys):
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None:
+            return ()
+        return tuple((sid, self.get_friend_persona_name(sid),
+                      tuple(lobby.member_data.get(sid, {}).get(key, "").encode("utf-8") for key in keys))
+                     for sid in lobby.members)
+
+    def get_lobby_member_data(self, lobby_id_int, steam_id_int, key):
+        # 与 steam_wrapper 一致，返回 bytes
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None:
+            return None
+        return lobby.member_data.get(steam_id_int, {}).get(key, "").encode("utf-8")
+
+    def set_lobby_member_data(self, lobby_id_int, key, value):
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None or self.steam_id not in lobby.members:
+            return
+        lobby.member_data[self.steam_id][key] = value
+        self.world._data_updated(lobby, self.steam_id)
+
+    def set_lobby_joinable(self, lobby_id_int, bLobbyJoinable):
+        lobby = self._lobby(lobby_id_int)
+        if lobby is None or lobby.owner != self.steam_id:
+            return False
+        lobby.joinable = bool(bLobbyJoinable)
+        return True
+
+
+# ======== 模块级接口：让本模块本身可以顶替 steam_wrapper ========
+
+_API = ("init", "shutdown", "run_callbacks", "get_my_steam_id", "get_launch_query_param", "is_overlay_enabled",
+        "get_my_persona_name", "activate_game_overlay_invite_dialog", "set_rich_presence", "clear_rich_presence",
+        "get_friend_count", "get_friend_by_index", "get_friend_persona_name", "get_friends", "create_lobby",
+        "join_lobby", "leave_lobby", "get_lobby_data", "set_lobby_data", "get_lobby_member_by_index",
+        "get_num_lobby_members", "get_lobby_members", "get_all_member_data", "get_lobby_member_data",
+        "set_lobby_member_data", "set_lobby_joinable", "SteamCallback")
+
+world = None  # install() 创建的默认 world
+client = None  # 模块级函数所绑定的客户端
+
+
+def use(fake: FakeSteam):
+    """把模块级的 steam_wrapper 函数绑定到某个客户端"""
+    global client
+    client = fake
+    module = sys.modules[__name__]
+    for name in _API:
+        setattr(module, name, getattr(fake, name))
+
+
+def install(persona_name: str = "player", fake_world: FakeSteamWorld = None):
+    """
+    让 `import steam_wrapper` 得到本模块，并绑定一个新客户端
+
+    Returns:
+        FakeSteam: 绑定的客户端
+    """
+    global world
+    world = fake_world if fake_world is not None else (world or FakeSteamWorld())
+    fake = world.client(persona_name)
+    use(fake)
+    sys.modules["steam_wrapper"] = sys.modules[__name__]
+    return fake
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+好友列表缓存 —— 每个会话只批量读取一次，之后靠 PersonaStateChange 增量更新
+
+第一次 get() 时用 steam_wrapper.get_friends() 一次读完整个好友列表（旧版
+steam_wrapper.pyd 没有批量接口时退回逐个读取）；之后：
+  - 好友改名（k_EPersonaChangeName / NameFirstSet / Nickname）只重读这一个人的昵称
+  - 好友关系变化（k_EPersonaChangeRelationshipChanged）才重新批量读取一次
+Lobby 每次构造都直接拿缓存，好友再多界面也是立即打开；界面按 version 判断要不要刷新。
+旧版 steam_wrapper.pyd 不支持回调 304 时退化为只读取一次，不再自动更新。
+"""
+import steam_wrapper
+
+CBID_PersonaStateChange = 304
+
+k_EFriendFlagImmediate = 4  # 普通好友
+
+# EPersonaChange
+k_EPersonaChangeName = 0x0001
+k_EPersonaChangeRelationshipChanged = 0x0200
+k_EPersonaChangeNameFirstSet = 0x0400
+k_EPersonaChangeNickname = 0x1000
+
+NAME_CHANGES = k_EPersonaChangeName | k_EPersonaChangeNameFirstSet | k_EPersonaChangeNickname
+
+
+class FriendsCache:
+    """好友 Steam ID -> 昵称（按 Steam 返回的顺序）"""
+
+    def __init__(self, steam=steam_wrapper, flags: int = k_EFriendFlagImmediate):
+        """
+        Args:
+            steam: 已 init() 的 steam_wrapper 模块
+            flags: EFriendFlags，默认只要普通好友
+        """
+        self.steam = steam
+        self.flags = flags
+        self._names = {}
+        self.version = 0  # 好友或昵称每变化一次 +1
+        self.live = False  # 是否收到 PersonaStateChange 增量更新
+        self._started = False
+        self._callback = None
+
+    def load(self):
+        """批量读取整个好友列表"""
+        steam = self.steam
+        if hasattr(steam, "get_friends"):
+            friends = steam.get_friends(self.flags)
+        else:  # 旧版 steam_wrapper.pyd：每个好友两次调用
+            friends = []
+            for i in range(max(0, steam.get_friend_count(self.flags))):
+                fid = steam.get_friend_by_index(i, self.flags)
+                friends.append((fid, steam.get_friend_persona_name(fid)))
+        self._names = {fid: name for fid, name in friends if fid}
+        self.version += 1
+
+    def start(self):
+        """读取好友列表并开始监听 PersonaStateChange（重复调用无副作用）"""
+        if self._started:
+            return
+        self._started = True
+        try:
+            self._callback = self.steam.SteamCallback(CBID_PersonaStateChange, self.on_persona_state_change)
+            self.live = True
+        except TypeError as e:  # 旧版 steam_wrapper.pyd：SteamCallback 不认识 304
+            print(f"[FriendsCache] 好友列表只读取一次，不会随好友改名更新: {e}")
+        self.load()
+
+    def stop(self):
+        """注销回调（SteamCallback 对象被回收即注销）"""
+        self._callback = None
+        self.live = False
+        self._started = False
+
+    def on_persona_state_change(self, data) -> bool:
+        """
+        处理 PersonaStateChange：只更新发生变化的那个好友
+
+        Returns:
+            bool: 好友列表是否变化
+        """
+        flags = data['m_nChangeFlags']
+        if flags & k_EPersonaChangeRelationshipChanged:
+            self.load()  # 加 / 删好友很少见，直接整体重读
+            return True
+        steam_id = data['m_ulSteamID']
+        if not flags & NAME_CHANGES or steam_id not in self._names:
+            return False
+        name = self.steam.get_friend_persona_name(steam_id)
+        if name == self._names[steam_id]:
+            return False
+        self._names[steam_id] = name
+        self.version += 1
+        return True
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, steam_id):
+        return steam_id in self._names
+
+    def ids(self):
+        return list(self._names)
+
+    def names(self):
+        """好友昵称（空昵称显示为 "Unknown"）"""
+        return [name or "Unknown" for name in self._names.values()]
+
+    def name(self, steam_id, default=""):
+        return self._names.get(steam_id, default)
+
+
+_cache = None
+
+
+def get(steam=steam_wrapper):
+    """本会话共用的好友缓存，第一次调用时读取并注册回调"""
+    global _cache
+    if _cache is None or _cache.steam is not steam:
+        _cache = FriendsCache(steam)
+        _cache.start()
+    return _cache
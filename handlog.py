@@ -0,0 +1,239 @@
+"""Append-only binary hand history.
+
+Every event of a session (deal, bet, fold, board card, payout) is one fixed
+16-byte record appended to ``<name>.hands``; a sidecar ``<name>.hands.idx``
+holds one 8-byte record number per hand, appended when the hand starts. Both
+files only ever grow, so a crash loses at most the unflushed tail, and the
+reader memory-maps them: streaming millions of hands or jumping straight to
+hand N never loads the whole log.
+
+Record layout (little-endian): hand u32, kind u8, seat u8, card u8, street u8,
+amount i64.
+
+A third file, ``<name>.hands.snap``, holds periodic opaque state snapshots
+(``Room.snapshot()``), each tagged with the record number it was taken at, so a
+replay can start close to any point instead of from the first hand.
+"""
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+RECORD = struct.Struct("<IBBBBq")
+INDEX = struct.Struct("<Q")
+SNAPSHOT = struct.Struct("<QI")  # record number, payload length
+
+# Record kinds
+SESSION = 0  # seat = number of seats, card = SEEDED when amount holds the deck seed (see encodeSeed)
+HAND_START = 1  # seat = dealer seat
+HOLE_CARD = 2  # seat, card
+BOARD_CARD = 3  # card
+CHIP_IN = 4  # seat, amount
+FOLD = 5  # seat
+PAYOUT = 6  # seat, amount won
+HAND_END = 7
+SEAT_JOIN = 8  # seat, amount = money at the table (also written for a rebuy between hands)
+STATE_HASH = 9  # amount = Room.stateHash() after the hand was settled
+
+KIND_NAMES = {SESSION: "session", HAND_START: "hand_start", HOLE_CARD: "hole_card", BOARD_CARD: "board_card",
+              CHIP_IN: "chip_in", FOLD: "fold", PAYOUT: "payout", HAND_END: "hand_end", SEAT_JOIN: "seat_join",
+              STATE_HASH: "state_hash"}
+
+NO_SEAT = 0xFF
+NO_CARD = 0xFF
+SEEDED = 1  # SESSION card value when the deck was seeded; any seed, 0 included, is valid
+
+SEED_BITS = 64
+
+Record = namedtuple("Record", ["hand", "kind", "seat", "card", "street", "amount"])
+
+
+def encodeSeed(seed):
+    """Store an unsigned 64-bit deck seed in the signed amount field (two's complement)
+
+    Raises:
+        ValueError: The seed is negative or wider than 64 bits
+    """
+    if not 0 <= seed < 1 << SEED_BITS:
+        raise ValueError(f"deck seed must be an unsigned {SEED_BITS}-bit integer, got {seed}")
+    return seed - (1 << SEED_BITS) if seed >> (SEED_BITS - 1) else seed
+
+
+def decodeSeed(amount):
+    """Inverse of encodeSeed"""
+    return amount & ((1 << SEED_BITS) - 1)
+
+
+def indexPath(path):
+    """Path of the per-hand index that accompanies a log file"""
+    return path + ".idx"
+
+
+def snapshotPath(path):
+    """Path of the snapshot file that accompanies a log file"""
+    return path + ".snap"
+
+
+class HandLogWriter:
+    """Appends records to a session log and its per-hand index"""
+
+    def __init__(self, path, bufferSize=1 << 16):
+        """Open (or continue) a log
+
+        Args:
+            path: Log file path, conventionally ending in .hands
+            bufferSize: Write buffer size; records reach the disk on flush() and at hand end
+        """
+        self.path = path
+        self._log = open(path, "ab", buffering=bufferSize)
+        self._index = open(indexPath(path), "ab", buffering=0)
+        self._snapshots = open(snapshotPath(path), "ab", buffering=0)
+        self.records = self._log.tell() // RECORD.size
+        self.hands = os.path.getsize(indexPath(path)) // INDEX.size
+        self.hand = max(self.hands - 1, 0)  # Number stamped on the records being written
+
+    def write(self, kind, seat=NO_SEAT, card=NO_CARD, street=0, amount=0):
+        """Append one record to the current hand"""
+        if kind == HAND_START:
+            self.hand = self.hands
+            self.hands += 1
+            self._log.flush()
+            self._index.write(INDEX.pack(self.records))
+        self._log.write(RECORD.pack(self.hand, kind, seat, card, street, amount))
+        self.records += 1
+        if kind == HAND_END:
+            self._log.flush()
+
+    def snapshot(self, data):
+        """Store a state snapshot taken after the records written so far
+
+        Args:
+            data: Opaque bytes, e.g. Room.snapshot()
+        """
+        self._log.flush()
+        self._snapshots.write(SNAPSHOT.pack(self.records, len(data)) + data)
+
+    def flush(self):
+        self._log.flush()
+
+    def close(self):
+        self._log.close()
+        self._index.close()
+        self._snapshots.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HandLogReader:
+    """Memory-mapped, read-only view of a session log"""
+
+    def __init__(self, path):
+        self.path = path
+        self._log, self._logMap = self._map(path)
+        self._index, self._indexMap = self._map(indexPath(path))
+        # Ignore a torn record at the tail left by a crash mid-write
+        self._records = len(self._logMap) // RECORD.size if self._logMap is not None else 0
+        self._hands = len(self._indexMap) // INDEX.size if self._indexMap is not None else 0
+        self._snap = self._snapMap = None  # Snapshot file, mapped on first use
+        self._snapshotTable = None  # [(record, offset, length)], read on first use
+
+    @staticmethod
+    def _map(path):
+        if not os.path.exists(path):
+            return None, None  # Logs written before snapshots existed have no .snap
+        f = open(path, "rb")
+        if os.fstat(f.fileno()).st_size == 0:
+            return f, None  # mmap cannot map an empty file
+        return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        """Number of records"""
+        return self._records
+
+    @property
+    def numHands(self):
+        return self._hands
+
+    def record(self, i):
+        """Random access to record i"""
+        if not 0 <= i < self._records:
+            raise IndexError("record index out of range")
+        return Record(*RECORD.unpack_from(self._logMap, i * RECORD.size))
+
+    def iterRecords(self, start=0, stop=None):
+        """Stream records [start, stop) straight from the mapping"""
+        stop = self._records if stop is None else min(stop, self._records)
+        if start >= stop:
+            return
+        view = memoryview(self._logMap)[start * RECORD.size:stop * RECORD.size]
+        try:
+            for fields in RECORD.iter_unpack(view):
+                yield Record(*fields)
+        finally:
+            view.release()
+
+    def handRange(self, hand):
+        """Record numbers [start, stop) of a hand"""
+        if not 0 <= hand < self._hands:
+            raise IndexError("hand index out of range")
+        start = INDEX.unpack_from(self._indexMap, hand * INDEX.size)[0]
+        if hand + 1 < self._hands:
+            stop = INDEX.unpack_from(self._indexMap, (hand + 1) * INDEX.size)[0]
+        else:
+            stop = self._records
+        return start, stop
+
+    def hand(self, hand):
+        """All records of one hand"""
+        return list(self.iterRecords(*self.handRange(hand)))
+
+    def iterHands(self, start=0):
+        """Stream hands from `start`, each as a list of records"""
+        for hand in range(start, self._hands):
+            yield self.hand(hand)
+
+    def session(self):
+        """Records written before the first hand (SESSION and SEAT_JOIN)"""
+        stop = self.handRange(0)[0] if self._hands else self._records
+        return list(self.iterRecords(0, stop))
+
+    def snapshots(self):
+        """Record numbers at which snapshots were taken, ascending"""
+        if self._snapshotTable is None:
+            self._snapshotTable = []
+            self._snap, self._snapMap = self._map(snapshotPath(self.path))
+            snapMap = self._snapMap
+            if snapMap is not None:
+                offset = 0
+                while offset + SNAPSHOT.size <= len(snapMap):
+                    record, length = SNAPSHOT.unpack_from(snapMap, offset)
+                    offset += SNAPSHOT.size
+                    if offset + length > len(snapMap) or record > self._records:
+                        break  # Torn tail, or taken after records that never reached the disk
+                    self._snapshotTable.append((record, offset, length))
+                    offset += length
+        return [record for record, _, _ in self._snapshotTable]
+
+    def snapshot(self, i):
+        """Payload of snapshot i (in the order of snapshots()), read from the mapping"""
+        self.snapshots()
+        _, offset, length = self._snapshotTable[i]
+        return self._snapMap[offset:offset + length]
+
+    def close(self):
+        for mapping in (self._logMap, self._indexMap, self._snapMap):
+            if mapping is not None:
+                mapping.close()
+        for f in (self._log, self._index, self._snap):
+            if f is not None:
+                f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
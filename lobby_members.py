@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Lobby 成员缓存 —— 按 Steam ID 增量维护，回调只处理发生变化的那个成员
+
+进入 Lobby 时 reload() 完整读一次成员；之后：
+  - LobbyChatUpdate（有人进 / 出）交给 on_chat_update()，只增删 m_ulSteamIDUserChanged
+  - LobbyDataUpdate（某成员改了成员数据）交给 on_data_update()，只重读 m_ulSteamIDMember 的 "player"
+每个事件最多跨 Cython 边界两三次，与成员人数无关。显示行只在成员真正变化后
+重建一次（version 递增），界面按 version 判断要不要刷新。
+"""
+import player
+import steam_wrapper
+
+# EChatMemberStateChange
+k_EChatMemberStateChangeEntered = 0x0001
+k_EChatMemberStateChangeLeft = 0x0002
+k_EChatMemberStateChangeDisconnected = 0x0004
+k_EChatMemberStateChangeKicked = 0x0008
+k_EChatMemberStateChangeBanned = 0x0010
+
+PLAYER_KEY = "player"  # 成员数据键，值为 "username,steam_id,money"（见 Lobby._push_my_member_data）
+PLAYER_KEYS = (PLAYER_KEY,)  # get_all_member_data 的键列表
+
+
+def _parse_player(raw):
+    """解析 "player" 成员数据，格式不对时返回 None"""
+    s = raw.decode("utf-8", "ignore") if raw else ""
+    parts = s.split(",", 3)
+    if len(parts) != 3:
+        return None
+    name, steam_id, money = parts
+    try:
+        return player.Player.remote(steam_id, name, int(money))
+    except ValueError:
+        return None
+
+
+class Member:
+    """一个 Lobby 成员的缓存数据"""
+
+    __slots__ = ("steam_id", "persona_name", "raw", "player")
+
+    def __init__(self, steam_id: int, persona_name: str, raw: bytes):
+        self.steam_id = steam_id
+        self.persona_name = persona_name
+        self.raw = raw  # "player" 成员数据原文，用来判断是否真的变了
+        self.player = _parse_player(raw)  # 还没发布或格式不对时为 None
+
+    def row(self) -> str:
+        """成员列表里显示的一行"""
+        p = self.player
+        if p is None:
+            return self.persona_name or "Unknown"
+        return f"{p.username} | {p.steam_id} | ¥{p.money}"
+
+
+class MemberCache:
+    """当前 Lobby 的成员表（Steam ID -> Member，按加入顺序）"""
+
+    def __init__(self, steam=steam_wrapper):
+        """
+        Args:
+            steam: steam_wrapper 模块（测试时可换成 fake_steam_wrapper）
+        """
+        self.steam = steam
+        self.lobby_id = 0
+        self._members = {}
+        self.version = 0  # 成员或其数据每变化一次 +1
+        self._rows = []
+        self._rows_version = -1
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, steam_id):
+        return steam_id in self._members
+
+    def _load_member(self, steam_id: int) -> Member:
+        """从 Steam 读取一个成员（昵称 + "player" 数据）"""
+        steam = self.steam
+        return Member(steam_id, steam.get_friend_persona_name(steam_id),
+                      steam.get_lobby_member_data(self.lobby_id, steam_id, PLAYER_KEY))
+
+    def reload(self, lobby_id: int):
+        """进入 Lobby 时完整读取一次全部成员（get_all_member_data 一次批量调用）"""
+        steam = self.steam
+        self.lobby_id = lobby_id
+        self._members = {}
+        if hasattr(steam, "get_all_member_data"):
+            for steam_id, persona_name, (raw,) in steam.get_all_member_data(lobby_id, PLAYER_KEYS):
+                if steam_id:
+                    self._members[steam_id] = Member(steam_id, persona_name, raw)
+        else:  # 旧版 steam_wrapper.pyd 没有批量接口：逐个成员读
+            for i in range(steam.get_num_lobby_members(lobby_id)):
+                steam_id = steam.get_lobby_member_by_index(lobby_id, i)
+                if steam_id:
+                    self._members[steam_id] = self._load_member(steam_id)
+        self.version += 1
+
+    def clear(self):
+        """离开 Lobby"""
+        self.lobby_id = 0
+        self._members = {}
+        self.version += 1
+
+    def on_chat_update(self, data) -> bool:
+        """
+        处理 LobbyChatUpdate：有人进入就读取他，有人离开 / 掉线 / 被踢就删掉
+
+        Returns:
+            bool: 成员表是否变化
+        """
+        if not self.lobby_id or data['m_ulSteamIDLobby'] != self.lobby_id:
+            return False
+        steam_id = data['m_ulSteamIDUserChanged']
+        if data['m_rgfChatMemberStateChange'] & k_EChatMemberStateChangeEntered:
+            self._members[steam_id] = self._load_member(steam_id)
+        elif self._members.pop(steam_id, None) is None:
+            return False
+        self.version += 1
+        return True
+
+    def on_data_update(self, data) -> bool:
+        """
+        处理 LobbyDataUpdate：只重读发生变化的那个成员的 "player" 数据
+
+        m_ulSteamIDMember 等于 Lobby ID 时是 Lobby 本身的数据（如 "start"），与成员表无关。
+
+        Returns:
+            bool: 成员表是否变化
+        """
+        if not self.lobby_id or data['m_ulSteamIDLobby'] != self.lobby_id:
+            return False
+        steam_id = data['m_ulSteamIDMember']
+        if steam_id in (0, self.lobby_id):
+            return False
+        member = self._members.get(steam_id)
+        if member is None:
+            # 数据更新先于 ChatUpdate 到达：顺便把这个成员加进来
+            self._members[steam_id] = self._load_member(steam_id)
+        else:
+            raw = self.steam.get_lobby_member_data(self.lobby_id, steam_id, PLAYER_KEY)
+            if raw == member.raw:
+                return False  # 改的是别的键
+            member.raw = raw
+            member.player = _parse_player(raw)
+        self.version += 1
+        return True
+
+    def rows(self):
+        """成员列表显示行；只在 version 变化后重建"""
+        if self._rows_version != self.version:
+            self._rows = [member.row() for member in self._members.values()]
+            self._rows_version = self.version
+        return self._rows
+
+    def names(self):
+        """成员昵称列表（Steam 昵称为空时用 "player" 数据里的名字）"""
+        return [m.persona_name or (m.player.username if m.player is not None else "Unknown")
+                for m in self._members.values()]
+
+    def players(self):
+        """已发布 "player" 数据的成员，按加入顺序（同一 Steam ID 始终是同一个 Player 实例）"""
+        return [m.player for m in self._members.values() if m.player is not None]
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+不依赖 Steam 的传输层，用于在一台机器上跑大量模拟客户端做压测
+
+- LoopbackHub / LoopbackTransport：进程内，消息直接放进目标玩家的队列
+- UdpTransport：UDP 本机回环，每个模拟客户端一个端口，可以跨进程
+
+两者都实现 net.Transport，交给 net.SteamNetworkMessenger(transport=...) 使用。
+"""
+import socket
+import struct
+from collections import deque
+
+import net
+
+
+class LoopbackHub:
+    """进程内的"网络"：按 (Steam ID, 通道) 保存待收的消息"""
+
+    def __init__(self):
+        self._queues = {}  # (steam_id, channel) -> deque[(sender_id, bytes)]
+        self.sent = 0  # 累计投递的消息数
+        self.bytes_sent = 0
+
+    def transport(self, steam_id: int):
+        """为某个模拟玩家创建传输层"""
+        return LoopbackTransport(self, steam_id)
+
+    def deliver(self, sender_id: int, target_id: int, data: bytes, channel: int):
+        key = (target_id, channel)
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+        queue.append((sender_id, bytes(data)))
+        self.sent += 1
+        self.bytes_sent += len(data)
+
+    def take(self, steam_id: int, channel: int):
+        return self._queues.get((steam_id, channel))
+
+
+class LoopbackTransport(net.Transport):
+    """LoopbackHub 上的一个端点；发送即投递，没有丢包和乱序"""
+
+    def __init__(self, hub: LoopbackHub, steam_id: int):
+        self.hub = hub
+        self.steam_id = steam_id
+
+    def send(self, target_steam_id: int, data: bytes, channel: int, flags: int) -> bool:
+        self.hub.deliver(self.steam_id, target_steam_id, data, channel)
+        return True
+
+    def iter_payloads(self, channel: int, max_messages: int):
+        queue = self.hub.take(self.steam_id, channel)
+        if not queue:
+            return
+        for _ in range(min(max_messages, len(queue))):
+            sender_id, data = queue.popleft()
+            yield sender_id, memoryview(data)
+
+
+class UdpTransport(net.Transport):
+    """
+    UDP 本机传输：数据报 = 8 字节发送者 Steam ID + 1 字节通道 + 负载
+
+    本机回环上 UDP 实际不会丢包，足以压测；可靠性标志被忽略。
+    """
+
+    HEADER = struct.Struct("<QB")
+    MAX_DATAGRAM = 65507
+
+    def __init__(self, steam_id: int, directory: dict, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            steam_id: 本端模拟的 Steam ID
+            directory: Steam ID -> (host, port) 的共享地址表，本端会把自己登记进去
+            host, port: 绑定地址，port 为 0 时由系统分配
+        """
+        self.steam_id = steam_id
+        self.directory = directory
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((host, port))
+        self._sock.setblocking(False)
+        self.address = self._sock.getsockname()
+        directory[steam_id] = self.address
+
+        self._buffer = bytearray(self.MAX_DATAGRAM)
+        self._view = memoryview(self._buffer)
+        self._pending = {}  # 通道 -> deque[(sender_id, bytes)]，读到但还没被取走的消息
+
+    def send(self, target_steam_id: int, data: bytes, channel: int, flags: int) -> bool:
+        address = self.directory.get(target_steam_id)
+        if address is None:
+            return False
+        try:
+            self._sock.sendto(self.HEADER.pack(self.steam_id, channel) + data, address)
+        except OSError as e:
+            print(f"[Loopback] UDP 发送失败: {e}")
+            return False
+        return True
+
+    def _drain_socket(self):
+        """把内核缓冲区里的数据报全部读出，按通道分拣"""
+        header = self.HEADER
+        view = self._view
+        while True:
+            try:
+                size = self._sock.recv_into(self._buffer)
+            except (BlockingIOError, InterruptedError):
+                return
+            if size < header.size:
+                continue
+            sender_id, channel = header.unpack_from(view, 0)
+            queue = self._pending.get(channel)
+            if queue is None:
+                queue = self._pending[channel] = deque()
+            queue.append((sender_id, bytes(view[header.size:size])))
+
+    def iter_payloads(self, channel: int, max_messages: int):
+        self._drain_socket()
+        queue = self._pending.get(channel)
+        if not queue:
+            return
+        for _ in range(min(max_messages, len(queue))):
+            sender_id, data = queue.popleft()
+            yield sender_id, memoryview(data)
+
+    def close(self):
+        self.directory.pop(self.steam_id, None)
+        self._sock.close()
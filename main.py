@@ -1,5 +1,4 @@
 # main.py (修正版)
-import json
 import os
 import sys
 import imgui
@@ -56,13 +55,7 @@ def main():
     g_steam_callbacks.append(callback)
 
     # ... (加载玩家数据、初始化pygame和混音器的代码保持不变) ...
-    if not os.path.exists('data'): os.mkdir('data')
-    sid = steam.get_my_steam_id()
-    if os.path.exists(f"data/{sid}.json"):
-        data = json.load(open(f"data/{sid}.json"))
-        current_player = player.Player(data['steam_id'], data['username'], data['money'])
-    else:
-        current_player = player.Player(steam.get_my_steam_id(), steam.get_my_persona_name())
+    current_player = player.Player.create(steam.get_my_steam_id(), steam.get_my_persona_name())
 
     pygame.mixer.pre_init(44100, -16, 2, 512)
     os.environ["SDL_RENDER_SCALE_QUALITY"] = "0"
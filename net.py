@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import ctypes
-import pickle
+import threading
+import time
+from collections import deque
 from ctypes import c_void_p, c_uint64, c_int32, c_uint32, c_char_p, POINTER, Structure
 
+import protocol
+
 
 # ======== Steam Networking 结构体 ========
 class SteamNetworkingIdentity(Structure):
@@ -140,10 +144,107 @@ def _bind_networking_functions(DLL, client_handle):
         return False
 
 
+# ======== 传输层 ========
+
+class Transport:
+    """
+    SteamNetworkMessenger 底下的传输层接口
+
+    实现只需收发已编码的字节负载，协议编解码、合并发送和分发都在 messenger 里。
+    除 SteamTransport 外，loopback 模块提供进程内 / UDP 本机实现用于压测。
+    """
+
+    def send(self, target_steam_id: int, data: bytes, channel: int, flags: int) -> bool:
+        """发送一个负载，flags 为 k_nSteamNetworkingSend_* 的组合；成功返回 True"""
+        raise NotImplementedError
+
+    def iter_payloads(self, channel: int, max_messages: int):
+        """
+        取出指定通道的一批消息
+
+        Yields:
+            (sender_steam_id, memoryview)，view 只在本次迭代内有效
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """释放传输层占用的资源"""
+
+
+class SteamTransport(Transport):
+    """通过 ctypes 调用 ISteamNetworkingMessages 的传输层"""
+
+    RECEIVE_BATCH = 64  # 单次 ReceiveMessagesOnChannel 的上限
+
+    def __init__(self, steam_dll, client_handle):
+        """
+        Args:
+            steam_dll: Steam DLL 对象
+            client_handle: Steam Client 句柄
+        """
+        if not _bind_networking_functions(steam_dll, client_handle):
+            raise RuntimeError("Steam 网络消息接口初始化失败")
+
+        self._identities = {}  # Steam ID -> SteamNetworkingIdentity
+
+        # 复用的接收数组：每帧不再重新分配 ctypes 数组
+        self._recv_array = (POINTER(SteamNetworkingMessage_t) * self.RECEIVE_BATCH)()
+        self._recv_ptr = ctypes.cast(self._recv_array, POINTER(POINTER(SteamNetworkingMessage_t)))
+
+    def _identity(self, steam_id: int):
+        """按 Steam ID 缓存的 SteamNetworkingIdentity（每个玩家只构造一次）"""
+        identity = self._identities.get(steam_id)
+        if identity is None:
+            identity = self._identities[steam_id] = SteamNetworkingIdentity.from_steam_id(steam_id)
+        return identity
+
+    def send(self, target_steam_id: int, data: bytes, channel: int, flags: int) -> bool:
+        result = ISteamNetworkingMessages_SendMessageToUser(
+            _networking_messages_handle,
+            ctypes.byref(self._identity(target_steam_id)),
+            data,
+            len(data),
+            flags,
+            channel
+        )
+        # EResult: 1 = k_EResultOK
+        return result == 1
+
+    def iter_payloads(self, channel: int, max_messages: int = RECEIVE_BATCH):
+        """
+        从指定通道取出一批消息，逐条给出负载的 memoryview（零拷贝）
+
+        view 直接指向 Steam 的 m_pData，只在本次迭代内有效：进入下一次迭代
+        （或生成器关闭）时 view 被 release，消息随即归还给 Steam。
+        """
+        messages = self._recv_array
+        count = ISteamNetworkingMessages_ReceiveMessagesOnChannel(
+            _networking_messages_handle,
+            channel,
+            self._recv_ptr,
+            min(max_messages, self.RECEIVE_BATCH)
+        )
+        released = 0
+        try:
+            for i in range(count):
+                msg = messages[i].contents
+                view = memoryview((ctypes.c_char * msg.m_cbSize).from_address(msg.m_pData)).cast("B")
+                try:
+                    yield msg.m_identityPeer.m_steamID64, view
+                finally:
+                    view.release()
+                    SteamNetworkingMessage_Release(messages[i])
+                    released = i + 1
+        finally:
+            # 调用方提前结束迭代时，把剩下的消息也还给 Steam
+            for i in range(released, count):
+                SteamNetworkingMessage_Release(messages[i])
+
+
 # ======== 高级封装：简化的发送/接收接口 ========
 
 class SteamNetworkMessenger:
-    """Steam 网络消息收发器 - 简化复杂对象传输"""
+    """Steam 网络消息收发器 - 以 protocol 模块的二进制格式收发消息"""
 
     # 消息通道定义
     CHANNEL_ROOM_DATA = 0  # Room 对象传输
@@ -156,142 +257,224 @@ class SteamNetworkMessenger:
     k_nSteamNetworkingSend_NoNagle = 1  # 立即发送
     k_nSteamNetworkingSend_UnreliableNoDelay = 0  # 不可靠但快速
 
-    def __init__(self, steam_dll, client_handle):
+    RECEIVE_BATCH = 64  # 每个通道每帧最多取出的消息数，限制单帧的网络开销
+    MAX_BATCH_BYTES = 1200  # 合并包的上限，不超过一个 MTU，避免分片
+
+    def __init__(self, steam_dll=None, client_handle=None, transport: Transport = None):
         """
         初始化消息收发器
 
         Args:
             steam_dll: Steam DLL 对象
             client_handle: Steam Client 句柄
+            transport: 自定义传输层（如 loopback.LoopbackTransport）；给出时忽略前两个参数
         """
-        self.initialized = _bind_networking_functions(steam_dll, client_handle)
-        if not self.initialized:
-            raise RuntimeError("Steam 网络消息接口初始化失败")
+        if transport is None:
+            transport = SteamTransport(steam_dll, client_handle)
+        self.transport = transport
+        self.initialized = True
 
         self._message_handlers = {}  # 消息处理器
-
-    def send_object(self, target_steam_id: int, obj, channel: int = 0, reliable: bool = True):
+        self.decode_errors = 0  # 无法解码而被丢弃的消息数
+        self._outbox = {}  # (目标, 通道, 是否可靠) -> 本帧待发的负载列表
+        self._outbox_lock = threading.Lock()  # NetworkWorker 线程与渲染线程都会排队 / flush
+
+    # 各消息类型的默认通道
+    MESSAGE_CHANNELS = {
+        protocol.RoomSetup: CHANNEL_ROOM_DATA,
+        protocol.GameState: CHANNEL_GAME_STATE,
+        protocol.StateDelta: CHANNEL_GAME_STATE,
+        protocol.ResyncRequest: CHANNEL_GAME_STATE,
+        protocol.HoleCards: CHANNEL_GAME_STATE,
+        protocol.PlayerAction: CHANNEL_PLAYER_ACTION,
+        protocol.ChatMessage: CHANNEL_CHAT,
+    }
+
+    def send_object(self, target_steam_id: int, obj, channel: int = None, reliable: bool = True):
         """
-        发送 Python 对象到指定玩家
+        立即发送协议消息到指定玩家
 
         Args:
             target_steam_id: 目标玩家的 Steam ID
-            obj: 要发送的 Python 对象（必须可 pickle）
-            channel: 消息通道（0-255）
+            obj: protocol 模块中的消息（RoomSetup / GameState / PlayerAction / ChatMessage / HoleCards）
+            channel: 消息通道（0-255），默认按消息类型选择
             reliable: 是否使用可靠传输
 
         Returns:
             bool: 发送是否成功
         """
         try:
-            # 序列化对象
-            data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
-
-            # 创建目标身份
-            identity = SteamNetworkingIdentity.from_steam_id(target_steam_id)
-
-            # 选择发送标志
-            if reliable:
-                flags = self.k_nSteamNetworkingSend_Reliable | self.k_nSteamNetworkingSend_NoNagle
-            else:
-                flags = self.k_nSteamNetworkingSend_UnreliableNoDelay
-
-            # 发送消息
-            result = ISteamNetworkingMessages_SendMessageToUser(
-                _networking_messages_handle,
-                ctypes.byref(identity),
-                data,
-                len(data),
-                flags,
-                channel
-            )
-
-            # EResult: 1 = k_EResultOK
-            if result == 1:
-                print(f"[SteamTools] 成功发送 {len(data)} 字节到 {target_steam_id} (channel {channel})")
-                return True
-            else:
-                print(f"[SteamTools] 发送失败，EResult={result}")
-                return False
-
+            # 序列化消息（不再使用 pickle：体积大、慢，且反序列化对端数据不安全）
+            data = protocol.encode(obj)
+            if channel is None:
+                channel = self.MESSAGE_CHANNELS[type(obj)]
+            return self._send_bytes(target_steam_id, data, channel, self._flags(reliable, True))
         except Exception as e:
             print(f"[SteamTools] 发送对象时出错: {e}")
             return False
 
-    def receive_objects(self, channel: int = 0, max_messages: int = 32):
+    def _flags(self, reliable: bool, flush: bool):
         """
-        从指定通道接收消息
+        选择发送标志：只有一批消息的最后一个包才带 NoNagle，
+        之前的包交给 Nagle 与它一起发出
+        """
+        if reliable:
+            flags = self.k_nSteamNetworkingSend_Reliable
+        else:
+            flags = self.k_nSteamNetworkingSend_UnreliableNoDelay
+        if flush:
+            flags |= self.k_nSteamNetworkingSend_NoNagle
+        return flags
+
+    def _send_bytes(self, target_steam_id: int, data: bytes, channel: int, flags: int):
+        """把已编码的负载交给传输层，只在失败时打印日志"""
+        if not self.transport.send(target_steam_id, data, channel, flags):
+            print(f"[SteamTools] 发送到 {target_steam_id} 失败")
+            return False
+        return True
+
+    def queue(self, target_steam_id: int, obj, channel: int = None, reliable: bool = True):
+        """
+        把消息放进本帧的发送队列，flush() 时与发给同一玩家的其他消息合并发送
 
         Args:
-            channel: 消息通道
-            max_messages: 最多接收的消息数
+            target_steam_id: 目标玩家的 Steam ID
+            obj: 协议消息
+            channel: 消息通道，默认按消息类型选择
+            reliable: 是否可靠传输
+        """
+        if channel is None:
+            channel = self.MESSAGE_CHANNELS[type(obj)]
+        self._queue_bytes((target_steam_id,), protocol.encode(obj), channel, reliable)
+
+    def queue_broadcast(self, lobby_members, obj, channel: int = None, reliable: bool = True):
+        """把一条消息放进所有成员的发送队列（只序列化一次）"""
+        if channel is None:
+            channel = self.MESSAGE_CHANNELS[type(obj)]
+        self._queue_bytes(lobby_members, protocol.encode(obj), channel, reliable)
+
+    def _queue_bytes(self, targets, data: bytes, channel: int, reliable: bool):
+        with self._outbox_lock:
+            outbox = self._outbox
+            for target in targets:
+                key = (target, channel, reliable)
+                pending = outbox.get(key)
+                if pending is None:
+                    outbox[key] = [data]
+                else:
+                    pending.append(data)
+
+    def flush(self):
+        """
+        发出本帧排队的所有消息（每帧末尾调用一次）
+
+        发给同一玩家、同一通道的消息合并成 MSG_BATCH 包，每包不超过
+        MAX_BATCH_BYTES；同一批里只有最后一个包带 NoNagle。
 
         Returns:
-            list: [(sender_steam_id, obj), ...] 发送者ID和对象的列表
+            int: 发出的包数
         """
-        try:
-            # 准备消息数组
-            messages_array_type = POINTER(SteamNetworkingMessage_t) * max_messages
-            messages = messages_array_type()
-
-            # 接收消息
-            count = ISteamNetworkingMessages_ReceiveMessagesOnChannel(
-                _networking_messages_handle,
-                channel,
-                ctypes.cast(messages, POINTER(POINTER(SteamNetworkingMessage_t))),
-                max_messages
-            )
-
-            if count <= 0:
-                return []
-
-            results = []
-            for i in range(count):
-                msg = messages[i].contents
+        with self._outbox_lock:
+            outbox = self._outbox
+            if not outbox:
+                return 0
+            self._outbox = {}  # 取走后在锁外发送，每条消息只会被一次 flush 发出
+        packets = 0
+        for (target, channel, reliable), payloads in outbox.items():
+            chunks = self._coalesce(payloads)
+            last = len(chunks) - 1
+            for i, data in enumerate(chunks):
+                try:
+                    self._send_bytes(target, data, channel, self._flags(reliable, i == last))
+                except Exception as e:
+                    print(f"[SteamTools] 发送对象时出错: {e}")
+                packets += 1
+        return packets
+
+    def _coalesce(self, payloads):
+        """把负载按 MAX_BATCH_BYTES 分组，单条消息的组不加 MSG_BATCH 外壳"""
+        if len(payloads) == 1:
+            return payloads
+        chunks = []
+        group = []
+        size = 2
+        for data in payloads:
+            framed = len(data) + 2
+            if group and size + framed > self.MAX_BATCH_BYTES:
+                chunks.append(group[0] if len(group) == 1 else protocol.batch(group))
+                group = []
+                size = 2
+            group.append(data)
+            size += framed
+        chunks.append(group[0] if len(group) == 1 else protocol.batch(group))
+        return chunks
+
+    def iter_payloads(self, channel: int = 0, max_messages: int = RECEIVE_BATCH):
+        """
+        从指定通道取出一批消息，逐条给出负载的 memoryview（零拷贝）
 
-                # 提取发送者 Steam ID
-                sender_id = msg.m_identityPeer.m_steamID64
+        view 只在本次迭代内有效，见 Transport.iter_payloads。
 
-                # 提取数据
-                data_size = msg.m_cbSize
-                data_ptr = msg.m_pData
-                data_bytes = ctypes.string_at(data_ptr, data_size)
+        Args:
+            channel: 消息通道
+            max_messages: 最多接收的消息数（不超过 RECEIVE_BATCH）
 
-                # 反序列化对象
-                try:
-                    obj = pickle.loads(data_bytes)
-                    results.append((sender_id, obj))
-                    print(f"[SteamTools] 从 {sender_id} 接收到对象 (channel {channel})")
-                except Exception as e:
-                    print(f"[SteamTools] 反序列化失败: {e}")
+        Yields:
+            (sender_steam_id, memoryview)
+        """
+        return self.transport.iter_payloads(channel, min(max_messages, self.RECEIVE_BATCH))
 
-                # 释放消息
-                SteamNetworkingMessage_Release(messages[i])
+    def receive_objects(self, channel: int = 0, max_messages: int = 32):
+        """
+        从指定通道接收消息
 
-            return results
+        Args:
+            channel: 消息通道
+            max_messages: 最多接收的消息数
 
+        Returns:
+            list: [(sender_steam_id, msg), ...] 发送者ID和协议消息的列表
+        """
+        results = []
+        try:
+            for sender_id, view in self.iter_payloads(channel, max_messages):
+                try:
+                    for msg in protocol.iter_decode(view):
+                        results.append((sender_id, msg))
+                except protocol.ProtocolError as e:
+                    self.decode_errors += 1
+                    print(f"[SteamTools] 解码失败: {e}")
         except Exception as e:
             print(f"[SteamTools] 接收对象时出错: {e}")
-            return []
+        return results
 
-    def broadcast_to_lobby(self, lobby_members, obj, channel: int = 0, reliable: bool = True):
+    def broadcast_to_lobby(self, lobby_members, obj, channel: int = None, reliable: bool = True):
         """
-        向大厅所有成员广播对象
+        向大厅所有成员广播协议消息
 
         Args:
             lobby_members: 成员 Steam ID 列表
-            obj: 要广播的对象
-            channel: 消息通道
+            obj: 要广播的协议消息
+            channel: 消息通道，默认按消息类型选择
             reliable: 是否可靠传输
 
         Returns:
             int: 成功发送的数量
         """
-        success_count = 0
-        for member_id in lobby_members:
-            if self.send_object(member_id, obj, channel, reliable):
-                success_count += 1
-        return success_count
+        try:
+            # 只序列化一次，所有成员共用同一份负载
+            data = protocol.encode(obj)
+            if channel is None:
+                channel = self.MESSAGE_CHANNELS[type(obj)]
+            flags = self._flags(reliable, True)
+            success_count = 0
+            for member_id in lobby_members:
+                if self._send_bytes(member_id, data, channel, flags):
+                    success_count += 1
+            return success_count
+        except Exception as e:
+            print(f"[SteamTools] 广播时出错: {e}")
+            return 0
 
     def register_handler(self, channel: int, handler_func):
         """
@@ -299,21 +482,173 @@ class SteamNetworkMessenger:
 
         Args:
             channel: 消息通道
-            handler_func: 处理函数 func(sender_steam_id, obj)
+            handler_func: 处理函数 func(sender_steam_id, msg)
         """
         self._message_handlers[channel] = handler_func
 
     def process_messages(self):
         """
         处理所有已注册通道的消息（在主循环中调用）
+
+        每帧对每个通道只调用一次 ReceiveMessagesOnChannel，复用同一个接收数组，
+        在 Steam 缓冲区上直接解码后分发，单帧开销有上限（RECEIVE_BATCH / 通道）
         """
-        for channel, handler in self._message_handlers.items():
-            messages = self.receive_objects(channel)
-            for sender_id, obj in messages:
+        for channel in self._message_handlers:
+            for sender_id, view in self.iter_payloads(channel):
                 try:
-                    handler(sender_id, obj)
-                except Exception as e:
-                    print(f"[SteamTools] 处理消息时出错: {e}")
+                    for msg in protocol.iter_decode(view):
+                        self.dispatch(channel, sender_id, msg)
+                except protocol.ProtocolError as e:
+                    self.decode_errors += 1
+                    print(f"[SteamTools] 解码失败: {e}")
+
+    def dispatch(self, channel: int, sender_id: int, msg):
+        """把一条已解码的消息交给该通道的处理器"""
+        handler = self._message_handlers.get(channel)
+        if handler is None:
+            return
+        try:
+            handler(sender_id, msg)
+        except Exception as e:
+            print(f"[SteamTools] 处理消息时出错: {e}")
+
+
+class NetworkWorker:
+    """
+    可选的后台网络线程：独占 ISteamNetworkingMessages 的收发
+
+    线程在后台接收并解码所有已注册通道的消息，放进有界的入站队列；渲染循环
+    每帧调用 drain() 在时间预算内分发。发送请求进入出站队列，由线程发出。
+    两个队列都是 collections.deque（append / popleft 是原子操作，无需加锁）。
+    入站队列满时线程暂停接收，消息留在 Steam 的队列里，不会丢失。容量按解码后的
+    消息数计算：一个 MSG_BATCH 包放不下的部分暂存在线程自己的溢出队列里，入站
+    队列腾出位置后先补进去，溢出队列非空时不再向 Steam 收包。
+
+    用法：
+        worker = NetworkWorker(messenger)   # 先 register_handler
+        worker.start()
+        # 每帧: worker.drain()  代替 messenger.process_messages()
+        worker.stop()
+    """
+
+    def __init__(self, messenger: SteamNetworkMessenger, inbound_capacity: int = 1024,
+                 idle_sleep: float = 0.001):
+        """
+        Args:
+            messenger: 已初始化的 SteamNetworkMessenger
+            inbound_capacity: 入站队列容量
+            idle_sleep: 无消息时线程的休眠时间（秒）
+        """
+        self.messenger = messenger
+        self.inbound_capacity = inbound_capacity
+        self.idle_sleep = idle_sleep
+        self._inbound = deque()  # (channel, sender_id, msg)
+        self._overflow = deque()  # 已解码但入站队列放不下的消息，只有网络线程访问
+        self._outbound = deque()  # (target_steam_ids, msg, channel, reliable)
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="SteamNetworkWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """停止线程（未发出的消息会先发完）"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def send(self, target_steam_id: int, obj, channel: int = None, reliable: bool = True):
+        """排队发送给单个玩家（不阻塞渲染线程）"""
+        self._outbound.append(((target_steam_id,), obj, channel, reliable))
+
+    def broadcast(self, lobby_members, obj, channel: int = None, reliable: bool = True):
+        """排队广播给大厅成员"""
+        self._outbound.append((tuple(lobby_members), obj, channel, reliable))
+
+    def pending(self):
+        """已解码、等待分发的消息数（含溢出队列）"""
+        return len(self._inbound) + len(self._overflow)
+
+    def drain(self, budget: float = 0.002):
+        """
+        在渲染循环中调用：分发入站消息，直到队列清空或用完时间预算
+
+        Args:
+            budget: 本帧允许花在消息处理上的时间（秒）
+
+        Returns:
+            int: 本帧分发的消息数
+        """
+        inbound = self._inbound
+        dispatch = self.messenger.dispatch
+        deadline = time.perf_counter() + budget
+        handled = 0
+        while inbound:
+            channel, sender_id, msg = inbound.popleft()
+            dispatch(channel, sender_id, msg)
+            handled += 1
+            if time.perf_counter() >= deadline:
+                break
+        return handled
+
+    def _flush_outbound(self):
+        outbound = self._outbound
+        messenger = self.messenger
+        sent = False
+        while outbound:
+            targets, obj, channel, reliable = outbound.popleft()
+            try:
+                messenger.queue_broadcast(targets, obj, channel, reliable)
+            except Exception as e:
+                print(f"[SteamTools] 发送对象时出错: {e}")
+            sent = True
+        if sent:
+            messenger.flush()  # 这一轮排队的消息按玩家合并发出
+        return sent
+
+    def _receive(self):
+        messenger = self.messenger
+        inbound = self._inbound
+        overflow = self._overflow
+        capacity = self.inbound_capacity
+        received = False
+        while overflow and len(inbound) < capacity:
+            inbound.append(overflow.popleft())
+            received = True
+        for channel in tuple(messenger._message_handlers):
+            # 每个包至少一条消息，按包数收不会超出剩余容量；批量包展开后多出的进溢出队列
+            room = capacity - len(inbound)
+            if room <= 0 or overflow:
+                break  # 背压：让消息留在 Steam 队列里
+            for sender_id, view in messenger.iter_payloads(channel, room):
+                try:
+                    for msg in protocol.iter_decode(view):
+                        if len(inbound) < capacity:
+                            inbound.append((channel, sender_id, msg))
+                        else:
+                            overflow.append((channel, sender_id, msg))
+                except protocol.ProtocolError as e:
+                    messenger.decode_errors += 1
+                    print(f"[SteamTools] 解码失败: {e}")
+                received = True
+        return received
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                busy = self._flush_outbound()
+                busy = self._receive() or busy
+            except Exception as e:
+                print(f"[SteamTools] 网络线程出错: {e}")
+                busy = False
+            if not busy:
+                self._stop_event.wait(self.idle_sleep)
+        self._flush_outbound()
 
 
 # ======== 便捷函数 ========
@@ -345,27 +680,37 @@ def create_messenger(steam_bootstrap_module):
 # 在 Lobby.py 或 main.py 中使用：
 
 import steam_bootstrap as steam
-import tools
+import net
+import protocol
 
 # 初始化（在 steam.init() 之后）
-messenger = tools.create_messenger(steam)
+messenger = net.create_messenger(steam)
 
-# 房主：创建 Room 并广播
+# 房主：创建 Room 并广播开局消息（牌堆留在房主本地）
 room = Room([players, minBet, initBet])
 member_ids = [member.steam_id for member in lobby_members]
-messenger.broadcast_to_lobby(member_ids, room, channel=tools.SteamNetworkMessenger.CHANNEL_ROOM_DATA)
+messenger.broadcast_to_lobby(member_ids, protocol.room_setup(room))
+for seat, p in enumerate(room.players):
+    messenger.send_object(int(p.steam_id), protocol.hole_cards(seat, p.handCards))
 
-# 非房主：接收 Room
-def on_room_received(sender_id, room_obj):
-    print(f"收到来自 {sender_id} 的 Room 对象")
+# 非房主：接收开局消息并重建 Room
+def on_room_received(sender_id, setup):
+    print(f"收到来自 {sender_id} 的开局消息")
     # 启动游戏
-    start_game(room_obj)
+    start_game(Room.fromSetup(setup))
 
-messenger.register_handler(tools.SteamNetworkMessenger.CHANNEL_ROOM_DATA, on_room_received)
+messenger.register_handler(net.SteamNetworkMessenger.CHANNEL_ROOM_DATA, on_room_received)
 
 # 主循环中
 while running:
     steam.run_callbacks()
     messenger.process_messages()  # 处理网络消息
-    # ... 其他逻辑
+    # ... 其他逻辑；本帧要发的小消息用 messenger.queue / queue_broadcast 排队
+    messenger.flush()  # 每个玩家合并成一个包发出
+
+# 压测 / 无 Steam 环境：换成 loopback 传输层和 fake_steam_wrapper
+import fake_steam_wrapper
+world = fake_steam_wrapper.FakeSteamWorld()
+bot = world.client("bot0")
+messenger = net.SteamNetworkMessenger(transport=bot.transport())
 """
\ No newline at end of file
@@ -1,6 +1,19 @@
-import os
 import config
-import tools
+import playerstore
+
+# Process-wide registry: steam_id -> [Player, store stamp]; the stamp is None for
+# players only known from the network, whose profiles are not stored here
+_registry = {}
+_registryDirectory = None  # config.USER_DATA_PATH the registry was filled from
+
+
+def _entries():
+    """Registry for the current USER_DATA_PATH; a new one starts an empty registry"""
+    global _registry, _registryDirectory
+    if config.USER_DATA_PATH != _registryDirectory:
+        _registry = {}
+        _registryDirectory = config.USER_DATA_PATH
+    return _registry
 
 
 class Player:
@@ -11,29 +24,49 @@ class Player:
         self.handCards = []
 
     def storeData(self):
-        tools.createPathIfNotExist(config.USER_DATA_PATH)
-        data = {
-            "steam_id": self.steam_id,
-            "username": self.username,
-            "money": self.money,
-        }
-        tools.setJsonData(os.path.join(config.USER_DATA_PATH, self.steam_id + ".json"), data)
+        """Queue the profile for saving; playerstore writes it in the background"""
+        playerstore.get().markDirty(self)
 
     @classmethod
     def create(cls, steam_id, username):
-        steam_id = str(steam_id)
-        path = os.path.join(config.USER_DATA_PATH, steam_id + ".json")
+        """Get the stored profile of a player, creating it on first sight
 
-        if not os.path.exists(path):
-            p = cls(steam_id=steam_id, username=username)
-            p.storeData()
-            return p
+        Profiles are loaded at most once and then shared: every call for the
+        same Steam ID returns the same instance. A profile this process has
+        saved is never read back, since the instance is newer than the disk; one
+        that was only loaded is read again when its stored row version changed
+        (another process wrote it).
 
-        data = tools.getJsonData(path) or {}
-        saved_money = data.get("money", config.INIT_MONEY)
-        saved_username = data.get("username", username)
+        Args:
+            steam_id: Steam ID (int or str)
+            username: Current persona name; replaces the stored one if different
 
-        p = cls(steam_id=steam_id, username=saved_username, money=saved_money)
+        Returns:
+            The shared Player instance
+        """
+        steam_id = str(steam_id)
+        registry = _entries()
+        store = playerstore.get()
+        entry = registry.get(steam_id)
+        owned = entry is not None and store.isOwned(steam_id)  # Saved here: no need to look at the disk
+        stamp = None if owned else store.stamp(steam_id)
+        if entry is not None and (owned or entry[1] == stamp):
+            p = entry[0]
+        else:
+            data = store.load(steam_id)
+            if entry is None:
+                p = cls(steam_id=steam_id, username=username)
+                registry[steam_id] = entry = [p, stamp]
+            else:
+                p = entry[0]
+                entry[1] = stamp
+            if data is None:
+                p.username = username
+                p.money = config.INIT_MONEY
+                p.storeData()
+                return p
+            p.username = data.get("username", username)
+            p.money = data.get("money", config.INIT_MONEY)
 
         if p.username != username:
             p.username = username
@@ -41,5 +74,29 @@ class Player:
 
         return p
 
+    @classmethod
+    def remote(cls, steam_id, username, money):
+        """Get the shared instance of a player announced by another client
+
+        Nothing is read or written: the profile belongs to that client. A
+        player whose profile is stored here (the local player) keeps its own
+        balance rather than the one announced over the network.
+
+        Returns:
+            The shared Player instance
+        """
+        steam_id = str(steam_id)
+        registry = _entries()
+        entry = registry.get(steam_id)
+        if entry is None:
+            p = cls(steam_id, username, money)
+            registry[steam_id] = [p, None]
+            return p
+        p = entry[0]
+        p.username = username
+        if entry[1] is None:
+            p.money = money
+        return p
+
     def getOnlineData(self):
         return ",".join([self.username, self.steam_id, str(self.money)])
@@ -0,0 +1,249 @@
+"""Write-behind persistence for player profiles.
+
+Player.storeData only marks the player dirty; a background thread writes every
+dirty profile in one batch each FLUSH_INTERVAL seconds and once more at
+shutdown, so the game thread never waits for the disk.
+
+Profiles live in a single SQLite database (WAL journal) under
+config.USER_DATA_PATH. Profiles still stored the old way, one
+``<steam_id>.json`` per player, are read when the database has no row for the
+player and move into the database on the next flush.
+"""
+import atexit
+import os
+import sqlite3
+import threading
+
+import config
+import tools
+
+
+def _mtime(path):
+    """Modification time in ns, 0 when the file does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+class JsonBackend:
+    """One JSON file per player (the original layout), written atomically"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, steam_id):
+        return os.path.join(self.directory, steam_id + ".json")
+
+    def load(self, steam_id):
+        """Profile dict of a player, or None when there is none"""
+        path = self._path(steam_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            return tools.getJsonData(path)
+        except (OSError, ValueError):
+            return None  # Unreadable or torn by a crash before writes were atomic
+
+    def stamp(self, steam_id):
+        """Changes whenever the stored profile may have changed (the file's mtime)"""
+        return _mtime(self._path(steam_id))
+
+    def saveMany(self, rows):
+        """Write (steam_id, username, money) rows"""
+        tools.createPathIfNotExist(self.directory)
+        for steam_id, username, money in rows:
+            tools.setJsonData(self._path(steam_id), {"steam_id": steam_id, "username": username, "money": money})
+
+    def close(self):
+        pass
+
+
+class SqliteBackend:
+    """All profiles in one SQLite file, journaled with WAL"""
+
+    def __init__(self, path, fallback=None):
+        """Open (or create) the database
+
+        Args:
+            path: Database file
+            fallback: Backend read when a player has no row yet (e.g. JsonBackend for old data)
+        """
+        tools.createPathIfNotExist(os.path.dirname(path) or ".")
+        self.path = path
+        self.fallback = fallback
+        self._lock = threading.Lock()  # One connection, used by the game and writer threads
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent after a crash
+        self._db.execute("CREATE TABLE IF NOT EXISTS players (steam_id TEXT PRIMARY KEY, username TEXT NOT NULL, "
+                         "money INTEGER NOT NULL, version INTEGER NOT NULL DEFAULT 0)")
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(players)")]
+        if "version" not in columns:  # Databases created before rows were versioned
+            self._db.execute("ALTER TABLE players ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+        self._db.commit()
+
+    def load(self, steam_id):
+        """Profile dict of a player, or None when there is none"""
+        with self._lock:
+            row = self._db.execute("SELECT username, money FROM players WHERE steam_id = ?", (steam_id,)).fetchone()
+        if row is not None:
+            return {"steam_id": steam_id, "username": row[0], "money": row[1]}
+        return self.fallback.load(steam_id) if self.fallback is not None else None
+
+    def stamp(self, steam_id):
+        """Changes whenever the stored profile may have changed
+
+        The row's version, bumped by every write of that player only; players
+        without a row yet are stamped by their old JSON file.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT version FROM players WHERE steam_id = ?", (steam_id,)).fetchone()
+        if row is not None:
+            return row[0]
+        return None, self.fallback.stamp(steam_id) if self.fallback is not None else 0
+
+    def saveMany(self, rows):
+        """Upsert (steam_id, username, money) rows in one transaction"""
+        with self._lock, self._db:
+            self._db.executemany("INSERT INTO players (steam_id, username, money) VALUES (?, ?, ?) "
+                                 "ON CONFLICT(steam_id) DO UPDATE SET username = excluded.username, "
+                                 "money = excluded.money, version = players.version + 1", rows)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class PlayerStore:
+    """In-memory dirty set in front of a backend, flushed by a background thread"""
+
+    FLUSH_INTERVAL = 1.0  # Seconds between background flushes
+
+    def __init__(self, backend, flushInterval=FLUSH_INTERVAL):
+        """
+        Args:
+            backend: JsonBackend or SqliteBackend
+            flushInterval: Seconds between background flushes
+        """
+        self.backend = backend
+        self.flushInterval = flushInterval
+        self._dirty = {}  # steam_id -> Player, written with its values at flush time
+        self._owned = set()  # steam_ids marked dirty at least once by this process
+        self._lock = threading.Lock()
+        self._flushLock = threading.Lock()  # Keeps two flushes from writing out of order
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="PlayerStore", daemon=True)
+        self._thread.start()
+
+    def markDirty(self, player):
+        """Queue a player's current profile for the next flush (O(1), no I/O)"""
+        with self._lock:
+            self._dirty[player.steam_id] = player
+            self._owned.add(player.steam_id)
+
+    def load(self, steam_id):
+        """Latest profile dict of a player, including changes not flushed yet, or None"""
+        with self._lock:
+            p = self._dirty.get(steam_id)
+        if p is not None:
+            return {"steam_id": p.steam_id, "username": p.username, "money": p.money}
+        return self.backend.load(steam_id)
+
+    def stamp(self, steam_id):
+        """Backend stamp of a profile; compare two to tell whether it changed on disk"""
+        return self.backend.stamp(steam_id)
+
+    def isDirty(self, steam_id):
+        """True while the profile has changes not written yet"""
+        return steam_id in self._dirty
+
+    def isOwned(self, steam_id):
+        """True once this process has saved the profile: its in-memory copy is the latest
+
+        Stays true while a flush is writing it, unlike isDirty.
+        """
+        return steam_id in self._owned
+
+    def pending(self):
+        """Number of profiles waiting to be written"""
+        return len(self._dirty)
+
+    def flush(self):
+        """Write every dirty profile now
+
+        Returns:
+            int: Profiles written
+        """
+        with self._flushLock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, {}
+            if not dirty:
+                return 0
+            rows = [(p.steam_id, p.username, int(p.money)) for p in dirty.values()]
+            try:
+                self.backend.saveMany(rows)
+            except Exception:
+                with self._lock:
+                    for steam_id, p in dirty.items():
+                        self._dirty.setdefault(steam_id, p)  # Retry next time; newer marks win
+                raise
+            return len(rows)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flushInterval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"WARNING: Failed to save player data: {e}")
+
+    def close(self):
+        """Stop the writer thread, write what is left and close the backend"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        self.backend.close()
+
+
+_store = None
+_storeDirectory = None
+_storeLock = threading.Lock()
+
+
+def get():
+    """The process-wide store for config.USER_DATA_PATH, created on first use
+
+    A different USER_DATA_PATH (the simulator and benchmarks point it at a
+    temporary directory) closes the old store and opens one there.
+    """
+    global _store, _storeDirectory
+    directory = config.USER_DATA_PATH
+    if _store is not None and _storeDirectory == directory:
+        return _store
+    with _storeLock:
+        if _store is not None and _storeDirectory != directory:
+            _store.close()
+            _store = None
+        if _store is None:
+            backend = SqliteBackend(os.path.join(directory, config.PLAYER_DB), fallback=JsonBackend(directory))
+            _store = PlayerStore(backend)
+            _storeDirectory = directory
+        return _store
+
+
+def close():
+    """Flush and close the process-wide store (also runs at interpreter exit)"""
+    global _store
+    with _storeLock:
+        if _store is not None:
+            _store.close()
+            _store = None
+
+
+atexit.register(close)
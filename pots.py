@@ -0,0 +1,113 @@
+"""Side-pot resolution for showdowns with all-ins.
+
+``build_pots`` turns every seat's total contribution into a main pot and side
+pots in one pass over the seats sorted by contribution; chips put in by seats
+that folded stay in the pots but those seats are never eligible to win them.
+``resolve`` scores every live hand with a single ``evaluator.evaluate_board``
+call and pays each pot to its best eligible hands. Split pots are shared
+evenly and the odd chips go one at a time to the tied winners in clockwise
+order from ``first_seat`` (normally the seat left of the button), so a
+settlement never depends on dict or set ordering.
+"""
+from collections import namedtuple
+
+import evaluator
+
+Pot = namedtuple("Pot", ["amount", "eligible"])  # eligible: tuple of seat indices, ascending
+
+
+def _seats(mask):
+    """Seat indices of a bitmask, ascending."""
+    seats = []
+    while mask:
+        low = mask & -mask
+        seats.append(low.bit_length() - 1)
+        mask ^= low
+    return tuple(seats)
+
+
+def build_pots(contributions, live):
+    """Split the chips in the middle into a main pot and side pots.
+
+    Args:
+        contributions: Chips each seat put in this hand, indexed by seat
+        live: Bitmask of seats still in the hand (not folded)
+
+    Returns:
+        list: Pot tuples from the main pot up; amounts sum to sum(contributions)
+    """
+    order = sorted(range(len(contributions)), key=contributions.__getitem__)
+    pots = []
+    eligible = live  # Live seats whose contribution reaches the current level
+    dead = 0  # Chips at levels no live seat reached, carried into a pot below
+    previous = 0
+    remaining = len(order)
+    for seat in order:
+        level = contributions[seat]
+        if level > previous:
+            amount = (level - previous) * remaining
+            previous = level
+            if eligible:
+                if pots and pots[-1][1] == eligible:
+                    pots[-1][0] += amount + dead
+                else:
+                    pots.append([amount + dead, eligible])
+                dead = 0
+            elif pots:
+                pots[-1][0] += amount  # Only folded seats bet this much: dead money
+            else:
+                dead += amount
+        eligible &= ~(1 << seat)
+        remaining -= 1
+
+    if dead:
+        if pots:
+            pots[-1][0] += dead
+        else:
+            pots.append([dead, live])  # Everyone who bet folded; the live seats share it
+    return [Pot(amount, _seats(mask)) for amount, mask in pots]
+
+
+def _clockwise(seats, first_seat, numSeats):
+    """Order seat indices clockwise starting at first_seat."""
+    return sorted(seats, key=lambda seat: (seat - first_seat) % numSeats)
+
+
+def resolve(contributions, holes, board, first_seat=0):
+    """Settle a showdown.
+
+    Args:
+        contributions: Chips each seat put in this hand, indexed by seat
+        holes: Hole-card codes per seat; None for seats that folded
+        board: Board card codes (3 to 5)
+        first_seat: Seat that receives the first odd chip of a split pot
+
+    Returns:
+        list: Chips won by each seat (sums to sum(contributions)); when every
+        seat folded, each gets its own contribution back
+    """
+    numSeats = len(contributions)
+    if all(hole is None for hole in holes):
+        return list(contributions)  # Nobody left to win the pots: every seat gets its chips back
+    liveSeats = [seat for seat in range(numSeats) if holes[seat] is not None]
+    live = 0
+    for seat in liveSeats:
+        live |= 1 << seat
+
+    strengths = [0] * numSeats
+    if len(liveSeats) > 1:
+        scored = evaluator.evaluate_board([holes[seat] for seat in liveSeats], board)
+        for seat, strength in zip(liveSeats, scored):
+            strengths[seat] = strength
+
+    payouts = [0] * numSeats
+    for amount, eligible in build_pots(contributions, live):
+        best = max(strengths[seat] for seat in eligible)
+        winners = [seat for seat in eligible if strengths[seat] == best]
+        if len(winners) == 1:
+            payouts[winners[0]] += amount
+            continue
+        share, odd = divmod(amount, len(winners))
+        for i, seat in enumerate(_clockwise(winners, first_seat, numSeats)):
+            payouts[seat] += share + (1 if i < odd else 0)
+    return payouts
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+二进制网络协议 —— 取代 SteamNetworkMessenger 里的 pickle
+
+每条消息 = 2 字节头 (协议版本, 消息类型) + 按类型固定布局的 struct 负载，
+小端序。牌一律用 0-51 的牌码 (card.Card.code) 单字节表示，0xFF 表示空位。
+解码只在 memoryview 上用 struct.unpack_from 读取，不复制负载；
+只有玩家名 / 聊天文本在转成 str 时才产生新对象。
+"""
+import struct
+from collections import namedtuple
+
+PROTOCOL_VERSION = 1
+
+# 消息类型
+MSG_ROOM_SETUP = 1  # 开局：盲注、庄家、玩家列表
+MSG_GAME_STATE = 2  # 完整的牌桌状态
+MSG_PLAYER_ACTION = 3  # 玩家操作
+MSG_CHAT = 4  # 聊天
+MSG_HOLE_CARDS = 5  # 单独发给某个玩家的手牌
+MSG_STATE_DELTA = 6  # 相对上一版本只改动的字段
+MSG_RESYNC_REQUEST = 7  # 客户端发现版本断档，请求关键帧
+MSG_BATCH = 8  # 同一帧发给同一玩家的多条消息合并成一个包
+
+# 玩家操作
+ACTION_FOLD = 0
+ACTION_CHECK = 1
+ACTION_CALL = 2
+ACTION_RAISE = 3
+ACTION_ALL_IN = 4
+
+NO_CARD = 0xFF  # 空牌位
+NO_SEAT = 0xFF  # 无人行动
+
+RoomSetup = namedtuple("RoomSetup", ["min_bet", "init_bet", "dealer_seat", "players"])
+PlayerInfo = namedtuple("PlayerInfo", ["steam_id", "money", "username"])
+# GameState.street 是 round.STREETS 的下标
+GameState = namedtuple("GameState", ["revision", "street", "turn_seat", "active_mask", "pot", "last_chip", "board"])
+PlayerAction = namedtuple("PlayerAction", ["seat", "action", "amount"])
+ChatMessage = namedtuple("ChatMessage", ["steam_id", "text"])
+HoleCards = namedtuple("HoleCards", ["seat", "cards"])
+# 未改动的字段为 None；revision - base_revision 不超过 0xFFFF
+StateDelta = namedtuple("StateDelta", ["base_revision", "revision"] + list(GameState._fields[1:]))
+ResyncRequest = namedtuple("ResyncRequest", ["revision"])
+
+# 布局都以 2 字节头 (版本, 类型) 开头，一次 pack/unpack 完成
+_HEADER = struct.Struct("<BB")
+_ROOM_SETUP = struct.Struct("<BBIIBB")
+_PLAYER_INFO = struct.Struct("<QqB")  # RoomSetup 里每个玩家，后接用户名
+_GAME_STATE = struct.Struct("<BBIBBHII5s")
+_PLAYER_ACTION = struct.Struct("<BBBBI")
+_CHAT = struct.Struct("<BBQH")  # 后接聊天文本
+_HOLE_CARDS = struct.Struct("<BBB2s")
+_STATE_DELTA = struct.Struct("<BBIHB")  # 基准版本, 版本增量, 字段位图；后接改动的字段
+_RESYNC_REQUEST = struct.Struct("<BBI")
+_FRAME_LENGTH = struct.Struct("<H")  # MSG_BATCH 里每条子消息前的长度
+# StateDelta 各字段（与 GameState 同序）的编码，位图第 i 位对应第 i 个
+_DELTA_FIELDS = tuple(struct.Struct(f) for f in ("<B", "<B", "<H", "<I", "<I", "<5s"))
+_DELTA_BOARD = len(_DELTA_FIELDS) - 1
+
+
+class ProtocolError(ValueError):
+    """收到无法解析的消息（版本不符、类型未知或长度不对）"""
+
+
+def _cardBytes(cards, size):
+    """牌码序列 -> 定长字节串，None 写成 NO_CARD"""
+    codes = [NO_CARD if c is None else c for c in cards]
+    return bytes(codes + [NO_CARD] * (size - len(codes)))
+
+
+_CODE_OR_NONE = tuple(range(NO_CARD)) + (None,)  # 字节 -> 牌码，NO_CARD -> None
+
+
+def _cardTuple(raw):
+    return tuple(map(_CODE_OR_NONE.__getitem__, raw))
+
+
+def _encodeText(text, limit):
+    data = text.encode("utf-8")
+    if len(data) > limit:
+        # 截断到合法的 UTF-8 边界
+        data = data[:limit].decode("utf-8", "ignore").encode("utf-8")
+    return data
+
+
+def encode(msg):
+    """
+    把协议消息编码成 bytes
+
+    Args:
+        msg: RoomSetup / GameState / PlayerAction / ChatMessage / HoleCards 之一
+
+    Returns:
+        bytes: 可直接交给 SendMessageToUser 的负载
+    """
+    kind = type(msg)
+    if kind is PlayerAction:
+        return _PLAYER_ACTION.pack(PROTOCOL_VERSION, MSG_PLAYER_ACTION, *msg)
+    if kind is GameState:
+        return _GAME_STATE.pack(PROTOCOL_VERSION, MSG_GAME_STATE, msg.revision, msg.street, msg.turn_seat,
+                                msg.active_mask, msg.pot, msg.last_chip, _cardBytes(msg.board, 5))
+    if kind is HoleCards:
+        return _HOLE_CARDS.pack(PROTOCOL_VERSION, MSG_HOLE_CARDS, msg.seat, _cardBytes(msg.cards, 2))
+    if kind is ChatMessage:
+        text = _encodeText(msg.text, 0xFFFF)
+        return _CHAT.pack(PROTOCOL_VERSION, MSG_CHAT, msg.steam_id, len(text)) + text
+    if kind is StateDelta:
+        mask = 0
+        parts = [b""]
+        for i, value in enumerate(msg[2:]):
+            if value is not None:
+                mask |= 1 << i
+                parts.append(_DELTA_FIELDS[i].pack(_cardBytes(value, 5) if i == _DELTA_BOARD else value))
+        parts[0] = _STATE_DELTA.pack(PROTOCOL_VERSION, MSG_STATE_DELTA, msg.base_revision,
+                                     msg.revision - msg.base_revision, mask)
+        return b"".join(parts)
+    if kind is ResyncRequest:
+        return _RESYNC_REQUEST.pack(PROTOCOL_VERSION, MSG_RESYNC_REQUEST, msg.revision)
+    if kind is RoomSetup:
+        parts = [_ROOM_SETUP.pack(PROTOCOL_VERSION, MSG_ROOM_SETUP, msg.min_bet, msg.init_bet, msg.dealer_seat,
+                                  len(msg.players))]
+        for info in msg.players:
+            name = _encodeText(info.username, 0xFF)
+            parts.append(_PLAYER_INFO.pack(int(info.steam_id), info.money, len(name)))
+            parts.append(name)
+        return b"".join(parts)
+    raise TypeError(f"无法编码的消息类型: {kind.__name__}")
+
+
+def decode(data):
+    """
+    解码一条消息
+
+    Args:
+        data: bytes / bytearray / memoryview，不会被复制
+
+    Returns:
+        对应的协议消息 namedtuple
+
+    Raises:
+        ProtocolError: 版本不符、类型未知或长度不对
+    """
+    view = memoryview(data)
+    try:
+        version, kind = _HEADER.unpack_from(view, 0)
+        if version != PROTOCOL_VERSION:
+            raise ProtocolError(f"协议版本不符: {version}")
+
+        if kind == MSG_PLAYER_ACTION:
+            return PlayerAction(*_PLAYER_ACTION.unpack_from(view, 0)[2:])
+        if kind == MSG_GAME_STATE:
+            *fields, board = _GAME_STATE.unpack_from(view, 0)[2:]
+            return GameState(*fields, _cardTuple(board))
+        if kind == MSG_HOLE_CARDS:
+            seat, cards = _HOLE_CARDS.unpack_from(view, 0)[2:]
+            return HoleCards(seat, _cardTuple(cards))
+        if kind == MSG_STATE_DELTA:
+            base, step, mask = _STATE_DELTA.unpack_from(view, 0)[2:]
+            offset = _STATE_DELTA.size
+            values = [None] * len(_DELTA_FIELDS)
+            for i, field in enumerate(_DELTA_FIELDS):
+                if mask >> i & 1:
+                    value, = field.unpack_from(view, offset)
+                    values[i] = _cardTuple(value) if i == _DELTA_BOARD else value
+                    offset += field.size
+            return StateDelta(base, base + step, *values)
+        if kind == MSG_RESYNC_REQUEST:
+            return ResyncRequest(_RESYNC_REQUEST.unpack_from(view, 0)[2])
+        if kind == MSG_CHAT:
+            steam_id, length = _CHAT.unpack_from(view, 0)[2:]
+            offset = _CHAT.size
+            if offset + length > len(view):
+                raise ProtocolError("聊天消息长度不对")
+            return ChatMessage(steam_id, str(view[offset:offset + length], "utf-8", "replace"))
+        if kind == MSG_ROOM_SETUP:
+            min_bet, init_bet, dealer_seat, count = _ROOM_SETUP.unpack_from(view, 0)[2:]
+            offset = _ROOM_SETUP.size
+            players = []
+            for _ in range(count):
+                steam_id, money, length = _PLAYER_INFO.unpack_from(view, offset)
+                offset += _PLAYER_INFO.size
+                if offset + length > len(view):
+                    raise ProtocolError("玩家名长度不对")
+                players.append(PlayerInfo(steam_id, money, str(view[offset:offset + length], "utf-8", "replace")))
+                offset += length
+            return RoomSetup(min_bet, init_bet, dealer_seat, tuple(players))
+    except struct.error as e:
+        raise ProtocolError(f"消息被截断: {e}") from e
+    raise ProtocolError(f"未知消息类型: {kind}")
+
+
+def message_type(data):
+    """只读消息头，返回消息类型（不解码负载）"""
+    version, kind = _HEADER.unpack_from(data, 0)
+    if version != PROTOCOL_VERSION:
+        raise ProtocolError(f"协议版本不符: {version}")
+    return kind
+
+
+def batch(payloads):
+    """
+    把多条已编码的消息合并成一个 MSG_BATCH 包
+
+    Args:
+        payloads: encode() 的结果序列，每条不超过 0xFFFF 字节
+
+    Returns:
+        bytes: 头 + 逐条 (2 字节长度, 负载)
+    """
+    parts = [_HEADER.pack(PROTOCOL_VERSION, MSG_BATCH)]
+    for data in payloads:
+        parts.append(_FRAME_LENGTH.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def iter_decode(data):
+    """
+    解码一个包里的所有消息：普通消息给出一条，MSG_BATCH 逐条给出子消息
+
+    子消息在原缓冲区的切片上解码，不复制负载。
+
+    Raises:
+        ProtocolError: 包或其中某条子消息无法解析
+    """
+    view = memoryview(data)
+    try:
+        kind = message_type(view)
+    except struct.error as e:
+        raise ProtocolError(f"消息被截断: {e}") from e
+    if kind != MSG_BATCH:
+        yield decode(view)
+        return
+
+    offset = _HEADER.size
+    end = len(view)
+    while offset < end:
+        if offset + _FRAME_LENGTH.size > end:
+            raise ProtocolError("合并包被截断")
+        length, = _FRAME_LENGTH.unpack_from(view, offset)
+        offset += _FRAME_LENGTH.size
+        if offset + length > end:
+            raise ProtocolError("合并包子消息长度不对")
+        yield decode(view[offset:offset + length])
+        offset += length
+
+
+# ======== Room <-> 协议消息 ========
+
+def room_setup(room):
+    """从 round.Room 生成开局消息（不含牌堆，牌由房主单独发 HoleCards）"""
+    players = tuple(PlayerInfo(int(p.steam_id), int(p.money), p.username) for p in room.players)
+    return RoomSetup(int(room.minBet), int(room.initBet), room.players.index(room.banker), players)
+
+
+def hole_cards(seat, cards):
+    """生成某个座位的手牌消息"""
+    return HoleCards(seat, tuple(c.code for c in cards))
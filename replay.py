@@ -0,0 +1,253 @@
+"""Deterministic replay of a recorded session.
+
+A session log (see handlog) holds the deck seed and every action; replaying it
+drives a fresh Room through the same chipIn / playerQuitRound / deliverCards /
+addCardToPublicPool / showdown / newRound calls, so the state at any record can
+be rebuilt and compared with what the host recorded. Every dealt card, payout
+and end-of-hand state hash is checked on the way; the first difference raises
+ReplayError naming the hand and record, which is where a host/client desync
+starts.
+
+Seeking restores the nearest Room.snapshot() at or before the target (written
+by the recorder every few hands, or kept from an earlier pass) and replays only
+the records after it.
+
+Usage:
+    with HandReplay("table0.hands") as replay:
+        room = replay.seekHand(9000)  # State right after hand 9000 started
+        replay.verify()  # Re-check the whole session
+"""
+import bisect
+
+import deck
+import handlog
+import player
+import round
+
+
+class ReplayError(RuntimeError):
+    """The replayed state diverged from the recording"""
+
+
+class ReplayPlayer(player.Player):
+    """Seat occupant of a replayed room; replays never write profiles"""
+
+    def storeData(self):
+        pass
+
+
+class HandReplay:
+    """Rebuilds Room state at any record of a session log"""
+
+    def __init__(self, path, snapshotInterval=64):
+        """Open a log and read its session header
+
+        Args:
+            path: Session log written through Room.recordTo
+            snapshotInterval: While replaying, keep an in-memory snapshot every this
+                many hands wherever the log has none (0: only use the stored ones)
+
+        Raises:
+            ReplayError: The log has no session header, or it cannot be replayed
+        """
+        self.log = handlog.HandLogReader(path)
+        header = self.log.session()
+        if not header or header[0].kind != handlog.SESSION:
+            raise ReplayError(f"{path}: no session header")
+        self.numSeats = header[0].seat
+        self.seed = handlog.decodeSeed(header[0].amount) if header[0].card == handlog.SEEDED else None
+        self.startMoney = [0] * self.numSeats
+        for rec in header[1:]:
+            if rec.kind == handlog.SEAT_JOIN:
+                self.startMoney[rec.seat] = rec.amount
+        self._start = len(header)  # First record of hand 0
+
+        # Snapshot record numbers (ascending), stored and in-memory alike; for each, either the
+        # index of a snapshot in the log (payload read from the mapping on restore) or the bytes
+        self._snapRecords = self.log.snapshots()
+        self._snapData = list(range(len(self._snapRecords)))
+        if not self._snapRecords and self.seed is None:
+            raise ReplayError(f"{path}: the deck was not seeded, the deal cannot be reproduced")
+        self.snapshotInterval = snapshotInterval
+
+        self.room = None
+        self.position = 0  # Records [0, position) have been applied to room
+        self._dealt = False
+        self._payouts = None
+
+    def __len__(self):
+        """Number of records in the log"""
+        return len(self.log)
+
+    @property
+    def numHands(self):
+        return self.log.numHands
+
+    def _newRoom(self):
+        """A room for the session's table, with its seed and starting balances"""
+        players = [ReplayPlayer(seat, f"seat{seat}", money) for seat, money in enumerate(self.startMoney)]
+        return round.Room([players, 0, 0], deck.seededRng(self.seed))
+
+    def _resetHand(self):
+        self._dealt = False
+        self._payouts = None
+
+    def _restore(self, i):
+        """Rebuild the room from snapshot i"""
+        if self.room is None:
+            self.room = self._newRoom()
+        data = self._snapData[i]
+        self.room.restore(self.log.snapshot(data) if isinstance(data, int) else data)
+        self.position = self._snapRecords[i]
+        self._resetHand()
+
+    def _rewind(self):
+        """Back to the start of hand 0, without any snapshot"""
+        room = self.room = self._newRoom()
+        first = self.log.record(self._start)  # HAND_START of hand 0: only places the button
+        room.banker = room.players[first.seat]
+        room.order = round.Round(room.players, room.banker, room.order._seating)
+        room.actions = round.ActionOrder(room.order)
+        self.position = self._start + 1
+        self._resetHand()
+
+    def seek(self, index):
+        """Rebuild the state after records [0, index)
+
+        The deal of a hand is applied as a whole: stopping between two hole
+        cards leaves every seat's cards dealt.
+
+        Args:
+            index: Record number; clamped to the log length
+
+        Returns:
+            The replayed Room (owned by this replay; do not keep it across seeks)
+
+        Raises:
+            ReplayError: The recording diverges before `index`
+        """
+        index = max(self._start + 1, min(index, len(self.log)))
+        snap = bisect.bisect_right(self._snapRecords, index) - 1
+        snapRecord = self._snapRecords[snap] if snap >= 0 else -1
+        if self.room is None or index < self.position or snapRecord > self.position:
+            if snap >= 0:
+                self._restore(snap)
+            else:
+                self._rewind()
+        self._play(index)
+        return self.room
+
+    def seekHand(self, hand):
+        """Rebuild the state right after hand `hand` started (button moved, deck shuffled)"""
+        return self.seek(self.log.handRange(hand)[0] + 1)
+
+    def verify(self, startHand=0, stopHand=None):
+        """Replay hands [startHand, stopHand) and check them against the recording
+
+        Returns:
+            int: Number of hands checked
+
+        Raises:
+            ReplayError: At the first divergence
+        """
+        stopHand = self.numHands if stopHand is None else min(stopHand, self.numHands)
+        if startHand >= stopHand:
+            return 0
+        self.seekHand(startHand)
+        stop = self.log.handRange(stopHand)[0] if stopHand < self.numHands else len(self.log)
+        self._play(stop)
+        return stopHand - startHand
+
+    def _play(self, stop):
+        """Apply records [position, stop)"""
+        apply = self._apply
+        interval = self.snapshotInterval
+        position = self.position
+        for rec in self.log.iterRecords(position, stop):
+            apply(rec, position)
+            position += 1
+            self.position = position
+            if rec.kind == handlog.HAND_START and interval and rec.hand % interval == 0:
+                self._keepSnapshot(position)
+
+    def _keepSnapshot(self, record):
+        """Remember the state at a hand start, unless a snapshot already covers it"""
+        i = bisect.bisect_left(self._snapRecords, record)
+        if i < len(self._snapRecords) and self._snapRecords[i] == record:
+            return
+        self._snapRecords.insert(i, record)
+        self._snapData.insert(i, self.room.snapshot())
+
+    def _fail(self, rec, index, message):
+        raise ReplayError(f"hand {rec.hand}, record {index} ({handlog.KIND_NAMES.get(rec.kind, rec.kind)}): {message}")
+
+    def _apply(self, rec, index):
+        """Drive the room through one recorded event and check its outcome"""
+        room = self.room
+        kind = rec.kind
+        if kind == handlog.CHIP_IN or kind == handlog.FOLD:
+            p = room.players[rec.seat]
+            if p not in room.activePlayers:
+                self._fail(rec, index, f"seat {rec.seat} is not in the hand")
+            if kind == handlog.FOLD:
+                room.playerQuitRound(room.activePlayers[p])
+            elif not room.chipIn(p, rec.amount):
+                self._fail(rec, index, f"seat {rec.seat} could not bet {rec.amount}")
+
+        elif kind == handlog.HOLE_CARD:
+            if not self._dealt:
+                room.deliverCards()
+                self._dealt = True
+            if rec.card not in [c.code for c in room.players[rec.seat].handCards]:
+                self._fail(rec, index, f"seat {rec.seat} was not dealt card {rec.card}")
+
+        elif kind == handlog.BOARD_CARD:
+            room.addCardToPublicPool()
+            dealt = [c for c in room.publicCardPool if c is not None]
+            if not dealt or dealt[-1].code != rec.card:
+                self._fail(rec, index, f"board card {rec.card} was not dealt")
+
+        elif kind == handlog.PAYOUT:
+            if self._payouts is None:
+                self._payouts = self._settle(room)
+            won = self._payouts.get(rec.seat, 0)
+            if won != rec.amount:
+                self._fail(rec, index, f"seat {rec.seat} won {won}, recorded {rec.amount}")
+
+        elif kind == handlog.STATE_HASH:
+            if self._payouts is None:
+                self._payouts = self._settle(room)  # Nobody was paid (empty pot)
+            if room.stateHash() != rec.amount:
+                self._fail(rec, index, "state hash differs")
+
+        elif kind == handlog.HAND_START:
+            room.newRound()
+            self._resetHand()
+            if room.order._idx[room.order.dealer] != rec.seat:
+                self._fail(rec, index, f"dealer is seat {room.order._idx[room.order.dealer]}, recorded {rec.seat}")
+
+        elif kind == handlog.SEAT_JOIN:
+            room.rebuy(room.players[rec.seat], rec.amount)
+
+    @staticmethod
+    def _settle(room):
+        """Settle the hand the way the host did: the pots if several players (or nobody) are left
+
+        Returns:
+            dict: seat -> chips paid, as the PAYOUT records should show (folded-seat refunds included)
+        """
+        if len(room.activePlayers) != 1:
+            return {seat: amount for seat, amount in enumerate(room.settle()) if amount}
+        winner = next(iter(room.activePlayers))
+        pot = room.betPool
+        room.endOfRound()
+        return {room.order._idx[winner]: pot}
+
+    def close(self):
+        self.log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,55 +1,45 @@
-from random import choice  # For choosing the host
-from random import shuffle  # For shuffling the deck of cards
+import hashlib  # State hashes for replay verification
+import struct  # Binary room snapshots
+from random import choice, SystemRandom  # For choosing the host; SystemRandom decks cannot be snapshotted
 
-import pygame
-import imgui
-from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT, glClearColor
+try:
+    import pygame
+    import imgui
+    from OpenGL.GL import glClear, GL_COLOR_BUFFER_BIT, glClearColor
+except ImportError:  # Headless use (simulator, dedicated host): only PlayScreen needs these
+    pygame = imgui = None
 
-import card  # Import the Card class for creating card instances
-import config  # Import configuration with card type/rank definitions
+import deck  # Preallocated deck engine backing CardPool
+import handlog  # Append-only hand history records
+import player  # Player profiles for rooms rebuilt from network messages
+import pots  # Side-pot settlement at showdown
 
 
-class CardPool:
+class CardPool(deck.Deck):
     """Represents a pool/deck of playing cards used in the game.
-    Manages card creation, shuffling, and distribution.
+    Manages shuffling and distribution on top of the allocation-free deck.Deck.
     """
 
-    def __init__(self):
-        """Initialize a new card pool with a full set of shuffled cards"""
-        self.cards = []  # List to hold all cards in the pool
+    def __init__(self, rng=None):
+        """Initialize a new card pool with a full set of shuffled cards
 
-        # Create a complete set of cards by combining all types and numbers
-        # Iterate through all possible card types (suits) from configuration
-        for cardType in config.CARD_TYPE_MAP:
-            # Iterate through all possible card numbers (ranks) from configuration
-            for cardNumber in range(2, 15):
-                # Create a new Card instance and add to the pool
-                self.cards.append(card.Card(cardType, cardNumber))
-
-        # Shuffle the cards to randomize their order
-        shuffle(self.cards)
-
-    def __iter__(self):
-        """Make the CardPool iterable.
-
-        Returns:
-            An iterator over the cards in the pool
+        Args:
+            rng: Shuffle RNG; deck.seededRng(seed) for replays, deck.secureRng() (default) for live play
         """
-        return iter(self.cards)
+        super().__init__(rng)
+
+    @property
+    def cards(self):
+        """List of the cards remaining in the pool, next card first"""
+        return list(self)
 
     def __next__(self):
         """Get the next card from the pool (by removing and returning it).
         Implements iterator protocol for sequential card drawing.
         """
-        return self.cards.pop()
-
-    def __len__(self):
-        """Get the current number of cards remaining in the pool.
-
-        Returns:
-            Integer count of remaining cards
-        """
-        return len(self.cards)
+        if not len(self):
+            raise StopIteration
+        return self.draw()
 
     def getNextCard(self):
         """Draw the next card from the pool (removes and returns it).
@@ -57,20 +47,79 @@ class CardPool:
         Returns:
             The next Card instance from the pool
         """
-        return self.cards.pop()
+        return self.draw()
+
+    def burnCard(self):
+        """Discard the next card face down before dealing a street"""
+        self.burn()
 
     def getTopThreeCards(self):
-        """Get the first three cards from the pool without removing them.
+        """Get the next three cards from the pool without removing them.
 
         Returns:
-            A list containing the first three Card instances
+            A list containing the next three Card instances, in the order getNextCard would deal them
         """
-        return self.cards[:3]
+        return self.peek(3)
 
 
 from typing import List, Dict, Optional, Iterable
 
 
+STREETS = ("preflop", "flop", "turn", "river")
+BOARD_STREET = (0, 1, 1, 1, 2, 3)  # Number of board cards dealt -> index into STREETS
+RNG_STATE = struct.Struct("<625I")  # random.Random (Mersenne Twister) internal state
+
+
+class Seating:
+    """
+    Turn-order tables for one seating arrangement.
+
+    Built once per table: for every possible dealer seat it stores the position
+    map and the action order of all four streets, so a Round only looks them up.
+    Orders are tuples and shared between rounds; never mutate them.
+    """
+
+    def __init__(self, players):
+        self.players = tuple(players)
+        self.index = {p: i for i, p in enumerate(self.players)}
+        self.positions = []  # dealer seat -> {name: player}
+        self.orders = []  # dealer seat -> {street: tuple of players}
+        for dealer in range(len(self.players)):
+            positions, preflop, postflop = self._build(dealer)
+            self.positions.append(positions)
+            self.orders.append({"preflop": preflop, "flop": postflop, "turn": postflop, "river": postflop})
+
+    def _ringFrom(self, start):
+        """One full clockwise loop starting from seat `start`."""
+        start %= len(self.players)
+        return self.players[start:] + self.players[:start]
+
+    def _build(self, dealer):
+        """
+        Positions and preflop/postflop orders with the button on seat `dealer`.
+
+        Rules:
+          - Heads-up: BTN is also SB;
+              preflop: BTN(SB) -> BB, postflop: BB -> BTN
+          - 3+ players:
+              preflop: starts left of BB, ends on BB
+              postflop: starts left of BTN, ends on BTN
+        """
+        players = self.players
+        n = len(players)
+        BTN = players[dealer]
+        if n == 2:
+            BB = players[(dealer + 1) % n]
+            return {"BTN": BTN, "SB": BTN, "BB": BB}, (BTN, BB), (BB, BTN)
+
+        positions = {"BTN": BTN, "SB": players[(dealer + 1) % n], "BB": players[(dealer + 2) % n]}
+        preflop = self._ringFrom(dealer + 3)
+        # The ring from UTG ends at BTN; its first element is UTG
+        # (UTG+1, HJ, CO are not named; read them off streetOrder)
+        positions["UTG"] = preflop[0]
+        return positions, preflop, self._ringFrom(dealer + 1)
+
+
 class Round:
     """
     Texas Hold'em turn-order helper.
@@ -79,25 +128,35 @@ class Round:
       - `players` is the clockwise seat order.
       - `dealer` (BTN) is an element of `players`.
       - No fold/leave tracking here (pure order only).
+
+    Orders and positions come from a Seating shared by every round at the same
+    table, so creating the next round or changing street allocates nothing.
     """
 
-    def __init__(self, players, dealer):
-        if not players or dealer not in players:
+    def __init__(self, players, dealer, seating: Optional[Seating] = None):
+        if seating is None:
+            if not players or dealer not in players:
+                raise ValueError("players must be non-empty and contain dealer")
+            seating = Seating(players)
+        elif dealer not in seating.index:
             raise ValueError("players must be non-empty and contain dealer")
 
-        self.players = list(players)
+        self._seating = seating
+        self.players = seating.players
         self.dealer = dealer
 
         # Cache common seat lookups
-        self._n = len(self.players)
-        self._idx = {p: i for i, p in enumerate(self.players)}
+        self._n = len(seating.players)
+        self._idx = seating.index
 
-        # Compute and cache static positions for the hand
-        self._pos_map: Dict[str, object] = self._computePositions()
+        # Static positions and street orders for this dealer seat
+        dealerSeat = seating.index[dealer]
+        self._pos_map: Dict[str, object] = seating.positions[dealerSeat]
+        self._orders: Dict[str, tuple] = seating.orders[dealerSeat]
 
         # Optional iteration state (only if you want to step through a street)
         self._street: Optional[str] = None
-        self._order: List = []
+        self._order: tuple = ()
         self._cursor: int = 0
 
     def positions(self):
@@ -119,6 +178,8 @@ class Round:
         Return action order for a given street: 'preflop' | 'flop' | 'turn' | 'river'
         (Flop/Turn/River share postflop rules.)
 
+        The returned tuple is shared with the seating tables.
+
         Rules:
           - Heads-up:
               preflop: BTN(SB) -> BB
@@ -127,41 +188,22 @@ class Round:
               preflop: starts left of BB, ends on BB
               postflop: starts left of BTN, ends on BTN
         """
-        street = street.lower()
-        if street not in ("preflop", "flop", "turn", "river"):
-            raise ValueError("street must be one of: preflop, flop, turn, river")
-
-        n = self._n
-        BTN = self._pos_map["BTN"]
-
-        if n == 2:
-            SB = BTN  # In heads-up, BTN is SB
-            BB = self._pos_map["BB"]
-            if street == "preflop":
-                return [SB, BB]
-            else:
-                return [BB, SB]
-
-        # n >= 3
-        SB = self._pos_map["SB"]
-        BB = self._pos_map["BB"]
-
-        if street == "preflop":
-            # Start left of BB, wrap around to BB (BB acts last preflop)
-            start = self._leftOf(BB)
-            order = self._ringFrom(start)
-            # Ensure BB is last (ring_from already includes everyone once)
-            return order
-        else:
-            # Postflop streets start left of BTN, BTN acts last
-            start = self._leftOf(BTN)
-            order = self._ringFrom(start)
-            return order
+        order = self._orders.get(street)
+        if order is None:
+            order = self._orders.get(street.lower())
+            if order is None:
+                raise ValueError("street must be one of: preflop, flop, turn, river")
+        return order
+
+    @property
+    def street(self) -> Optional[str]:
+        """Street prepared via setStreet, or None."""
+        return self._street
 
     def setStreet(self, street: str):
         """Prepare internal iterator for a given street."""
-        self._street = street
         self._order = self.streetOrder(street)
+        self._street = street
         self._cursor = 0
 
     def current(self):
@@ -174,68 +216,215 @@ class Round:
         """Advance to next actor and return them (one loop only)."""
         if not self._order:
             return None
-        self._cursor = (self._cursor + 1) % len(self._order)
-        return self._order[self._cursor]
+        cursor = self._cursor + 1
+        if cursor == self._n:
+            cursor = 0
+        self._cursor = cursor
+        return self._order[cursor]
+
+    def seek(self, player):
+        """Make `player` the current actor of the prepared street."""
+        self._cursor = self._order.index(player)
 
     def __iter__(self) -> Iterable:
         """Iterate once through the prepared street order (doesn't modify cursor)."""
-        return iter(list(self._order))
-
-    def _computePositions(self) -> Dict[str, object]:
-        """
-        Compute positional map based on dealer.
-        """
-        n = self._n
-        BTN = self.dealer
-        BTN_i = self._idx[BTN]
-
-        def seat(i):  # helper to fetch player by absolute index with wrap
-            return self.players[i % n]
-
-        pos = {"BTN": BTN}
-
-        if n == 2:
-            # Heads-up: BTN is SB; the other player is BB.
-            BB = seat(BTN_i + 1)
-            pos["SB"] = BTN
-            pos["BB"] = BB
-            return pos
-
-        # 3+ players
-        SB = seat(BTN_i + 1)
-        BB = seat(BTN_i + 2)
-        pos["SB"] = SB
-        pos["BB"] = BB
-
-        # Build UTG and the remaining seats (everything left of BB through back to BTN)
-        ring_from_utg = self._ringFrom(self._leftOf(BB))
-        # ring_from_utg ends at BTN; first element is UTG
-        if ring_from_utg:
-            pos["UTG"] = ring_from_utg[0]
-            # You can inspect the rest via street_order; we don't name all (UTG+1, HJ, CO) here.
-        return pos
+        return iter(self._order)
 
     def _leftOf(self, player):
         """Next clockwise seat."""
         i = self._idx[player]
         return self.players[(i + 1) % self._n]
 
-    def _ringFrom(self, starter) -> List:
+    def _ringFrom(self, starter) -> tuple:
         """Return a single full clockwise loop starting from `starter`."""
-        s = self._idx[starter]
-        return self.players[s:] + self.players[:s]
+        return self._seating._ringFrom(self._idx[starter])
 
     @classmethod
     def createNextRound(cls, previous_round):
         """
         Create a new round with the given previous round.
+        The button moves one seat clockwise; the seating tables are reused.
+        """
+        seating = previous_round._seating
+        players = seating.players
+        next_index = (seating.index[previous_round.dealer] + 1) % len(players)
+        return cls(players, players[next_index], seating)
+
+
+class ActionOrder:
+    """
+    Fold-aware betting order on top of a Round.
+
+    Live seats, all-in seats and the seats that still have to act this betting
+    round are kept as bitmasks indexed by seat. Street orders are clockwise rings,
+    so "next to act" is the next set bit after the current seat, found with a
+    shift and a lowest-bit trick instead of rescanning the player list.
+    """
+
+    def __init__(self, round_: Round):
+        self.round = round_
+        seating = round_._seating
+        self._players = seating.players
+        self._index = seating.index
+        self._n = len(seating.players)
+        self.live = (1 << self._n) - 1  # Seats still in the hand
+        self.allIn = 0  # Live seats that cannot bet any more
+        self.pending = 0  # Seats that still have to act this betting round
+        self._seat = -1  # Seat to act, -1 when nobody is
+
+    def _nextAfter(self, seat, mask):
+        """First seat of `mask` clockwise after `seat` (wrapping), or -1."""
+        if not mask:
+            return -1
+        higher = mask >> (seat + 1) << (seat + 1)
+        if higher:
+            mask = higher
+        return (mask & -mask).bit_length() - 1
+
+    def startStreet(self, street: str):
+        """
+        Set the street on the Round and open a new betting round.
+
+        Returns:
+            The first player to act, or None when fewer than two players can still bet.
+        """
+        round_ = self.round
+        round_.setStreet(street)
+        actionable = self.live & ~self.allIn
+        if actionable & (actionable - 1) == 0:
+            self.pending = 0  # Nobody left to bet against
+            self._seat = -1
+            return None
+        self.pending = actionable
+        first = self._index[round_._order[0]]
+        seat = self._seat = self._nextAfter((first - 1) % self._n, actionable)
+        return self._players[seat]
+
+    def current(self):
+        """Player to act, or None when the betting round is complete."""
+        return self._players[self._seat] if self.pending else None
+
+    def act(self, player, raised: bool = False, allIn: bool = False):
+        """
+        Record a check/call, bet/raise or all-in and move to the next player.
+
+        Args:
+            player: Acting player
+            raised: The action raised the bet, so every other live seat acts again
+            allIn: The player has no chips left
+
+        Returns:
+            The next player to act, or None when the betting round is complete
+        """
+        seat = self._index[player]
+        bit = 1 << seat
+        if allIn:
+            self.allIn |= bit
+        if raised:
+            pending = self.live & ~self.allIn & ~bit
+        else:
+            pending = self.pending & ~bit
+        self.pending = pending
+        if not pending:
+            self._seat = -1
+            return None
+        # Inlined _nextAfter: this is the per-action hot path
+        higher = pending >> (seat + 1) << (seat + 1)
+        if higher:
+            pending = higher
+        seat = self._seat = (pending & -pending).bit_length() - 1
+        return self._players[seat]
+
+    def fold(self, player):
+        """
+        Remove a player from the hand (folding in turn or leaving out of turn).
+
+        Returns:
+            The player to act next, or None
+        """
+        seat = self._index[player]
+        bit = 1 << seat
+        self.live &= ~bit
+        self.pending &= ~bit
+        if self.live & (self.live - 1) == 0:
+            self.pending = 0  # Last player standing wins without acting
+        if seat == self._seat or not self.pending:
+            self._seat = self._nextAfter(seat, self.pending)
+        return self.current()
+
+    def setTurn(self, live, seat):
+        """
+        Mirror the host's live seats and seat to act (statesync clients).
+
+        Args:
+            live: Bitmask of seats still in the hand
+            seat: Seat to act, or -1 when nobody is
         """
-        players = previous_round.players
-        current_dealer = previous_round.dealer
-        current_index = previous_round._idx[current_dealer]
-        next_index = (current_index + 1) % len(players)
-        new_dealer = players[next_index]
-        return cls(players, new_dealer)
+        self.live = live
+        if seat < 0:
+            self.pending = 0
+            self._seat = -1
+        else:
+            self.pending = self.pending & live | 1 << seat
+            self._seat = seat
+
+    def isRoundComplete(self):
+        """True when nobody has to act any more this betting round."""
+        return not self.pending
+
+    def isHandOver(self):
+        """True when at most one player is left, so the hand ends without a showdown."""
+        live = self.live
+        return live & (live - 1) == 0
+
+    def isAllInRunout(self):
+        """True when two or more are live but at most one can still bet: deal out the board."""
+        live = self.live
+        actionable = live & ~self.allIn
+        return live & (live - 1) != 0 and actionable & (actionable - 1) == 0 and not self.pending
+
+    def isLive(self, player):
+        return self.live >> self._index[player] & 1 == 1
+
+    @property
+    def liveCount(self):
+        return bin(self.live).count("1")
+
+    def livePlayers(self):
+        """Live players in seat order."""
+        live = self.live
+        players = self._players
+        while live:
+            low = live & -live
+            yield players[low.bit_length() - 1]
+            live ^= low
+
+
+class PlayerInGame:
+    """A player's state for the current hand.
+
+    currentBet is the remaining bet capacity; it starts at the player's money and
+    chipIn draws it down, so committed is what the player has put in this hand.
+    """
+
+    def __init__(self, player):
+        self.player = player
+        self.stack = player.money  # Money at the start of the hand
+        self.currentBet = player.money  # Remaining bet capacity for this hand
+
+    @property
+    def committed(self):
+        """Chips put into the pot this hand"""
+        return self.stack - self.currentBet
+
+    @property
+    def handCards(self):
+        """Hole cards, stored on the Player"""
+        return self.player.handCards
+
+    @handCards.setter
+    def handCards(self, cards):
+        self.player.handCards = cards
 
 
 class Room:
@@ -243,18 +432,153 @@ class Room:
     Handles game state, player interactions, betting pools, and round progression.
     """
 
-    def __init__(self, data):
+    def __init__(self, data, rng=None):
         self.players = data[0]  # 房间中的所有人，从房主创房那边直接传递过来
-        self.activePlayers = self.players  # 在打牌的人，弃牌了就不在这了，初始和players一样
+        self.handStates = self._dealIn()  # 本手所有人的状态（含已弃牌的），结算边池用
+        self.activePlayers = dict(self.handStates)  # 在打牌的人（Player -> PlayerInGame），弃牌了就不在这了
         self.numPlayers = len(self.players)
         self.minBet = data[1]  # 最小下注数额
         self.initBet = data[2]  # 所有人的入局赌注数额
         self.banker = choice(self.players)  # 首次随机选一个作为庄家
         self.order = Round(self.players, self.banker)  # Manages turn order for the round
+        self.actions = ActionOrder(self.order)  # Who is live / all-in / still to act
         self.betPool = 0  # Total accumulated bets in the current round
         self.lastChip = 0
-        self.cards = CardPool()
+        self.cards = CardPool(rng)  # rng: deck.seededRng(seed) to make the deal replayable
         self.publicCardPool = [None] * 5
+        self.revision = 0  # Bumped on every state change, drives statesync deltas
+        self.history = None  # Optional handlog.HandLogWriter, see recordTo()
+        self.snapshotInterval = 0
+
+    @classmethod
+    def fromSetup(cls, setup, rng=None):
+        """Rebuild a room from a protocol.RoomSetup message sent by the host
+
+        Args:
+            setup: protocol.RoomSetup with blinds, dealer seat and players
+            rng: Optional shuffle RNG for the local CardPool
+
+        Returns:
+            Room with the host's seating and dealer
+        """
+        players = [player.Player.remote(p.steam_id, p.username, p.money) for p in setup.players]
+        room = cls([players, setup.min_bet, setup.init_bet], rng)
+        room.banker = players[setup.dealer_seat]
+        room.order = Round(players, room.banker)
+        room.actions = ActionOrder(room.order)
+        return room
+
+    def recordTo(self, writer, seed=None, snapshotInterval=64):
+        """Start recording this room's hands into a hand history log
+
+        Writes the session header (seat count, deck seed, every seat's money)
+        and opens the current hand; later events are appended as they happen.
+        Call it between hands, before deliverCards.
+
+        Args:
+            writer: handlog.HandLogWriter
+            seed: Deck seed (unsigned 64-bit, as passed to deck.seededRng), for replays;
+                None when the deck is not seeded
+            snapshotInterval: Store a Room.snapshot() every this many hands (0: never).
+                Only seeded decks can be snapshotted; see replay.HandReplay.
+        """
+        if seed is None:
+            header = handlog.NO_CARD, 0
+        else:
+            header = handlog.SEEDED, handlog.encodeSeed(seed)  # Raises before anything is written
+        self.history = writer
+        writer.write(handlog.SESSION, seat=len(self.players), card=header[0], amount=header[1])
+        for seat, p in enumerate(self.players):
+            writer.write(handlog.SEAT_JOIN, seat=seat, amount=int(p.money))
+        self._record(handlog.HAND_START, seat=self.order._idx[self.order.dealer])
+        # OS entropy (deck.secureRng) has no state to save
+        self.snapshotInterval = 0 if isinstance(self.cards.rng, SystemRandom) else snapshotInterval
+        if self.snapshotInterval:
+            writer.snapshot(self.snapshot())
+
+    def _record(self, kind, seat=handlog.NO_SEAT, card=handlog.NO_CARD, amount=0):
+        """Append an event of the current hand to the history log"""
+        self.history.write(kind, seat, card, BOARD_STREET[5 - self.publicCardPool.count(None)], amount)
+
+    def _recordHandEnd(self):
+        """Close the current hand in the history log with the settled state's hash"""
+        self._record(handlog.STATE_HASH, amount=self.stateHash())
+        self._record(handlog.HAND_END)
+
+    def stateHash(self):
+        """64-bit hash of the table state: dealer, balances, bets, live seats and cards
+
+        The turn cursor and revision are left out; they follow from the actions.
+
+        Returns:
+            int: Signed 64-bit value (fits a handlog record amount)
+        """
+        h = hashlib.blake2b(digest_size=8)
+        states = self.handStates
+        h.update(struct.pack("<Bqq", self.order._idx[self.order.dealer], self.betPool, self.lastChip))
+        for p in self.players:
+            h.update(struct.pack("<qq?", int(p.money), states[p].committed, p in self.activePlayers))
+            h.update(bytes(c.code for c in p.handCards))
+        h.update(bytes(0xFF if c is None else c.code for c in self.publicCardPool))
+        return int.from_bytes(h.digest(), "little", signed=True)
+
+    def snapshot(self):
+        """Serialize the state between hands: balances, dealer, deck order and shuffle RNG
+
+        Only valid right after newRound() (or before the first deliverCards), when
+        no bets, cards or folds are outstanding.
+
+        Returns:
+            bytes for restore()
+        """
+        players = self.players
+        state = self.cards.rng.getstate()[1]  # (version, 625 words, gauss_next); shuffle never uses gauss
+        return b"".join((
+            struct.pack(f"<BB{len(players)}q", len(players), self.order._idx[self.order.dealer],
+                        *(int(p.money) for p in players)),
+            bytes(self.cards._codes), bytes((self.cards._cursor,)),
+            RNG_STATE.pack(*state),
+        ))
+
+    def restore(self, data):
+        """Return the room to a state captured by snapshot()"""
+        players = self.players
+        numSeats, dealerSeat = struct.unpack_from("<BB", data)
+        if numSeats != len(players):
+            raise ValueError("snapshot was taken at a table with a different number of seats")
+        offset = 2 + 8 * numSeats
+        for p, money in zip(players, struct.unpack_from(f"<{numSeats}q", data, 2)):
+            p.money = money
+            p.handCards = []
+        pool = self.cards
+        codes = pool._codes
+        size = len(codes)
+        del codes[:]
+        codes.frombytes(data[offset:offset + size])  # Same array object, refilled in place
+        pool._cursor = data[offset + size]
+        pool.rng.setstate((3, RNG_STATE.unpack_from(data, offset + size + 1), None))
+
+        self.handStates = self._dealIn()
+        self.activePlayers = dict(self.handStates)
+        self.order = Round(players, players[dealerSeat], self.order._seating)
+        self.actions = ActionOrder(self.order)
+        self.banker = self.order.dealer
+        self.betPool = 0
+        self.lastChip = 0
+        self.publicCardPool = [None] * 5
+        self.revision += 1
+
+    def rebuy(self, player, money):
+        """Set a seated player's balance between hands (rebuy / top-up)"""
+        player.money = money
+        player.storeData()
+        if self.history is not None:
+            self.history.write(handlog.SEAT_JOIN, seat=self.order._idx[player], amount=int(money))
+        self.revision += 1
+
+    def _dealIn(self):
+        """Create the in-hand state of every seated player"""
+        return {p: PlayerInGame(p) for p in self.players}
 
     def getDealerAndTwoPartners(self):
         positions = self.order.positions()
@@ -288,15 +612,24 @@ class Room:
         # Deduct bet from player's available amount and add to pool
         playerInGame.currentBet -= bet
         self.betPool += bet
+        self.actions.act(player, raised=bet > self.lastChip, allIn=playerInGame.currentBet == 0)
         self.lastChip = bet
+        if self.history is not None:
+            self._record(handlog.CHIP_IN, seat=self.order._idx[player], amount=bet)
+        self.revision += 1
         return True
 
     def deliverCards(self):
+        """Deal two hole cards to every seat and open the preflop betting round"""
         self.order.setStreet("flop")
         for i in range(2):
             for player in self.order:
                 card = self.cards.getNextCard()
                 player.handCards.append(card)
+                if self.history is not None:
+                    self._record(handlog.HOLE_CARD, seat=self.order._idx[player], card=card.code)
+        self.actions.startStreet("preflop")
+        self.revision += 1
 
     def addCardToPublicPool(self):
         if not None in self.publicCardPool:
@@ -304,6 +637,11 @@ class Room:
         place = self.publicCardPool.index(None)
         card = self.cards.getNextCard()
         self.publicCardPool[place] = card
+        if self.history is not None:
+            self._record(handlog.BOARD_CARD, card=card.code)
+        if place >= 2:  # The flop is complete, or the turn / river was dealt: open its betting round
+            self.actions.startStreet(STREETS[BOARD_STREET[place + 1]])
+        self.revision += 1
         return True
 
     def endOfRound(self):
@@ -316,18 +654,73 @@ class Room:
         if len(self.activePlayers.values()) > 1:
             return False
 
+        # Every seat folded: nobody wins, settle() refunds each seat like showdown does
+        if not self.activePlayers:
+            self.settle()
+            return True
+
         # Get the remaining player as winner
         winnerKey = list(self.activePlayers.keys())[0]
         winner = self.activePlayers[winnerKey]
 
-        # Update winner's money: deduct unused bet capacity, add total pool
-        winner.player.money += self.betPool
+        # Update winner's money: the pool minus the winner's own contribution
+        winner.player.money += self.betPool - winner.committed
         winner.player.storeData()  # Save updated balance to storage
 
         # Reset winner's hand for next round
         winner.handCards = []
+        if self.history is not None:
+            self._record(handlog.PAYOUT, seat=self.order._idx[winnerKey], amount=self.betPool)
+            self._recordHandEnd()
+        self.revision += 1
         return True
 
+    def showdown(self):
+        """Settle a hand that reached showdown, with side pots for all-ins
+
+        Every seat's contribution is split into pots, the live hands are scored
+        in one batch and each pot goes to its best eligible hands; odd chips of
+        a split go clockwise from the seat left of the button.
+
+        Returns:
+            dict: Player -> chips won from the pots (live players only; see settle)
+        """
+        payouts = self.settle()
+        return {p: amount for p, amount in zip(self.players, payouts) if p in self.activePlayers}
+
+    def settle(self):
+        """Pay out the pots (see showdown) and close the hand
+
+        Returns:
+            list: Chips paid to each seat, indexed by seat; includes the refunds
+            folded seats get when every seat folded
+        """
+        players = self.players
+        states = self.handStates
+        contributions = [states[p].committed for p in players]
+        holes = [[c.code for c in p.handCards] if p in self.activePlayers else None for p in players]
+        board = [c.code for c in self.publicCardPool if c is not None]
+        firstSeat = (self.order._idx[self.order.dealer] + 1) % len(players)
+        payouts = pots.resolve(contributions, holes, board, firstSeat)
+
+        for p, amount in zip(players, payouts):
+            if p not in self.activePlayers:
+                if amount:  # Refund: every seat folded, nobody could win the pot
+                    p.money += amount
+                    p.storeData()
+                continue  # Folded players already paid in playerQuitRound
+            p.money += amount - states[p].committed
+            p.storeData()
+            p.handCards = []
+        self.betPool = 0
+        if self.history is not None:
+            for seat, amount in enumerate(payouts):
+                if amount:
+                    self._record(handlog.PAYOUT, seat=seat, amount=amount)
+            self._recordHandEnd()
+        self.revision += 1
+        return payouts
+
     def playerQuitRound(self, p):
         """Handle a player quitting the current round
 
@@ -338,24 +731,39 @@ class Room:
             bool: True if player is successfully removed
         """
         # Remove player from current round
-        self.activePlayers.pop(p)
+        self.activePlayers.pop(p.player)
+        self.actions.fold(p.player)
+        if self.history is not None:
+            self._record(handlog.FOLD, seat=self.order._idx[p.player])
 
         # Deduct their committed bet from their balance
-        p.player.money -= p.currentBet
+        p.player.money -= p.committed
         p.player.storeData()  # Save updated balance
 
         # Reset their hand
         p.handCards = []
+        self.revision += 1
 
     def newRound(self):
         """Initialize a new round, resetting game state while keeping room players"""
-        self.activePlayers = self.players
+        for p in self.players:
+            p.handCards = []
+        self.handStates = self._dealIn()
+        self.activePlayers = dict(self.handStates)
 
         # Advance to next round order (likely rotating turns)
         self.order = Round.createNextRound(self.order)
+        self.actions = ActionOrder(self.order)
         self.betPool = 0  # Clear the betting pool
-        self.banker = self.order.positions()["BTN"]  # Update host to button position (likely dealer)
-        self.cards = CardPool()
+        self.lastChip = 0
+        self.publicCardPool = [None] * 5
+        self.banker = self.order.dealer  # Update host to button position (likely dealer)
+        self.cards.reset()  # Reshuffle the same deck in place
+        if self.history is not None:
+            self._record(handlog.HAND_START, seat=self.order._idx[self.order.dealer])
+            if self.snapshotInterval and self.history.hand % self.snapshotInterval == 0:
+                self.history.snapshot(self.snapshot())
+        self.revision += 1
 
 
 class PlayScreen:
@@ -0,0 +1,207 @@
+"""Headless multi-table load simulator for the game engine.
+
+Runs N tables of scripted bots through complete hands (deliverCards, chipIn,
+addCardToPublicPool, playerQuitRound, showdown or endOfRound, newRound)
+without pygame, imgui or Steam. Tables are interleaved one action at a time,
+the way a host loop would serve them, and the run reports hands/sec, p50/p99
+latency per engine call and traced memory per table.
+
+Run from the repository root:
+    python simulator.py [--tables N] [--players K] [--hands H] [--seed S] [--json PATH]
+                        [--history DIR]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import config
+import deck
+import handlog
+import player
+import playerstore
+import round
+
+BOT_STEAM_ID = 76561190000000000
+
+
+class BotTable:
+    """One simulated table: a Room of scripted bots driven through whole hands"""
+
+    def __init__(self, tableId, numPlayers, seed, minBet=10, initBet=50, foldRate=0.15, raiseRate=0.1,
+                 historyDir=None):
+        """Seat the bots and create the room
+
+        Args:
+            tableId: Index of the table, used to derive unique Steam IDs
+            numPlayers: Bots at the table (2-9)
+            seed: Seed for both the deck and the bot decisions
+            minBet: Room minimum bet, also the raise increment
+            initBet: Room buy-in bet
+            foldRate: Probability that a bot folds when it is to act
+            raiseRate: Probability that a bot raises instead of calling
+            historyDir: If set, the table's hands are logged to <historyDir>/table<tableId>.hands
+        """
+        players = [player.Player(BOT_STEAM_ID + tableId * 16 + i, f"bot{tableId}_{i}")
+                   for i in range(numPlayers)]
+        self.rng = random.Random(seed)
+        self.room = round.Room([players, minBet, initBet], rng=deck.seededRng(seed))
+        self.foldRate = foldRate
+        self.raiseRate = raiseRate
+        self.hands = 0
+        if historyDir:
+            self.room.recordTo(handlog.HandLogWriter(os.path.join(historyDir, f"table{tableId}.hands")), seed)
+
+    def _timed(self, latencies, func, *args):
+        start = time.perf_counter_ns()
+        result = func(*args)
+        latencies.append(time.perf_counter_ns() - start)
+        return result
+
+    def _act(self, bot, latencies):
+        """Let one bot fold, call or raise"""
+        room = self.room
+        state = room.activePlayers[bot]
+        bet = room.lastChip
+        if self.rng.random() < self.raiseRate:
+            bet += room.minBet
+        if self.rng.random() < self.foldRate or not self._timed(latencies, room.chipIn, bot, bet):
+            self._timed(latencies, room.playerQuitRound, state)
+
+    def playHand(self, latencies):
+        """Play one complete hand, yielding after every engine call
+
+        Betting follows room.actions, so folded and all-in seats are skipped.
+
+        Args:
+            latencies: List that receives the duration of each call in nanoseconds
+        """
+        room = self.room
+        self._timed(latencies, room.deliverCards)
+        yield
+        for street in round.STREETS:
+            if street != "preflop":
+                for _ in range(3 if street == "flop" else 1):
+                    self._timed(latencies, room.addCardToPublicPool)
+                yield
+            actions = room.actions  # deliverCards / addCardToPublicPool opened the betting round
+            bot = actions.current()
+            while bot is not None:
+                self._act(bot, latencies)
+                yield
+                bot = actions.current()
+            if actions.isHandOver():
+                break
+
+        if len(room.activePlayers) > 1:
+            self._timed(latencies, room.showdown)  # Side pots, one batched evaluation
+        else:
+            self._timed(latencies, room.endOfRound)
+        for bot in room.players:
+            if bot.money < room.initBet:
+                room.rebuy(bot, config.INIT_MONEY)  # Busted bots rebuy so the table keeps running
+        self._timed(latencies, room.newRound)
+        self.hands += 1
+        yield
+
+
+def runTables(tables, hands, latencies):
+    """Interleave the tables one engine call at a time until each has played `hands` hands"""
+    running = [(table, table.playHand(latencies)) for table in tables]
+    target = {id(table): table.hands + hands for table in tables}
+    while running:
+        still = []
+        for table, hand in running:
+            try:
+                next(hand)
+            except StopIteration:
+                if table.hands >= target[id(table)]:
+                    continue
+                hand = table.playHand(latencies)
+            still.append((table, hand))
+        running = still
+
+
+def percentile(sortedValues, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sortedValues:
+        return 0
+    index = min(len(sortedValues) - 1, max(0, math.ceil(fraction * len(sortedValues)) - 1))
+    return sortedValues[index]
+
+
+def simulate(numTables=100, numPlayers=6, hands=50, seed=1, historyDir=None):
+    """Build the tables, play the hands and collect the report
+
+    Returns:
+        Dict with hands/sec, action latency percentiles (µs) and memory per table (bytes)
+    """
+    if historyDir:
+        os.makedirs(historyDir, exist_ok=True)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tables = [BotTable(i, numPlayers, seed * 1000003 + i, historyDir=historyDir) for i in range(numTables)]
+    runTables(tables, 1, [])  # Warm-up hand so steady-state per-hand objects are counted too
+    perTable = (tracemalloc.get_traced_memory()[0] - before) / numTables
+    tracemalloc.stop()
+
+    latencies = []
+    start = time.perf_counter()
+    runTables(tables, hands, latencies)
+    elapsed = time.perf_counter() - start
+
+    for table in tables:
+        if table.room.history is not None:
+            table.room.history.close()
+
+    latencies.sort()
+    totalHands = numTables * hands
+    return {
+        "tables": numTables,
+        "players": numPlayers,
+        "hands": totalHands,
+        "seconds": elapsed,
+        "hands_per_sec": totalHands / elapsed,
+        "actions": len(latencies),
+        "action_p50_us": percentile(latencies, 0.50) / 1000,
+        "action_p99_us": percentile(latencies, 0.99) / 1000,
+        "action_mean_us": statistics.fmean(latencies) / 1000 if latencies else 0.0,
+        "memory_per_table_bytes": perTable,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tables", type=int, default=100)
+    parser.add_argument("--players", type=int, default=6)
+    parser.add_argument("--hands", type=int, default=50, help="hands per table")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--data-dir", help="where bot balances are stored (default: a temporary directory)")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--history", help="write one hand history log per table into this directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        # Player.storeData runs on every fold and win; keep bot profiles out of ./data
+        config.USER_DATA_PATH = args.data_dir or scratch
+        report = simulate(args.tables, args.players, args.hands, args.seed, args.history)
+        playerstore.close()  # Write the bot balances before the directory goes away
+
+    print(f"{report['tables']} tables x {report['players']} players, {report['hands']} hands "
+          f"in {report['seconds']:.2f}s")
+    print(f"  hands/sec          {report['hands_per_sec']:>12,.0f}")
+    print(f"  actions            {report['actions']:>12,}")
+    print(f"  action p50 / p99   {report['action_p50_us']:>9.1f} / {report['action_p99_us']:.1f} µs")
+    print(f"  memory per table   {report['memory_per_table_bytes'] / 1024:>9.1f} KiB")
+    if args.json:
+        with open(args.json, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
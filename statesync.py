@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+牌桌状态同步 —— 在 CHANNEL_GAME_STATE 上只发字段级增量
+
+房主每帧调用 StateSender.poll(room)：Room.revision 没变就什么也不发；变了就
+与上一次发出的状态比较，只把改动的字段编码成 protocol.StateDelta（通常十几个
+字节），每隔 keyframe_interval 条消息或收到 ResyncRequest 时改发完整的
+protocol.GameState 关键帧。
+
+客户端用 StateReceiver.apply(msg) 应用消息；增量的 base_revision 与本地版本
+对不上说明丢了消息，此时 apply 返回 False，应把 resync_request() 发回房主。
+"""
+import card
+import protocol
+import round
+
+
+def snapshot(room):
+    """
+    把 round.Room 的当前状态转成 protocol.GameState
+
+    Args:
+        room: Room 实例（底池、lastChip、在局玩家、公共牌、当前行动者）
+              当前行动者取自 room.actions，已弃牌 / 全下的座位不会轮到
+
+    Returns:
+        protocol.GameState
+    """
+    players = room.players
+    active = room.activePlayers
+    mask = 0
+    for seat, p in enumerate(players):
+        if p in active:
+            mask |= 1 << seat
+
+    order = room.order
+    current = room.actions.current()
+    turn = order._idx[current] if current is not None else protocol.NO_SEAT
+    street = round.STREETS.index(order.street.lower()) if order.street else 0
+    board = tuple(None if c is None else c.code for c in room.publicCardPool)
+    return protocol.GameState(room.revision & 0xFFFFFFFF, street, turn, mask, room.betPool, room.lastChip, board)
+
+
+def diff(old, new):
+    """
+    计算两个 GameState 之间的增量
+
+    Returns:
+        protocol.StateDelta；没有字段变化时返回 None
+    """
+    changes = [b if a != b else None for a, b in zip(old[1:], new[1:])]
+    if all(value is None for value in changes):
+        return None
+    return protocol.StateDelta(old.revision, new.revision, *changes)
+
+
+def apply_to_room(state, room):
+    """把收到的 GameState 写回客户端本地的 Room"""
+    room.betPool = state.pot
+    room.lastChip = state.last_chip
+    room.publicCardPool = [None if code is None else card.CARDS[code] for code in state.board]
+    active = room.activePlayers
+    room.activePlayers = {p: active[p] if p in active else round.PlayerInGame(p)
+                          for seat, p in enumerate(room.players) if state.active_mask >> seat & 1}
+
+    street = round.STREETS[state.street]
+    if room.order.street != street:
+        room.order.setStreet(street)
+    room.actions.setTurn(state.active_mask, -1 if state.turn_seat == protocol.NO_SEAT else state.turn_seat)
+    room.revision = state.revision
+
+
+class StateSender:
+    """房主端：生成关键帧 / 增量"""
+
+    KEYFRAME_INTERVAL = 30  # 每隔多少条消息强制发一次关键帧
+
+    def __init__(self, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self._last = None  # 上一次发出的完整状态
+        self._seen_revision = None  # 上一次 poll 时的 Room.revision
+        self._since_keyframe = 0
+        self._force_keyframe = True
+
+    def request_keyframe(self):
+        """下一次 poll 发关键帧（有客户端请求重同步时调用）"""
+        self._force_keyframe = True
+
+    def handle(self, sender_id, msg):
+        """作为 CHANNEL_GAME_STATE 的处理器注册到 SteamNetworkMessenger"""
+        if isinstance(msg, protocol.ResyncRequest):
+            print(f"[StateSync] {sender_id} 请求重同步 (revision {msg.revision})")
+            self.request_keyframe()
+
+    def poll(self, room):
+        """
+        检查房间状态，有变化时返回要广播的消息
+
+        Returns:
+            protocol.GameState（关键帧）、protocol.StateDelta，或 None（无需发送）
+        """
+        if room.revision == self._seen_revision and not self._force_keyframe:
+            return None
+        self._seen_revision = room.revision
+        state = snapshot(room)
+
+        last = self._last
+        if (self._force_keyframe or last is None or self._since_keyframe >= self.keyframe_interval
+                or not 0 < state.revision - last.revision <= 0xFFFF):
+            self._force_keyframe = False
+            self._since_keyframe = 0
+            self._last = state
+            return state
+
+        delta = diff(last, state)
+        if delta is None:
+            # 版本号变了但字段没变：不发送，接收端继续以旧版本为基准
+            return None
+        self._since_keyframe += 1
+        self._last = state
+        return delta
+
+
+class StateReceiver:
+    """客户端：按版本号应用关键帧 / 增量"""
+
+    def __init__(self):
+        self.state = None  # 当前的完整 GameState
+        self.needs_resync = False
+
+    def apply(self, msg):
+        """
+        应用一条状态消息
+
+        Returns:
+            bool: 状态已更新返回 True；发现断档返回 False（应发送 resync_request()）
+        """
+        if isinstance(msg, protocol.GameState):
+            self.state = msg
+            self.needs_resync = False
+            return True
+
+        if isinstance(msg, protocol.StateDelta):
+            state = self.state
+            if state is None or msg.base_revision != state.revision:
+                self.needs_resync = True
+                return False
+            fields = [old if new is None else new for old, new in zip(state[1:], msg[2:])]
+            self.state = protocol.GameState(msg.revision, *fields)
+            return True
+
+        return False
+
+    def resync_request(self):
+        """生成发给房主的重同步请求"""
+        return protocol.ResyncRequest(self.state.revision if self.state else 0)
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio 接入 Steam 回调与网络消息
+
+SteamAsync 在事件循环里跑一个泵任务，按 interval 节奏调用 run_callbacks()、
+收取已订阅通道的消息并发出 messenger 的发送队列，游戏逻辑可以写成协程：
+
+    async def main():
+        steam_io = SteamAsync(steam, messenger)
+        steam_io.start()
+        lobby_id = await steam_io.create_lobby(Lobby.ELobbyType_Public, 9)
+        async for sender_id, msg in steam_io.channel(net.SteamNetworkMessenger.CHANNEL_PLAYER_ACTION):
+            ...
+
+回调仍然由 steam_wrapper.SteamCallback 注册，只是结果被转给 Future / 队列。
+"""
+import asyncio
+from collections import deque
+
+import steam_wrapper
+
+CBID_LobbyCreated = 513
+CBID_LobbyEnter = 504
+CBID_LobbyDataUpdate = 505
+CBID_LobbyChatUpdate = 506
+
+k_EResultOK = 1
+k_EChatRoomEnterResponseSuccess = 1
+
+
+class SteamCallError(RuntimeError):
+    """Steam 调用返回了失败结果"""
+
+
+class SteamAsync:
+    """Steam 回调 / 网络消息的 asyncio 门面"""
+
+    DEFAULT_INTERVAL = 0.005  # 泵的默认周期（秒）
+
+    def __init__(self, steam=steam_wrapper, messenger=None, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            steam: 已 init() 的 steam_wrapper 模块
+            messenger: 可选的 net.SteamNetworkMessenger，用于 recv / channel
+            interval: 泵调用 run_callbacks 的周期（秒），可随时修改
+        """
+        self.steam = steam
+        self.messenger = messenger
+        self.interval = interval
+        self._task = None
+        self._callbacks = {}  # 回调 ID -> SteamCallback（保持引用，否则会被注销）
+        self._waiters = {}  # 回调 ID -> deque[(predicate, Future)]
+        self._event_queues = {}  # 回调 ID -> [asyncio.Queue]
+        self._channel_queues = {}  # 通道 -> asyncio.Queue[(sender_id, msg)]
+
+    # ======== 泵 ========
+
+    def start(self):
+        """在当前事件循环里启动泵任务（须在协程中调用）"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._pump())
+        return self._task
+
+    async def stop(self):
+        """停止泵任务，并让所有还在等待的调用以 CancelledError 结束"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for waiters in self._waiters.values():
+            for _, future in waiters:
+                future.cancel()
+            waiters.clear()
+
+    def pump_once(self):
+        """执行一次泵：分发 Steam 回调、处理网络消息、发出本轮排队的消息"""
+        self.steam.run_callbacks()
+        messenger = self.messenger
+        if messenger is not None:
+            messenger.process_messages()
+            messenger.flush()
+
+    async def _pump(self):
+        while True:
+            try:
+                self.pump_once()
+            except Exception as e:
+                print(f"[SteamAsync] 泵出错: {e}")
+            await asyncio.sleep(self.interval)
+
+    # ======== 回调 -> Future / 队列 ========
+
+    def _listen(self, callback_id: int):
+        """确保某个回调 ID 已注册到 steam_wrapper"""
+        if callback_id not in self._callbacks:
+            self._callbacks[callback_id] = self.steam.SteamCallback(
+                callback_id, lambda data, cid=callback_id: self._on_callback(cid, data))
+            self._waiters[callback_id] = deque()
+            self._event_queues[callback_id] = []
+
+    def _on_callback(self, callback_id: int, data: dict):
+        # 最早的、条件匹配的等待者拿到结果
+        waiters = self._waiters[callback_id]
+        for entry in waiters:
+            predicate, future = entry
+            if future.done():
+                continue
+            if predicate is None or predicate(data):
+                future.set_result(data)
+                waiters.remove(entry)
+                break
+        # 清掉已超时 / 取消的等待者
+        while waiters and waiters[0][1].done():
+            waiters.popleft()
+        for queue in self._event_queues[callback_id]:
+            queue.put_nowait(data)
+
+    def _expect(self, callback_id: int, predicate=None):
+        """登记一个等待者（同步完成，调用 Steam 之前登记可避免错过回调）"""
+        self._listen(callback_id)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[callback_id].append((predicate, future))
+        return future
+
+    async def wait_for(self, callback_id: int, predicate=None, timeout: float = None):
+        """
+        等待下一个满足条件的回调
+
+        Args:
+            callback_id: 回调 ID（如 504 LobbyEnter）
+            predicate: 可选的 func(data) -> bool
+            timeout: 超时秒数，None 表示一直等
+
+        Returns:
+            dict: 回调数据
+        """
+        return await asyncio.wait_for(self._expect(callback_id, predicate), timeout)
+
+    async def events(self, callback_id: int):
+        """异步迭代某个回调 ID 的所有后续回调"""
+        self._listen(callback_id)
+        queue = asyncio.Queue()
+        self._event_queues[callback_id].append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._event_queues[callback_id].remove(queue)
+
+    # ======== 可等待的 Steam 调用 ========
+
+    async def create_lobby(self, lobby_type: int, max_members: int, timeout: float = 10.0):
+        """
+        创建大厅并等待 LobbyCreated (513)
+
+        Returns:
+            int: 大厅 ID
+
+        Raises:
+            SteamCallError: 创建失败
+            asyncio.TimeoutError: 超时未收到回调
+        """
+        future = self._expect(CBID_LobbyCreated)
+        if not self.steam.create_lobby(lobby_type, max_members):
+            future.cancel()
+            raise SteamCallError("CreateLobby 调用失败")
+        data = await asyncio.wait_for(future, timeout)
+        if data['m_eResult'] != k_EResultOK:
+            raise SteamCallError(f"创建大厅失败，EResult={data['m_eResult']}")
+        return data['m_ulSteamIDLobby']
+
+    async def join_lobby(self, lobby_id: int, timeout: float = 10.0):
+        """
+        加入大厅并等待对应的 LobbyEnter (504)
+
+        Returns:
+            dict: LobbyEnter 回调数据
+
+        Raises:
+            SteamCallError: 进入被拒绝
+            asyncio.TimeoutError: 超时未收到回调
+        """
+        future = self._expect(CBID_LobbyEnter, lambda data: data['m_ulSteamIDLobby'] == lobby_id)
+        if not self.steam.join_lobby(lobby_id):
+            future.cancel()
+            raise SteamCallError("JoinLobby 调用失败")
+        data = await asyncio.wait_for(future, timeout)
+        if data['m_EChatRoomEnterResponse'] != k_EChatRoomEnterResponseSuccess:
+            raise SteamCallError(f"进入大厅失败，response={data['m_EChatRoomEnterResponse']}")
+        return data
+
+    # ======== 网络消息 ========
+
+    def _channel_queue(self, channel: int):
+        queue = self._channel_queues.get(channel)
+        if queue is None:
+            if self.messenger is None:
+                raise RuntimeError("SteamAsync 没有绑定 messenger")
+            queue = self._channel_queues[channel] = asyncio.Queue()
+            # 通道的消息改由队列接收（会替换该通道原有的处理器）
+            self.messenger.register_handler(channel, lambda sender_id, msg: queue.put_nowait((sender_id, msg)))
+        return queue
+
+    async def recv(self, channel: int):
+        """
+        等待指定通道的下一条消息
+
+        Returns:
+            (sender_steam_id, msg)
+        """
+        return await self._channel_queue(channel).get()
+
+    async def channel(self, channel: int):
+        """异步迭代指定通道的消息"""
+        queue = self._channel_queue(channel)
+        while True:
+            yield await queue.get()
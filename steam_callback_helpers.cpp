@@ -22,4 +22,5 @@ MAKE_HANDLER(lobby_data_update, LobbyDataUpdate_t)
 MAKE_HANDLER(lobby_invite, LobbyInvite_t)
 MAKE_HANDLER(join_requested, GameLobbyJoinRequested_t)
 MAKE_HANDLER(game_rich_presence_join_requested, GameRichPresenceJoinRequested_t)
-MAKE_HANDLER(game_overlay_activated, GameOverlayActivated_t)
\ No newline at end of file
+MAKE_HANDLER(game_overlay_activated, GameOverlayActivated_t)
+MAKE_HANDLER(persona_state_change, PersonaStateChange_t)
\ No newline at end of file
@@ -7,4 +7,5 @@ void* new_lobby_data_update_handler(SteamCallback* obj); void del_lobby_data_upd
 void* new_lobby_invite_handler(SteamCallback* obj); void del_lobby_invite_handler(void* handler);
 void* new_join_requested_handler(SteamCallback* obj); void del_join_requested_handler(void* handler);
 void* new_game_rich_presence_join_requested_handler(SteamCallback* obj); void del_game_rich_presence_join_requested_handler(void* handler);
-void* new_game_overlay_activated_handler(SteamCallback* obj); void del_game_overlay_activated_handler(void* handler);
\ No newline at end of file
+void* new_game_overlay_activated_handler(SteamCallback* obj); void del_game_overlay_activated_handler(void* handler);
+void* new_persona_state_change_handler(SteamCallback* obj); void del_persona_state_change_handler(void* handler);
\ No newline at end of file
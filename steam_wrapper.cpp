@@ -4,18 +4,18 @@
 {
     "distutils": {
         "depends": [
-            "resources\\sdk\\public\\steam\\isteamapps.h",
-            "resources\\sdk\\public\\steam\\isteamfriends.h",
-            "resources\\sdk\\public\\steam\\isteammatchmaking.h",
-            "resources\\sdk\\public\\steam\\isteamuser.h",
-            "resources\\sdk\\public\\steam\\isteamutils.h",
-            "resources\\sdk\\public\\steam\\steam_api.h",
-            "resources\\sdk\\public\\steam\\steam_api_common.h",
-            "resources\\sdk\\public\\steam\\steamclientpublic.h",
+            "resources/sdk/public/steam/isteamapps.h",
+            "resources/sdk/public/steam/isteamfriends.h",
+            "resources/sdk/public/steam/isteammatchmaking.h",
+            "resources/sdk/public/steam/isteamuser.h",
+            "resources/sdk/public/steam/isteamutils.h",
+            "resources/sdk/public/steam/steam_api.h",
+            "resources/sdk/public/steam/steam_api_common.h",
+            "resources/sdk/public/steam/steamclientpublic.h",
             "steam_callback_helpers.h"
         ],
         "include_dirs": [
-            "resources\\sdk\\public/steam",
+            "resources/sdk/public/steam",
             "."
         ],
         "language": "c++",
@@ -23,7 +23,7 @@
             "steam_api64"
         ],
         "library_dirs": [
-            "resources\\sdk\\redistributable_bin\\win64"
+            "resources/sdk/redistributable_bin/win64"
         ],
         "name": "steam_wrapper",
         "sources": [
@@ -1555,8 +1555,8 @@ static const char* const __pyx_f[] = {
 /*--- Type declarations ---*/
 struct SteamCallback;
 
-/* "steam_wrapper.pyx":109
- *     void del_game_overlay_activated_handler(void * handler)
+/* "steam_wrapper.pyx":115
+ *     void del_persona_state_change_handler(void * handler)
  * 
  * cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:             # <<<<<<<<<<<<<<
  *     cdef:
@@ -1583,6 +1583,7 @@ struct __pyx_vtabstruct_13steam_wrapper_SteamCallback {
   void (*on_join_requested)(struct SteamCallback *, GameLobbyJoinRequested_t *);
   void (*on_game_rich_presence_join_requested)(struct SteamCallback *, GameRichPresenceJoinRequested_t *);
   void (*on_game_overlay_activated)(struct SteamCallback *, GameOverlayActivated_t *);
+  void (*on_persona_state_change)(struct SteamCallback *, PersonaStateChange_t *);
 };
 static struct __pyx_vtabstruct_13steam_wrapper_SteamCallback *__pyx_vtabptr_13steam_wrapper_SteamCallback;
 /* #### Code section: utility_code_proto ### */
@@ -1920,6 +1921,24 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
 /* RejectKeywords.proto */
 static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds);
 
+/* dict_getitem_default.proto */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* CallUnboundCMethod1.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
 /* PyObjectFastCallMethod.proto */
 #if CYTHON_VECTORCALL && PY_VERSION_HEX >= 0x03090000
 #define __Pyx_PyObject_FastCallMethod(name, args, nargsf) PyObject_VectorcallMethod(name, args, nargsf, NULL)
@@ -1955,6 +1974,70 @@ static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
   #define __PYX_STD_MOVE_IF_SUPPORTED(x) x
 #endif
 
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
 /* CallTypeTraverse.proto */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
@@ -2153,6 +2236,27 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 #define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
 /* CLineInTraceback.proto */
 #if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
 static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
@@ -2378,6 +2482,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallbac
 void __pyx_f_13steam_wrapper_13SteamCallback_on_join_requested(struct SteamCallback *__pyx_v_self, GameLobbyJoinRequested_t *__pyx_v_data); /* proto*/
 void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requested(struct SteamCallback *__pyx_v_self, GameRichPresenceJoinRequested_t *__pyx_v_data); /* proto*/
 void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct SteamCallback *__pyx_v_self, GameOverlayActivated_t *__pyx_v_data); /* proto*/
+void __pyx_f_13steam_wrapper_13SteamCallback_on_persona_state_change(struct SteamCallback *__pyx_v_self, PersonaStateChange_t *__pyx_v_data); /* proto*/
 
 /* Module declarations from "steam_wrapper" */
 static ISteamFriends *__pyx_v_13steam_wrapper_g_friends;
@@ -2385,6 +2490,8 @@ static ISteamMatchmaking *__pyx_v_13steam_wrapper_g_matchmaking;
 static ISteamUser *__pyx_v_13steam_wrapper_g_user;
 static ISteamApps *__pyx_v_13steam_wrapper_g_apps;
 static ISteamUtils *__pyx_v_13steam_wrapper_g_utils;
+static PyObject *__pyx_v_13steam_wrapper__encoded_keys = 0;
+static PyObject *__pyx_f_13steam_wrapper__key(PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "steam_wrapper"
@@ -2396,74 +2503,99 @@ int __pyx_module_is_main_steam_wrapper = 0;
 static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_print;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_ValueError;
 /* #### Code section: string_decls ### */
 static const char __pyx_k_[] = "";
 static const char __pyx_k_Q[] = "\200\001\330\004\n\210+\220Q";
+static const char __pyx_k_i[] = "i";
+static const char __pyx_k_k[] = "k";
 static const char __pyx_k_q[] = "\200\001\330\004\007\200q\330\010\025\220[\240\001\240\030\250\021\250!";
 static const char __pyx_k_t[] = "\200\001\330\004\007\200t\210?\230'\240\021\330\004\013\210=\320\030)\250\021\250(\260!\260?\300!";
 static const char __pyx_k__2[] = "?";
 static const char __pyx_k__3[] = "\200\001\330\004\031\230\021";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_Q_2[] = "\200\001\330\004\025\220Q";
+static const char __pyx_k_get[] = "get";
 static const char __pyx_k_key[] = "key";
 static const char __pyx_k_pop[] = "pop";
 static const char __pyx_k_q_1[] = "\200\001\330\004\007\200q\330\010\021\320\021#\2401";
 static const char __pyx_k_func[] = "__func__";
 static const char __pyx_k_init[] = "init";
+static const char __pyx_k_keys[] = "keys";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_self[] = "self";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_count[] = "count";
+static const char __pyx_k_lobby[] = "lobby";
 static const char __pyx_k_print[] = "print";
 static const char __pyx_k_q_1_1[] = "\200\001\330\004\007\200q\330\010\021\320\0211\260\021\260(\270!\2701";
+static const char __pyx_k_q_avU[] = "\200\001\330\004\007\200q\330\010\021\320\021!\240\021\240$\240a\240v\250U\260'\270\021\270!";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_start[] = "start";
 static const char __pyx_k_utf_8[] = "utf-8";
 static const char __pyx_k_value[] = "value";
+static const char __pyx_k_c_keys[] = "c_keys";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_member[] = "member";
 static const char __pyx_k_module[] = "__module__";
+static const char __pyx_k_player[] = "player";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_t_1HAQ[] = "\200\001\330\004\007\200t\210?\230'\240\021\330\004\013\210=\320\030+\2501\250H\260A\260Q";
+static const char __pyx_k_values[] = "values";
 static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_encoded[] = "encoded";
+static const char __pyx_k_friends[] = "friends";
 static const char __pyx_k_iFriend[] = "iFriend";
 static const char __pyx_k_iMember[] = "iMember";
+static const char __pyx_k_members[] = "members";
 static const char __pyx_k_q_L_l_1[] = "\200\001\330\004\007\200q\330\010\017\210}\230L\250\001\250\035\260l\300!\330\004\013\2101";
 static const char __pyx_k_q_v_2_1[] = "\200\001\330\004\007\200q\330\010\017\210v\220[\240\002\320\"2\260!\330\004\013\2101";
 static const char __pyx_k_q_y_r_1[] = "\200\001\330\004\007\200q\330\010\017\210y\230\017\240r\250\027\260\001\260\031\270!\330\004\013\2101";
 static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_num_keys[] = "num_keys";
 static const char __pyx_k_q_Jaxq_1[] = "\200\001\330\004\007\200q\330\010\017\210}\230J\240a\240x\250q\260\001\330\004\013\2101";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_set_name[] = "__set_name__";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_shutdown[] = "shutdown";
-static const char __pyx_k_t87_6_Qc[] = "\200\001\330\004\007\200t\2108\2207\230!\330\004\013\2106\320\021%\240Q\240c\250\027\260\001\260\021";
 static const char __pyx_k_t9G1_7_1[] = "\200\001\330\004\007\200t\2109\220G\2301\330\004\013\2107\320\022#\2401";
+static const char __pyx_k_KEY_START[] = "KEY_START";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_friend_id[] = "friend_id";
 static const char __pyx_k_isenabled[] = "isenabled";
 static const char __pyx_k_m_bActive[] = "m_bActive";
 static const char __pyx_k_m_bLocked[] = "m_bLocked";
 static const char __pyx_k_m_eResult[] = "m_eResult";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
-static const char __pyx_k_q_WAZuG1A[] = "\200\001\330\004\007\200q\330\010\021\320\021!\240\021\240#\240W\250A\250Z\260u\270G\3001\300A";
 static const char __pyx_k_q_y_PPQ_1[] = "\200\001\330\004\007\200q\330\010\017\210y\320\030)\250\021\250)\260=\320@P\320PQ\330\004\013\2101";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_t_gQ_9O1A[] = "\200\001\330\004\007\200t\210;\220g\230Q\330\004\013\2109\220O\2401\240A";
+static const char __pyx_k_KEY_PLAYER[] = "KEY_PLAYER";
+static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_join_lobby[] = "join_lobby";
 static const char __pyx_k_lobby_type[] = "lobby_type";
 static const char __pyx_k_m_bSuccess[] = "m_bSuccess";
 static const char __pyx_k_m_ulGameID[] = "m_ulGameID";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_t87_6_Qd_1[] = "\200\001\330\004\007\200t\2108\2207\230!\330\004\013\2106\320\021%\240Q\240d\250!\2501";
 static const char __pyx_k_Callback_ID[] = "Callback ID ";
 static const char __pyx_k_callback_id[] = "callback_id";
+static const char __pyx_k_encoded_key[] = "encoded_key";
+static const char __pyx_k_get_friends[] = "get_friends";
 static const char __pyx_k_leave_lobby[] = "leave_lobby";
+static const char __pyx_k_m_ulSteamID[] = "m_ulSteamID";
 static const char __pyx_k_max_members[] = "max_members";
 static const char __pyx_k_py_callback[] = "py_callback";
 static const char __pyx_k_value_bytes[] = "value_bytes";
+static const char __pyx_k_A_q_m_Qa_1_1[] = "\200\001\330\004$\240A\330\004\007\200q\330\010\026\220m\240=\260\001\260\030\270\021\270/\310\024\310Q\310a\330\010\017\210{\230'\240\021\240)\2501\330\004\013\2101";
 static const char __pyx_k_RuntimeError[] = "RuntimeError";
 static const char __pyx_k_create_lobby[] = "create_lobby";
 static const char __pyx_k_iFriendFlags[] = "iFriendFlags";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
 static const char __pyx_k_lobby_id_int[] = "lobby_id_int";
-static const char __pyx_k_q_81O3gQjPUU[] = "\200\001\330\004\007\200q\330\010\025\220]\240!\2408\2501\250O\2703\270g\300Q\300j\320PU\320U\\\320\\]\320]^";
 static const char __pyx_k_steam_id_int[] = "steam_id_int";
 static const char __pyx_k_stringsource[] = "<stringsource>";
 static const char __pyx_k_SteamCallback[] = "SteamCallback";
@@ -2473,21 +2605,23 @@ static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_run_callbacks[] = "run_callbacks";
 static const char __pyx_k_steamIDFriend[] = "steamIDFriend";
 static const char __pyx_k_steam_wrapper[] = "steam_wrapper";
-static const char __pyx_k_t_AXQoS_q_RWW[] = "\200\001\330\004\007\200t\210?\230!\330\004\021\320\021$\240A\240X\250Q\250o\270S\300\007\300q\310\n\320RW\320W^\320^_\320_`";
+static const char __pyx_k_t_AXQoT_WTUUV[] = "\200\001\330\004\007\200t\210?\230!\330\004\021\320\021$\240A\240X\250Q\250o\270T\300\021\300&\310\005\310W\320TU\320UV";
 static const char __pyx_k_bLobbyJoinable[] = "bLobbyJoinable";
 static const char __pyx_k_get_lobby_data[] = "get_lobby_data";
+static const char __pyx_k_m_nChangeFlags[] = "m_nChangeFlags";
 static const char __pyx_k_m_steamIDLobby[] = "m_steamIDLobby";
 static const char __pyx_k_q_2_81O8Sccd_1[] = "\200\001\330\004\007\200q\330\010\017\210}\320\0342\260!\2608\2701\270O\3108\320Sc\320cd\330\004\013\2101";
+static const char __pyx_k_q_81O4q_e7RSST[] = "\200\001\330\004\007\200q\330\010\025\220]\240!\2408\2501\250O\2704\270q\300\006\300e\3107\320RS\320ST";
 static const char __pyx_k_set_lobby_data[] = "set_lobby_data";
-static const char __pyx_k_A_q_m_GSTTU_1_1[] = "\200\001\330\004$\240A\330\004\007\200q\330\010\026\220m\240=\260\001\260\030\270\021\270/\310\023\310G\320ST\320TU\330\010\017\210{\230'\240\021\240)\2501\330\004\013\2101";
 static const char __pyx_k_get_my_steam_id[] = "get_my_steam_id";
 static const char __pyx_k_m_steamIDFriend[] = "m_steamIDFriend";
 static const char __pyx_k_m_ulSteamIDUser[] = "m_ulSteamIDUser";
+static const char __pyx_k_q_q_PQQ_ddeef_1[] = "\200\001\330\004\007\200q\330\010\017\210}\320\034/\250q\260\010\270\001\270\037\310\010\320PQ\320Q`\320`d\320de\320ef\330\004\013\2101";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_get_friend_count[] = "get_friend_count";
 static const char __pyx_k_m_ulSteamIDLobby[] = "m_ulSteamIDLobby";
+static const char __pyx_k_get_lobby_members[] = "get_lobby_members";
 static const char __pyx_k_m_ulSteamIDMember[] = "m_ulSteamIDMember";
-static const char __pyx_k_q_q_PQQ_ccjjkkl_1[] = "\200\001\330\004\007\200q\330\010\017\210}\320\034/\250q\260\010\270\001\270\037\310\010\320PQ\320Q`\320`c\320cj\320jk\320kl\330\004\013\2101";
 static const char __pyx_k_set_rich_presence[] = "set_rich_presence";
 static const char __pyx_k_steam_wrapper_pyx[] = "steam_wrapper.pyx";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
@@ -2495,6 +2629,7 @@ static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_is_overlay_enabled[] = "is_overlay_enabled";
 static const char __pyx_k_set_lobby_joinable[] = "set_lobby_joinable";
 static const char __pyx_k_clear_rich_presence[] = "clear_rich_presence";
+static const char __pyx_k_get_all_member_data[] = "get_all_member_data";
 static const char __pyx_k_get_friend_by_index[] = "get_friend_by_index";
 static const char __pyx_k_get_my_persona_name[] = "get_my_persona_name";
 static const char __pyx_k_SteamAPI_Init_failed[] = "SteamAPI_Init() failed.";
@@ -2507,13 +2642,17 @@ static const char __pyx_k_m_ulSteamIDUserChanged[] = "m_ulSteamIDUserChanged";
 static const char __pyx_k_get_friend_persona_name[] = "get_friend_persona_name";
 static const char __pyx_k_m_ulSteamIDMakingChange[] = "m_ulSteamIDMakingChange";
 static const char __pyx_k_m_EChatRoomEnterResponse[] = "m_EChatRoomEnterResponse";
+static const char __pyx_k_1_t_M_AQ_5_5QgR_OsRVV_aab[] = "\200\001\360\006\000\005\033\230(\240!\2401\330\004\007\200t\210?\230'\240\021\330\004\014\210M\320\031,\250A\250Q\330\004\013\2105\220\001\220\021\220-\320\0375\260Q\260g\270R\320?O\310s\320RV\320V[\320[`\320`a\320ab";
 static const char __pyx_k_get_lobby_member_by_index[] = "get_lobby_member_by_index";
 static const char __pyx_k_m_rgfChatMemberStateChange[] = "m_rgfChatMemberStateChange";
 static const char __pyx_k_SteamCallback___reduce_cython[] = "SteamCallback.__reduce_cython__";
 static const char __pyx_k_Failed_to_get_Steam_interfaces[] = "Failed to get Steam interfaces.";
 static const char __pyx_k_t_l_1_A_A_Ya_Ya_j_uJd_G4wd_l_1[] = "\200\001\330\004\005\330\004\007\200t\210=\230\001\330\010\016\210l\230!\2301\330\004\020\220\014\230A\330\004\024\320\024$\240A\330\004\r\210Y\220a\330\004\r\210Y\220a\330\004\016\210j\230\001\330\004\007\200u\210J\220d\230.\250\004\250G\2604\260w\270d\300!\330\010\016\210l\230!\2301\330\004\t\210\021\210!";
+static const char __pyx_k_1_t_D_7_at1E_WA_s_1_y_j_U_1_gQa[] = "\200\001\360\020\000\005\033\230(\240!\2401\360\010\000\005\010\200t\210>\230\023\230D\240\013\2507\260!\330\004\016\210a\210t\2201\220E\230\024\230W\240A\330\004\017\210s\220!\2201\330\004\007\200y\220\002\220!\330\010\016\210j\230\001\230\021\330\004\010\210\005\210U\220!\2201\330\010\026\220g\230Q\230a\330\010\016\210a\210u\220A\330\004\014\210M\320\031,\250A\250Q\330\004\016\210a\330\004\010\210\005\210U\220!\2201\330\010\021\220\035\320\0364\260A\260W\270A\330\010\021\220\025\220a\220q\230\010\240\r\320-@\300\001\300\027\310\010\320PV\320VW\320W[\320[_\320_d\320di\320ij\320jk\330\010\017\210w\220b\230\006\320\036.\250a\330\030!\320!6\260a\260w\270g\300Q\300i\310{\320Z[\330\004\013\2105\220\001\220\021";
 static const char __pyx_k_SteamCallback___setstate_cython[] = "SteamCallback.__setstate_cython__";
+static const char __pyx_k_t_gQ_I_AQ_a_U_1_I_as_wb_1_6az_R[] = "\200\001\360\010\000\005\010\200t\210;\220g\230Q\330\004\014\210I\220_\240A\240Q\330\004\016\210a\330\004\010\210\005\210U\220!\2201\330\010\024\220I\320\035.\250a\250s\260!\330\010\017\210w\220b\230\t\320!1\260\021\330\030!\320!6\260a\260z\300\027\310\001\310\031\320RS\330\004\013\2105\220\001\220\021";
 static const char __pyx_k_activate_game_overlay_invite_dia[] = "activate_game_overlay_invite_dialog";
+static const char __pyx_k_get_all_member_data_takes_at_mos[] = "get_all_member_data() takes at most 16 keys";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_steam_wrapper_Steamworks_API_ini[] = "steam_wrapper: Steamworks API initialized successfully.";
 /* #### Code section: decls ### */
@@ -2534,16 +2673,19 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
 static PyObject *__pyx_pf_13steam_wrapper_20get_friend_count(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_iFriendFlags); /* proto */
 static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_iFriend, int __pyx_v_iFriendFlags); /* proto */
 static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_steamIDFriend); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lobby_type, PyObject *__pyx_v_max_members); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_iMember); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_38get_num_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_40get_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, unsigned PY_LONG_LONG __pyx_v_steam_id_int, PyObject *__pyx_v_key); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
-static PyObject *__pyx_pf_13steam_wrapper_44set_lobby_joinable(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_bLobbyJoinable); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_26get_friends(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_iFriendFlags); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_28create_lobby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lobby_type, PyObject *__pyx_v_max_members); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_30join_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_32leave_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_34get_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_36set_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_38get_lobby_member_by_index(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_iMember); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_40get_num_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_42get_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_44get_all_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_keys); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_46get_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, unsigned PY_LONG_LONG __pyx_v_steam_id_int, PyObject *__pyx_v_key); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_48set_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_13steam_wrapper_50set_lobby_joinable(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_bLobbyJoinable); /* proto */
 static PyObject *__pyx_tp_new_13steam_wrapper_SteamCallback(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
@@ -2585,9 +2727,10 @@ typedef struct {
   #endif
   PyObject *SteamCallback_Type;
   PyTypeObject *__pyx_ptype_13steam_wrapper_SteamCallback;
+  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_get;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
-  PyObject *__pyx_codeobj_tab[25];
-  PyObject *__pyx_string_tab[95];
+  PyObject *__pyx_codeobj_tab[28];
+  PyObject *__pyx_string_tab[124];
   PyObject *__pyx_int_0;
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -2629,98 +2772,127 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u_ __pyx_string_tab[0]
 #define __pyx_kp_u_Callback_ID __pyx_string_tab[1]
 #define __pyx_kp_u_Failed_to_get_Steam_interfaces __pyx_string_tab[2]
-#define __pyx_n_u_RuntimeError __pyx_string_tab[3]
-#define __pyx_kp_u_SteamAPI_Init_failed __pyx_string_tab[4]
-#define __pyx_n_u_SteamCallback __pyx_string_tab[5]
-#define __pyx_n_u_SteamCallback___reduce_cython __pyx_string_tab[6]
-#define __pyx_n_u_SteamCallback___setstate_cython __pyx_string_tab[7]
-#define __pyx_n_u_TypeError __pyx_string_tab[8]
-#define __pyx_kp_u__2 __pyx_string_tab[9]
-#define __pyx_n_u_activate_game_overlay_invite_dia __pyx_string_tab[10]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[11]
-#define __pyx_n_u_bLobbyJoinable __pyx_string_tab[12]
-#define __pyx_n_u_callback_id __pyx_string_tab[13]
-#define __pyx_n_u_clear_rich_presence __pyx_string_tab[14]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[15]
-#define __pyx_n_u_create_lobby __pyx_string_tab[16]
-#define __pyx_kp_u_disable __pyx_string_tab[17]
-#define __pyx_kp_u_enable __pyx_string_tab[18]
-#define __pyx_n_u_encode __pyx_string_tab[19]
-#define __pyx_n_u_func __pyx_string_tab[20]
-#define __pyx_kp_u_gc __pyx_string_tab[21]
-#define __pyx_n_u_get_friend_by_index __pyx_string_tab[22]
-#define __pyx_n_u_get_friend_count __pyx_string_tab[23]
-#define __pyx_n_u_get_friend_persona_name __pyx_string_tab[24]
-#define __pyx_n_u_get_launch_query_param __pyx_string_tab[25]
-#define __pyx_n_u_get_lobby_data __pyx_string_tab[26]
-#define __pyx_n_u_get_lobby_member_by_index __pyx_string_tab[27]
-#define __pyx_n_u_get_lobby_member_data __pyx_string_tab[28]
-#define __pyx_n_u_get_my_persona_name __pyx_string_tab[29]
-#define __pyx_n_u_get_my_steam_id __pyx_string_tab[30]
-#define __pyx_n_u_get_num_lobby_members __pyx_string_tab[31]
-#define __pyx_n_u_getstate __pyx_string_tab[32]
-#define __pyx_n_u_iFriend __pyx_string_tab[33]
-#define __pyx_n_u_iFriendFlags __pyx_string_tab[34]
-#define __pyx_n_u_iMember __pyx_string_tab[35]
-#define __pyx_n_u_init __pyx_string_tab[36]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[37]
-#define __pyx_kp_u_is_not_supported_yet __pyx_string_tab[38]
-#define __pyx_n_u_is_overlay_enabled __pyx_string_tab[39]
-#define __pyx_kp_u_isenabled __pyx_string_tab[40]
-#define __pyx_n_u_join_lobby __pyx_string_tab[41]
-#define __pyx_n_u_key __pyx_string_tab[42]
-#define __pyx_n_u_leave_lobby __pyx_string_tab[43]
-#define __pyx_n_u_lobby_id_int __pyx_string_tab[44]
-#define __pyx_n_u_lobby_type __pyx_string_tab[45]
-#define __pyx_n_u_m_EChatRoomEnterResponse __pyx_string_tab[46]
-#define __pyx_n_u_m_bActive __pyx_string_tab[47]
-#define __pyx_n_u_m_bLocked __pyx_string_tab[48]
-#define __pyx_n_u_m_bSuccess __pyx_string_tab[49]
-#define __pyx_n_u_m_eResult __pyx_string_tab[50]
-#define __pyx_n_u_m_rgchConnect __pyx_string_tab[51]
-#define __pyx_n_u_m_rgfChatMemberStateChange __pyx_string_tab[52]
-#define __pyx_n_u_m_steamIDFriend __pyx_string_tab[53]
-#define __pyx_n_u_m_steamIDLobby __pyx_string_tab[54]
-#define __pyx_n_u_m_ulGameID __pyx_string_tab[55]
-#define __pyx_n_u_m_ulSteamIDLobby __pyx_string_tab[56]
-#define __pyx_n_u_m_ulSteamIDMakingChange __pyx_string_tab[57]
-#define __pyx_n_u_m_ulSteamIDMember __pyx_string_tab[58]
-#define __pyx_n_u_m_ulSteamIDUser __pyx_string_tab[59]
-#define __pyx_n_u_m_ulSteamIDUserChanged __pyx_string_tab[60]
-#define __pyx_n_u_main __pyx_string_tab[61]
-#define __pyx_n_u_max_members __pyx_string_tab[62]
-#define __pyx_n_u_module __pyx_string_tab[63]
-#define __pyx_n_u_name __pyx_string_tab[64]
-#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[65]
-#define __pyx_n_u_pop __pyx_string_tab[66]
-#define __pyx_n_u_print __pyx_string_tab[67]
-#define __pyx_n_u_py_callback __pyx_string_tab[68]
-#define __pyx_n_u_pyx_state __pyx_string_tab[69]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[70]
-#define __pyx_n_u_qualname __pyx_string_tab[71]
-#define __pyx_n_u_reduce __pyx_string_tab[72]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[73]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[74]
-#define __pyx_n_u_run_callbacks __pyx_string_tab[75]
-#define __pyx_n_u_self __pyx_string_tab[76]
-#define __pyx_n_u_set_lobby_data __pyx_string_tab[77]
-#define __pyx_n_u_set_lobby_joinable __pyx_string_tab[78]
-#define __pyx_n_u_set_lobby_member_data __pyx_string_tab[79]
-#define __pyx_n_u_set_name __pyx_string_tab[80]
-#define __pyx_n_u_set_rich_presence __pyx_string_tab[81]
-#define __pyx_n_u_setstate __pyx_string_tab[82]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[83]
-#define __pyx_n_u_shutdown __pyx_string_tab[84]
-#define __pyx_n_u_steamIDFriend __pyx_string_tab[85]
-#define __pyx_n_u_steam_id_int __pyx_string_tab[86]
-#define __pyx_n_u_steam_wrapper __pyx_string_tab[87]
-#define __pyx_kp_u_steam_wrapper_Steamworks_API_ini __pyx_string_tab[88]
-#define __pyx_kp_u_steam_wrapper_pyx __pyx_string_tab[89]
-#define __pyx_kp_u_stringsource __pyx_string_tab[90]
-#define __pyx_n_u_test __pyx_string_tab[91]
-#define __pyx_kp_u_utf_8 __pyx_string_tab[92]
-#define __pyx_n_u_value __pyx_string_tab[93]
-#define __pyx_n_u_value_bytes __pyx_string_tab[94]
+#define __pyx_n_u_KEY_PLAYER __pyx_string_tab[3]
+#define __pyx_n_u_KEY_START __pyx_string_tab[4]
+#define __pyx_n_u_RuntimeError __pyx_string_tab[5]
+#define __pyx_kp_u_SteamAPI_Init_failed __pyx_string_tab[6]
+#define __pyx_n_u_SteamCallback __pyx_string_tab[7]
+#define __pyx_n_u_SteamCallback___reduce_cython __pyx_string_tab[8]
+#define __pyx_n_u_SteamCallback___setstate_cython __pyx_string_tab[9]
+#define __pyx_n_u_TypeError __pyx_string_tab[10]
+#define __pyx_n_u_ValueError __pyx_string_tab[11]
+#define __pyx_kp_u__2 __pyx_string_tab[12]
+#define __pyx_n_u_activate_game_overlay_invite_dia __pyx_string_tab[13]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[14]
+#define __pyx_n_u_bLobbyJoinable __pyx_string_tab[15]
+#define __pyx_n_u_c_keys __pyx_string_tab[16]
+#define __pyx_n_u_callback_id __pyx_string_tab[17]
+#define __pyx_n_u_clear_rich_presence __pyx_string_tab[18]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[19]
+#define __pyx_n_u_count __pyx_string_tab[20]
+#define __pyx_n_u_create_lobby __pyx_string_tab[21]
+#define __pyx_kp_u_disable __pyx_string_tab[22]
+#define __pyx_kp_u_enable __pyx_string_tab[23]
+#define __pyx_n_u_encode __pyx_string_tab[24]
+#define __pyx_n_u_encoded __pyx_string_tab[25]
+#define __pyx_n_u_encoded_key __pyx_string_tab[26]
+#define __pyx_n_u_friend_id __pyx_string_tab[27]
+#define __pyx_n_u_friends __pyx_string_tab[28]
+#define __pyx_n_u_func __pyx_string_tab[29]
+#define __pyx_kp_u_gc __pyx_string_tab[30]
+#define __pyx_n_u_get __pyx_string_tab[31]
+#define __pyx_n_u_get_all_member_data __pyx_string_tab[32]
+#define __pyx_kp_u_get_all_member_data_takes_at_mos __pyx_string_tab[33]
+#define __pyx_n_u_get_friend_by_index __pyx_string_tab[34]
+#define __pyx_n_u_get_friend_count __pyx_string_tab[35]
+#define __pyx_n_u_get_friend_persona_name __pyx_string_tab[36]
+#define __pyx_n_u_get_friends __pyx_string_tab[37]
+#define __pyx_n_u_get_launch_query_param __pyx_string_tab[38]
+#define __pyx_n_u_get_lobby_data __pyx_string_tab[39]
+#define __pyx_n_u_get_lobby_member_by_index __pyx_string_tab[40]
+#define __pyx_n_u_get_lobby_member_data __pyx_string_tab[41]
+#define __pyx_n_u_get_lobby_members __pyx_string_tab[42]
+#define __pyx_n_u_get_my_persona_name __pyx_string_tab[43]
+#define __pyx_n_u_get_my_steam_id __pyx_string_tab[44]
+#define __pyx_n_u_get_num_lobby_members __pyx_string_tab[45]
+#define __pyx_n_u_getstate __pyx_string_tab[46]
+#define __pyx_n_u_i __pyx_string_tab[47]
+#define __pyx_n_u_iFriend __pyx_string_tab[48]
+#define __pyx_n_u_iFriendFlags __pyx_string_tab[49]
+#define __pyx_n_u_iMember __pyx_string_tab[50]
+#define __pyx_n_u_init __pyx_string_tab[51]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[52]
+#define __pyx_kp_u_is_not_supported_yet __pyx_string_tab[53]
+#define __pyx_n_u_is_overlay_enabled __pyx_string_tab[54]
+#define __pyx_kp_u_isenabled __pyx_string_tab[55]
+#define __pyx_n_u_join_lobby __pyx_string_tab[56]
+#define __pyx_n_u_k __pyx_string_tab[57]
+#define __pyx_n_u_key __pyx_string_tab[58]
+#define __pyx_n_u_keys __pyx_string_tab[59]
+#define __pyx_n_u_leave_lobby __pyx_string_tab[60]
+#define __pyx_n_u_lobby __pyx_string_tab[61]
+#define __pyx_n_u_lobby_id_int __pyx_string_tab[62]
+#define __pyx_n_u_lobby_type __pyx_string_tab[63]
+#define __pyx_n_u_m_EChatRoomEnterResponse __pyx_string_tab[64]
+#define __pyx_n_u_m_bActive __pyx_string_tab[65]
+#define __pyx_n_u_m_bLocked __pyx_string_tab[66]
+#define __pyx_n_u_m_bSuccess __pyx_string_tab[67]
+#define __pyx_n_u_m_eResult __pyx_string_tab[68]
+#define __pyx_n_u_m_nChangeFlags __pyx_string_tab[69]
+#define __pyx_n_u_m_rgchConnect __pyx_string_tab[70]
+#define __pyx_n_u_m_rgfChatMemberStateChange __pyx_string_tab[71]
+#define __pyx_n_u_m_steamIDFriend __pyx_string_tab[72]
+#define __pyx_n_u_m_steamIDLobby __pyx_string_tab[73]
+#define __pyx_n_u_m_ulGameID __pyx_string_tab[74]
+#define __pyx_n_u_m_ulSteamID __pyx_string_tab[75]
+#define __pyx_n_u_m_ulSteamIDLobby __pyx_string_tab[76]
+#define __pyx_n_u_m_ulSteamIDMakingChange __pyx_string_tab[77]
+#define __pyx_n_u_m_ulSteamIDMember __pyx_string_tab[78]
+#define __pyx_n_u_m_ulSteamIDUser __pyx_string_tab[79]
+#define __pyx_n_u_m_ulSteamIDUserChanged __pyx_string_tab[80]
+#define __pyx_n_u_main __pyx_string_tab[81]
+#define __pyx_n_u_max_members __pyx_string_tab[82]
+#define __pyx_n_u_member __pyx_string_tab[83]
+#define __pyx_n_u_members __pyx_string_tab[84]
+#define __pyx_n_u_module __pyx_string_tab[85]
+#define __pyx_n_u_name __pyx_string_tab[86]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[87]
+#define __pyx_n_u_num_keys __pyx_string_tab[88]
+#define __pyx_n_b_player __pyx_string_tab[89]
+#define __pyx_n_u_player __pyx_string_tab[90]
+#define __pyx_n_u_pop __pyx_string_tab[91]
+#define __pyx_n_u_print __pyx_string_tab[92]
+#define __pyx_n_u_py_callback __pyx_string_tab[93]
+#define __pyx_n_u_pyx_state __pyx_string_tab[94]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[95]
+#define __pyx_n_u_qualname __pyx_string_tab[96]
+#define __pyx_n_u_range __pyx_string_tab[97]
+#define __pyx_n_u_reduce __pyx_string_tab[98]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[99]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[100]
+#define __pyx_n_u_run_callbacks __pyx_string_tab[101]
+#define __pyx_n_u_self __pyx_string_tab[102]
+#define __pyx_n_u_set_lobby_data __pyx_string_tab[103]
+#define __pyx_n_u_set_lobby_joinable __pyx_string_tab[104]
+#define __pyx_n_u_set_lobby_member_data __pyx_string_tab[105]
+#define __pyx_n_u_set_name __pyx_string_tab[106]
+#define __pyx_n_u_set_rich_presence __pyx_string_tab[107]
+#define __pyx_n_u_setstate __pyx_string_tab[108]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[109]
+#define __pyx_n_u_shutdown __pyx_string_tab[110]
+#define __pyx_n_b_start __pyx_string_tab[111]
+#define __pyx_n_u_start __pyx_string_tab[112]
+#define __pyx_n_u_steamIDFriend __pyx_string_tab[113]
+#define __pyx_n_u_steam_id_int __pyx_string_tab[114]
+#define __pyx_n_u_steam_wrapper __pyx_string_tab[115]
+#define __pyx_kp_u_steam_wrapper_Steamworks_API_ini __pyx_string_tab[116]
+#define __pyx_kp_u_steam_wrapper_pyx __pyx_string_tab[117]
+#define __pyx_kp_u_stringsource __pyx_string_tab[118]
+#define __pyx_n_u_test __pyx_string_tab[119]
+#define __pyx_kp_u_utf_8 __pyx_string_tab[120]
+#define __pyx_n_u_value __pyx_string_tab[121]
+#define __pyx_n_u_value_bytes __pyx_string_tab[122]
+#define __pyx_n_u_values __pyx_string_tab[123]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2743,8 +2915,8 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   #endif
   Py_CLEAR(clear_module_state->__pyx_ptype_13steam_wrapper_SteamCallback);
   Py_CLEAR(clear_module_state->SteamCallback_Type);
-  for (int i=0; i<25; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<95; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<28; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<124; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   Py_CLEAR(clear_module_state->__pyx_int_0);
   return 0;
 }
@@ -2768,15 +2940,15 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   #endif
   Py_VISIT(traverse_module_state->__pyx_ptype_13steam_wrapper_SteamCallback);
   Py_VISIT(traverse_module_state->SteamCallback_Type);
-  for (int i=0; i<25; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<95; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<28; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<124; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_int_0);
   return 0;
 }
 #endif
 /* #### Code section: module_code ### */
 
-/* "steam_wrapper.pyx":115
+/* "steam_wrapper.pyx":121
  *         int callback_id
  * 
  *     def __cinit__(self, int callback_id, object py_callback):             # <<<<<<<<<<<<<<
@@ -2807,39 +2979,39 @@ static int __pyx_pw_13steam_wrapper_13SteamCallback_1__cinit__(PyObject *__pyx_v
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_callback_id,&__pyx_mstate_global->__pyx_n_u_py_callback,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 115, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 121, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 115, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 121, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 115, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 121, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__cinit__", 0) < 0) __PYX_ERR(0, 115, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__cinit__", 0) < 0) __PYX_ERR(0, 121, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, i); __PYX_ERR(0, 115, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, i); __PYX_ERR(0, 121, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 115, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 121, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 115, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 121, __pyx_L3_error)
     }
-    __pyx_v_callback_id = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_callback_id == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 115, __pyx_L3_error)
+    __pyx_v_callback_id = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_callback_id == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L3_error)
     __pyx_v_py_callback = values[1];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 115, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 121, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -2875,7 +3047,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "steam_wrapper.pyx":116
+  /* "steam_wrapper.pyx":122
  * 
  *     def __cinit__(self, int callback_id, object py_callback):
  *         self.callback_id = callback_id             # <<<<<<<<<<<<<<
@@ -2884,7 +3056,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
   __pyx_v_self->callback_id = __pyx_v_callback_id;
 
-  /* "steam_wrapper.pyx":117
+  /* "steam_wrapper.pyx":123
  *     def __cinit__(self, int callback_id, object py_callback):
  *         self.callback_id = callback_id
  *         self._py_callback = py_callback             # <<<<<<<<<<<<<<
@@ -2897,7 +3069,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
   __Pyx_DECREF(__pyx_v_self->_py_callback);
   __pyx_v_self->_py_callback = __pyx_v_py_callback;
 
-  /* "steam_wrapper.pyx":118
+  /* "steam_wrapper.pyx":124
  *         self.callback_id = callback_id
  *         self._py_callback = py_callback
  *         self._handler = NULL             # <<<<<<<<<<<<<<
@@ -2906,7 +3078,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
   __pyx_v_self->_handler = NULL;
 
-  /* "steam_wrapper.pyx":120
+  /* "steam_wrapper.pyx":126
  *         self._handler = NULL
  * 
  *         if callback_id == 513:             # <<<<<<<<<<<<<<
@@ -2916,7 +3088,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
   switch (__pyx_v_callback_id) {
     case 0x201:
 
-    /* "steam_wrapper.pyx":121
+    /* "steam_wrapper.pyx":127
  * 
  *         if callback_id == 513:
  *             self._handler = new_lobby_created_handler(self)             # <<<<<<<<<<<<<<
@@ -2925,7 +3097,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_lobby_created_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":120
+    /* "steam_wrapper.pyx":126
  *         self._handler = NULL
  * 
  *         if callback_id == 513:             # <<<<<<<<<<<<<<
@@ -2935,7 +3107,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x14D:
 
-    /* "steam_wrapper.pyx":123
+    /* "steam_wrapper.pyx":129
  *             self._handler = new_lobby_created_handler(self)
  *         elif callback_id == 333:
  *             self._handler = new_join_requested_handler(self)             # <<<<<<<<<<<<<<
@@ -2944,7 +3116,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_join_requested_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":122
+    /* "steam_wrapper.pyx":128
  *         if callback_id == 513:
  *             self._handler = new_lobby_created_handler(self)
  *         elif callback_id == 333:             # <<<<<<<<<<<<<<
@@ -2954,7 +3126,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x1F8:
 
-    /* "steam_wrapper.pyx":125
+    /* "steam_wrapper.pyx":131
  *             self._handler = new_join_requested_handler(self)
  *         elif callback_id == 504:
  *             self._handler = new_lobby_enter_handler(self)             # <<<<<<<<<<<<<<
@@ -2963,7 +3135,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_lobby_enter_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":124
+    /* "steam_wrapper.pyx":130
  *         elif callback_id == 333:
  *             self._handler = new_join_requested_handler(self)
  *         elif callback_id == 504:             # <<<<<<<<<<<<<<
@@ -2973,7 +3145,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x1FA:
 
-    /* "steam_wrapper.pyx":127
+    /* "steam_wrapper.pyx":133
  *             self._handler = new_lobby_enter_handler(self)
  *         elif callback_id == 506:
  *             self._handler = new_lobby_chat_update_handler(self)             # <<<<<<<<<<<<<<
@@ -2982,7 +3154,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_lobby_chat_update_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":126
+    /* "steam_wrapper.pyx":132
  *         elif callback_id == 504:
  *             self._handler = new_lobby_enter_handler(self)
  *         elif callback_id == 506:             # <<<<<<<<<<<<<<
@@ -2992,7 +3164,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x1F9:
 
-    /* "steam_wrapper.pyx":129
+    /* "steam_wrapper.pyx":135
  *             self._handler = new_lobby_chat_update_handler(self)
  *         elif callback_id == 505:
  *             self._handler = new_lobby_data_update_handler(self)             # <<<<<<<<<<<<<<
@@ -3001,7 +3173,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_lobby_data_update_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":128
+    /* "steam_wrapper.pyx":134
  *         elif callback_id == 506:
  *             self._handler = new_lobby_chat_update_handler(self)
  *         elif callback_id == 505:             # <<<<<<<<<<<<<<
@@ -3011,7 +3183,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x1F7:
 
-    /* "steam_wrapper.pyx":131
+    /* "steam_wrapper.pyx":137
  *             self._handler = new_lobby_data_update_handler(self)
  *         elif callback_id == 503:
  *             self._handler = new_lobby_invite_handler(self)             # <<<<<<<<<<<<<<
@@ -3020,7 +3192,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_lobby_invite_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":130
+    /* "steam_wrapper.pyx":136
  *         elif callback_id == 505:
  *             self._handler = new_lobby_data_update_handler(self)
  *         elif callback_id == 503:             # <<<<<<<<<<<<<<
@@ -3030,7 +3202,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x151:
 
-    /* "steam_wrapper.pyx":133
+    /* "steam_wrapper.pyx":139
  *             self._handler = new_lobby_invite_handler(self)
  *         elif callback_id == 337:
  *             self._handler = new_game_rich_presence_join_requested_handler(self)             # <<<<<<<<<<<<<<
@@ -3039,7 +3211,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
 */
     __pyx_v_self->_handler = new_game_rich_presence_join_requested_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":132
+    /* "steam_wrapper.pyx":138
  *         elif callback_id == 503:
  *             self._handler = new_lobby_invite_handler(self)
  *         elif callback_id == 337:             # <<<<<<<<<<<<<<
@@ -3049,27 +3221,46 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     break;
     case 0x14B:
 
-    /* "steam_wrapper.pyx":135
+    /* "steam_wrapper.pyx":141
  *             self._handler = new_game_rich_presence_join_requested_handler(self)
  *         elif callback_id == 331:
  *             self._handler = new_game_overlay_activated_handler(self)             # <<<<<<<<<<<<<<
- *         else:
- *             raise TypeError(f"Callback ID {callback_id} is not supported yet.")
+ *         elif callback_id == 304:
+ *             self._handler = new_persona_state_change_handler(self)
 */
     __pyx_v_self->_handler = new_game_overlay_activated_handler(__pyx_v_self);
 
-    /* "steam_wrapper.pyx":134
+    /* "steam_wrapper.pyx":140
  *         elif callback_id == 337:
  *             self._handler = new_game_rich_presence_join_requested_handler(self)
  *         elif callback_id == 331:             # <<<<<<<<<<<<<<
  *             self._handler = new_game_overlay_activated_handler(self)
+ *         elif callback_id == 304:
+*/
+    break;
+    case 0x130:
+
+    /* "steam_wrapper.pyx":143
+ *             self._handler = new_game_overlay_activated_handler(self)
+ *         elif callback_id == 304:
+ *             self._handler = new_persona_state_change_handler(self)             # <<<<<<<<<<<<<<
+ *         else:
+ *             raise TypeError(f"Callback ID {callback_id} is not supported yet.")
+*/
+    __pyx_v_self->_handler = new_persona_state_change_handler(__pyx_v_self);
+
+    /* "steam_wrapper.pyx":142
+ *         elif callback_id == 331:
+ *             self._handler = new_game_overlay_activated_handler(self)
+ *         elif callback_id == 304:             # <<<<<<<<<<<<<<
+ *             self._handler = new_persona_state_change_handler(self)
  *         else:
 */
     break;
     default:
 
-    /* "steam_wrapper.pyx":137
- *             self._handler = new_game_overlay_activated_handler(self)
+    /* "steam_wrapper.pyx":145
+ *             self._handler = new_persona_state_change_handler(self)
  *         else:
  *             raise TypeError(f"Callback ID {callback_id} is not supported yet.")             # <<<<<<<<<<<<<<
  * 
@@ -3078,13 +3269,13 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
     __pyx_t_2 = NULL;
     __Pyx_INCREF(__pyx_builtin_TypeError);
     __pyx_t_3 = __pyx_builtin_TypeError; 
-    __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_callback_id, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyUnicode_From_int(__pyx_v_callback_id, 0, ' ', 'd'); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_5[0] = __pyx_mstate_global->__pyx_kp_u_Callback_ID;
     __pyx_t_5[1] = __pyx_t_4;
     __pyx_t_5[2] = __pyx_mstate_global->__pyx_kp_u_is_not_supported_yet;
     __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_5, 3, 12 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4) + 22, 127);
-    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 137, __pyx_L1_error)
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 145, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __pyx_t_7 = 1;
@@ -3094,16 +3285,16 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
       __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 145, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     }
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 137, __pyx_L1_error)
+    __PYX_ERR(0, 145, __pyx_L1_error)
     break;
   }
 
-  /* "steam_wrapper.pyx":115
+  /* "steam_wrapper.pyx":121
  *         int callback_id
  * 
  *     def __cinit__(self, int callback_id, object py_callback):             # <<<<<<<<<<<<<<
@@ -3127,7 +3318,7 @@ static int __pyx_pf_13steam_wrapper_13SteamCallback___cinit__(struct SteamCallba
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":139
+/* "steam_wrapper.pyx":147
  *             raise TypeError(f"Callback ID {callback_id} is not supported yet.")
  * 
  *     cdef public api void on_lobby_created(self, LobbyCreated_t * data):             # <<<<<<<<<<<<<<
@@ -3147,35 +3338,35 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_created(struct SteamCallba
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_lobby_created", 0);
 
-  /* "steam_wrapper.pyx":141
+  /* "steam_wrapper.pyx":149
  *     cdef public api void on_lobby_created(self, LobbyCreated_t * data):
  *         py_data = {
  *             'm_eResult': data.m_eResult,             # <<<<<<<<<<<<<<
  *             'm_ulSteamIDLobby': data.m_ulSteamIDLobby,
  *         }
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_From_EResult(__pyx_v_data->m_eResult); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_EResult(__pyx_v_data->m_eResult); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_eResult, __pyx_t_2) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_eResult, __pyx_t_2) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":142
+  /* "steam_wrapper.pyx":150
  *         py_data = {
  *             'm_eResult': data.m_eResult,
  *             'm_ulSteamIDLobby': data.m_ulSteamIDLobby,             # <<<<<<<<<<<<<<
  *         }
  *         self._py_callback(py_data)
 */
-  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_2) < 0) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_2) < 0) __PYX_ERR(0, 149, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_py_data = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":144
+  /* "steam_wrapper.pyx":152
  *             'm_ulSteamIDLobby': data.m_ulSteamIDLobby,
  *         }
  *         self._py_callback(py_data)             # <<<<<<<<<<<<<<
@@ -3202,12 +3393,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_created(struct SteamCallba
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":139
+  /* "steam_wrapper.pyx":147
  *             raise TypeError(f"Callback ID {callback_id} is not supported yet.")
  * 
  *     cdef public api void on_lobby_created(self, LobbyCreated_t * data):             # <<<<<<<<<<<<<<
@@ -3227,7 +3418,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_created(struct SteamCallba
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":146
+/* "steam_wrapper.pyx":154
  *         self._py_callback(py_data)
  * 
  *     cdef public api void on_lobby_enter(self, LobbyEnter_t * data):             # <<<<<<<<<<<<<<
@@ -3248,7 +3439,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_enter(struct SteamCallback
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_lobby_enter", 0);
 
-  /* "steam_wrapper.pyx":147
+  /* "steam_wrapper.pyx":155
  * 
  *     cdef public api void on_lobby_enter(self, LobbyEnter_t * data):
  *         self._py_callback({'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_bLocked': data.m_bLocked,             # <<<<<<<<<<<<<<
@@ -3258,27 +3449,27 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_enter(struct SteamCallback
   __pyx_t_2 = NULL;
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_3 = __pyx_v_self->_py_callback; 
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bLocked); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bLocked); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bLocked, __pyx_t_5) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bLocked, __pyx_t_5) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":148
+  /* "steam_wrapper.pyx":156
  *     cdef public api void on_lobby_enter(self, LobbyEnter_t * data):
  *         self._py_callback({'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_bLocked': data.m_bLocked,
  *                            'm_EChatRoomEnterResponse': data.m_EChatRoomEnterResponse})             # <<<<<<<<<<<<<<
  * 
  *     cdef public api void on_lobby_chat_update(self, LobbyChatUpdate_t * data):
 */
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_int(__pyx_v_data->m_EChatRoomEnterResponse); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_int(__pyx_v_data->m_EChatRoomEnterResponse); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_EChatRoomEnterResponse, __pyx_t_5) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_EChatRoomEnterResponse, __pyx_t_5) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3298,12 +3489,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_enter(struct SteamCallback
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":146
+  /* "steam_wrapper.pyx":154
  *         self._py_callback(py_data)
  * 
  *     cdef public api void on_lobby_enter(self, LobbyEnter_t * data):             # <<<<<<<<<<<<<<
@@ -3324,7 +3515,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_enter(struct SteamCallback
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":150
+/* "steam_wrapper.pyx":158
  *                            'm_EChatRoomEnterResponse': data.m_EChatRoomEnterResponse})
  * 
  *     cdef public api void on_lobby_chat_update(self, LobbyChatUpdate_t * data):             # <<<<<<<<<<<<<<
@@ -3345,7 +3536,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_chat_update(struct SteamCa
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_lobby_chat_update", 0);
 
-  /* "steam_wrapper.pyx":151
+  /* "steam_wrapper.pyx":159
  * 
  *     cdef public api void on_lobby_chat_update(self, LobbyChatUpdate_t * data):
  *         self._py_callback(             # <<<<<<<<<<<<<<
@@ -3356,46 +3547,46 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_chat_update(struct SteamCa
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_3 = __pyx_v_self->_py_callback; 
 
-  /* "steam_wrapper.pyx":152
+  /* "steam_wrapper.pyx":160
  *     cdef public api void on_lobby_chat_update(self, LobbyChatUpdate_t * data):
  *         self._py_callback(
  *             {'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_ulSteamIDUserChanged': data.m_ulSteamIDUserChanged,             # <<<<<<<<<<<<<<
  *              'm_ulSteamIDMakingChange': data.m_ulSteamIDMakingChange,
  *              'm_rgfChatMemberStateChange': data.m_rgfChatMemberStateChange})
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDUserChanged); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDUserChanged); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDUserChanged, __pyx_t_5) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDUserChanged, __pyx_t_5) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":153
+  /* "steam_wrapper.pyx":161
  *         self._py_callback(
  *             {'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_ulSteamIDUserChanged': data.m_ulSteamIDUserChanged,
  *              'm_ulSteamIDMakingChange': data.m_ulSteamIDMakingChange,             # <<<<<<<<<<<<<<
  *              'm_rgfChatMemberStateChange': data.m_rgfChatMemberStateChange})
  * 
 */
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDMakingChange); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDMakingChange); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDMakingChange, __pyx_t_5) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDMakingChange, __pyx_t_5) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":154
+  /* "steam_wrapper.pyx":162
  *             {'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_ulSteamIDUserChanged': data.m_ulSteamIDUserChanged,
  *              'm_ulSteamIDMakingChange': data.m_ulSteamIDMakingChange,
  *              'm_rgfChatMemberStateChange': data.m_rgfChatMemberStateChange})             # <<<<<<<<<<<<<<
  * 
  *     cdef public api void on_lobby_data_update(self, LobbyDataUpdate_t * data):
 */
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_int(__pyx_v_data->m_rgfChatMemberStateChange); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_int(__pyx_v_data->m_rgfChatMemberStateChange); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 162, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_rgfChatMemberStateChange, __pyx_t_5) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_rgfChatMemberStateChange, __pyx_t_5) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3415,12 +3606,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_chat_update(struct SteamCa
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":150
+  /* "steam_wrapper.pyx":158
  *                            'm_EChatRoomEnterResponse': data.m_EChatRoomEnterResponse})
  * 
  *     cdef public api void on_lobby_chat_update(self, LobbyChatUpdate_t * data):             # <<<<<<<<<<<<<<
@@ -3441,7 +3632,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_chat_update(struct SteamCa
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":156
+/* "steam_wrapper.pyx":164
  *              'm_rgfChatMemberStateChange': data.m_rgfChatMemberStateChange})
  * 
  *     cdef public api void on_lobby_data_update(self, LobbyDataUpdate_t * data):             # <<<<<<<<<<<<<<
@@ -3462,7 +3653,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_data_update(struct SteamCa
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_lobby_data_update", 0);
 
-  /* "steam_wrapper.pyx":157
+  /* "steam_wrapper.pyx":165
  * 
  *     cdef public api void on_lobby_data_update(self, LobbyDataUpdate_t * data):
  *         self._py_callback({'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_ulSteamIDMember': data.m_ulSteamIDMember,             # <<<<<<<<<<<<<<
@@ -3472,27 +3663,27 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_data_update(struct SteamCa
   __pyx_t_2 = NULL;
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_3 = __pyx_v_self->_py_callback; 
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDMember); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDMember); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDMember, __pyx_t_5) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDMember, __pyx_t_5) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":158
+  /* "steam_wrapper.pyx":166
  *     cdef public api void on_lobby_data_update(self, LobbyDataUpdate_t * data):
  *         self._py_callback({'m_ulSteamIDLobby': data.m_ulSteamIDLobby, 'm_ulSteamIDMember': data.m_ulSteamIDMember,
  *                            'm_bSuccess': data.m_bSuccess})             # <<<<<<<<<<<<<<
  * 
  *     cdef public api void on_lobby_invite(self, LobbyInvite_t * data):
 */
-  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bSuccess); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bSuccess); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bSuccess, __pyx_t_5) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bSuccess, __pyx_t_5) < 0) __PYX_ERR(0, 165, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3512,12 +3703,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_data_update(struct SteamCa
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 157, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":156
+  /* "steam_wrapper.pyx":164
  *              'm_rgfChatMemberStateChange': data.m_rgfChatMemberStateChange})
  * 
  *     cdef public api void on_lobby_data_update(self, LobbyDataUpdate_t * data):             # <<<<<<<<<<<<<<
@@ -3538,7 +3729,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_data_update(struct SteamCa
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":160
+/* "steam_wrapper.pyx":168
  *                            'm_bSuccess': data.m_bSuccess})
  * 
  *     cdef public api void on_lobby_invite(self, LobbyInvite_t * data):             # <<<<<<<<<<<<<<
@@ -3559,7 +3750,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallbac
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_lobby_invite", 0);
 
-  /* "steam_wrapper.pyx":161
+  /* "steam_wrapper.pyx":169
  * 
  *     cdef public api void on_lobby_invite(self, LobbyInvite_t * data):
  *         self._py_callback({'m_ulSteamIDUser': data.m_ulSteamIDUser, 'm_ulSteamIDLobby': data.m_ulSteamIDLobby,             # <<<<<<<<<<<<<<
@@ -3569,27 +3760,27 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallbac
   __pyx_t_2 = NULL;
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_3 = __pyx_v_self->_py_callback; 
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDUser); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDUser); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDUser, __pyx_t_5) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDUser, __pyx_t_5) < 0) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamIDLobby); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamIDLobby, __pyx_t_5) < 0) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":162
+  /* "steam_wrapper.pyx":170
  *     cdef public api void on_lobby_invite(self, LobbyInvite_t * data):
  *         self._py_callback({'m_ulSteamIDUser': data.m_ulSteamIDUser, 'm_ulSteamIDLobby': data.m_ulSteamIDLobby,
  *                            'm_ulGameID': data.m_ulGameID})             # <<<<<<<<<<<<<<
  * 
  *     cdef public api void on_join_requested(self, GameLobbyJoinRequested_t * data):
 */
-  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulGameID); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 162, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulGameID); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulGameID, __pyx_t_5) < 0) __PYX_ERR(0, 161, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulGameID, __pyx_t_5) < 0) __PYX_ERR(0, 169, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3609,12 +3800,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallbac
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":160
+  /* "steam_wrapper.pyx":168
  *                            'm_bSuccess': data.m_bSuccess})
  * 
  *     cdef public api void on_lobby_invite(self, LobbyInvite_t * data):             # <<<<<<<<<<<<<<
@@ -3635,7 +3826,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallbac
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":164
+/* "steam_wrapper.pyx":172
  *                            'm_ulGameID': data.m_ulGameID})
  * 
  *     cdef public api void on_join_requested(self, GameLobbyJoinRequested_t * data):             # <<<<<<<<<<<<<<
@@ -3655,35 +3846,35 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_join_requested(struct SteamCallb
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_join_requested", 0);
 
-  /* "steam_wrapper.pyx":166
+  /* "steam_wrapper.pyx":174
  *     cdef public api void on_join_requested(self, GameLobbyJoinRequested_t * data):
  *         py_data = {
  *             'm_steamIDLobby': data.m_steamIDLobby.ConvertToUint64(),             # <<<<<<<<<<<<<<
  *             'm_steamIDFriend': data.m_steamIDFriend.ConvertToUint64()
  *         }
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDLobby.ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDLobby.ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_steamIDLobby, __pyx_t_2) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_steamIDLobby, __pyx_t_2) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":167
+  /* "steam_wrapper.pyx":175
  *         py_data = {
  *             'm_steamIDLobby': data.m_steamIDLobby.ConvertToUint64(),
  *             'm_steamIDFriend': data.m_steamIDFriend.ConvertToUint64()             # <<<<<<<<<<<<<<
  *         }
  *         self._py_callback(py_data)
 */
-  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDFriend.ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 167, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDFriend.ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_steamIDFriend, __pyx_t_2) < 0) __PYX_ERR(0, 166, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_m_steamIDFriend, __pyx_t_2) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_py_data = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":169
+  /* "steam_wrapper.pyx":177
  *             'm_steamIDFriend': data.m_steamIDFriend.ConvertToUint64()
  *         }
  *         self._py_callback(py_data)             # <<<<<<<<<<<<<<
@@ -3710,12 +3901,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_join_requested(struct SteamCallb
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":164
+  /* "steam_wrapper.pyx":172
  *                            'm_ulGameID': data.m_ulGameID})
  * 
  *     cdef public api void on_join_requested(self, GameLobbyJoinRequested_t * data):             # <<<<<<<<<<<<<<
@@ -3735,7 +3926,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_join_requested(struct SteamCallb
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":171
+/* "steam_wrapper.pyx":179
  *         self._py_callback(py_data)
  * 
  *     cdef public api void on_game_rich_presence_join_requested(self, GameRichPresenceJoinRequested_t * data):             # <<<<<<<<<<<<<<
@@ -3758,7 +3949,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requeste
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_game_rich_presence_join_requested", 0);
 
-  /* "steam_wrapper.pyx":172
+  /* "steam_wrapper.pyx":180
  * 
  *     cdef public api void on_game_rich_presence_join_requested(self, GameRichPresenceJoinRequested_t * data):
  *         connect_str = data.m_rgchConnect             # <<<<<<<<<<<<<<
@@ -3768,7 +3959,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requeste
   __pyx_t_1 = __pyx_v_data->m_rgchConnect;
   __pyx_v_connect_str = __pyx_t_1;
 
-  /* "steam_wrapper.pyx":173
+  /* "steam_wrapper.pyx":181
  *     cdef public api void on_game_rich_presence_join_requested(self, GameRichPresenceJoinRequested_t * data):
  *         connect_str = data.m_rgchConnect
  *         self._py_callback({'m_steamIDFriend': data.m_steamIDFriend.ConvertToUint64(), 'm_rgchConnect': connect_str})             # <<<<<<<<<<<<<<
@@ -3778,15 +3969,15 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requeste
   __pyx_t_3 = NULL;
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_4 = __pyx_v_self->_py_callback; 
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDFriend.ConvertToUint64()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_steamIDFriend.ConvertToUint64()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_m_steamIDFriend, __pyx_t_6) < 0) __PYX_ERR(0, 173, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_m_steamIDFriend, __pyx_t_6) < 0) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyBytes_FromString(__pyx_v_connect_str); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyBytes_FromString(__pyx_v_connect_str); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_m_rgchConnect, __pyx_t_6) < 0) __PYX_ERR(0, 173, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_m_rgchConnect, __pyx_t_6) < 0) __PYX_ERR(0, 181, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_t_7 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3806,12 +3997,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requeste
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 173, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":171
+  /* "steam_wrapper.pyx":179
  *         self._py_callback(py_data)
  * 
  *     cdef public api void on_game_rich_presence_join_requested(self, GameRichPresenceJoinRequested_t * data):             # <<<<<<<<<<<<<<
@@ -3832,7 +4023,7 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requeste
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":175
+/* "steam_wrapper.pyx":183
  *         self._py_callback({'m_steamIDFriend': data.m_steamIDFriend.ConvertToUint64(), 'm_rgchConnect': connect_str})
  * 
  *     cdef public api void on_game_overlay_activated(self, GameOverlayActivated_t * data):             # <<<<<<<<<<<<<<
@@ -3853,21 +4044,21 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct St
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("on_game_overlay_activated", 0);
 
-  /* "steam_wrapper.pyx":176
+  /* "steam_wrapper.pyx":184
  * 
  *     cdef public api void on_game_overlay_activated(self, GameOverlayActivated_t * data):
  *         self._py_callback({'m_bActive': data.m_bActive})             # <<<<<<<<<<<<<<
  * 
- *     def __dealloc__(self):
+ *     cdef public api void on_persona_state_change(self, PersonaStateChange_t * data):
 */
   __pyx_t_2 = NULL;
   __Pyx_INCREF(__pyx_v_self->_py_callback);
   __pyx_t_3 = __pyx_v_self->_py_callback; 
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bActive); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 176, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyBool_FromLong(__pyx_v_data->m_bActive); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bActive, __pyx_t_5) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_bActive, __pyx_t_5) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -3887,12 +4078,12 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct St
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "steam_wrapper.pyx":175
+  /* "steam_wrapper.pyx":183
  *         self._py_callback({'m_steamIDFriend': data.m_steamIDFriend.ConvertToUint64(), 'm_rgchConnect': connect_str})
  * 
  *     cdef public api void on_game_overlay_activated(self, GameOverlayActivated_t * data):             # <<<<<<<<<<<<<<
@@ -3913,9 +4104,94 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct St
   __Pyx_RefNannyFinishContext();
 }
 
-/* "steam_wrapper.pyx":178
+/* "steam_wrapper.pyx":186
+ *         self._py_callback({'m_bActive': data.m_bActive})
+ * 
+ *     cdef public api void on_persona_state_change(self, PersonaStateChange_t * data):             # <<<<<<<<<<<<<<
+ *         self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})
+ * 
+*/
+
+void __pyx_f_13steam_wrapper_13SteamCallback_on_persona_state_change(struct SteamCallback *__pyx_v_self, PersonaStateChange_t *__pyx_v_data) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("on_persona_state_change", 0);
+
+  /* "steam_wrapper.pyx":187
+ * 
+ *     cdef public api void on_persona_state_change(self, PersonaStateChange_t * data):
+ *         self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_INCREF(__pyx_v_self->_py_callback);
+  __pyx_t_3 = __pyx_v_self->_py_callback; 
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_data->m_ulSteamID); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_ulSteamID, __pyx_t_5) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_data->m_nChangeFlags); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_m_nChangeFlags, __pyx_t_5) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_t_4};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "steam_wrapper.pyx":186
  *         self._py_callback({'m_bActive': data.m_bActive})
  * 
+ *     cdef public api void on_persona_state_change(self, PersonaStateChange_t * data):             # <<<<<<<<<<<<<<
+ *         self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})
+ * 
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("steam_wrapper.SteamCallback.on_persona_state_change", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "steam_wrapper.pyx":189
+ *         self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})
+ * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         if self._handler != NULL:
  *             if self.callback_id == 513:
@@ -3937,7 +4213,7 @@ static void __pyx_pw_13steam_wrapper_13SteamCallback_3__dealloc__(PyObject *__py
 static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCallback *__pyx_v_self) {
   int __pyx_t_1;
 
-  /* "steam_wrapper.pyx":179
+  /* "steam_wrapper.pyx":190
  * 
  *     def __dealloc__(self):
  *         if self._handler != NULL:             # <<<<<<<<<<<<<<
@@ -3947,7 +4223,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
   __pyx_t_1 = (__pyx_v_self->_handler != NULL);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":180
+    /* "steam_wrapper.pyx":191
  *     def __dealloc__(self):
  *         if self._handler != NULL:
  *             if self.callback_id == 513:             # <<<<<<<<<<<<<<
@@ -3957,7 +4233,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
     switch (__pyx_v_self->callback_id) {
       case 0x201:
 
-      /* "steam_wrapper.pyx":181
+      /* "steam_wrapper.pyx":192
  *         if self._handler != NULL:
  *             if self.callback_id == 513:
  *                 del_lobby_created_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -3966,7 +4242,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_lobby_created_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":180
+      /* "steam_wrapper.pyx":191
  *     def __dealloc__(self):
  *         if self._handler != NULL:
  *             if self.callback_id == 513:             # <<<<<<<<<<<<<<
@@ -3976,7 +4252,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x14D:
 
-      /* "steam_wrapper.pyx":183
+      /* "steam_wrapper.pyx":194
  *                 del_lobby_created_handler(self._handler)
  *             elif self.callback_id == 333:
  *                 del_join_requested_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -3985,7 +4261,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_join_requested_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":182
+      /* "steam_wrapper.pyx":193
  *             if self.callback_id == 513:
  *                 del_lobby_created_handler(self._handler)
  *             elif self.callback_id == 333:             # <<<<<<<<<<<<<<
@@ -3995,7 +4271,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x1F8:
 
-      /* "steam_wrapper.pyx":185
+      /* "steam_wrapper.pyx":196
  *                 del_join_requested_handler(self._handler)
  *             elif self.callback_id == 504:
  *                 del_lobby_enter_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -4004,7 +4280,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_lobby_enter_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":184
+      /* "steam_wrapper.pyx":195
  *             elif self.callback_id == 333:
  *                 del_join_requested_handler(self._handler)
  *             elif self.callback_id == 504:             # <<<<<<<<<<<<<<
@@ -4014,7 +4290,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x1FA:
 
-      /* "steam_wrapper.pyx":187
+      /* "steam_wrapper.pyx":198
  *                 del_lobby_enter_handler(self._handler)
  *             elif self.callback_id == 506:
  *                 del_lobby_chat_update_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -4023,7 +4299,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_lobby_chat_update_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":186
+      /* "steam_wrapper.pyx":197
  *             elif self.callback_id == 504:
  *                 del_lobby_enter_handler(self._handler)
  *             elif self.callback_id == 506:             # <<<<<<<<<<<<<<
@@ -4033,7 +4309,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x1F9:
 
-      /* "steam_wrapper.pyx":189
+      /* "steam_wrapper.pyx":200
  *                 del_lobby_chat_update_handler(self._handler)
  *             elif self.callback_id == 505:
  *                 del_lobby_data_update_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -4042,7 +4318,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_lobby_data_update_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":188
+      /* "steam_wrapper.pyx":199
  *             elif self.callback_id == 506:
  *                 del_lobby_chat_update_handler(self._handler)
  *             elif self.callback_id == 505:             # <<<<<<<<<<<<<<
@@ -4052,7 +4328,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x1F7:
 
-      /* "steam_wrapper.pyx":191
+      /* "steam_wrapper.pyx":202
  *                 del_lobby_data_update_handler(self._handler)
  *             elif self.callback_id == 503:
  *                 del_lobby_invite_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -4061,7 +4337,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_lobby_invite_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":190
+      /* "steam_wrapper.pyx":201
  *             elif self.callback_id == 505:
  *                 del_lobby_data_update_handler(self._handler)
  *             elif self.callback_id == 503:             # <<<<<<<<<<<<<<
@@ -4071,7 +4347,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x151:
 
-      /* "steam_wrapper.pyx":193
+      /* "steam_wrapper.pyx":204
  *                 del_lobby_invite_handler(self._handler)
  *             elif self.callback_id == 337:
  *                 del_game_rich_presence_join_requested_handler(self._handler)             # <<<<<<<<<<<<<<
@@ -4080,7 +4356,7 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
       del_game_rich_presence_join_requested_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":192
+      /* "steam_wrapper.pyx":203
  *             elif self.callback_id == 503:
  *                 del_lobby_invite_handler(self._handler)
  *             elif self.callback_id == 337:             # <<<<<<<<<<<<<<
@@ -4090,36 +4366,55 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
       break;
       case 0x14B:
 
-      /* "steam_wrapper.pyx":195
+      /* "steam_wrapper.pyx":206
  *                 del_game_rich_presence_join_requested_handler(self._handler)
  *             elif self.callback_id == 331:
  *                 del_game_overlay_activated_handler(self._handler)             # <<<<<<<<<<<<<<
- *             self._handler = NULL
- * 
+ *             elif self.callback_id == 304:
+ *                 del_persona_state_change_handler(self._handler)
 */
       del_game_overlay_activated_handler(__pyx_v_self->_handler);
 
-      /* "steam_wrapper.pyx":194
+      /* "steam_wrapper.pyx":205
  *             elif self.callback_id == 337:
  *                 del_game_rich_presence_join_requested_handler(self._handler)
  *             elif self.callback_id == 331:             # <<<<<<<<<<<<<<
  *                 del_game_overlay_activated_handler(self._handler)
+ *             elif self.callback_id == 304:
+*/
+      break;
+      case 0x130:
+
+      /* "steam_wrapper.pyx":208
+ *                 del_game_overlay_activated_handler(self._handler)
+ *             elif self.callback_id == 304:
+ *                 del_persona_state_change_handler(self._handler)             # <<<<<<<<<<<<<<
+ *             self._handler = NULL
+ * 
+*/
+      del_persona_state_change_handler(__pyx_v_self->_handler);
+
+      /* "steam_wrapper.pyx":207
+ *             elif self.callback_id == 331:
+ *                 del_game_overlay_activated_handler(self._handler)
+ *             elif self.callback_id == 304:             # <<<<<<<<<<<<<<
+ *                 del_persona_state_change_handler(self._handler)
  *             self._handler = NULL
 */
       break;
       default: break;
     }
 
-    /* "steam_wrapper.pyx":196
- *             elif self.callback_id == 331:
- *                 del_game_overlay_activated_handler(self._handler)
+    /* "steam_wrapper.pyx":209
+ *             elif self.callback_id == 304:
+ *                 del_persona_state_change_handler(self._handler)
  *             self._handler = NULL             # <<<<<<<<<<<<<<
  * 
  * cdef ISteamFriends * g_friends = NULL
 */
     __pyx_v_self->_handler = NULL;
 
-    /* "steam_wrapper.pyx":179
+    /* "steam_wrapper.pyx":190
  * 
  *     def __dealloc__(self):
  *         if self._handler != NULL:             # <<<<<<<<<<<<<<
@@ -4128,8 +4423,8 @@ static void __pyx_pf_13steam_wrapper_13SteamCallback_2__dealloc__(struct SteamCa
 */
   }
 
-  /* "steam_wrapper.pyx":178
- *         self._py_callback({'m_bActive': data.m_bActive})
+  /* "steam_wrapper.pyx":189
+ *         self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         if self._handler != NULL:
@@ -4343,96 +4638,251 @@ static PyObject *__pyx_pf_13steam_wrapper_13SteamCallback_6__setstate_cython__(C
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":204
- * cdef ISteamUtils * g_utils = NULL
+/* "steam_wrapper.pyx":224
+ * cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}
  * 
- * def init():             # <<<<<<<<<<<<<<
- *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
- *     if not SteamAPI_Init():
+ * cdef bytes _key(key):             # <<<<<<<<<<<<<<
+ *     cdef bytes encoded
+ *     if isinstance(key, bytes):
 */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_1init(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_1init = {"init", (PyCFunction)__pyx_pw_13steam_wrapper_1init, METH_NOARGS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_1init(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("init (wrapper)", 0);
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_r = __pyx_pf_13steam_wrapper_init(__pyx_self);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_f_13steam_wrapper__key(PyObject *__pyx_v_key) {
+  PyObject *__pyx_v_encoded = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  int __pyx_t_6;
+  size_t __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("init", 0);
-
-  /* "steam_wrapper.pyx":206
- * def init():
- *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
- *     if not SteamAPI_Init():             # <<<<<<<<<<<<<<
- *         raise RuntimeError("SteamAPI_Init() failed.")
- *     g_friends = SteamFriends()
+  __Pyx_RefNannySetupContext("_key", 0);
+
+  /* "steam_wrapper.pyx":226
+ * cdef bytes _key(key):
+ *     cdef bytes encoded
+ *     if isinstance(key, bytes):             # <<<<<<<<<<<<<<
+ *         return <bytes> key
+ *     encoded = _encoded_keys.get(key)
 */
-  __pyx_t_1 = (!SteamAPI_Init());
-  if (unlikely(__pyx_t_1)) {
+  __pyx_t_1 = PyBytes_Check(__pyx_v_key); 
+  if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":207
- *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
- *     if not SteamAPI_Init():
- *         raise RuntimeError("SteamAPI_Init() failed.")             # <<<<<<<<<<<<<<
- *     g_friends = SteamFriends()
- *     g_matchmaking = SteamMatchmaking()
+    /* "steam_wrapper.pyx":227
+ *     cdef bytes encoded
+ *     if isinstance(key, bytes):
+ *         return <bytes> key             # <<<<<<<<<<<<<<
+ *     encoded = _encoded_keys.get(key)
+ *     if encoded is None:
 */
-    __pyx_t_3 = NULL;
-    __Pyx_INCREF(__pyx_builtin_RuntimeError);
-    __pyx_t_4 = __pyx_builtin_RuntimeError; 
-    __pyx_t_5 = 1;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_SteamAPI_Init_failed};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 207, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_key));
+    __pyx_r = ((PyObject*)__pyx_v_key);
+    goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":206
- * def init():
- *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
- *     if not SteamAPI_Init():             # <<<<<<<<<<<<<<
- *         raise RuntimeError("SteamAPI_Init() failed.")
- *     g_friends = SteamFriends()
+    /* "steam_wrapper.pyx":226
+ * cdef bytes _key(key):
+ *     cdef bytes encoded
+ *     if isinstance(key, bytes):             # <<<<<<<<<<<<<<
+ *         return <bytes> key
+ *     encoded = _encoded_keys.get(key)
 */
   }
 
-  /* "steam_wrapper.pyx":208
- *     if not SteamAPI_Init():
- *         raise RuntimeError("SteamAPI_Init() failed.")
- *     g_friends = SteamFriends()             # <<<<<<<<<<<<<<
- *     g_matchmaking = SteamMatchmaking()
- *     g_user = SteamUser()
+  /* "steam_wrapper.pyx":228
+ *     if isinstance(key, bytes):
+ *         return <bytes> key
+ *     encoded = _encoded_keys.get(key)             # <<<<<<<<<<<<<<
+ *     if encoded is None:
+ *         encoded = key.encode('utf-8')
+*/
+  if (unlikely(__pyx_v_13steam_wrapper__encoded_keys == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 228, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_13steam_wrapper__encoded_keys, __pyx_v_key, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_2))) __PYX_ERR(0, 228, __pyx_L1_error)
+  __pyx_v_encoded = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":229
+ *         return <bytes> key
+ *     encoded = _encoded_keys.get(key)
+ *     if encoded is None:             # <<<<<<<<<<<<<<
+ *         encoded = key.encode('utf-8')
+ *         _encoded_keys[key] = encoded
+*/
+  __pyx_t_1 = (__pyx_v_encoded == ((PyObject*)Py_None));
+  if (__pyx_t_1) {
+
+    /* "steam_wrapper.pyx":230
+ *     encoded = _encoded_keys.get(key)
+ *     if encoded is None:
+ *         encoded = key.encode('utf-8')             # <<<<<<<<<<<<<<
+ *         _encoded_keys[key] = encoded
+ *     return encoded
+*/
+    __pyx_t_3 = __pyx_v_key;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_utf_8};
+      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_2))) __PYX_ERR(0, 230, __pyx_L1_error)
+    __Pyx_DECREF_SET(__pyx_v_encoded, ((PyObject*)__pyx_t_2));
+    __pyx_t_2 = 0;
+
+    /* "steam_wrapper.pyx":231
+ *     if encoded is None:
+ *         encoded = key.encode('utf-8')
+ *         _encoded_keys[key] = encoded             # <<<<<<<<<<<<<<
+ *     return encoded
+ * 
+*/
+    if (unlikely(__pyx_v_13steam_wrapper__encoded_keys == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 231, __pyx_L1_error)
+    }
+    if (unlikely((PyDict_SetItem(__pyx_v_13steam_wrapper__encoded_keys, __pyx_v_key, __pyx_v_encoded) < 0))) __PYX_ERR(0, 231, __pyx_L1_error)
+
+    /* "steam_wrapper.pyx":229
+ *         return <bytes> key
+ *     encoded = _encoded_keys.get(key)
+ *     if encoded is None:             # <<<<<<<<<<<<<<
+ *         encoded = key.encode('utf-8')
+ *         _encoded_keys[key] = encoded
+*/
+  }
+
+  /* "steam_wrapper.pyx":232
+ *         encoded = key.encode('utf-8')
+ *         _encoded_keys[key] = encoded
+ *     return encoded             # <<<<<<<<<<<<<<
+ * 
+ * def init():
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_encoded);
+  __pyx_r = __pyx_v_encoded;
+  goto __pyx_L0;
+
+  /* "steam_wrapper.pyx":224
+ * cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}
+ * 
+ * cdef bytes _key(key):             # <<<<<<<<<<<<<<
+ *     cdef bytes encoded
+ *     if isinstance(key, bytes):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("steam_wrapper._key", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_encoded);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "steam_wrapper.pyx":234
+ *     return encoded
+ * 
+ * def init():             # <<<<<<<<<<<<<<
+ *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
+ *     if not SteamAPI_Init():
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13steam_wrapper_1init(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyMethodDef __pyx_mdef_13steam_wrapper_1init = {"init", (PyCFunction)__pyx_pw_13steam_wrapper_1init, METH_NOARGS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_1init(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("init (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_13steam_wrapper_init(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init", 0);
+
+  /* "steam_wrapper.pyx":236
+ * def init():
+ *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
+ *     if not SteamAPI_Init():             # <<<<<<<<<<<<<<
+ *         raise RuntimeError("SteamAPI_Init() failed.")
+ *     g_friends = SteamFriends()
+*/
+  __pyx_t_1 = (!SteamAPI_Init());
+  if (unlikely(__pyx_t_1)) {
+
+    /* "steam_wrapper.pyx":237
+ *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
+ *     if not SteamAPI_Init():
+ *         raise RuntimeError("SteamAPI_Init() failed.")             # <<<<<<<<<<<<<<
+ *     g_friends = SteamFriends()
+ *     g_matchmaking = SteamMatchmaking()
+*/
+    __pyx_t_3 = NULL;
+    __Pyx_INCREF(__pyx_builtin_RuntimeError);
+    __pyx_t_4 = __pyx_builtin_RuntimeError; 
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_SteamAPI_Init_failed};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 237, __pyx_L1_error)
+
+    /* "steam_wrapper.pyx":236
+ * def init():
+ *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
+ *     if not SteamAPI_Init():             # <<<<<<<<<<<<<<
+ *         raise RuntimeError("SteamAPI_Init() failed.")
+ *     g_friends = SteamFriends()
+*/
+  }
+
+  /* "steam_wrapper.pyx":238
+ *     if not SteamAPI_Init():
+ *         raise RuntimeError("SteamAPI_Init() failed.")
+ *     g_friends = SteamFriends()             # <<<<<<<<<<<<<<
+ *     g_matchmaking = SteamMatchmaking()
+ *     g_user = SteamUser()
 */
   __pyx_v_13steam_wrapper_g_friends = SteamFriends();
 
-  /* "steam_wrapper.pyx":209
+  /* "steam_wrapper.pyx":239
  *         raise RuntimeError("SteamAPI_Init() failed.")
  *     g_friends = SteamFriends()
  *     g_matchmaking = SteamMatchmaking()             # <<<<<<<<<<<<<<
@@ -4441,7 +4891,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
 */
   __pyx_v_13steam_wrapper_g_matchmaking = SteamMatchmaking();
 
-  /* "steam_wrapper.pyx":210
+  /* "steam_wrapper.pyx":240
  *     g_friends = SteamFriends()
  *     g_matchmaking = SteamMatchmaking()
  *     g_user = SteamUser()             # <<<<<<<<<<<<<<
@@ -4450,7 +4900,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
 */
   __pyx_v_13steam_wrapper_g_user = SteamUser();
 
-  /* "steam_wrapper.pyx":211
+  /* "steam_wrapper.pyx":241
  *     g_matchmaking = SteamMatchmaking()
  *     g_user = SteamUser()
  *     g_apps = SteamApps()             # <<<<<<<<<<<<<<
@@ -4459,7 +4909,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
 */
   __pyx_v_13steam_wrapper_g_apps = SteamApps();
 
-  /* "steam_wrapper.pyx":212
+  /* "steam_wrapper.pyx":242
  *     g_user = SteamUser()
  *     g_apps = SteamApps()
  *     g_utils = SteamUtils()             # <<<<<<<<<<<<<<
@@ -4468,7 +4918,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
 */
   __pyx_v_13steam_wrapper_g_utils = SteamUtils();
 
-  /* "steam_wrapper.pyx":213
+  /* "steam_wrapper.pyx":243
  *     g_apps = SteamApps()
  *     g_utils = SteamUtils()
  *     if not (g_friends and g_matchmaking and g_user and g_apps and g_utils):             # <<<<<<<<<<<<<<
@@ -4505,7 +4955,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
   __pyx_t_6 = (!__pyx_t_1);
   if (unlikely(__pyx_t_6)) {
 
-    /* "steam_wrapper.pyx":214
+    /* "steam_wrapper.pyx":244
  *     g_utils = SteamUtils()
  *     if not (g_friends and g_matchmaking and g_user and g_apps and g_utils):
  *         raise RuntimeError("Failed to get Steam interfaces.")             # <<<<<<<<<<<<<<
@@ -4521,14 +4971,14 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
       __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 214, __pyx_L1_error)
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 244, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
     }
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 214, __pyx_L1_error)
+    __PYX_ERR(0, 244, __pyx_L1_error)
 
-    /* "steam_wrapper.pyx":213
+    /* "steam_wrapper.pyx":243
  *     g_apps = SteamApps()
  *     g_utils = SteamUtils()
  *     if not (g_friends and g_matchmaking and g_user and g_apps and g_utils):             # <<<<<<<<<<<<<<
@@ -4537,7 +4987,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
 */
   }
 
-  /* "steam_wrapper.pyx":215
+  /* "steam_wrapper.pyx":245
  *     if not (g_friends and g_matchmaking and g_user and g_apps and g_utils):
  *         raise RuntimeError("Failed to get Steam interfaces.")
  *     print("steam_wrapper: Steamworks API initialized successfully.")             # <<<<<<<<<<<<<<
@@ -4553,13 +5003,13 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
     __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":204
- * cdef ISteamUtils * g_utils = NULL
+  /* "steam_wrapper.pyx":234
+ *     return encoded
  * 
  * def init():             # <<<<<<<<<<<<<<
  *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
@@ -4581,7 +5031,7 @@ static PyObject *__pyx_pf_13steam_wrapper_init(CYTHON_UNUSED PyObject *__pyx_sel
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":217
+/* "steam_wrapper.pyx":247
  *     print("steam_wrapper: Steamworks API initialized successfully.")
  * 
  * def shutdown():             # <<<<<<<<<<<<<<
@@ -4610,7 +5060,7 @@ static PyObject *__pyx_pf_13steam_wrapper_2shutdown(CYTHON_UNUSED PyObject *__py
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("shutdown", 0);
 
-  /* "steam_wrapper.pyx":218
+  /* "steam_wrapper.pyx":248
  * 
  * def shutdown():
  *     SteamAPI_Shutdown()             # <<<<<<<<<<<<<<
@@ -4619,7 +5069,7 @@ static PyObject *__pyx_pf_13steam_wrapper_2shutdown(CYTHON_UNUSED PyObject *__py
 */
   SteamAPI_Shutdown();
 
-  /* "steam_wrapper.pyx":217
+  /* "steam_wrapper.pyx":247
  *     print("steam_wrapper: Steamworks API initialized successfully.")
  * 
  * def shutdown():             # <<<<<<<<<<<<<<
@@ -4634,7 +5084,7 @@ static PyObject *__pyx_pf_13steam_wrapper_2shutdown(CYTHON_UNUSED PyObject *__py
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":220
+/* "steam_wrapper.pyx":250
  *     SteamAPI_Shutdown()
  * 
  * def run_callbacks():             # <<<<<<<<<<<<<<
@@ -4663,7 +5113,7 @@ static PyObject *__pyx_pf_13steam_wrapper_4run_callbacks(CYTHON_UNUSED PyObject
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("run_callbacks", 0);
 
-  /* "steam_wrapper.pyx":221
+  /* "steam_wrapper.pyx":251
  * 
  * def run_callbacks():
  *     SteamAPI_RunCallbacks()             # <<<<<<<<<<<<<<
@@ -4672,7 +5122,7 @@ static PyObject *__pyx_pf_13steam_wrapper_4run_callbacks(CYTHON_UNUSED PyObject
 */
   SteamAPI_RunCallbacks();
 
-  /* "steam_wrapper.pyx":220
+  /* "steam_wrapper.pyx":250
  *     SteamAPI_Shutdown()
  * 
  * def run_callbacks():             # <<<<<<<<<<<<<<
@@ -4687,7 +5137,7 @@ static PyObject *__pyx_pf_13steam_wrapper_4run_callbacks(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":224
+/* "steam_wrapper.pyx":254
  * 
  * # --- User ---
  * def get_my_steam_id():             # <<<<<<<<<<<<<<
@@ -4721,7 +5171,7 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_my_steam_id", 0);
 
-  /* "steam_wrapper.pyx":225
+  /* "steam_wrapper.pyx":255
  * # --- User ---
  * def get_my_steam_id():
  *     if g_user:             # <<<<<<<<<<<<<<
@@ -4731,7 +5181,7 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_user != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":226
+    /* "steam_wrapper.pyx":256
  * def get_my_steam_id():
  *     if g_user:
  *         return g_user.GetSteamID().ConvertToUint64()             # <<<<<<<<<<<<<<
@@ -4739,13 +5189,13 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
  * 
 */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_user->GetSteamID().ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_user->GetSteamID().ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 256, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":225
+    /* "steam_wrapper.pyx":255
  * # --- User ---
  * def get_my_steam_id():
  *     if g_user:             # <<<<<<<<<<<<<<
@@ -4754,7 +5204,7 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
 */
   }
 
-  /* "steam_wrapper.pyx":227
+  /* "steam_wrapper.pyx":257
  *     if g_user:
  *         return g_user.GetSteamID().ConvertToUint64()
  *     return 0             # <<<<<<<<<<<<<<
@@ -4766,7 +5216,7 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
   __pyx_r = __pyx_mstate_global->__pyx_int_0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":224
+  /* "steam_wrapper.pyx":254
  * 
  * # --- User ---
  * def get_my_steam_id():             # <<<<<<<<<<<<<<
@@ -4785,12 +5235,12 @@ static PyObject *__pyx_pf_13steam_wrapper_6get_my_steam_id(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":230
+/* "steam_wrapper.pyx":260
  * 
  * # --- Apps ---
  * def get_launch_query_param(key):             # <<<<<<<<<<<<<<
  *     if not g_apps: return ""
- *     return g_apps.GetLaunchQueryParam(key.encode('utf-8'))
+ *     return g_apps.GetLaunchQueryParam(_key(key))
 */
 
 /* Python wrapper */
@@ -4832,32 +5282,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_key,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 230, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 260, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 230, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 260, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_launch_query_param", 0) < 0) __PYX_ERR(0, 230, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_launch_query_param", 0) < 0) __PYX_ERR(0, 260, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_launch_query_param", 1, 1, 1, i); __PYX_ERR(0, 230, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_launch_query_param", 1, 1, 1, i); __PYX_ERR(0, 260, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 230, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 260, __pyx_L3_error)
     }
     __pyx_v_key = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_launch_query_param", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 230, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_launch_query_param", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 260, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4883,19 +5333,18 @@ static PyObject *__pyx_pf_13steam_wrapper_8get_launch_query_param(CYTHON_UNUSED
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  char const *__pyx_t_5;
+  char const *__pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_launch_query_param", 0);
 
-  /* "steam_wrapper.pyx":231
+  /* "steam_wrapper.pyx":261
  * # --- Apps ---
  * def get_launch_query_param(key):
  *     if not g_apps: return ""             # <<<<<<<<<<<<<<
- *     return g_apps.GetLaunchQueryParam(key.encode('utf-8'))
+ *     return g_apps.GetLaunchQueryParam(_key(key))
  * 
 */
   __pyx_t_1 = (!(__pyx_v_13steam_wrapper_g_apps != 0));
@@ -4906,44 +5355,40 @@ static PyObject *__pyx_pf_13steam_wrapper_8get_launch_query_param(CYTHON_UNUSED
     goto __pyx_L0;
   }
 
-  /* "steam_wrapper.pyx":232
+  /* "steam_wrapper.pyx":262
  * def get_launch_query_param(key):
  *     if not g_apps: return ""
- *     return g_apps.GetLaunchQueryParam(key.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *     return g_apps.GetLaunchQueryParam(_key(key))             # <<<<<<<<<<<<<<
  * 
  * # --- Utils ---
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __pyx_v_key;
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_utf_8};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 232, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_2 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (unlikely(__pyx_t_2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 262, __pyx_L1_error)
   }
-  __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_t_2); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 232, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyBytes_FromString(__pyx_v_13steam_wrapper_g_apps->GetLaunchQueryParam(__pyx_t_5)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 232, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_3 = __Pyx_PyBytes_AsString(__pyx_t_2); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 262, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyBytes_FromString(__pyx_v_13steam_wrapper_g_apps->GetLaunchQueryParam(__pyx_t_3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":230
+  /* "steam_wrapper.pyx":260
  * 
  * # --- Apps ---
  * def get_launch_query_param(key):             # <<<<<<<<<<<<<<
  *     if not g_apps: return ""
- *     return g_apps.GetLaunchQueryParam(key.encode('utf-8'))
+ *     return g_apps.GetLaunchQueryParam(_key(key))
 */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("steam_wrapper.get_launch_query_param", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -4952,7 +5397,7 @@ static PyObject *__pyx_pf_13steam_wrapper_8get_launch_query_param(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":235
+/* "steam_wrapper.pyx":265
  * 
  * # --- Utils ---
  * def is_overlay_enabled():             # <<<<<<<<<<<<<<
@@ -4986,7 +5431,7 @@ static PyObject *__pyx_pf_13steam_wrapper_10is_overlay_enabled(CYTHON_UNUSED PyO
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_overlay_enabled", 0);
 
-  /* "steam_wrapper.pyx":236
+  /* "steam_wrapper.pyx":266
  * # --- Utils ---
  * def is_overlay_enabled():
  *     if not g_utils: return False             # <<<<<<<<<<<<<<
@@ -5001,7 +5446,7 @@ static PyObject *__pyx_pf_13steam_wrapper_10is_overlay_enabled(CYTHON_UNUSED PyO
     goto __pyx_L0;
   }
 
-  /* "steam_wrapper.pyx":237
+  /* "steam_wrapper.pyx":267
  * def is_overlay_enabled():
  *     if not g_utils: return False
  *     return g_utils.IsOverlayEnabled()             # <<<<<<<<<<<<<<
@@ -5009,13 +5454,13 @@ static PyObject *__pyx_pf_13steam_wrapper_10is_overlay_enabled(CYTHON_UNUSED PyO
  * # --- Friends ---
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_13steam_wrapper_g_utils->IsOverlayEnabled()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(__pyx_v_13steam_wrapper_g_utils->IsOverlayEnabled()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 267, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":235
+  /* "steam_wrapper.pyx":265
  * 
  * # --- Utils ---
  * def is_overlay_enabled():             # <<<<<<<<<<<<<<
@@ -5034,7 +5479,7 @@ static PyObject *__pyx_pf_13steam_wrapper_10is_overlay_enabled(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":240
+/* "steam_wrapper.pyx":270
  * 
  * # --- Friends ---
  * def get_my_persona_name():             # <<<<<<<<<<<<<<
@@ -5070,7 +5515,7 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_my_persona_name", 0);
 
-  /* "steam_wrapper.pyx":241
+  /* "steam_wrapper.pyx":271
  * # --- Friends ---
  * def get_my_persona_name():
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5080,7 +5525,7 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":242
+    /* "steam_wrapper.pyx":272
  * def get_my_persona_name():
  *     if g_friends:
  *         return g_friends.GetPersonaName().decode('utf-8', 'ignore')             # <<<<<<<<<<<<<<
@@ -5089,15 +5534,15 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
 */
     __Pyx_XDECREF(__pyx_r);
     __pyx_t_2 = __pyx_v_13steam_wrapper_g_friends->GetPersonaName();
-    __pyx_t_3 = __Pyx_ssize_strlen(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 242, __pyx_L1_error)
-    __pyx_t_4 = __Pyx_decode_c_string(__pyx_t_2, 0, __pyx_t_3, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_ssize_strlen(__pyx_t_2); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 272, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_decode_c_string(__pyx_t_2, 0, __pyx_t_3, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 272, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_t_4);
     __pyx_r = __pyx_t_4;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":241
+    /* "steam_wrapper.pyx":271
  * # --- Friends ---
  * def get_my_persona_name():
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5106,7 +5551,7 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
 */
   }
 
-  /* "steam_wrapper.pyx":243
+  /* "steam_wrapper.pyx":273
  *     if g_friends:
  *         return g_friends.GetPersonaName().decode('utf-8', 'ignore')
  *     return ""             # <<<<<<<<<<<<<<
@@ -5118,7 +5563,7 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
   __pyx_r = __pyx_mstate_global->__pyx_kp_u_;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":240
+  /* "steam_wrapper.pyx":270
  * 
  * # --- Friends ---
  * def get_my_persona_name():             # <<<<<<<<<<<<<<
@@ -5137,7 +5582,7 @@ static PyObject *__pyx_pf_13steam_wrapper_12get_my_persona_name(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":245
+/* "steam_wrapper.pyx":275
  *     return ""
  * 
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -5184,32 +5629,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 245, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 275, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 245, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 275, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "activate_game_overlay_invite_dialog", 0) < 0) __PYX_ERR(0, 245, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "activate_game_overlay_invite_dialog", 0) < 0) __PYX_ERR(0, 275, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("activate_game_overlay_invite_dialog", 1, 1, 1, i); __PYX_ERR(0, 245, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("activate_game_overlay_invite_dialog", 1, 1, 1, i); __PYX_ERR(0, 275, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 245, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 275, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 245, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 275, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("activate_game_overlay_invite_dialog", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 245, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("activate_game_overlay_invite_dialog", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 275, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5240,7 +5685,7 @@ static PyObject *__pyx_pf_13steam_wrapper_14activate_game_overlay_invite_dialog(
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("activate_game_overlay_invite_dialog", 0);
 
-  /* "steam_wrapper.pyx":246
+  /* "steam_wrapper.pyx":276
  * 
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5250,7 +5695,7 @@ static PyObject *__pyx_pf_13steam_wrapper_14activate_game_overlay_invite_dialog(
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":247
+    /* "steam_wrapper.pyx":277
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):
  *     if g_friends:
  *         g_friends.ActivateGameOverlayInviteDialog(CSteamID(lobby_id_int))             # <<<<<<<<<<<<<<
@@ -5261,11 +5706,11 @@ static PyObject *__pyx_pf_13steam_wrapper_14activate_game_overlay_invite_dialog(
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 247, __pyx_L1_error)
+      __PYX_ERR(0, 277, __pyx_L1_error)
     }
     __pyx_v_13steam_wrapper_g_friends->ActivateGameOverlayInviteDialog(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2));
 
-    /* "steam_wrapper.pyx":246
+    /* "steam_wrapper.pyx":276
  * 
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5274,7 +5719,7 @@ static PyObject *__pyx_pf_13steam_wrapper_14activate_game_overlay_invite_dialog(
 */
   }
 
-  /* "steam_wrapper.pyx":245
+  /* "steam_wrapper.pyx":275
  *     return ""
  * 
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -5294,12 +5739,12 @@ static PyObject *__pyx_pf_13steam_wrapper_14activate_game_overlay_invite_dialog(
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":249
+/* "steam_wrapper.pyx":279
  *         g_friends.ActivateGameOverlayInviteDialog(CSteamID(lobby_id_int))
  * 
  * def set_rich_presence(key, value):             # <<<<<<<<<<<<<<
  *     if g_friends:
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
 */
 
 /* Python wrapper */
@@ -5342,39 +5787,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_key,&__pyx_mstate_global->__pyx_n_u_value,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 249, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 279, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 249, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 279, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 249, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 279, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_rich_presence", 0) < 0) __PYX_ERR(0, 249, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_rich_presence", 0) < 0) __PYX_ERR(0, 279, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_rich_presence", 1, 2, 2, i); __PYX_ERR(0, 249, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_rich_presence", 1, 2, 2, i); __PYX_ERR(0, 279, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 249, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 279, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 249, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 279, __pyx_L3_error)
     }
     __pyx_v_key = values[0];
     __pyx_v_value = values[1];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_rich_presence", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 249, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_rich_presence", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 279, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5400,74 +5845,70 @@ static PyObject *__pyx_pf_13steam_wrapper_16set_rich_presence(CYTHON_UNUSED PyOb
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  char const *__pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
+  char const *__pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
   char const *__pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_rich_presence", 0);
 
-  /* "steam_wrapper.pyx":250
+  /* "steam_wrapper.pyx":280
  * 
  * def set_rich_presence(key, value):
  *     if g_friends:             # <<<<<<<<<<<<<<
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
  * 
 */
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":251
+    /* "steam_wrapper.pyx":281
  * def set_rich_presence(key, value):
  *     if g_friends:
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))             # <<<<<<<<<<<<<<
  * 
  * def clear_rich_presence():
 */
-    __pyx_t_3 = __pyx_v_key;
-    __Pyx_INCREF(__pyx_t_3);
-    __pyx_t_4 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_2 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_2 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 281, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    if (unlikely(__pyx_t_2 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+      __PYX_ERR(0, 281, __pyx_L1_error)
     }
-    __pyx_t_5 = __Pyx_PyObject_AsString(__pyx_t_2); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L1_error)
-    __pyx_t_6 = __pyx_v_value;
-    __Pyx_INCREF(__pyx_t_6);
-    __pyx_t_4 = 0;
+    __pyx_t_3 = __Pyx_PyBytes_AsString(__pyx_t_2); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L1_error)
+    __pyx_t_5 = __pyx_v_value;
+    __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_6 = 0;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u_utf_8};
+      __pyx_t_4 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 281, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
     }
-    __pyx_t_7 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L1_error)
-    (void)(__pyx_v_13steam_wrapper_g_friends->SetRichPresence(__pyx_t_5, __pyx_t_7));
+    __pyx_t_7 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 281, __pyx_L1_error)
+    (void)(__pyx_v_13steam_wrapper_g_friends->SetRichPresence(__pyx_t_3, __pyx_t_7));
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "steam_wrapper.pyx":250
+    /* "steam_wrapper.pyx":280
  * 
  * def set_rich_presence(key, value):
  *     if g_friends:             # <<<<<<<<<<<<<<
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
  * 
 */
   }
 
-  /* "steam_wrapper.pyx":249
+  /* "steam_wrapper.pyx":279
  *         g_friends.ActivateGameOverlayInviteDialog(CSteamID(lobby_id_int))
  * 
  * def set_rich_presence(key, value):             # <<<<<<<<<<<<<<
  *     if g_friends:
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
 */
 
   /* function exit code */
@@ -5475,8 +5916,8 @@ static PyObject *__pyx_pf_13steam_wrapper_16set_rich_presence(CYTHON_UNUSED PyOb
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("steam_wrapper.set_rich_presence", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -5485,8 +5926,8 @@ static PyObject *__pyx_pf_13steam_wrapper_16set_rich_presence(CYTHON_UNUSED PyOb
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":253
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+/* "steam_wrapper.pyx":283
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
  * 
  * def clear_rich_presence():             # <<<<<<<<<<<<<<
  *     if g_friends:
@@ -5515,7 +5956,7 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("clear_rich_presence", 0);
 
-  /* "steam_wrapper.pyx":254
+  /* "steam_wrapper.pyx":284
  * 
  * def clear_rich_presence():
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5525,7 +5966,7 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":255
+    /* "steam_wrapper.pyx":285
  * def clear_rich_presence():
  *     if g_friends:
  *         g_friends.ClearRichPresence()             # <<<<<<<<<<<<<<
@@ -5534,7 +5975,7 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
 */
     __pyx_v_13steam_wrapper_g_friends->ClearRichPresence();
 
-    /* "steam_wrapper.pyx":254
+    /* "steam_wrapper.pyx":284
  * 
  * def clear_rich_presence():
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5543,8 +5984,8 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
 */
   }
 
-  /* "steam_wrapper.pyx":253
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":283
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
  * 
  * def clear_rich_presence():             # <<<<<<<<<<<<<<
  *     if g_friends:
@@ -5558,7 +5999,7 @@ static PyObject *__pyx_pf_13steam_wrapper_18clear_rich_presence(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":257
+/* "steam_wrapper.pyx":287
  *         g_friends.ClearRichPresence()
  * 
  * def get_friend_count(int iFriendFlags):             # <<<<<<<<<<<<<<
@@ -5605,32 +6046,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_iFriendFlags,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 257, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 287, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 257, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 287, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_count", 0) < 0) __PYX_ERR(0, 257, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_count", 0) < 0) __PYX_ERR(0, 287, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_count", 1, 1, 1, i); __PYX_ERR(0, 257, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_count", 1, 1, 1, i); __PYX_ERR(0, 287, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 257, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 287, __pyx_L3_error)
     }
-    __pyx_v_iFriendFlags = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_iFriendFlags == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 257, __pyx_L3_error)
+    __pyx_v_iFriendFlags = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_iFriendFlags == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 287, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_friend_count", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 257, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_friend_count", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 287, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5661,7 +6102,7 @@ static PyObject *__pyx_pf_13steam_wrapper_20get_friend_count(CYTHON_UNUSED PyObj
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_friend_count", 0);
 
-  /* "steam_wrapper.pyx":258
+  /* "steam_wrapper.pyx":288
  * 
  * def get_friend_count(int iFriendFlags):
  *     if not g_friends: return 0             # <<<<<<<<<<<<<<
@@ -5676,7 +6117,7 @@ static PyObject *__pyx_pf_13steam_wrapper_20get_friend_count(CYTHON_UNUSED PyObj
     goto __pyx_L0;
   }
 
-  /* "steam_wrapper.pyx":259
+  /* "steam_wrapper.pyx":289
  * def get_friend_count(int iFriendFlags):
  *     if not g_friends: return 0
  *     return g_friends.GetFriendCount(iFriendFlags)             # <<<<<<<<<<<<<<
@@ -5684,13 +6125,13 @@ static PyObject *__pyx_pf_13steam_wrapper_20get_friend_count(CYTHON_UNUSED PyObj
  * def get_friend_by_index(int iFriend, int iFriendFlags):
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_v_13steam_wrapper_g_friends->GetFriendCount(__pyx_v_iFriendFlags)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_v_13steam_wrapper_g_friends->GetFriendCount(__pyx_v_iFriendFlags)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":257
+  /* "steam_wrapper.pyx":287
  *         g_friends.ClearRichPresence()
  * 
  * def get_friend_count(int iFriendFlags):             # <<<<<<<<<<<<<<
@@ -5709,7 +6150,7 @@ static PyObject *__pyx_pf_13steam_wrapper_20get_friend_count(CYTHON_UNUSED PyObj
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":261
+/* "steam_wrapper.pyx":291
  *     return g_friends.GetFriendCount(iFriendFlags)
  * 
  * def get_friend_by_index(int iFriend, int iFriendFlags):             # <<<<<<<<<<<<<<
@@ -5757,39 +6198,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_iFriend,&__pyx_mstate_global->__pyx_n_u_iFriendFlags,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 261, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 291, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 261, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 291, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 261, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 291, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_by_index", 0) < 0) __PYX_ERR(0, 261, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_by_index", 0) < 0) __PYX_ERR(0, 291, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_by_index", 1, 2, 2, i); __PYX_ERR(0, 261, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_by_index", 1, 2, 2, i); __PYX_ERR(0, 291, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 261, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 291, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 261, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 291, __pyx_L3_error)
     }
-    __pyx_v_iFriend = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_iFriend == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L3_error)
-    __pyx_v_iFriendFlags = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_iFriendFlags == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L3_error)
+    __pyx_v_iFriend = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_iFriend == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 291, __pyx_L3_error)
+    __pyx_v_iFriendFlags = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_iFriendFlags == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 291, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_friend_by_index", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 261, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_friend_by_index", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 291, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5820,7 +6261,7 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_friend_by_index", 0);
 
-  /* "steam_wrapper.pyx":262
+  /* "steam_wrapper.pyx":292
  * 
  * def get_friend_by_index(int iFriend, int iFriendFlags):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5830,7 +6271,7 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":263
+    /* "steam_wrapper.pyx":293
  * def get_friend_by_index(int iFriend, int iFriendFlags):
  *     if g_friends:
  *         return g_friends.GetFriendByIndex(iFriend, iFriendFlags).ConvertToUint64()             # <<<<<<<<<<<<<<
@@ -5838,13 +6279,13 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
  * 
 */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_friends->GetFriendByIndex(__pyx_v_iFriend, __pyx_v_iFriendFlags).ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 263, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_friends->GetFriendByIndex(__pyx_v_iFriend, __pyx_v_iFriendFlags).ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __pyx_r = __pyx_t_2;
     __pyx_t_2 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":262
+    /* "steam_wrapper.pyx":292
  * 
  * def get_friend_by_index(int iFriend, int iFriendFlags):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5853,7 +6294,7 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
 */
   }
 
-  /* "steam_wrapper.pyx":264
+  /* "steam_wrapper.pyx":294
  *     if g_friends:
  *         return g_friends.GetFriendByIndex(iFriend, iFriendFlags).ConvertToUint64()
  *     return None             # <<<<<<<<<<<<<<
@@ -5864,7 +6305,7 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":261
+  /* "steam_wrapper.pyx":291
  *     return g_friends.GetFriendCount(iFriendFlags)
  * 
  * def get_friend_by_index(int iFriend, int iFriendFlags):             # <<<<<<<<<<<<<<
@@ -5883,7 +6324,7 @@ static PyObject *__pyx_pf_13steam_wrapper_22get_friend_by_index(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":266
+/* "steam_wrapper.pyx":296
  *     return None
  * 
  * def get_friend_persona_name(unsigned long long steamIDFriend):             # <<<<<<<<<<<<<<
@@ -5930,32 +6371,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_steamIDFriend,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 266, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 296, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 266, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 296, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_persona_name", 0) < 0) __PYX_ERR(0, 266, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friend_persona_name", 0) < 0) __PYX_ERR(0, 296, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_persona_name", 1, 1, 1, i); __PYX_ERR(0, 266, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friend_persona_name", 1, 1, 1, i); __PYX_ERR(0, 296, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 266, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 296, __pyx_L3_error)
     }
-    __pyx_v_steamIDFriend = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_steamIDFriend == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 266, __pyx_L3_error)
+    __pyx_v_steamIDFriend = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_steamIDFriend == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 296, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_friend_persona_name", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 266, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_friend_persona_name", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 296, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5989,7 +6430,7 @@ static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSE
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_friend_persona_name", 0);
 
-  /* "steam_wrapper.pyx":267
+  /* "steam_wrapper.pyx":297
  * 
  * def get_friend_persona_name(unsigned long long steamIDFriend):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -5999,7 +6440,7 @@ static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSE
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_friends != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":268
+    /* "steam_wrapper.pyx":298
  * def get_friend_persona_name(unsigned long long steamIDFriend):
  *     if g_friends:
  *         return g_friends.GetFriendPersonaName(CSteamID(steamIDFriend)).decode('utf-8')             # <<<<<<<<<<<<<<
@@ -6011,18 +6452,18 @@ static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSE
       __pyx_t_2 = CSteamID(__pyx_v_steamIDFriend);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 268, __pyx_L1_error)
+      __PYX_ERR(0, 298, __pyx_L1_error)
     }
     __pyx_t_3 = __pyx_v_13steam_wrapper_g_friends->GetFriendPersonaName(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2));
-    __pyx_t_4 = __Pyx_ssize_strlen(__pyx_t_3); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 268, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_decode_c_string(__pyx_t_3, 0, __pyx_t_4, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 268, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_ssize_strlen(__pyx_t_3); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 298, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_decode_c_string(__pyx_t_3, 0, __pyx_t_4, NULL, NULL, PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 298, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_INCREF(__pyx_t_5);
     __pyx_r = __pyx_t_5;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":267
+    /* "steam_wrapper.pyx":297
  * 
  * def get_friend_persona_name(unsigned long long steamIDFriend):
  *     if g_friends:             # <<<<<<<<<<<<<<
@@ -6031,19 +6472,19 @@ static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSE
 */
   }
 
-  /* "steam_wrapper.pyx":269
+  /* "steam_wrapper.pyx":299
  *     if g_friends:
  *         return g_friends.GetFriendPersonaName(CSteamID(steamIDFriend)).decode('utf-8')
  *     return ""             # <<<<<<<<<<<<<<
  * 
- * # --- Matchmaking ---
+ * def get_friends(int iFriendFlags):
 */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_mstate_global->__pyx_kp_u_);
   __pyx_r = __pyx_mstate_global->__pyx_kp_u_;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":266
+  /* "steam_wrapper.pyx":296
  *     return None
  * 
  * def get_friend_persona_name(unsigned long long steamIDFriend):             # <<<<<<<<<<<<<<
@@ -6062,43 +6503,43 @@ static PyObject *__pyx_pf_13steam_wrapper_24get_friend_persona_name(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":272
+/* "steam_wrapper.pyx":301
+ *     return ""
  * 
- * # --- Matchmaking ---
- * def create_lobby(lobby_type, max_members):             # <<<<<<<<<<<<<<
- *     if g_matchmaking:
- *         return g_matchmaking.CreateLobby(<ELobbyType> lobby_type, max_members)
+ * def get_friends(int iFriendFlags):             # <<<<<<<<<<<<<<
+ *     """All friends matching iFriendFlags as a tuple of (steam_id, persona_name), in one native loop"""
+ *     cdef int i, count
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_27create_lobby(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_27get_friends(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_27create_lobby = {"create_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_27create_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_27create_lobby(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_13steam_wrapper_26get_friends, "All friends matching iFriendFlags as a tuple of (steam_id, persona_name), in one native loop");
+static PyMethodDef __pyx_mdef_13steam_wrapper_27get_friends = {"get_friends", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_27get_friends, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_13steam_wrapper_26get_friends};
+static PyObject *__pyx_pw_13steam_wrapper_27get_friends(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_lobby_type = 0;
-  PyObject *__pyx_v_max_members = 0;
+  int __pyx_v_iFriendFlags;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("create_lobby (wrapper)", 0);
+  __Pyx_RefNannySetupContext("get_friends (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -6108,52 +6549,45 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_type,&__pyx_mstate_global->__pyx_n_u_max_members,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_iFriendFlags,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 272, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 301, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 272, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 272, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 301, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "create_lobby", 0) < 0) __PYX_ERR(0, 272, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("create_lobby", 1, 2, 2, i); __PYX_ERR(0, 272, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_friends", 0) < 0) __PYX_ERR(0, 301, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_friends", 1, 1, 1, i); __PYX_ERR(0, 301, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 2)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 272, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 272, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 301, __pyx_L3_error)
     }
-    __pyx_v_lobby_type = values[0];
-    __pyx_v_max_members = values[1];
+    __pyx_v_iFriendFlags = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_iFriendFlags == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 301, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("create_lobby", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 272, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_friends", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 301, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("steam_wrapper.create_lobby", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("steam_wrapper.get_friends", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_26create_lobby(__pyx_self, __pyx_v_lobby_type, __pyx_v_max_members);
+  __pyx_r = __pyx_pf_13steam_wrapper_26get_friends(__pyx_self, __pyx_v_iFriendFlags);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6163,19 +6597,277 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lobby_type, PyObject *__pyx_v_max_members) {
+static PyObject *__pyx_pf_13steam_wrapper_26get_friends(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_iFriendFlags) {
+  int __pyx_v_i;
+  int __pyx_v_count;
+  CSteamID __pyx_v_friend_id;
+  PyObject *__pyx_v_friends = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  ELobbyType __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  char const *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("create_lobby", 0);
-
-  /* "steam_wrapper.pyx":273
+  __Pyx_RefNannySetupContext("get_friends", 0);
+
+  /* "steam_wrapper.pyx":305
+ *     cdef int i, count
+ *     cdef CSteamID friend_id
+ *     if not g_friends: return ()             # <<<<<<<<<<<<<<
+ *     count = g_friends.GetFriendCount(iFriendFlags)
+ *     friends = []
+*/
+  __pyx_t_1 = (!(__pyx_v_13steam_wrapper_g_friends != 0));
+  if (__pyx_t_1) {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_empty_tuple);
+    __pyx_r = __pyx_mstate_global->__pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "steam_wrapper.pyx":306
+ *     cdef CSteamID friend_id
+ *     if not g_friends: return ()
+ *     count = g_friends.GetFriendCount(iFriendFlags)             # <<<<<<<<<<<<<<
+ *     friends = []
+ *     for i in range(count):
+*/
+  __pyx_v_count = __pyx_v_13steam_wrapper_g_friends->GetFriendCount(__pyx_v_iFriendFlags);
+
+  /* "steam_wrapper.pyx":307
+ *     if not g_friends: return ()
+ *     count = g_friends.GetFriendCount(iFriendFlags)
+ *     friends = []             # <<<<<<<<<<<<<<
+ *     for i in range(count):
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+*/
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_friends = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":308
+ *     count = g_friends.GetFriendCount(iFriendFlags)
+ *     friends = []
+ *     for i in range(count):             # <<<<<<<<<<<<<<
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+ *         friends.append((friend_id.ConvertToUint64(),
+*/
+  __pyx_t_3 = __pyx_v_count;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "steam_wrapper.pyx":309
+ *     friends = []
+ *     for i in range(count):
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)             # <<<<<<<<<<<<<<
+ *         friends.append((friend_id.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))
+*/
+    __pyx_v_friend_id = __pyx_v_13steam_wrapper_g_friends->GetFriendByIndex(__pyx_v_i, __pyx_v_iFriendFlags);
+
+    /* "steam_wrapper.pyx":310
+ *     for i in range(count):
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+ *         friends.append((friend_id.ConvertToUint64(),             # <<<<<<<<<<<<<<
+ *                         g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))
+ *     return tuple(friends)
+*/
+    __pyx_t_2 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_friend_id.ConvertToUint64()); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 310, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+
+    /* "steam_wrapper.pyx":311
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+ *         friends.append((friend_id.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))             # <<<<<<<<<<<<<<
+ *     return tuple(friends)
+ * 
+*/
+    __pyx_t_6 = __pyx_v_13steam_wrapper_g_friends->GetFriendPersonaName(__pyx_v_friend_id);
+    __pyx_t_7 = __Pyx_ssize_strlen(__pyx_t_6); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 311, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_decode_c_string(__pyx_t_6, 0, __pyx_t_7, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 311, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+
+    /* "steam_wrapper.pyx":310
+ *     for i in range(count):
+ *         friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+ *         friends.append((friend_id.ConvertToUint64(),             # <<<<<<<<<<<<<<
+ *                         g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))
+ *     return tuple(friends)
+*/
+    __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 310, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_GIVEREF(__pyx_t_2);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_2) != (0)) __PYX_ERR(0, 310, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_t_8);
+    __Pyx_GIVEREF(__pyx_t_8);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_8) != (0)) __PYX_ERR(0, 310, __pyx_L1_error);
+    __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_friends, __pyx_t_9); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 310, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  }
+
+  /* "steam_wrapper.pyx":312
+ *         friends.append((friend_id.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))
+ *     return tuple(friends)             # <<<<<<<<<<<<<<
+ * 
+ * # --- Matchmaking ---
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_9 = PyList_AsTuple(__pyx_v_friends); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 312, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_r = __pyx_t_9;
+  __pyx_t_9 = 0;
+  goto __pyx_L0;
+
+  /* "steam_wrapper.pyx":301
+ *     return ""
+ * 
+ * def get_friends(int iFriendFlags):             # <<<<<<<<<<<<<<
+ *     """All friends matching iFriendFlags as a tuple of (steam_id, persona_name), in one native loop"""
+ *     cdef int i, count
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("steam_wrapper.get_friends", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_friends);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "steam_wrapper.pyx":315
+ * 
+ * # --- Matchmaking ---
+ * def create_lobby(lobby_type, max_members):             # <<<<<<<<<<<<<<
+ *     if g_matchmaking:
+ *         return g_matchmaking.CreateLobby(<ELobbyType> lobby_type, max_members)
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13steam_wrapper_29create_lobby(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_13steam_wrapper_29create_lobby = {"create_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_29create_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_29create_lobby(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_lobby_type = 0;
+  PyObject *__pyx_v_max_members = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("create_lobby (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_type,&__pyx_mstate_global->__pyx_n_u_max_members,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 315, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "create_lobby", 0) < 0) __PYX_ERR(0, 315, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("create_lobby", 1, 2, 2, i); __PYX_ERR(0, 315, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+    }
+    __pyx_v_lobby_type = values[0];
+    __pyx_v_max_members = values[1];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("create_lobby", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 315, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("steam_wrapper.create_lobby", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_13steam_wrapper_28create_lobby(__pyx_self, __pyx_v_lobby_type, __pyx_v_max_members);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13steam_wrapper_28create_lobby(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_lobby_type, PyObject *__pyx_v_max_members) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  ELobbyType __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("create_lobby", 0);
+
+  /* "steam_wrapper.pyx":316
  * # --- Matchmaking ---
  * def create_lobby(lobby_type, max_members):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6185,7 +6877,7 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":274
+    /* "steam_wrapper.pyx":317
  * def create_lobby(lobby_type, max_members):
  *     if g_matchmaking:
  *         return g_matchmaking.CreateLobby(<ELobbyType> lobby_type, max_members)             # <<<<<<<<<<<<<<
@@ -6193,15 +6885,15 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
  * 
 */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_2 = ((ELobbyType)__Pyx_PyLong_As_ELobbyType(__pyx_v_lobby_type)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 274, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_v_max_members); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 274, __pyx_L1_error)
-    __pyx_t_4 = __Pyx_PyLong_From_SteamAPICall_t(__pyx_v_13steam_wrapper_g_matchmaking->CreateLobby(((ELobbyType)__pyx_t_2), __pyx_t_3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_t_2 = ((ELobbyType)__Pyx_PyLong_As_ELobbyType(__pyx_v_lobby_type)); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 317, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyLong_As_int(__pyx_v_max_members); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 317, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyLong_From_SteamAPICall_t(__pyx_v_13steam_wrapper_g_matchmaking->CreateLobby(((ELobbyType)__pyx_t_2), __pyx_t_3)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 317, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_r = __pyx_t_4;
     __pyx_t_4 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":273
+    /* "steam_wrapper.pyx":316
  * # --- Matchmaking ---
  * def create_lobby(lobby_type, max_members):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6210,7 +6902,7 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
 */
   }
 
-  /* "steam_wrapper.pyx":275
+  /* "steam_wrapper.pyx":318
  *     if g_matchmaking:
  *         return g_matchmaking.CreateLobby(<ELobbyType> lobby_type, max_members)
  *     return 0             # <<<<<<<<<<<<<<
@@ -6222,7 +6914,7 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
   __pyx_r = __pyx_mstate_global->__pyx_int_0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":272
+  /* "steam_wrapper.pyx":315
  * 
  * # --- Matchmaking ---
  * def create_lobby(lobby_type, max_members):             # <<<<<<<<<<<<<<
@@ -6241,7 +6933,7 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":277
+/* "steam_wrapper.pyx":320
  *     return 0
  * 
  * def join_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -6250,15 +6942,15 @@ static PyObject *__pyx_pf_13steam_wrapper_26create_lobby(CYTHON_UNUSED PyObject
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_29join_lobby(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_31join_lobby(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_29join_lobby = {"join_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_29join_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_29join_lobby(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_31join_lobby = {"join_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_31join_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_31join_lobby(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6288,32 +6980,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 277, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 320, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 277, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 320, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "join_lobby", 0) < 0) __PYX_ERR(0, 277, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "join_lobby", 0) < 0) __PYX_ERR(0, 320, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("join_lobby", 1, 1, 1, i); __PYX_ERR(0, 277, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("join_lobby", 1, 1, 1, i); __PYX_ERR(0, 320, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 277, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 320, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 320, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("join_lobby", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 277, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("join_lobby", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 320, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6324,7 +7016,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_28join_lobby(__pyx_self, __pyx_v_lobby_id_int);
+  __pyx_r = __pyx_pf_13steam_wrapper_30join_lobby(__pyx_self, __pyx_v_lobby_id_int);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6334,7 +7026,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
+static PyObject *__pyx_pf_13steam_wrapper_30join_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -6345,7 +7037,7 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("join_lobby", 0);
 
-  /* "steam_wrapper.pyx":278
+  /* "steam_wrapper.pyx":321
  * 
  * def join_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6355,7 +7047,7 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":279
+    /* "steam_wrapper.pyx":322
  * def join_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:
  *         return g_matchmaking.JoinLobby(CSteamID(lobby_id_int))             # <<<<<<<<<<<<<<
@@ -6367,15 +7059,15 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 279, __pyx_L1_error)
+      __PYX_ERR(0, 322, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyLong_From_SteamAPICall_t(__pyx_v_13steam_wrapper_g_matchmaking->JoinLobby(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyLong_From_SteamAPICall_t(__pyx_v_13steam_wrapper_g_matchmaking->JoinLobby(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 322, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":278
+    /* "steam_wrapper.pyx":321
  * 
  * def join_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6384,7 +7076,7 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
 */
   }
 
-  /* "steam_wrapper.pyx":280
+  /* "steam_wrapper.pyx":323
  *     if g_matchmaking:
  *         return g_matchmaking.JoinLobby(CSteamID(lobby_id_int))
  *     return 0             # <<<<<<<<<<<<<<
@@ -6396,7 +7088,7 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
   __pyx_r = __pyx_mstate_global->__pyx_int_0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":277
+  /* "steam_wrapper.pyx":320
  *     return 0
  * 
  * def join_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -6415,7 +7107,7 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":282
+/* "steam_wrapper.pyx":325
  *     return 0
  * 
  * def leave_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -6424,15 +7116,15 @@ static PyObject *__pyx_pf_13steam_wrapper_28join_lobby(CYTHON_UNUSED PyObject *_
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_31leave_lobby(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_33leave_lobby(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_31leave_lobby = {"leave_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_31leave_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_31leave_lobby(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_33leave_lobby = {"leave_lobby", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_33leave_lobby, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_33leave_lobby(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6462,32 +7154,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 282, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 325, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 282, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 325, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "leave_lobby", 0) < 0) __PYX_ERR(0, 282, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "leave_lobby", 0) < 0) __PYX_ERR(0, 325, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("leave_lobby", 1, 1, 1, i); __PYX_ERR(0, 282, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("leave_lobby", 1, 1, 1, i); __PYX_ERR(0, 325, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 282, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 325, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 282, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 325, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("leave_lobby", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 282, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("leave_lobby", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 325, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6498,7 +7190,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_30leave_lobby(__pyx_self, __pyx_v_lobby_id_int);
+  __pyx_r = __pyx_pf_13steam_wrapper_32leave_lobby(__pyx_self, __pyx_v_lobby_id_int);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6508,7 +7200,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
+static PyObject *__pyx_pf_13steam_wrapper_32leave_lobby(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -6518,7 +7210,7 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("leave_lobby", 0);
 
-  /* "steam_wrapper.pyx":283
+  /* "steam_wrapper.pyx":326
  * 
  * def leave_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6528,7 +7220,7 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":284
+    /* "steam_wrapper.pyx":327
  * def leave_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:
  *         g_matchmaking.LeaveLobby(CSteamID(lobby_id_int))             # <<<<<<<<<<<<<<
@@ -6539,11 +7231,11 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 284, __pyx_L1_error)
+      __PYX_ERR(0, 327, __pyx_L1_error)
     }
     __pyx_v_13steam_wrapper_g_matchmaking->LeaveLobby(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2));
 
-    /* "steam_wrapper.pyx":283
+    /* "steam_wrapper.pyx":326
  * 
  * def leave_lobby(unsigned long long lobby_id_int):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -6552,7 +7244,7 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
 */
   }
 
-  /* "steam_wrapper.pyx":282
+  /* "steam_wrapper.pyx":325
  *     return 0
  * 
  * def leave_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -6572,7 +7264,7 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":286
+/* "steam_wrapper.pyx":329
  *         g_matchmaking.LeaveLobby(CSteamID(lobby_id_int))
  * 
  * def get_lobby_data(unsigned long long lobby_id_int, key):             # <<<<<<<<<<<<<<
@@ -6581,15 +7273,15 @@ static PyObject *__pyx_pf_13steam_wrapper_30leave_lobby(CYTHON_UNUSED PyObject *
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_33get_lobby_data(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_35get_lobby_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_33get_lobby_data = {"get_lobby_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_33get_lobby_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_33get_lobby_data(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_35get_lobby_data = {"get_lobby_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_35get_lobby_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_35get_lobby_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6620,39 +7312,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_key,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 286, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 329, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 286, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 329, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 286, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 329, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_data", 0) < 0) __PYX_ERR(0, 286, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_data", 0) < 0) __PYX_ERR(0, 329, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_data", 1, 2, 2, i); __PYX_ERR(0, 286, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_data", 1, 2, 2, i); __PYX_ERR(0, 329, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 286, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 329, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 286, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 329, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 286, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 329, __pyx_L3_error)
     __pyx_v_key = values[1];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_lobby_data", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 286, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_lobby_data", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 329, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6663,7 +7355,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_32get_lobby_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key);
+  __pyx_r = __pyx_pf_13steam_wrapper_34get_lobby_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6673,45 +7365,43 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key) {
+static PyObject *__pyx_pf_13steam_wrapper_34get_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key) {
   char const *__pyx_v_value_bytes;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   CSteamID __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  char const *__pyx_t_6;
-  Py_ssize_t __pyx_t_7;
+  char const *__pyx_t_4;
+  Py_ssize_t __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_lobby_data", 0);
 
-  /* "steam_wrapper.pyx":287
+  /* "steam_wrapper.pyx":330
  * 
  * def get_lobby_data(unsigned long long lobby_id_int, key):
  *     cdef const char * value_bytes = NULL             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
 */
   __pyx_v_value_bytes = NULL;
 
-  /* "steam_wrapper.pyx":288
+  /* "steam_wrapper.pyx":331
  * def get_lobby_data(unsigned long long lobby_id_int, key):
  *     cdef const char * value_bytes = NULL
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
  *         return value_bytes.decode('utf-8', 'ignore')
 */
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":289
+    /* "steam_wrapper.pyx":332
  *     cdef const char * value_bytes = NULL
  *     if g_matchmaking:
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))             # <<<<<<<<<<<<<<
  *         return value_bytes.decode('utf-8', 'ignore')
  *     return ""
 */
@@ -6719,48 +7409,44 @@ static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObjec
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 289, __pyx_L1_error)
+      __PYX_ERR(0, 332, __pyx_L1_error)
     }
-    __pyx_t_4 = __pyx_v_key;
-    __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_5 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 289, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_3 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 332, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (unlikely(__pyx_t_3 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+      __PYX_ERR(0, 332, __pyx_L1_error)
     }
-    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 289, __pyx_L1_error)
-    __pyx_v_value_bytes = __pyx_v_13steam_wrapper_g_matchmaking->GetLobbyData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_6);
+    __pyx_t_4 = __Pyx_PyBytes_AsString(__pyx_t_3); if (unlikely((!__pyx_t_4) && PyErr_Occurred())) __PYX_ERR(0, 332, __pyx_L1_error)
+    __pyx_v_value_bytes = __pyx_v_13steam_wrapper_g_matchmaking->GetLobbyData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "steam_wrapper.pyx":290
+    /* "steam_wrapper.pyx":333
  *     if g_matchmaking:
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
  *         return value_bytes.decode('utf-8', 'ignore')             # <<<<<<<<<<<<<<
  *     return ""
  * 
 */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_7 = __Pyx_ssize_strlen(__pyx_v_value_bytes); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 290, __pyx_L1_error)
-    __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_value_bytes, 0, __pyx_t_7, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_ssize_strlen(__pyx_v_value_bytes); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 333, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_decode_c_string(__pyx_v_value_bytes, 0, __pyx_t_5, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":288
+    /* "steam_wrapper.pyx":331
  * def get_lobby_data(unsigned long long lobby_id_int, key):
  *     cdef const char * value_bytes = NULL
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
  *         return value_bytes.decode('utf-8', 'ignore')
 */
   }
 
-  /* "steam_wrapper.pyx":291
- *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+  /* "steam_wrapper.pyx":334
+ *         value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
  *         return value_bytes.decode('utf-8', 'ignore')
  *     return ""             # <<<<<<<<<<<<<<
  * 
@@ -6771,7 +7457,7 @@ static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObjec
   __pyx_r = __pyx_mstate_global->__pyx_kp_u_;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":286
+  /* "steam_wrapper.pyx":329
  *         g_matchmaking.LeaveLobby(CSteamID(lobby_id_int))
  * 
  * def get_lobby_data(unsigned long long lobby_id_int, key):             # <<<<<<<<<<<<<<
@@ -6782,7 +7468,6 @@ static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObjec
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_AddTraceback("steam_wrapper.get_lobby_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -6791,24 +7476,24 @@ static PyObject *__pyx_pf_13steam_wrapper_32get_lobby_data(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":293
+/* "steam_wrapper.pyx":336
  *     return ""
  * 
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_35set_lobby_data(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_37set_lobby_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_35set_lobby_data = {"set_lobby_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_35set_lobby_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_35set_lobby_data(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_37set_lobby_data = {"set_lobby_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_37set_lobby_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_37set_lobby_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -6840,46 +7525,46 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_key,&__pyx_mstate_global->__pyx_n_u_value,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 293, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 336, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 293, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 336, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 293, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 336, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 293, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 336, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_data", 0) < 0) __PYX_ERR(0, 293, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_data", 0) < 0) __PYX_ERR(0, 336, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_data", 1, 3, 3, i); __PYX_ERR(0, 293, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_data", 1, 3, 3, i); __PYX_ERR(0, 336, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 293, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 336, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 293, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 336, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 293, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 336, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 293, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 336, __pyx_L3_error)
     __pyx_v_key = values[1];
     __pyx_v_value = values[2];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_lobby_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 293, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_lobby_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 336, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6890,7 +7575,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_34set_lobby_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key, __pyx_v_value);
+  __pyx_r = __pyx_pf_13steam_wrapper_36set_lobby_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key, __pyx_v_value);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -6900,36 +7585,36 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+static PyObject *__pyx_pf_13steam_wrapper_36set_lobby_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   CSteamID __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  char const *__pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  char const *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
   char const *__pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_lobby_data", 0);
 
-  /* "steam_wrapper.pyx":294
+  /* "steam_wrapper.pyx":337
  * 
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
 */
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":295
+    /* "steam_wrapper.pyx":338
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):
  *     if g_matchmaking:
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))             # <<<<<<<<<<<<<<
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):
 */
@@ -6937,49 +7622,45 @@ static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObjec
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 295, __pyx_L1_error)
+      __PYX_ERR(0, 338, __pyx_L1_error)
     }
-    __pyx_t_4 = __pyx_v_key;
-    __Pyx_INCREF(__pyx_t_4);
-    __pyx_t_5 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_3 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    if (unlikely(__pyx_t_3 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+      __PYX_ERR(0, 338, __pyx_L1_error)
     }
-    __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 295, __pyx_L1_error)
-    __pyx_t_7 = __pyx_v_value;
-    __Pyx_INCREF(__pyx_t_7);
-    __pyx_t_5 = 0;
+    __pyx_t_4 = __Pyx_PyBytes_AsString(__pyx_t_3); if (unlikely((!__pyx_t_4) && PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L1_error)
+    __pyx_t_6 = __pyx_v_value;
+    __Pyx_INCREF(__pyx_t_6);
+    __pyx_t_7 = 0;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_4 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 295, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_kp_u_utf_8};
+      __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
     }
-    __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 295, __pyx_L1_error)
-    (void)(__pyx_v_13steam_wrapper_g_matchmaking->SetLobbyData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_6, __pyx_t_8));
+    __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_t_5); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 338, __pyx_L1_error)
+    (void)(__pyx_v_13steam_wrapper_g_matchmaking->SetLobbyData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_4, __pyx_t_8));
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "steam_wrapper.pyx":294
+    /* "steam_wrapper.pyx":337
  * 
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
 */
   }
 
-  /* "steam_wrapper.pyx":293
+  /* "steam_wrapper.pyx":336
  *     return ""
  * 
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
 
   /* function exit code */
@@ -6987,8 +7668,8 @@ static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObjec
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("steam_wrapper.set_lobby_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -6997,8 +7678,8 @@ static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":297
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+/* "steam_wrapper.pyx":340
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
@@ -7006,15 +7687,15 @@ static PyObject *__pyx_pf_13steam_wrapper_34set_lobby_data(CYTHON_UNUSED PyObjec
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_37get_lobby_member_by_index(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_39get_lobby_member_by_index(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_37get_lobby_member_by_index = {"get_lobby_member_by_index", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_37get_lobby_member_by_index, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_37get_lobby_member_by_index(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_39get_lobby_member_by_index = {"get_lobby_member_by_index", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_39get_lobby_member_by_index, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_39get_lobby_member_by_index(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7045,39 +7726,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_iMember,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 297, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 340, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 297, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 340, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 297, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 340, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_member_by_index", 0) < 0) __PYX_ERR(0, 297, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_member_by_index", 0) < 0) __PYX_ERR(0, 340, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_member_by_index", 1, 2, 2, i); __PYX_ERR(0, 297, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_member_by_index", 1, 2, 2, i); __PYX_ERR(0, 340, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 297, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 340, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 297, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 340, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 297, __pyx_L3_error)
-    __pyx_v_iMember = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_iMember == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 297, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 340, __pyx_L3_error)
+    __pyx_v_iMember = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_iMember == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 340, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_lobby_member_by_index", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 297, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_lobby_member_by_index", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 340, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7088,7 +7769,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_36get_lobby_member_by_index(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_iMember);
+  __pyx_r = __pyx_pf_13steam_wrapper_38get_lobby_member_by_index(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_iMember);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7098,7 +7779,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_iMember) {
+static PyObject *__pyx_pf_13steam_wrapper_38get_lobby_member_by_index(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_iMember) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -7109,7 +7790,7 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_lobby_member_by_index", 0);
 
-  /* "steam_wrapper.pyx":298
+  /* "steam_wrapper.pyx":341
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -7119,7 +7800,7 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":299
+    /* "steam_wrapper.pyx":342
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):
  *     if g_matchmaking:
  *         return g_matchmaking.GetLobbyMemberByIndex(CSteamID(lobby_id_int), iMember).ConvertToUint64()             # <<<<<<<<<<<<<<
@@ -7131,15 +7812,15 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 299, __pyx_L1_error)
+      __PYX_ERR(0, 342, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberByIndex(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_v_iMember).ConvertToUint64()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberByIndex(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_v_iMember).ConvertToUint64()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 342, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":298
+    /* "steam_wrapper.pyx":341
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
@@ -7148,7 +7829,7 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
 */
   }
 
-  /* "steam_wrapper.pyx":300
+  /* "steam_wrapper.pyx":343
  *     if g_matchmaking:
  *         return g_matchmaking.GetLobbyMemberByIndex(CSteamID(lobby_id_int), iMember).ConvertToUint64()
  *     return 0             # <<<<<<<<<<<<<<
@@ -7160,8 +7841,8 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
   __pyx_r = __pyx_mstate_global->__pyx_int_0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":297
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":340
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
@@ -7179,7 +7860,7 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":302
+/* "steam_wrapper.pyx":345
  *     return 0
  * 
  * def get_num_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
@@ -7188,15 +7869,15 @@ static PyObject *__pyx_pf_13steam_wrapper_36get_lobby_member_by_index(CYTHON_UNU
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_39get_num_lobby_members(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_41get_num_lobby_members(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_39get_num_lobby_members = {"get_num_lobby_members", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_39get_num_lobby_members, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_39get_num_lobby_members(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_41get_num_lobby_members = {"get_num_lobby_members", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_41get_num_lobby_members, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_41get_num_lobby_members(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7226,32 +7907,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 302, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 345, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 302, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 345, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_num_lobby_members", 0) < 0) __PYX_ERR(0, 302, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_num_lobby_members", 0) < 0) __PYX_ERR(0, 345, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_num_lobby_members", 1, 1, 1, i); __PYX_ERR(0, 302, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_num_lobby_members", 1, 1, 1, i); __PYX_ERR(0, 345, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 302, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 345, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 302, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 345, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_num_lobby_members", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 302, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_num_lobby_members", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 345, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7262,7 +7943,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_38get_num_lobby_members(__pyx_self, __pyx_v_lobby_id_int);
+  __pyx_r = __pyx_pf_13steam_wrapper_40get_num_lobby_members(__pyx_self, __pyx_v_lobby_id_int);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7272,7 +7953,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_38get_num_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
+static PyObject *__pyx_pf_13steam_wrapper_40get_num_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -7283,78 +7964,778 @@ static PyObject *__pyx_pf_13steam_wrapper_38get_num_lobby_members(CYTHON_UNUSED
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_num_lobby_members", 0);
 
-  /* "steam_wrapper.pyx":303
+  /* "steam_wrapper.pyx":346
  * 
  * def get_num_lobby_members(unsigned long long lobby_id_int):
  *     if not g_matchmaking: return 0             # <<<<<<<<<<<<<<
  *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
  * 
 */
-  __pyx_t_1 = (!(__pyx_v_13steam_wrapper_g_matchmaking != 0));
-  if (__pyx_t_1) {
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
-    __pyx_r = __pyx_mstate_global->__pyx_int_0;
-    goto __pyx_L0;
+  __pyx_t_1 = (!(__pyx_v_13steam_wrapper_g_matchmaking != 0));
+  if (__pyx_t_1) {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_int_0);
+    __pyx_r = __pyx_mstate_global->__pyx_int_0;
+    goto __pyx_L0;
+  }
+
+  /* "steam_wrapper.pyx":347
+ * def get_num_lobby_members(unsigned long long lobby_id_int):
+ *     if not g_matchmaking: return 0
+ *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))             # <<<<<<<<<<<<<<
+ * 
+ * def get_lobby_members(unsigned long long lobby_id_int):
+*/
+  __Pyx_XDECREF(__pyx_r);
+  try {
+    __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 347, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyLong_From_int(__pyx_v_13steam_wrapper_g_matchmaking->GetNumLobbyMembers(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 347, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "steam_wrapper.pyx":345
+ *     return 0
+ * 
+ * def get_num_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
+ *     if not g_matchmaking: return 0
+ *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("steam_wrapper.get_num_lobby_members", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "steam_wrapper.pyx":349
+ *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+ * 
+ * def get_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
+ *     """Steam IDs of every lobby member, in member index order"""
+ *     cdef int i, count
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13steam_wrapper_43get_lobby_members(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_13steam_wrapper_42get_lobby_members, "Steam IDs of every lobby member, in member index order");
+static PyMethodDef __pyx_mdef_13steam_wrapper_43get_lobby_members = {"get_lobby_members", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_43get_lobby_members, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_13steam_wrapper_42get_lobby_members};
+static PyObject *__pyx_pw_13steam_wrapper_43get_lobby_members(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  unsigned PY_LONG_LONG __pyx_v_lobby_id_int;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_lobby_members (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 349, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 349, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_members", 0) < 0) __PYX_ERR(0, 349, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_members", 1, 1, 1, i); __PYX_ERR(0, 349, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 349, __pyx_L3_error)
+    }
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 349, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_lobby_members", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 349, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("steam_wrapper.get_lobby_members", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_13steam_wrapper_42get_lobby_members(__pyx_self, __pyx_v_lobby_id_int);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13steam_wrapper_42get_lobby_members(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int) {
+  int __pyx_v_count;
+  CSteamID __pyx_v_lobby;
+  int __pyx_7genexpr__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  CSteamID __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_lobby_members", 0);
+
+  /* "steam_wrapper.pyx":352
+ *     """Steam IDs of every lobby member, in member index order"""
+ *     cdef int i, count
+ *     cdef CSteamID lobby = CSteamID(lobby_id_int)             # <<<<<<<<<<<<<<
+ *     if not g_matchmaking: return ()
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+*/
+  try {
+    __pyx_t_1 = CSteamID(__pyx_v_lobby_id_int);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 352, __pyx_L1_error)
+  }
+  __pyx_v_lobby = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_1);
+
+  /* "steam_wrapper.pyx":353
+ *     cdef int i, count
+ *     cdef CSteamID lobby = CSteamID(lobby_id_int)
+ *     if not g_matchmaking: return ()             # <<<<<<<<<<<<<<
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
+*/
+  __pyx_t_2 = (!(__pyx_v_13steam_wrapper_g_matchmaking != 0));
+  if (__pyx_t_2) {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_empty_tuple);
+    __pyx_r = __pyx_mstate_global->__pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "steam_wrapper.pyx":354
+ *     cdef CSteamID lobby = CSteamID(lobby_id_int)
+ *     if not g_matchmaking: return ()
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)             # <<<<<<<<<<<<<<
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
+ * 
+*/
+  __pyx_v_count = __pyx_v_13steam_wrapper_g_matchmaking->GetNumLobbyMembers(__pyx_v_lobby);
+
+  /* "steam_wrapper.pyx":355
+ *     if not g_matchmaking: return ()
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])             # <<<<<<<<<<<<<<
+ * 
+ * def get_all_member_data(unsigned long long lobby_id_int, keys):
+*/
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 355, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __pyx_v_count;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_7genexpr__pyx_v_i = __pyx_t_6;
+      __pyx_t_7 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberByIndex(__pyx_v_lobby, __pyx_7genexpr__pyx_v_i).ConvertToUint64()); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 355, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_3, (PyObject*)__pyx_t_7))) __PYX_ERR(0, 355, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_t_7 = PyList_AsTuple(((PyObject*)__pyx_t_3)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  /* "steam_wrapper.pyx":349
+ *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+ * 
+ * def get_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
+ *     """Steam IDs of every lobby member, in member index order"""
+ *     cdef int i, count
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("steam_wrapper.get_lobby_members", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "steam_wrapper.pyx":357
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
+ * 
+ * def get_all_member_data(unsigned long long lobby_id_int, keys):             # <<<<<<<<<<<<<<
+ *     """
+ *     Every lobby member with its persona name and member data, in one native loop
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_13steam_wrapper_45get_all_member_data(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_13steam_wrapper_44get_all_member_data, "\n    Every lobby member with its persona name and member data, in one native loop\n\n    Returns a tuple of (steam_id, persona_name, values) where values holds the\n    bytes of each key in `keys`, in order (b\"\" when a member has not set it).\n    ");
+static PyMethodDef __pyx_mdef_13steam_wrapper_45get_all_member_data = {"get_all_member_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_45get_all_member_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_13steam_wrapper_44get_all_member_data};
+static PyObject *__pyx_pw_13steam_wrapper_45get_all_member_data(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  unsigned PY_LONG_LONG __pyx_v_lobby_id_int;
+  PyObject *__pyx_v_keys = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_all_member_data (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_keys,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 357, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 357, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 357, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_all_member_data", 0) < 0) __PYX_ERR(0, 357, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_all_member_data", 1, 2, 2, i); __PYX_ERR(0, 357, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 357, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 357, __pyx_L3_error)
+    }
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 357, __pyx_L3_error)
+    __pyx_v_keys = values[1];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_all_member_data", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 357, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("steam_wrapper.get_all_member_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_13steam_wrapper_44get_all_member_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_keys);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_13steam_wrapper_44get_all_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_keys) {
+  int __pyx_v_i;
+  int __pyx_v_k;
+  int __pyx_v_count;
+  int __pyx_v_num_keys;
+  CSteamID __pyx_v_lobby;
+  CSteamID __pyx_v_member;
+  char const *__pyx_v_c_keys[16];
+  PyObject *__pyx_v_encoded_key = 0;
+  PyObject *__pyx_v_encoded = NULL;
+  PyObject *__pyx_v_members = NULL;
+  PyObject *__pyx_v_values = NULL;
+  PyObject *__pyx_8genexpr1__pyx_v_key = NULL;
+  int __pyx_8genexpr2__pyx_v_k;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  CSteamID __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  PyObject *__pyx_t_8 = NULL;
+  size_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  char const *__pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  char const *__pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_all_member_data", 0);
+
+  /* "steam_wrapper.pyx":365
+ *     """
+ *     cdef int i, k, count, num_keys
+ *     cdef CSteamID lobby = CSteamID(lobby_id_int)             # <<<<<<<<<<<<<<
+ *     cdef CSteamID member
+ *     cdef const char * c_keys[16]
+*/
+  try {
+    __pyx_t_1 = CSteamID(__pyx_v_lobby_id_int);
+  } catch(...) {
+    __Pyx_CppExn2PyErr();
+    __PYX_ERR(0, 365, __pyx_L1_error)
+  }
+  __pyx_v_lobby = __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_1);
+
+  /* "steam_wrapper.pyx":369
+ *     cdef const char * c_keys[16]
+ *     cdef bytes encoded_key
+ *     if not g_matchmaking or not g_friends: return ()             # <<<<<<<<<<<<<<
+ *     encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them
+ *     num_keys = len(encoded)
+*/
+  __pyx_t_3 = (!(__pyx_v_13steam_wrapper_g_matchmaking != 0));
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = (!(__pyx_v_13steam_wrapper_g_friends != 0));
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_mstate_global->__pyx_empty_tuple);
+    __pyx_r = __pyx_mstate_global->__pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "steam_wrapper.pyx":370
+ *     cdef bytes encoded_key
+ *     if not g_matchmaking or not g_friends: return ()
+ *     encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them             # <<<<<<<<<<<<<<
+ *     num_keys = len(encoded)
+ *     if num_keys > 16:
+*/
+  { /* enter inner scope */
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L8_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (likely(PyList_CheckExact(__pyx_v_keys)) || PyTuple_CheckExact(__pyx_v_keys)) {
+      __pyx_t_5 = __pyx_v_keys; __Pyx_INCREF(__pyx_t_5);
+      __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_v_keys); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 370, __pyx_L8_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_7 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 370, __pyx_L8_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 370, __pyx_L8_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          __pyx_t_8 = __Pyx_PyList_GetItemRef(__pyx_t_5, __pyx_t_6);
+          ++__pyx_t_6;
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
+            #if !CYTHON_ASSUME_SAFE_SIZE
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 370, __pyx_L8_error)
+            #endif
+            if (__pyx_t_6 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_8 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6));
+          #else
+          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_6);
+          #endif
+          ++__pyx_t_6;
+        }
+        if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 370, __pyx_L8_error)
+      } else {
+        __pyx_t_8 = __pyx_t_7(__pyx_t_5);
+        if (unlikely(!__pyx_t_8)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 370, __pyx_L8_error)
+            PyErr_Clear();
+          }
+          break;
+        }
+      }
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_key, __pyx_t_8);
+      __pyx_t_8 = 0;
+      __pyx_t_8 = __pyx_f_13steam_wrapper__key(__pyx_8genexpr1__pyx_v_key); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 370, __pyx_L8_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)__pyx_t_8))) __PYX_ERR(0, 370, __pyx_L8_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_key); __pyx_8genexpr1__pyx_v_key = 0;
+    goto __pyx_L12_exit_scope;
+    __pyx_L8_error:;
+    __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_key); __pyx_8genexpr1__pyx_v_key = 0;
+    goto __pyx_L1_error;
+    __pyx_L12_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_encoded = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "steam_wrapper.pyx":371
+ *     if not g_matchmaking or not g_friends: return ()
+ *     encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them
+ *     num_keys = len(encoded)             # <<<<<<<<<<<<<<
+ *     if num_keys > 16:
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")
+*/
+  __pyx_t_6 = __Pyx_PyList_GET_SIZE(__pyx_v_encoded); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_v_num_keys = __pyx_t_6;
+
+  /* "steam_wrapper.pyx":372
+ *     encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them
+ *     num_keys = len(encoded)
+ *     if num_keys > 16:             # <<<<<<<<<<<<<<
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")
+ *     for k in range(num_keys):
+*/
+  __pyx_t_2 = (__pyx_v_num_keys > 16);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "steam_wrapper.pyx":373
+ *     num_keys = len(encoded)
+ *     if num_keys > 16:
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")             # <<<<<<<<<<<<<<
+ *     for k in range(num_keys):
+ *         encoded_key = encoded[k]
+*/
+    __pyx_t_5 = NULL;
+    __Pyx_INCREF(__pyx_builtin_ValueError);
+    __pyx_t_8 = __pyx_builtin_ValueError; 
+    __pyx_t_9 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u_get_all_member_data_takes_at_mos};
+      __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+__pyx_t_9, (2-__pyx_t_9) | (__pyx_t_9*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 373, __pyx_L1_error)
+
+    /* "steam_wrapper.pyx":372
+ *     encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them
+ *     num_keys = len(encoded)
+ *     if num_keys > 16:             # <<<<<<<<<<<<<<
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")
+ *     for k in range(num_keys):
+*/
+  }
+
+  /* "steam_wrapper.pyx":374
+ *     if num_keys > 16:
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")
+ *     for k in range(num_keys):             # <<<<<<<<<<<<<<
+ *         encoded_key = encoded[k]
+ *         c_keys[k] = encoded_key
+*/
+  __pyx_t_10 = __pyx_v_num_keys;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_k = __pyx_t_12;
+
+    /* "steam_wrapper.pyx":375
+ *         raise ValueError("get_all_member_data() takes at most 16 keys")
+ *     for k in range(num_keys):
+ *         encoded_key = encoded[k]             # <<<<<<<<<<<<<<
+ *         c_keys[k] = encoded_key
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+*/
+    __pyx_t_4 = __Pyx_GetItemInt_List(__pyx_v_encoded, __pyx_v_k, int, 1, __Pyx_PyLong_From_int, 1, 1, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_4))) __PYX_ERR(0, 375, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_encoded_key, ((PyObject*)__pyx_t_4));
+    __pyx_t_4 = 0;
+
+    /* "steam_wrapper.pyx":376
+ *     for k in range(num_keys):
+ *         encoded_key = encoded[k]
+ *         c_keys[k] = encoded_key             # <<<<<<<<<<<<<<
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+ *     members = []
+*/
+    if (unlikely(__pyx_v_encoded_key == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+      __PYX_ERR(0, 376, __pyx_L1_error)
+    }
+    __pyx_t_13 = __Pyx_PyBytes_AsString(__pyx_v_encoded_key); if (unlikely((!__pyx_t_13) && PyErr_Occurred())) __PYX_ERR(0, 376, __pyx_L1_error)
+    (__pyx_v_c_keys[__pyx_v_k]) = __pyx_t_13;
+  }
+
+  /* "steam_wrapper.pyx":377
+ *         encoded_key = encoded[k]
+ *         c_keys[k] = encoded_key
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)             # <<<<<<<<<<<<<<
+ *     members = []
+ *     for i in range(count):
+*/
+  __pyx_v_count = __pyx_v_13steam_wrapper_g_matchmaking->GetNumLobbyMembers(__pyx_v_lobby);
+
+  /* "steam_wrapper.pyx":378
+ *         c_keys[k] = encoded_key
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+ *     members = []             # <<<<<<<<<<<<<<
+ *     for i in range(count):
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+*/
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_v_members = ((PyObject*)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "steam_wrapper.pyx":379
+ *     count = g_matchmaking.GetNumLobbyMembers(lobby)
+ *     members = []
+ *     for i in range(count):             # <<<<<<<<<<<<<<
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+*/
+  __pyx_t_10 = __pyx_v_count;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_i = __pyx_t_12;
+
+    /* "steam_wrapper.pyx":380
+ *     members = []
+ *     for i in range(count):
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)             # <<<<<<<<<<<<<<
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+ *         members.append((member.ConvertToUint64(),
+*/
+    __pyx_v_member = __pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberByIndex(__pyx_v_lobby, __pyx_v_i);
+
+    /* "steam_wrapper.pyx":381
+ *     for i in range(count):
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])             # <<<<<<<<<<<<<<
+ *         members.append((member.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))
+*/
+    { /* enter inner scope */
+      __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 381, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_14 = __pyx_v_num_keys;
+      __pyx_t_15 = __pyx_t_14;
+      for (__pyx_t_16 = 0; __pyx_t_16 < __pyx_t_15; __pyx_t_16+=1) {
+        __pyx_8genexpr2__pyx_v_k = __pyx_t_16;
+        __pyx_t_8 = __Pyx_PyBytes_FromString(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberData(__pyx_v_lobby, __pyx_v_member, (__pyx_v_c_keys[__pyx_8genexpr2__pyx_v_k]))); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 381, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_4, (PyObject*)((PyObject*)__pyx_t_8)))) __PYX_ERR(0, 381, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      }
+    } /* exit inner scope */
+    __pyx_t_8 = PyList_AsTuple(((PyObject*)__pyx_t_4)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_values, ((PyObject*)__pyx_t_8));
+    __pyx_t_8 = 0;
+
+    /* "steam_wrapper.pyx":382
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+ *         members.append((member.ConvertToUint64(),             # <<<<<<<<<<<<<<
+ *                         g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))
+ *     return tuple(members)
+*/
+    __pyx_t_8 = __Pyx_PyLong_From_unsigned_PY_LONG_LONG(__pyx_v_member.ConvertToUint64()); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+
+    /* "steam_wrapper.pyx":383
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+ *         members.append((member.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))             # <<<<<<<<<<<<<<
+ *     return tuple(members)
+ * 
+*/
+    __pyx_t_17 = __pyx_v_13steam_wrapper_g_friends->GetFriendPersonaName(__pyx_v_member);
+    __pyx_t_6 = __Pyx_ssize_strlen(__pyx_t_17); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 383, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_decode_c_string(__pyx_t_17, 0, __pyx_t_6, NULL, ((char const *)"ignore"), PyUnicode_DecodeUTF8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 383, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+
+    /* "steam_wrapper.pyx":382
+ *         member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+ *         values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+ *         members.append((member.ConvertToUint64(),             # <<<<<<<<<<<<<<
+ *                         g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))
+ *     return tuple(members)
+*/
+    __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_8);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_8) != (0)) __PYX_ERR(0, 382, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4) != (0)) __PYX_ERR(0, 382, __pyx_L1_error);
+    __Pyx_INCREF(__pyx_v_values);
+    __Pyx_GIVEREF(__pyx_v_values);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_v_values) != (0)) __PYX_ERR(0, 382, __pyx_L1_error);
+    __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_18 = __Pyx_PyList_Append(__pyx_v_members, __pyx_t_5); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 382, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
 
-  /* "steam_wrapper.pyx":304
- * def get_num_lobby_members(unsigned long long lobby_id_int):
- *     if not g_matchmaking: return 0
- *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))             # <<<<<<<<<<<<<<
+  /* "steam_wrapper.pyx":384
+ *         members.append((member.ConvertToUint64(),
+ *                         g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))
+ *     return tuple(members)             # <<<<<<<<<<<<<<
  * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):
 */
   __Pyx_XDECREF(__pyx_r);
-  try {
-    __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
-  } catch(...) {
-    __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 304, __pyx_L1_error)
-  }
-  __pyx_t_3 = __Pyx_PyLong_From_int(__pyx_v_13steam_wrapper_g_matchmaking->GetNumLobbyMembers(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 304, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_5 = PyList_AsTuple(__pyx_v_members); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":302
- *     return 0
+  /* "steam_wrapper.pyx":357
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
  * 
- * def get_num_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
- *     if not g_matchmaking: return 0
- *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+ * def get_all_member_data(unsigned long long lobby_id_int, keys):             # <<<<<<<<<<<<<<
+ *     """
+ *     Every lobby member with its persona name and member data, in one native loop
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("steam_wrapper.get_num_lobby_members", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("steam_wrapper.get_all_member_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_encoded_key);
+  __Pyx_XDECREF(__pyx_v_encoded);
+  __Pyx_XDECREF(__pyx_v_members);
+  __Pyx_XDECREF(__pyx_v_values);
+  __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_key);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":306
- *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+/* "steam_wrapper.pyx":386
+ *     return tuple(members)
  * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_41get_lobby_member_data(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_47get_lobby_member_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_41get_lobby_member_data = {"get_lobby_member_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_41get_lobby_member_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_41get_lobby_member_data(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_47get_lobby_member_data = {"get_lobby_member_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_47get_lobby_member_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_47get_lobby_member_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7386,46 +8767,46 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_steam_id_int,&__pyx_mstate_global->__pyx_n_u_key,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 306, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 386, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 306, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 386, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 306, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 386, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 306, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 386, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_member_data", 0) < 0) __PYX_ERR(0, 306, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_lobby_member_data", 0) < 0) __PYX_ERR(0, 386, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_member_data", 1, 3, 3, i); __PYX_ERR(0, 306, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_lobby_member_data", 1, 3, 3, i); __PYX_ERR(0, 386, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 306, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 386, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 306, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 386, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 306, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 386, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 306, __pyx_L3_error)
-    __pyx_v_steam_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_steam_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 306, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 386, __pyx_L3_error)
+    __pyx_v_steam_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_steam_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 386, __pyx_L3_error)
     __pyx_v_key = values[2];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_lobby_member_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 306, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("get_lobby_member_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 386, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7436,7 +8817,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_40get_lobby_member_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_steam_id_int, __pyx_v_key);
+  __pyx_r = __pyx_pf_13steam_wrapper_46get_lobby_member_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_steam_id_int, __pyx_v_key);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7446,35 +8827,34 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_40get_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, unsigned PY_LONG_LONG __pyx_v_steam_id_int, PyObject *__pyx_v_key) {
+static PyObject *__pyx_pf_13steam_wrapper_46get_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, unsigned PY_LONG_LONG __pyx_v_steam_id_int, PyObject *__pyx_v_key) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   CSteamID __pyx_t_2;
   CSteamID __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
-  char const *__pyx_t_7;
+  char const *__pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_lobby_member_data", 0);
 
-  /* "steam_wrapper.pyx":307
+  /* "steam_wrapper.pyx":387
  * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
  *     return None
 */
   __pyx_t_1 = (__pyx_v_13steam_wrapper_g_matchmaking != 0);
   if (__pyx_t_1) {
 
-    /* "steam_wrapper.pyx":308
+    /* "steam_wrapper.pyx":388
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):
  *     if g_matchmaking:
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))             # <<<<<<<<<<<<<<
  *     return None
  * 
 */
@@ -7483,44 +8863,40 @@ static PyObject *__pyx_pf_13steam_wrapper_40get_lobby_member_data(CYTHON_UNUSED
       __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 308, __pyx_L1_error)
+      __PYX_ERR(0, 388, __pyx_L1_error)
     }
     try {
       __pyx_t_3 = CSteamID(__pyx_v_steam_id_int);
     } catch(...) {
       __Pyx_CppExn2PyErr();
-      __PYX_ERR(0, 308, __pyx_L1_error)
+      __PYX_ERR(0, 388, __pyx_L1_error)
     }
-    __pyx_t_5 = __pyx_v_key;
-    __Pyx_INCREF(__pyx_t_5);
-    __pyx_t_6 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_4 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 308, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_4 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (unlikely(__pyx_t_4 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+      __PYX_ERR(0, 388, __pyx_L1_error)
     }
-    __pyx_t_7 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 308, __pyx_L1_error)
-    __pyx_t_5 = __Pyx_PyBytes_FromString(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_3), __pyx_t_7)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_5 = __Pyx_PyBytes_AsString(__pyx_t_4); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 388, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyBytes_FromString(__pyx_v_13steam_wrapper_g_matchmaking->GetLobbyMemberData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_3), __pyx_t_5)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 388, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_r = __pyx_t_5;
-    __pyx_t_5 = 0;
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
     goto __pyx_L0;
 
-    /* "steam_wrapper.pyx":307
+    /* "steam_wrapper.pyx":387
  * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):
  *     if g_matchmaking:             # <<<<<<<<<<<<<<
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
  *     return None
 */
   }
 
-  /* "steam_wrapper.pyx":309
+  /* "steam_wrapper.pyx":389
  *     if g_matchmaking:
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
  *     return None             # <<<<<<<<<<<<<<
  * 
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):
@@ -7529,18 +8905,18 @@ static PyObject *__pyx_pf_13steam_wrapper_40get_lobby_member_data(CYTHON_UNUSED
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":306
- *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
+  /* "steam_wrapper.pyx":386
+ *     return tuple(members)
  * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
 */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("steam_wrapper.get_lobby_member_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -7549,24 +8925,24 @@ static PyObject *__pyx_pf_13steam_wrapper_40get_lobby_member_data(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":311
+/* "steam_wrapper.pyx":391
  *     return None
  * 
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_43set_lobby_member_data(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_49set_lobby_member_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_43set_lobby_member_data = {"set_lobby_member_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_43set_lobby_member_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_43set_lobby_member_data(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_49set_lobby_member_data = {"set_lobby_member_data", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_49set_lobby_member_data, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_49set_lobby_member_data(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7598,46 +8974,46 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_key,&__pyx_mstate_global->__pyx_n_u_value,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 311, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 391, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 311, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 391, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 311, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 391, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 311, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 391, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_member_data", 0) < 0) __PYX_ERR(0, 311, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_member_data", 0) < 0) __PYX_ERR(0, 391, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_member_data", 1, 3, 3, i); __PYX_ERR(0, 311, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_member_data", 1, 3, 3, i); __PYX_ERR(0, 391, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 3)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 311, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 391, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 311, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 391, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 311, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 391, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 391, __pyx_L3_error)
     __pyx_v_key = values[1];
     __pyx_v_value = values[2];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_lobby_member_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 311, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_lobby_member_data", 1, 3, 3, __pyx_nargs); __PYX_ERR(0, 391, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7648,7 +9024,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_42set_lobby_member_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key, __pyx_v_value);
+  __pyx_r = __pyx_pf_13steam_wrapper_48set_lobby_member_data(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_key, __pyx_v_value);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7658,27 +9034,27 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
+static PyObject *__pyx_pf_13steam_wrapper_48set_lobby_member_data(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, PyObject *__pyx_v_key, PyObject *__pyx_v_value) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   CSteamID __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  size_t __pyx_t_5;
-  char const *__pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  char const *__pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
   char const *__pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_lobby_member_data", 0);
 
-  /* "steam_wrapper.pyx":312
+  /* "steam_wrapper.pyx":392
  * 
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):
  *     if not g_matchmaking: return             # <<<<<<<<<<<<<<
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
 */
   __pyx_t_1 = (!(__pyx_v_13steam_wrapper_g_matchmaking != 0));
@@ -7688,10 +9064,10 @@ static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED
     goto __pyx_L0;
   }
 
-  /* "steam_wrapper.pyx":313
+  /* "steam_wrapper.pyx":393
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):
  *     if not g_matchmaking: return
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))             # <<<<<<<<<<<<<<
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))             # <<<<<<<<<<<<<<
  * 
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):
 */
@@ -7699,40 +9075,36 @@ static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED
     __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 313, __pyx_L1_error)
+    __PYX_ERR(0, 393, __pyx_L1_error)
   }
-  __pyx_t_4 = __pyx_v_key;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_t_5 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_mstate_global->__pyx_kp_u_utf_8};
-    __pyx_t_3 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 313, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_3 = __pyx_f_13steam_wrapper__key(__pyx_v_key); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (unlikely(__pyx_t_3 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 393, __pyx_L1_error)
   }
-  __pyx_t_6 = __Pyx_PyObject_AsString(__pyx_t_3); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 313, __pyx_L1_error)
-  __pyx_t_7 = __pyx_v_value;
-  __Pyx_INCREF(__pyx_t_7);
-  __pyx_t_5 = 0;
+  __pyx_t_4 = __Pyx_PyBytes_AsString(__pyx_t_3); if (unlikely((!__pyx_t_4) && PyErr_Occurred())) __PYX_ERR(0, 393, __pyx_L1_error)
+  __pyx_t_6 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_6);
+  __pyx_t_7 = 0;
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_mstate_global->__pyx_kp_u_utf_8};
-    __pyx_t_4 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 313, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_kp_u_utf_8};
+    __pyx_t_5 = __Pyx_PyObject_FastCallMethod(__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_7, (2-__pyx_t_7) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
   }
-  __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_t_4); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 313, __pyx_L1_error)
-  __pyx_v_13steam_wrapper_g_matchmaking->SetLobbyMemberData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_6, __pyx_t_8);
+  __pyx_t_8 = __Pyx_PyObject_AsString(__pyx_t_5); if (unlikely((!__pyx_t_8) && PyErr_Occurred())) __PYX_ERR(0, 393, __pyx_L1_error)
+  __pyx_v_13steam_wrapper_g_matchmaking->SetLobbyMemberData(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_t_4, __pyx_t_8);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "steam_wrapper.pyx":311
+  /* "steam_wrapper.pyx":391
  *     return None
  * 
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
 
   /* function exit code */
@@ -7740,8 +9112,8 @@ static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("steam_wrapper.set_lobby_member_data", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -7750,8 +9122,8 @@ static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED
   return __pyx_r;
 }
 
-/* "steam_wrapper.pyx":315
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+/* "steam_wrapper.pyx":395
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return None
@@ -7759,15 +9131,15 @@ static PyObject *__pyx_pf_13steam_wrapper_42set_lobby_member_data(CYTHON_UNUSED
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_13steam_wrapper_45set_lobby_joinable(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_13steam_wrapper_51set_lobby_joinable(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyMethodDef __pyx_mdef_13steam_wrapper_45set_lobby_joinable = {"set_lobby_joinable", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_45set_lobby_joinable, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_13steam_wrapper_45set_lobby_joinable(PyObject *__pyx_self, 
+static PyMethodDef __pyx_mdef_13steam_wrapper_51set_lobby_joinable = {"set_lobby_joinable", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_13steam_wrapper_51set_lobby_joinable, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_13steam_wrapper_51set_lobby_joinable(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -7798,39 +9170,39 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lobby_id_int,&__pyx_mstate_global->__pyx_n_u_bLobbyJoinable,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 315, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 395, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 395, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 395, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_joinable", 0) < 0) __PYX_ERR(0, 315, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "set_lobby_joinable", 0) < 0) __PYX_ERR(0, 395, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_joinable", 1, 2, 2, i); __PYX_ERR(0, 315, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("set_lobby_joinable", 1, 2, 2, i); __PYX_ERR(0, 395, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 315, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 395, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 315, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 395, __pyx_L3_error)
     }
-    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
-    __pyx_v_bLobbyJoinable = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_bLobbyJoinable == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
+    __pyx_v_lobby_id_int = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[0]); if (unlikely((__pyx_v_lobby_id_int == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 395, __pyx_L3_error)
+    __pyx_v_bLobbyJoinable = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_bLobbyJoinable == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 395, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set_lobby_joinable", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 315, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("set_lobby_joinable", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 395, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7841,7 +9213,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_13steam_wrapper_44set_lobby_joinable(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_bLobbyJoinable);
+  __pyx_r = __pyx_pf_13steam_wrapper_50set_lobby_joinable(__pyx_self, __pyx_v_lobby_id_int, __pyx_v_bLobbyJoinable);
 
   /* function exit code */
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
@@ -7851,7 +9223,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_13steam_wrapper_44set_lobby_joinable(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_bLobbyJoinable) {
+static PyObject *__pyx_pf_13steam_wrapper_50set_lobby_joinable(CYTHON_UNUSED PyObject *__pyx_self, unsigned PY_LONG_LONG __pyx_v_lobby_id_int, int __pyx_v_bLobbyJoinable) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
@@ -7862,7 +9234,7 @@ static PyObject *__pyx_pf_13steam_wrapper_44set_lobby_joinable(CYTHON_UNUSED PyO
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("set_lobby_joinable", 0);
 
-  /* "steam_wrapper.pyx":316
+  /* "steam_wrapper.pyx":396
  * 
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):
  *     if not g_matchmaking: return None             # <<<<<<<<<<<<<<
@@ -7875,7 +9247,7 @@ static PyObject *__pyx_pf_13steam_wrapper_44set_lobby_joinable(CYTHON_UNUSED PyO
     goto __pyx_L0;
   }
 
-  /* "steam_wrapper.pyx":317
+  /* "steam_wrapper.pyx":397
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):
  *     if not g_matchmaking: return None
  *     return g_matchmaking.SetLobbyJoinable(CSteamID(lobby_id_int), bLobbyJoinable)             # <<<<<<<<<<<<<<
@@ -7885,16 +9257,16 @@ static PyObject *__pyx_pf_13steam_wrapper_44set_lobby_joinable(CYTHON_UNUSED PyO
     __pyx_t_2 = CSteamID(__pyx_v_lobby_id_int);
   } catch(...) {
     __Pyx_CppExn2PyErr();
-    __PYX_ERR(0, 317, __pyx_L1_error)
+    __PYX_ERR(0, 397, __pyx_L1_error)
   }
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_v_13steam_wrapper_g_matchmaking->SetLobbyJoinable(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_v_bLobbyJoinable)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_v_13steam_wrapper_g_matchmaking->SetLobbyJoinable(__PYX_STD_MOVE_IF_SUPPORTED(__pyx_t_2), __pyx_v_bLobbyJoinable)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 397, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "steam_wrapper.pyx":315
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":395
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return None
@@ -8113,6 +9485,7 @@ static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
+  __pyx_v_13steam_wrapper__encoded_keys = ((PyObject*)Py_None); Py_INCREF(Py_None);
   __Pyx_RefNannyFinishContext();
   return 0;
 }
@@ -8152,26 +9525,27 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __pyx_vtable_13steam_wrapper_SteamCallback.on_join_requested = (void (*)(struct SteamCallback *, GameLobbyJoinRequested_t *))__pyx_f_13steam_wrapper_13SteamCallback_on_join_requested;
   __pyx_vtable_13steam_wrapper_SteamCallback.on_game_rich_presence_join_requested = (void (*)(struct SteamCallback *, GameRichPresenceJoinRequested_t *))__pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requested;
   __pyx_vtable_13steam_wrapper_SteamCallback.on_game_overlay_activated = (void (*)(struct SteamCallback *, GameOverlayActivated_t *))__pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated;
+  __pyx_vtable_13steam_wrapper_SteamCallback.on_persona_state_change = (void (*)(struct SteamCallback *, PersonaStateChange_t *))__pyx_f_13steam_wrapper_13SteamCallback_on_persona_state_change;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &SteamCallback_Type_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback)) __PYX_ERR(0, 109, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&SteamCallback_Type_spec, __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &SteamCallback_Type_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&SteamCallback_Type_spec, __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback = &SteamCallback_Type;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback->tp_dictoffset && __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback->tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback, __pyx_vtabptr_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_SteamCallback, (PyObject *) __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 109, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback, __pyx_vtabptr_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_SteamCallback, (PyObject *) __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_13steam_wrapper_SteamCallback) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8382,6 +9756,7 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_steam_wrapper(PyObject *__pyx_pyin
   __pyx_mstatetype *__pyx_mstate = NULL;
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -8509,7 +9884,7 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(1, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":198
+  /* "steam_wrapper.pyx":211
  *             self._handler = NULL
  * 
  * cdef ISteamFriends * g_friends = NULL             # <<<<<<<<<<<<<<
@@ -8518,7 +9893,7 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
 */
   __pyx_v_13steam_wrapper_g_friends = NULL;
 
-  /* "steam_wrapper.pyx":199
+  /* "steam_wrapper.pyx":212
  * 
  * cdef ISteamFriends * g_friends = NULL
  * cdef ISteamMatchmaking * g_matchmaking = NULL             # <<<<<<<<<<<<<<
@@ -8527,7 +9902,7 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
 */
   __pyx_v_13steam_wrapper_g_matchmaking = NULL;
 
-  /* "steam_wrapper.pyx":200
+  /* "steam_wrapper.pyx":213
  * cdef ISteamFriends * g_friends = NULL
  * cdef ISteamMatchmaking * g_matchmaking = NULL
  * cdef ISteamUser * g_user = NULL             # <<<<<<<<<<<<<<
@@ -8536,7 +9911,7 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
 */
   __pyx_v_13steam_wrapper_g_user = NULL;
 
-  /* "steam_wrapper.pyx":201
+  /* "steam_wrapper.pyx":214
  * cdef ISteamMatchmaking * g_matchmaking = NULL
  * cdef ISteamUser * g_user = NULL
  * cdef ISteamApps * g_apps = NULL             # <<<<<<<<<<<<<<
@@ -8545,289 +9920,365 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
 */
   __pyx_v_13steam_wrapper_g_apps = NULL;
 
-  /* "steam_wrapper.pyx":202
+  /* "steam_wrapper.pyx":215
  * cdef ISteamUser * g_user = NULL
  * cdef ISteamApps * g_apps = NULL
  * cdef ISteamUtils * g_utils = NULL             # <<<<<<<<<<<<<<
  * 
- * def init():
+ * # --- Pre-encoded keys ---
 */
   __pyx_v_13steam_wrapper_g_utils = NULL;
 
-  /* "steam_wrapper.pyx":204
- * cdef ISteamUtils * g_utils = NULL
+  /* "steam_wrapper.pyx":220
+ * # Keys used on every lobby refresh are encoded once here; any other key is
+ * # encoded on first use and cached, so no call pays key.encode('utf-8') twice.
+ * KEY_PLAYER = b"player"             # <<<<<<<<<<<<<<
+ * KEY_START = b"start"
+ * cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_KEY_PLAYER, __pyx_mstate_global->__pyx_n_b_player) < 0) __PYX_ERR(0, 220, __pyx_L1_error)
+
+  /* "steam_wrapper.pyx":221
+ * # encoded on first use and cached, so no call pays key.encode('utf-8') twice.
+ * KEY_PLAYER = b"player"
+ * KEY_START = b"start"             # <<<<<<<<<<<<<<
+ * cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}
+ * 
+*/
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_KEY_START, __pyx_mstate_global->__pyx_n_b_start) < 0) __PYX_ERR(0, 221, __pyx_L1_error)
+
+  /* "steam_wrapper.pyx":222
+ * KEY_PLAYER = b"player"
+ * KEY_START = b"start"
+ * cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}             # <<<<<<<<<<<<<<
+ * 
+ * cdef bytes _key(key):
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_KEY_PLAYER); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_player, __pyx_t_3) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_KEY_START); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_start, __pyx_t_3) < 0) __PYX_ERR(0, 222, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_XGOTREF(__pyx_v_13steam_wrapper__encoded_keys);
+  __Pyx_DECREF_SET(__pyx_v_13steam_wrapper__encoded_keys, ((PyObject*)__pyx_t_2));
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":234
+ *     return encoded
  * 
  * def init():             # <<<<<<<<<<<<<<
  *     global g_friends, g_matchmaking, g_user, g_apps, g_utils
  *     if not SteamAPI_Init():
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_1init, 0, __pyx_mstate_global->__pyx_n_u_init, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 204, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_1init, 0, __pyx_mstate_global->__pyx_n_u_init, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_init, __pyx_t_2) < 0) __PYX_ERR(0, 204, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_init, __pyx_t_2) < 0) __PYX_ERR(0, 234, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":217
+  /* "steam_wrapper.pyx":247
  *     print("steam_wrapper: Steamworks API initialized successfully.")
  * 
  * def shutdown():             # <<<<<<<<<<<<<<
  *     SteamAPI_Shutdown()
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_3shutdown, 0, __pyx_mstate_global->__pyx_n_u_shutdown, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_3shutdown, 0, __pyx_mstate_global->__pyx_n_u_shutdown, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 247, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_shutdown, __pyx_t_2) < 0) __PYX_ERR(0, 217, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_shutdown, __pyx_t_2) < 0) __PYX_ERR(0, 247, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":220
+  /* "steam_wrapper.pyx":250
  *     SteamAPI_Shutdown()
  * 
  * def run_callbacks():             # <<<<<<<<<<<<<<
  *     SteamAPI_RunCallbacks()
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_5run_callbacks, 0, __pyx_mstate_global->__pyx_n_u_run_callbacks, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 220, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_5run_callbacks, 0, __pyx_mstate_global->__pyx_n_u_run_callbacks, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_run_callbacks, __pyx_t_2) < 0) __PYX_ERR(0, 220, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_run_callbacks, __pyx_t_2) < 0) __PYX_ERR(0, 250, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":224
+  /* "steam_wrapper.pyx":254
  * 
  * # --- User ---
  * def get_my_steam_id():             # <<<<<<<<<<<<<<
  *     if g_user:
  *         return g_user.GetSteamID().ConvertToUint64()
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_7get_my_steam_id, 0, __pyx_mstate_global->__pyx_n_u_get_my_steam_id, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_7get_my_steam_id, 0, __pyx_mstate_global->__pyx_n_u_get_my_steam_id, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_my_steam_id, __pyx_t_2) < 0) __PYX_ERR(0, 224, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_my_steam_id, __pyx_t_2) < 0) __PYX_ERR(0, 254, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":230
+  /* "steam_wrapper.pyx":260
  * 
  * # --- Apps ---
  * def get_launch_query_param(key):             # <<<<<<<<<<<<<<
  *     if not g_apps: return ""
- *     return g_apps.GetLaunchQueryParam(key.encode('utf-8'))
+ *     return g_apps.GetLaunchQueryParam(_key(key))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_9get_launch_query_param, 0, __pyx_mstate_global->__pyx_n_u_get_launch_query_param, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_9get_launch_query_param, 0, __pyx_mstate_global->__pyx_n_u_get_launch_query_param, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_launch_query_param, __pyx_t_2) < 0) __PYX_ERR(0, 230, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_launch_query_param, __pyx_t_2) < 0) __PYX_ERR(0, 260, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":235
+  /* "steam_wrapper.pyx":265
  * 
  * # --- Utils ---
  * def is_overlay_enabled():             # <<<<<<<<<<<<<<
  *     if not g_utils: return False
  *     return g_utils.IsOverlayEnabled()
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_11is_overlay_enabled, 0, __pyx_mstate_global->__pyx_n_u_is_overlay_enabled, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_11is_overlay_enabled, 0, __pyx_mstate_global->__pyx_n_u_is_overlay_enabled, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_is_overlay_enabled, __pyx_t_2) < 0) __PYX_ERR(0, 235, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_is_overlay_enabled, __pyx_t_2) < 0) __PYX_ERR(0, 265, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":240
+  /* "steam_wrapper.pyx":270
  * 
  * # --- Friends ---
  * def get_my_persona_name():             # <<<<<<<<<<<<<<
  *     if g_friends:
  *         return g_friends.GetPersonaName().decode('utf-8', 'ignore')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_13get_my_persona_name, 0, __pyx_mstate_global->__pyx_n_u_get_my_persona_name, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_13get_my_persona_name, 0, __pyx_mstate_global->__pyx_n_u_get_my_persona_name, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[8])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_my_persona_name, __pyx_t_2) < 0) __PYX_ERR(0, 240, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_my_persona_name, __pyx_t_2) < 0) __PYX_ERR(0, 270, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":245
+  /* "steam_wrapper.pyx":275
  *     return ""
  * 
  * def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
  *     if g_friends:
  *         g_friends.ActivateGameOverlayInviteDialog(CSteamID(lobby_id_int))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_15activate_game_overlay_invite_dialog, 0, __pyx_mstate_global->__pyx_n_u_activate_game_overlay_invite_dia, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_15activate_game_overlay_invite_dialog, 0, __pyx_mstate_global->__pyx_n_u_activate_game_overlay_invite_dia, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[9])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_activate_game_overlay_invite_dia, __pyx_t_2) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_activate_game_overlay_invite_dia, __pyx_t_2) < 0) __PYX_ERR(0, 275, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":249
+  /* "steam_wrapper.pyx":279
  *         g_friends.ActivateGameOverlayInviteDialog(CSteamID(lobby_id_int))
  * 
  * def set_rich_presence(key, value):             # <<<<<<<<<<<<<<
  *     if g_friends:
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_17set_rich_presence, 0, __pyx_mstate_global->__pyx_n_u_set_rich_presence, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_17set_rich_presence, 0, __pyx_mstate_global->__pyx_n_u_set_rich_presence, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[10])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 279, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_rich_presence, __pyx_t_2) < 0) __PYX_ERR(0, 249, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_rich_presence, __pyx_t_2) < 0) __PYX_ERR(0, 279, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":253
- *         g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":283
+ *         g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
  * 
  * def clear_rich_presence():             # <<<<<<<<<<<<<<
  *     if g_friends:
  *         g_friends.ClearRichPresence()
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_19clear_rich_presence, 0, __pyx_mstate_global->__pyx_n_u_clear_rich_presence, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_19clear_rich_presence, 0, __pyx_mstate_global->__pyx_n_u_clear_rich_presence, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_clear_rich_presence, __pyx_t_2) < 0) __PYX_ERR(0, 253, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_clear_rich_presence, __pyx_t_2) < 0) __PYX_ERR(0, 283, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":257
+  /* "steam_wrapper.pyx":287
  *         g_friends.ClearRichPresence()
  * 
  * def get_friend_count(int iFriendFlags):             # <<<<<<<<<<<<<<
  *     if not g_friends: return 0
  *     return g_friends.GetFriendCount(iFriendFlags)
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_21get_friend_count, 0, __pyx_mstate_global->__pyx_n_u_get_friend_count, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_21get_friend_count, 0, __pyx_mstate_global->__pyx_n_u_get_friend_count, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[12])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_count, __pyx_t_2) < 0) __PYX_ERR(0, 257, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_count, __pyx_t_2) < 0) __PYX_ERR(0, 287, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":261
+  /* "steam_wrapper.pyx":291
  *     return g_friends.GetFriendCount(iFriendFlags)
  * 
  * def get_friend_by_index(int iFriend, int iFriendFlags):             # <<<<<<<<<<<<<<
  *     if g_friends:
  *         return g_friends.GetFriendByIndex(iFriend, iFriendFlags).ConvertToUint64()
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_23get_friend_by_index, 0, __pyx_mstate_global->__pyx_n_u_get_friend_by_index, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_23get_friend_by_index, 0, __pyx_mstate_global->__pyx_n_u_get_friend_by_index, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[13])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 291, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_by_index, __pyx_t_2) < 0) __PYX_ERR(0, 261, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_by_index, __pyx_t_2) < 0) __PYX_ERR(0, 291, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":266
+  /* "steam_wrapper.pyx":296
  *     return None
  * 
  * def get_friend_persona_name(unsigned long long steamIDFriend):             # <<<<<<<<<<<<<<
  *     if g_friends:
  *         return g_friends.GetFriendPersonaName(CSteamID(steamIDFriend)).decode('utf-8')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_25get_friend_persona_name, 0, __pyx_mstate_global->__pyx_n_u_get_friend_persona_name, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_25get_friend_persona_name, 0, __pyx_mstate_global->__pyx_n_u_get_friend_persona_name, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[14])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_persona_name, __pyx_t_2) < 0) __PYX_ERR(0, 296, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":301
+ *     return ""
+ * 
+ * def get_friends(int iFriendFlags):             # <<<<<<<<<<<<<<
+ *     """All friends matching iFriendFlags as a tuple of (steam_id, persona_name), in one native loop"""
+ *     cdef int i, count
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_27get_friends, 0, __pyx_mstate_global->__pyx_n_u_get_friends, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[15])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 301, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friend_persona_name, __pyx_t_2) < 0) __PYX_ERR(0, 266, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_friends, __pyx_t_2) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":272
+  /* "steam_wrapper.pyx":315
  * 
  * # --- Matchmaking ---
  * def create_lobby(lobby_type, max_members):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
  *         return g_matchmaking.CreateLobby(<ELobbyType> lobby_type, max_members)
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_27create_lobby, 0, __pyx_mstate_global->__pyx_n_u_create_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[15])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_29create_lobby, 0, __pyx_mstate_global->__pyx_n_u_create_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_create_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 272, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_create_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":277
+  /* "steam_wrapper.pyx":320
  *     return 0
  * 
  * def join_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
  *         return g_matchmaking.JoinLobby(CSteamID(lobby_id_int))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_29join_lobby, 0, __pyx_mstate_global->__pyx_n_u_join_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_31join_lobby, 0, __pyx_mstate_global->__pyx_n_u_join_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 320, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_join_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_join_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 320, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":282
+  /* "steam_wrapper.pyx":325
  *     return 0
  * 
  * def leave_lobby(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
  *         g_matchmaking.LeaveLobby(CSteamID(lobby_id_int))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_31leave_lobby, 0, __pyx_mstate_global->__pyx_n_u_leave_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_33leave_lobby, 0, __pyx_mstate_global->__pyx_n_u_leave_lobby, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 325, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_leave_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 282, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_leave_lobby, __pyx_t_2) < 0) __PYX_ERR(0, 325, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":286
+  /* "steam_wrapper.pyx":329
  *         g_matchmaking.LeaveLobby(CSteamID(lobby_id_int))
  * 
  * def get_lobby_data(unsigned long long lobby_id_int, key):             # <<<<<<<<<<<<<<
  *     cdef const char * value_bytes = NULL
  *     if g_matchmaking:
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_33get_lobby_data, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 286, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_35get_lobby_data, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 329, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_data, __pyx_t_2) < 0) __PYX_ERR(0, 286, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_data, __pyx_t_2) < 0) __PYX_ERR(0, 329, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":293
+  /* "steam_wrapper.pyx":336
  *     return ""
  * 
  * def set_lobby_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_35set_lobby_data, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_37set_lobby_data, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_data, __pyx_t_2) < 0) __PYX_ERR(0, 293, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_data, __pyx_t_2) < 0) __PYX_ERR(0, 336, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":297
- *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":340
+ *         g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
  *         return g_matchmaking.GetLobbyMemberByIndex(CSteamID(lobby_id_int), iMember).ConvertToUint64()
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_37get_lobby_member_by_index, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_member_by_index, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_39get_lobby_member_by_index, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_member_by_index, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[21])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 340, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_member_by_index, __pyx_t_2) < 0) __PYX_ERR(0, 297, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_member_by_index, __pyx_t_2) < 0) __PYX_ERR(0, 340, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":302
+  /* "steam_wrapper.pyx":345
  *     return 0
  * 
  * def get_num_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return 0
  *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_39get_num_lobby_members, 0, __pyx_mstate_global->__pyx_n_u_get_num_lobby_members, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[21])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 302, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_41get_num_lobby_members, 0, __pyx_mstate_global->__pyx_n_u_get_num_lobby_members, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[22])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 345, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_num_lobby_members, __pyx_t_2) < 0) __PYX_ERR(0, 302, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_num_lobby_members, __pyx_t_2) < 0) __PYX_ERR(0, 345, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":306
+  /* "steam_wrapper.pyx":349
  *     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
  * 
+ * def get_lobby_members(unsigned long long lobby_id_int):             # <<<<<<<<<<<<<<
+ *     """Steam IDs of every lobby member, in member index order"""
+ *     cdef int i, count
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_43get_lobby_members, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_members, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[23])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_members, __pyx_t_2) < 0) __PYX_ERR(0, 349, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":357
+ *     return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
+ * 
+ * def get_all_member_data(unsigned long long lobby_id_int, keys):             # <<<<<<<<<<<<<<
+ *     """
+ *     Every lobby member with its persona name and member data, in one native loop
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_45get_all_member_data, 0, __pyx_mstate_global->__pyx_n_u_get_all_member_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[24])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_all_member_data, __pyx_t_2) < 0) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "steam_wrapper.pyx":386
+ *     return tuple(members)
+ * 
  * def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):             # <<<<<<<<<<<<<<
  *     if g_matchmaking:
- *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+ *         return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_41get_lobby_member_data, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_member_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[22])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_47get_lobby_member_data, 0, __pyx_mstate_global->__pyx_n_u_get_lobby_member_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[25])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 386, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_member_data, __pyx_t_2) < 0) __PYX_ERR(0, 306, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_get_lobby_member_data, __pyx_t_2) < 0) __PYX_ERR(0, 386, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":311
+  /* "steam_wrapper.pyx":391
  *     return None
  * 
  * def set_lobby_member_data(unsigned long long lobby_id_int, key, value):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_43set_lobby_member_data, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_member_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[23])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_49set_lobby_member_data, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_member_data, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[26])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 391, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_member_data, __pyx_t_2) < 0) __PYX_ERR(0, 311, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_member_data, __pyx_t_2) < 0) __PYX_ERR(0, 391, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "steam_wrapper.pyx":315
- *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+  /* "steam_wrapper.pyx":395
+ *     g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
  * 
  * def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):             # <<<<<<<<<<<<<<
  *     if not g_matchmaking: return None
  *     return g_matchmaking.SetLobbyJoinable(CSteamID(lobby_id_int), bLobbyJoinable)
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_45set_lobby_joinable, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_joinable, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[24])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_13steam_wrapper_51set_lobby_joinable, 0, __pyx_mstate_global->__pyx_n_u_set_lobby_joinable, NULL, __pyx_mstate_global->__pyx_n_u_steam_wrapper, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[27])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 395, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_joinable, __pyx_t_2) < 0) __PYX_ERR(0, 315, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_set_lobby_joinable, __pyx_t_2) < 0) __PYX_ERR(0, 395, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "steam_wrapper.pyx":1
@@ -8845,6 +10296,7 @@ __Pyx_RefNannySetupContext("PyInit_steam_wrapper", 0);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
   if (__pyx_m) {
     if (__pyx_mstate->__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init steam_wrapper", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -8901,36 +10353,51 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_, sizeof(__pyx_k_), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_ */
   {__pyx_k_Callback_ID, sizeof(__pyx_k_Callback_ID), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Callback_ID */
   {__pyx_k_Failed_to_get_Steam_interfaces, sizeof(__pyx_k_Failed_to_get_Steam_interfaces), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_Failed_to_get_Steam_interfaces */
+  {__pyx_k_KEY_PLAYER, sizeof(__pyx_k_KEY_PLAYER), 0, 1, 1}, /* PyObject cname: __pyx_n_u_KEY_PLAYER */
+  {__pyx_k_KEY_START, sizeof(__pyx_k_KEY_START), 0, 1, 1}, /* PyObject cname: __pyx_n_u_KEY_START */
   {__pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_RuntimeError */
   {__pyx_k_SteamAPI_Init_failed, sizeof(__pyx_k_SteamAPI_Init_failed), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_SteamAPI_Init_failed */
   {__pyx_k_SteamCallback, sizeof(__pyx_k_SteamCallback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_SteamCallback */
   {__pyx_k_SteamCallback___reduce_cython, sizeof(__pyx_k_SteamCallback___reduce_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_SteamCallback___reduce_cython */
   {__pyx_k_SteamCallback___setstate_cython, sizeof(__pyx_k_SteamCallback___setstate_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_SteamCallback___setstate_cython */
   {__pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_TypeError */
+  {__pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 1, 1}, /* PyObject cname: __pyx_n_u_ValueError */
   {__pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0}, /* PyObject cname: __pyx_kp_u__2 */
   {__pyx_k_activate_game_overlay_invite_dia, sizeof(__pyx_k_activate_game_overlay_invite_dia), 0, 1, 1}, /* PyObject cname: __pyx_n_u_activate_game_overlay_invite_dia */
   {__pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 1, 1}, /* PyObject cname: __pyx_n_u_asyncio_coroutines */
   {__pyx_k_bLobbyJoinable, sizeof(__pyx_k_bLobbyJoinable), 0, 1, 1}, /* PyObject cname: __pyx_n_u_bLobbyJoinable */
+  {__pyx_k_c_keys, sizeof(__pyx_k_c_keys), 0, 1, 1}, /* PyObject cname: __pyx_n_u_c_keys */
   {__pyx_k_callback_id, sizeof(__pyx_k_callback_id), 0, 1, 1}, /* PyObject cname: __pyx_n_u_callback_id */
   {__pyx_k_clear_rich_presence, sizeof(__pyx_k_clear_rich_presence), 0, 1, 1}, /* PyObject cname: __pyx_n_u_clear_rich_presence */
   {__pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_cline_in_traceback */
+  {__pyx_k_count, sizeof(__pyx_k_count), 0, 1, 1}, /* PyObject cname: __pyx_n_u_count */
   {__pyx_k_create_lobby, sizeof(__pyx_k_create_lobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_create_lobby */
   {__pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_disable */
   {__pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_enable */
   {__pyx_k_encode, sizeof(__pyx_k_encode), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encode */
+  {__pyx_k_encoded, sizeof(__pyx_k_encoded), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encoded */
+  {__pyx_k_encoded_key, sizeof(__pyx_k_encoded_key), 0, 1, 1}, /* PyObject cname: __pyx_n_u_encoded_key */
+  {__pyx_k_friend_id, sizeof(__pyx_k_friend_id), 0, 1, 1}, /* PyObject cname: __pyx_n_u_friend_id */
+  {__pyx_k_friends, sizeof(__pyx_k_friends), 0, 1, 1}, /* PyObject cname: __pyx_n_u_friends */
   {__pyx_k_func, sizeof(__pyx_k_func), 0, 1, 1}, /* PyObject cname: __pyx_n_u_func */
   {__pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_gc */
+  {__pyx_k_get, sizeof(__pyx_k_get), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get */
+  {__pyx_k_get_all_member_data, sizeof(__pyx_k_get_all_member_data), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_all_member_data */
+  {__pyx_k_get_all_member_data_takes_at_mos, sizeof(__pyx_k_get_all_member_data_takes_at_mos), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_get_all_member_data_takes_at_mos */
   {__pyx_k_get_friend_by_index, sizeof(__pyx_k_get_friend_by_index), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_friend_by_index */
   {__pyx_k_get_friend_count, sizeof(__pyx_k_get_friend_count), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_friend_count */
   {__pyx_k_get_friend_persona_name, sizeof(__pyx_k_get_friend_persona_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_friend_persona_name */
+  {__pyx_k_get_friends, sizeof(__pyx_k_get_friends), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_friends */
   {__pyx_k_get_launch_query_param, sizeof(__pyx_k_get_launch_query_param), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_launch_query_param */
   {__pyx_k_get_lobby_data, sizeof(__pyx_k_get_lobby_data), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_lobby_data */
   {__pyx_k_get_lobby_member_by_index, sizeof(__pyx_k_get_lobby_member_by_index), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_lobby_member_by_index */
   {__pyx_k_get_lobby_member_data, sizeof(__pyx_k_get_lobby_member_data), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_lobby_member_data */
+  {__pyx_k_get_lobby_members, sizeof(__pyx_k_get_lobby_members), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_lobby_members */
   {__pyx_k_get_my_persona_name, sizeof(__pyx_k_get_my_persona_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_my_persona_name */
   {__pyx_k_get_my_steam_id, sizeof(__pyx_k_get_my_steam_id), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_my_steam_id */
   {__pyx_k_get_num_lobby_members, sizeof(__pyx_k_get_num_lobby_members), 0, 1, 1}, /* PyObject cname: __pyx_n_u_get_num_lobby_members */
   {__pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_getstate */
+  {__pyx_k_i, sizeof(__pyx_k_i), 0, 1, 1}, /* PyObject cname: __pyx_n_u_i */
   {__pyx_k_iFriend, sizeof(__pyx_k_iFriend), 0, 1, 1}, /* PyObject cname: __pyx_n_u_iFriend */
   {__pyx_k_iFriendFlags, sizeof(__pyx_k_iFriendFlags), 0, 1, 1}, /* PyObject cname: __pyx_n_u_iFriendFlags */
   {__pyx_k_iMember, sizeof(__pyx_k_iMember), 0, 1, 1}, /* PyObject cname: __pyx_n_u_iMember */
@@ -8940,8 +10407,11 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_is_overlay_enabled, sizeof(__pyx_k_is_overlay_enabled), 0, 1, 1}, /* PyObject cname: __pyx_n_u_is_overlay_enabled */
   {__pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_isenabled */
   {__pyx_k_join_lobby, sizeof(__pyx_k_join_lobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_join_lobby */
+  {__pyx_k_k, sizeof(__pyx_k_k), 0, 1, 1}, /* PyObject cname: __pyx_n_u_k */
   {__pyx_k_key, sizeof(__pyx_k_key), 0, 1, 1}, /* PyObject cname: __pyx_n_u_key */
+  {__pyx_k_keys, sizeof(__pyx_k_keys), 0, 1, 1}, /* PyObject cname: __pyx_n_u_keys */
   {__pyx_k_leave_lobby, sizeof(__pyx_k_leave_lobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_leave_lobby */
+  {__pyx_k_lobby, sizeof(__pyx_k_lobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lobby */
   {__pyx_k_lobby_id_int, sizeof(__pyx_k_lobby_id_int), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lobby_id_int */
   {__pyx_k_lobby_type, sizeof(__pyx_k_lobby_type), 0, 1, 1}, /* PyObject cname: __pyx_n_u_lobby_type */
   {__pyx_k_m_EChatRoomEnterResponse, sizeof(__pyx_k_m_EChatRoomEnterResponse), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_EChatRoomEnterResponse */
@@ -8949,11 +10419,13 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_m_bLocked, sizeof(__pyx_k_m_bLocked), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_bLocked */
   {__pyx_k_m_bSuccess, sizeof(__pyx_k_m_bSuccess), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_bSuccess */
   {__pyx_k_m_eResult, sizeof(__pyx_k_m_eResult), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_eResult */
+  {__pyx_k_m_nChangeFlags, sizeof(__pyx_k_m_nChangeFlags), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_nChangeFlags */
   {__pyx_k_m_rgchConnect, sizeof(__pyx_k_m_rgchConnect), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_rgchConnect */
   {__pyx_k_m_rgfChatMemberStateChange, sizeof(__pyx_k_m_rgfChatMemberStateChange), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_rgfChatMemberStateChange */
   {__pyx_k_m_steamIDFriend, sizeof(__pyx_k_m_steamIDFriend), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_steamIDFriend */
   {__pyx_k_m_steamIDLobby, sizeof(__pyx_k_m_steamIDLobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_steamIDLobby */
   {__pyx_k_m_ulGameID, sizeof(__pyx_k_m_ulGameID), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulGameID */
+  {__pyx_k_m_ulSteamID, sizeof(__pyx_k_m_ulSteamID), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulSteamID */
   {__pyx_k_m_ulSteamIDLobby, sizeof(__pyx_k_m_ulSteamIDLobby), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulSteamIDLobby */
   {__pyx_k_m_ulSteamIDMakingChange, sizeof(__pyx_k_m_ulSteamIDMakingChange), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulSteamIDMakingChange */
   {__pyx_k_m_ulSteamIDMember, sizeof(__pyx_k_m_ulSteamIDMember), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulSteamIDMember */
@@ -8961,15 +10433,21 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_m_ulSteamIDUserChanged, sizeof(__pyx_k_m_ulSteamIDUserChanged), 0, 1, 1}, /* PyObject cname: __pyx_n_u_m_ulSteamIDUserChanged */
   {__pyx_k_main, sizeof(__pyx_k_main), 0, 1, 1}, /* PyObject cname: __pyx_n_u_main */
   {__pyx_k_max_members, sizeof(__pyx_k_max_members), 0, 1, 1}, /* PyObject cname: __pyx_n_u_max_members */
+  {__pyx_k_member, sizeof(__pyx_k_member), 0, 1, 1}, /* PyObject cname: __pyx_n_u_member */
+  {__pyx_k_members, sizeof(__pyx_k_members), 0, 1, 1}, /* PyObject cname: __pyx_n_u_members */
   {__pyx_k_module, sizeof(__pyx_k_module), 0, 1, 1}, /* PyObject cname: __pyx_n_u_module */
   {__pyx_k_name, sizeof(__pyx_k_name), 0, 1, 1}, /* PyObject cname: __pyx_n_u_name */
   {__pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_no_default___reduce___due_to_non */
+  {__pyx_k_num_keys, sizeof(__pyx_k_num_keys), 0, 1, 1}, /* PyObject cname: __pyx_n_u_num_keys */
+  {__pyx_k_player, sizeof(__pyx_k_player), 0, 0, 1}, /* PyObject cname: __pyx_n_b_player */
+  {__pyx_k_player, sizeof(__pyx_k_player), 0, 1, 1}, /* PyObject cname: __pyx_n_u_player */
   {__pyx_k_pop, sizeof(__pyx_k_pop), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pop */
   {__pyx_k_print, sizeof(__pyx_k_print), 0, 1, 1}, /* PyObject cname: __pyx_n_u_print */
   {__pyx_k_py_callback, sizeof(__pyx_k_py_callback), 0, 1, 1}, /* PyObject cname: __pyx_n_u_py_callback */
   {__pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_state */
   {__pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 1, 1}, /* PyObject cname: __pyx_n_u_pyx_vtable */
   {__pyx_k_qualname, sizeof(__pyx_k_qualname), 0, 1, 1}, /* PyObject cname: __pyx_n_u_qualname */
+  {__pyx_k_range, sizeof(__pyx_k_range), 0, 1, 1}, /* PyObject cname: __pyx_n_u_range */
   {__pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 1, 1}, /* PyObject cname: __pyx_n_u_reduce */
   {__pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_reduce_cython */
   {__pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 1, 1}, /* PyObject cname: __pyx_n_u_reduce_ex */
@@ -8983,6 +10461,8 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 1, 1}, /* PyObject cname: __pyx_n_u_setstate */
   {__pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 1, 1}, /* PyObject cname: __pyx_n_u_setstate_cython */
   {__pyx_k_shutdown, sizeof(__pyx_k_shutdown), 0, 1, 1}, /* PyObject cname: __pyx_n_u_shutdown */
+  {__pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1}, /* PyObject cname: __pyx_n_b_start */
+  {__pyx_k_start, sizeof(__pyx_k_start), 0, 1, 1}, /* PyObject cname: __pyx_n_u_start */
   {__pyx_k_steamIDFriend, sizeof(__pyx_k_steamIDFriend), 0, 1, 1}, /* PyObject cname: __pyx_n_u_steamIDFriend */
   {__pyx_k_steam_id_int, sizeof(__pyx_k_steam_id_int), 0, 1, 1}, /* PyObject cname: __pyx_n_u_steam_id_int */
   {__pyx_k_steam_wrapper, sizeof(__pyx_k_steam_wrapper), 0, 1, 1}, /* PyObject cname: __pyx_n_u_steam_wrapper */
@@ -8993,6 +10473,7 @@ static const __Pyx_StringTabEntry __pyx_string_tab[] = {
   {__pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 1, 0}, /* PyObject cname: __pyx_kp_u_utf_8 */
   {__pyx_k_value, sizeof(__pyx_k_value), 0, 1, 1}, /* PyObject cname: __pyx_n_u_value */
   {__pyx_k_value_bytes, sizeof(__pyx_k_value_bytes), 0, 1, 1}, /* PyObject cname: __pyx_n_u_value_bytes */
+  {__pyx_k_values, sizeof(__pyx_k_values), 0, 1, 1}, /* PyObject cname: __pyx_n_u_values */
   {0, 0, 0, 0, 0}
 };
 /* InitStrings.proto */
@@ -9002,9 +10483,11 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry const *t, PyObject **target, c
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 137, __pyx_L1_error)
-  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 207, __pyx_L1_error)
-  __pyx_builtin_print = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_print); if (!__pyx_builtin_print) __PYX_ERR(0, 215, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 237, __pyx_L1_error)
+  __pyx_builtin_print = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_print); if (!__pyx_builtin_print) __PYX_ERR(0, 245, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_range); if (!__pyx_builtin_range) __PYX_ERR(0, 308, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 373, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -9022,6 +10505,8 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
+  __pyx_mstate->__pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_get.method_name = &__pyx_mstate->__pyx_n_u_get;
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
   __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
   if (__Pyx_InitStrings(__pyx_string_tab, __pyx_mstate->__pyx_string_tab, __pyx_string_tab_encodings) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
@@ -9036,10 +10521,10 @@ static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
             unsigned int argcount : 2;
             unsigned int num_posonly_args : 1;
             unsigned int num_kwonly_args : 1;
-            unsigned int nlocals : 2;
+            unsigned int nlocals : 4;
             unsigned int flags : 10;
             unsigned int first_line : 9;
-            unsigned int line_table_length : 11;
+            unsigned int line_table_length : 13;
         } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -9066,119 +10551,134 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_k_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 204, 98};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 234, 98};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_init, __pyx_k_t_l_1_A_A_Ya_Ya_j_uJd_G4wd_l_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 217, 7};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 247, 7};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_shutdown, __pyx_k_Q_2, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 220, 7};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 250, 7};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_run_callbacks, __pyx_k__3, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 224, 26};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 254, 26};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_my_steam_id, __pyx_k_q_v_2_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 230, 31};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 260, 29};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_key};
-    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_launch_query_param, __pyx_k_t87_6_Qc, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_launch_query_param, __pyx_k_t87_6_Qd_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 235, 23};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 265, 23};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_is_overlay_enabled, __pyx_k_t9G1_7_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 240, 29};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 270, 29};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[8] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_my_persona_name, __pyx_k_q_y_r_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[8])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 245, 21};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 275, 21};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int};
     __pyx_mstate_global->__pyx_codeobj_tab[9] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_activate_game_overlay_invite_dia, __pyx_k_q_1_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[9])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 249, 31};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 279, 29};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_value};
-    __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_rich_presence, __pyx_k_q_WAZuG1A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_rich_presence, __pyx_k_q_avU, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 253, 15};
+    const __Pyx_PyCode_New_function_description descr = {0, 0, 0, 0, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 283, 15};
     PyObject* const varnames[] = {0};
     __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_clear_rich_presence, __pyx_k_q_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 257, 24};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 287, 24};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_iFriendFlags};
     __pyx_mstate_global->__pyx_codeobj_tab[12] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_friend_count, __pyx_k_t_gQ_9O1A, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[12])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 261, 32};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 291, 32};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_iFriend, __pyx_mstate->__pyx_n_u_iFriendFlags};
     __pyx_mstate_global->__pyx_codeobj_tab[13] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_friend_by_index, __pyx_k_q_y_PPQ_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[13])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 266, 34};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 296, 34};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_steamIDFriend};
     __pyx_mstate_global->__pyx_codeobj_tab[14] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_friend_persona_name, __pyx_k_q_y_Qha_gQa_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[14])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 272, 27};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 301, 98};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_iFriendFlags, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_count, __pyx_mstate->__pyx_n_u_friend_id, __pyx_mstate->__pyx_n_u_friends};
+    __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_friends, __pyx_k_t_gQ_I_AQ_a_U_1_I_as_wb_1_6az_R, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 315, 27};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_type, __pyx_mstate->__pyx_n_u_max_members};
-    __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_create_lobby, __pyx_k_q_L_l_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_create_lobby, __pyx_k_q_L_l_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 277, 27};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 320, 27};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int};
-    __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_join_lobby, __pyx_k_q_Jaxq_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_join_lobby, __pyx_k_q_Jaxq_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 282, 20};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 325, 20};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int};
-    __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_leave_lobby, __pyx_k_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_leave_lobby, __pyx_k_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 286, 55};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 329, 51};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_value_bytes};
-    __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_data, __pyx_k_A_q_m_GSTTU_1_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_data, __pyx_k_A_q_m_Qa_1_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 293, 40};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 336, 36};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_value};
-    __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_data, __pyx_k_q_81O3gQjPUU, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_data, __pyx_k_q_81O4q_e7RSST, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 297, 36};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 340, 36};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_iMember};
-    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_member_by_index, __pyx_k_q_2_81O8Sccd_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[21] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_member_by_index, __pyx_k_q_2_81O8Sccd_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[21])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 302, 29};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 345, 29};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int};
-    __pyx_mstate_global->__pyx_codeobj_tab[21] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_num_lobby_members, __pyx_k_t_1HAQ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[21])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[22] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_num_lobby_members, __pyx_k_t_1HAQ, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[22])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 349, 76};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_count, __pyx_mstate->__pyx_n_u_lobby, __pyx_mstate->__pyx_n_u_i};
+    __pyx_mstate_global->__pyx_codeobj_tab[23] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_members, __pyx_k_1_t_M_AQ_5_5QgR_OsRVV_aab, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[23])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 15, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 357, 237};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_keys, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_count, __pyx_mstate->__pyx_n_u_num_keys, __pyx_mstate->__pyx_n_u_lobby, __pyx_mstate->__pyx_n_u_member, __pyx_mstate->__pyx_n_u_c_keys, __pyx_mstate->__pyx_n_u_encoded_key, __pyx_mstate->__pyx_n_u_encoded, __pyx_mstate->__pyx_n_u_members, __pyx_mstate->__pyx_n_u_values, __pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_k};
+    __pyx_mstate_global->__pyx_codeobj_tab[24] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_all_member_data, __pyx_k_1_t_D_7_at1E_WA_s_1_y_j_U_1_gQa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[24])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 306, 48};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 386, 45};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_steam_id_int, __pyx_mstate->__pyx_n_u_key};
-    __pyx_mstate_global->__pyx_codeobj_tab[22] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_member_data, __pyx_k_q_q_PQQ_ccjjkkl_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[22])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[25] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_get_lobby_member_data, __pyx_k_q_q_PQQ_ddeef_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[25])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 311, 45};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 391, 41};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_value};
-    __pyx_mstate_global->__pyx_codeobj_tab[23] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_member_data, __pyx_k_t_AXQoS_q_RWW, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[23])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[26] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_member_data, __pyx_k_t_AXQoT_WTUUV, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[26])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 315, 31};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 395, 31};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_lobby_id_int, __pyx_mstate->__pyx_n_u_bLobbyJoinable};
-    __pyx_mstate_global->__pyx_codeobj_tab[24] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_joinable, __pyx_k_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[24])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[27] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_steam_wrapper_pyx, __pyx_mstate->__pyx_n_u_set_lobby_joinable, __pyx_k_t, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[27])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -10868,6 +12368,106 @@ static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
     }
 }
 
+/* PyObjectCall2Args */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args[3] = {NULL, arg1, arg2};
+    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    int was_initialized =  __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return __Pyx_CallCFunction(cfunc, self, arg);
+        } else if (flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, &arg, 1);
+        } else if (flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, &arg, 1, NULL);
+        }
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod1(&tmp_cfunc, self, arg);
+    }
+#endif
+    PyObject* result = __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *args = PyTuple_New(1);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+    } else
+#endif
+    {
+        result = __Pyx_PyObject_Call2Args(cfunc->method, self, arg);
+    }
+    return result;
+}
+
+/* dict_getitem_default */
+static PyObject* __Pyx_PyDict_GetItemDefault(PyObject* d, PyObject* key, PyObject* default_value) {
+    PyObject* value;
+#if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+    value = PyDict_GetItemWithError(d, key);
+    if (unlikely(!value)) {
+        if (unlikely(PyErr_Occurred()))
+            return NULL;
+        value = default_value;
+    }
+    Py_INCREF(value);
+    if ((1));
+#else
+    if (PyBytes_CheckExact(key) || PyUnicode_CheckExact(key) || PyLong_CheckExact(key)) {
+        value = PyDict_GetItem(d, key);
+        if (unlikely(!value)) {
+            value = default_value;
+        }
+        Py_INCREF(value);
+    }
+#endif
+    else {
+        if (default_value == Py_None)
+            value = __Pyx_CallUnboundCMethod1(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key);
+        else
+            value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_get, d, key, default_value);
+    }
+    return value;
+}
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
 /* PyObjectFastCallMethod */
 #if !CYTHON_VECTORCALL || PY_VERSION_HEX < 0x03090000
 static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
@@ -10914,6 +12514,99 @@ static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
     }
 }
 
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE && !CYTHON_AVOID_BORROWED_REFS && !CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            return __Pyx_PyList_GetItemRef(o, n);
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (mm && mm->mp_subscript) {
+            PyObject *r, *key = PyLong_FromSsize_t(i);
+            if (unlikely(!key)) return NULL;
+            r = mm->mp_subscript(o, key);
+            Py_DECREF(key);
+            return r;
+        }
+        if (likely(sm && sm->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || !PyMapping_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+}
+
 /* CallTypeTraverse */
 #if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
 #else
@@ -12974,6 +14667,42 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 }
 #endif
 
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    PyErr_Clear();
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
 /* CLineInTraceback */
 #if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
 static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
@@ -6,8 +6,8 @@
 #include "Python.h"
 struct SteamCallback;
 
-/* "steam_wrapper.pyx":109
- *     void del_game_overlay_activated_handler(void * handler)
+/* "steam_wrapper.pyx":115
+ *     void del_persona_state_change_handler(void * handler)
  * 
  * cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:             # <<<<<<<<<<<<<<
  *     cdef:
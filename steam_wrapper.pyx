@@ -15,6 +15,7 @@ cdef extern from "steam_api_common.h":
 
 cdef extern from "steamclientpublic.h":
     cdef cppclass CSteamID "CSteamID":
+        CSteamID() except +
         CSteamID(unsigned long long ulSteamID) except +
         unsigned long long ConvertToUint64() nogil
 
@@ -27,6 +28,9 @@ cdef extern from "isteamfriends.h":
         char m_rgchConnect[256]
     ctypedef struct GameOverlayActivated_t "GameOverlayActivated_t":
         bint m_bActive;
+    ctypedef struct PersonaStateChange_t "PersonaStateChange_t":
+        unsigned long long m_ulSteamID
+        int m_nChangeFlags
     cdef cppclass ISteamFriends:
         const char * GetPersonaName()
         void ActivateGameOverlayInviteDialog(CSteamID steamIDLobby)
@@ -105,6 +109,8 @@ cdef extern from "steam_callback_helpers.h":
     void del_game_rich_presence_join_requested_handler(void * handler)
     void * new_game_overlay_activated_handler(SteamCallback obj)
     void del_game_overlay_activated_handler(void * handler)
+    void * new_persona_state_change_handler(SteamCallback obj)
+    void del_persona_state_change_handler(void * handler)
 
 cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:
     cdef:
@@ -133,6 +139,8 @@ cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:
             self._handler = new_game_rich_presence_join_requested_handler(self)
         elif callback_id == 331:
             self._handler = new_game_overlay_activated_handler(self)
+        elif callback_id == 304:
+            self._handler = new_persona_state_change_handler(self)
         else:
             raise TypeError(f"Callback ID {callback_id} is not supported yet.")
 
@@ -175,6 +183,9 @@ cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:
     cdef public api void on_game_overlay_activated(self, GameOverlayActivated_t * data):
         self._py_callback({'m_bActive': data.m_bActive})
 
+    cdef public api void on_persona_state_change(self, PersonaStateChange_t * data):
+        self._py_callback({'m_ulSteamID': data.m_ulSteamID, 'm_nChangeFlags': data.m_nChangeFlags})
+
     def __dealloc__(self):
         if self._handler != NULL:
             if self.callback_id == 513:
@@ -193,6 +204,8 @@ cdef public class SteamCallback[object SteamCallback, type SteamCallback_Type]:
                 del_game_rich_presence_join_requested_handler(self._handler)
             elif self.callback_id == 331:
                 del_game_overlay_activated_handler(self._handler)
+            elif self.callback_id == 304:
+                del_persona_state_change_handler(self._handler)
             self._handler = NULL
 
 cdef ISteamFriends * g_friends = NULL
@@ -201,6 +214,23 @@ cdef ISteamUser * g_user = NULL
 cdef ISteamApps * g_apps = NULL
 cdef ISteamUtils * g_utils = NULL
 
+# --- Pre-encoded keys ---
+# Keys used on every lobby refresh are encoded once here; any other key is
+# encoded on first use and cached, so no call pays key.encode('utf-8') twice.
+KEY_PLAYER = b"player"
+KEY_START = b"start"
+cdef dict _encoded_keys = {"player": KEY_PLAYER, "start": KEY_START}
+
+cdef bytes _key(key):
+    cdef bytes encoded
+    if isinstance(key, bytes):
+        return <bytes> key
+    encoded = _encoded_keys.get(key)
+    if encoded is None:
+        encoded = key.encode('utf-8')
+        _encoded_keys[key] = encoded
+    return encoded
+
 def init():
     global g_friends, g_matchmaking, g_user, g_apps, g_utils
     if not SteamAPI_Init():
@@ -229,7 +259,7 @@ def get_my_steam_id():
 # --- Apps ---
 def get_launch_query_param(key):
     if not g_apps: return ""
-    return g_apps.GetLaunchQueryParam(key.encode('utf-8'))
+    return g_apps.GetLaunchQueryParam(_key(key))
 
 # --- Utils ---
 def is_overlay_enabled():
@@ -248,7 +278,7 @@ def activate_game_overlay_invite_dialog(unsigned long long lobby_id_int):
 
 def set_rich_presence(key, value):
     if g_friends:
-        g_friends.SetRichPresence(key.encode('utf-8'), value.encode('utf-8'))
+        g_friends.SetRichPresence(_key(key), value.encode('utf-8'))
 
 def clear_rich_presence():
     if g_friends:
@@ -268,6 +298,19 @@ def get_friend_persona_name(unsigned long long steamIDFriend):
         return g_friends.GetFriendPersonaName(CSteamID(steamIDFriend)).decode('utf-8')
     return ""
 
+def get_friends(int iFriendFlags):
+    """All friends matching iFriendFlags as a tuple of (steam_id, persona_name), in one native loop"""
+    cdef int i, count
+    cdef CSteamID friend_id
+    if not g_friends: return ()
+    count = g_friends.GetFriendCount(iFriendFlags)
+    friends = []
+    for i in range(count):
+        friend_id = g_friends.GetFriendByIndex(i, iFriendFlags)
+        friends.append((friend_id.ConvertToUint64(),
+                        g_friends.GetFriendPersonaName(friend_id).decode('utf-8', 'ignore')))
+    return tuple(friends)
+
 # --- Matchmaking ---
 def create_lobby(lobby_type, max_members):
     if g_matchmaking:
@@ -286,13 +329,13 @@ def leave_lobby(unsigned long long lobby_id_int):
 def get_lobby_data(unsigned long long lobby_id_int, key):
     cdef const char * value_bytes = NULL
     if g_matchmaking:
-        value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'))
+        value_bytes = g_matchmaking.GetLobbyData(CSteamID(lobby_id_int), _key(key))
         return value_bytes.decode('utf-8', 'ignore')
     return ""
 
 def set_lobby_data(unsigned long long lobby_id_int, key, value):
     if g_matchmaking:
-        g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+        g_matchmaking.SetLobbyData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 
 def get_lobby_member_by_index(unsigned long long lobby_id_int, int iMember):
     if g_matchmaking:
@@ -303,14 +346,51 @@ def get_num_lobby_members(unsigned long long lobby_id_int):
     if not g_matchmaking: return 0
     return g_matchmaking.GetNumLobbyMembers(CSteamID(lobby_id_int))
 
+def get_lobby_members(unsigned long long lobby_id_int):
+    """Steam IDs of every lobby member, in member index order"""
+    cdef int i, count
+    cdef CSteamID lobby = CSteamID(lobby_id_int)
+    if not g_matchmaking: return ()
+    count = g_matchmaking.GetNumLobbyMembers(lobby)
+    return tuple([g_matchmaking.GetLobbyMemberByIndex(lobby, i).ConvertToUint64() for i in range(count)])
+
+def get_all_member_data(unsigned long long lobby_id_int, keys):
+    """
+    Every lobby member with its persona name and member data, in one native loop
+
+    Returns a tuple of (steam_id, persona_name, values) where values holds the
+    bytes of each key in `keys`, in order (b"" when a member has not set it).
+    """
+    cdef int i, k, count, num_keys
+    cdef CSteamID lobby = CSteamID(lobby_id_int)
+    cdef CSteamID member
+    cdef const char * c_keys[16]
+    cdef bytes encoded_key
+    if not g_matchmaking or not g_friends: return ()
+    encoded = [_key(key) for key in keys]  # Keeps the buffers alive while c_keys points into them
+    num_keys = len(encoded)
+    if num_keys > 16:
+        raise ValueError("get_all_member_data() takes at most 16 keys")
+    for k in range(num_keys):
+        encoded_key = encoded[k]
+        c_keys[k] = encoded_key
+    count = g_matchmaking.GetNumLobbyMembers(lobby)
+    members = []
+    for i in range(count):
+        member = g_matchmaking.GetLobbyMemberByIndex(lobby, i)
+        values = tuple([<bytes> g_matchmaking.GetLobbyMemberData(lobby, member, c_keys[k]) for k in range(num_keys)])
+        members.append((member.ConvertToUint64(),
+                        g_friends.GetFriendPersonaName(member).decode('utf-8', 'ignore'), values))
+    return tuple(members)
+
 def get_lobby_member_data(unsigned long long lobby_id_int, unsigned long long steam_id_int, key):
     if g_matchmaking:
-        return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), key.encode('utf-8'))
+        return g_matchmaking.GetLobbyMemberData(CSteamID(lobby_id_int), CSteamID(steam_id_int), _key(key))
     return None
 
 def set_lobby_member_data(unsigned long long lobby_id_int, key, value):
     if not g_matchmaking: return
-    g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), key.encode('utf-8'), value.encode('utf-8'))
+    g_matchmaking.SetLobbyMemberData(CSteamID(lobby_id_int), _key(key), value.encode('utf-8'))
 
 def set_lobby_joinable(unsigned long long lobby_id_int, bint bLobbyJoinable):
     if not g_matchmaking: return None
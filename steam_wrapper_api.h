@@ -11,4 +11,5 @@ void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_data_update(struct SteamCa
 void __pyx_f_13steam_wrapper_13SteamCallback_on_lobby_invite(struct SteamCallback *, LobbyInvite_t *);
 void __pyx_f_13steam_wrapper_13SteamCallback_on_join_requested(struct SteamCallback *, GameLobbyJoinRequested_t *);
 void __pyx_f_13steam_wrapper_13SteamCallback_on_game_rich_presence_join_requested(struct SteamCallback *, GameRichPresenceJoinRequested_t *);
-void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct SteamCallback *, GameOverlayActivated_t *);
\ No newline at end of file
+void __pyx_f_13steam_wrapper_13SteamCallback_on_game_overlay_activated(struct SteamCallback *, GameOverlayActivated_t *);
+void __pyx_f_13steam_wrapper_13SteamCallback_on_persona_state_change(struct SteamCallback *, PersonaStateChange_t *);
\ No newline at end of file
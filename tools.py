@@ -23,8 +23,13 @@ def getJsonData(path):
 
 
 def setJsonData(path, data):
-    with open(path, "w", encoding="utf8") as f:
+    """Write JSON atomically: a crash leaves either the old file or the new one"""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf8") as f:
         f.write(json.dumps(data, ensure_ascii=False))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def resource_path(relative_path):